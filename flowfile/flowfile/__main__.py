@@ -206,7 +206,7 @@ def main():
     parser.add_argument(
         "component",
         nargs="?",
-        choices=["ui", "core", "worker", "flow", "init", "open", "save"],
+        choices=["ui", "core", "worker", "runner", "flow", "init", "open", "save"],
         help="Component to run, or project sub-command (init/open/save)",
     )
     parser.add_argument("file_path", nargs="?", help="Flow file path, project folder, or version message")
@@ -242,6 +242,11 @@ def main():
             from flowfile_worker.main import run as run_worker
 
             run_worker(host=args.host, port=args.port)
+        elif args.component == "runner":
+            # Warm flow runner: scheduled and on-demand runs skip the interpreter boot
+            from flowfile.runner import run_runner
+
+            run_runner()
         elif args.component == "flow":
             if not args.file_path:
                 print("Error: 'flow' component requires a file path", file=sys.stderr)
@@ -276,6 +281,7 @@ def main():
         print("  # Advanced: Run individual components")
         print("  flowfile run core  # Start only the core service")
         print("  flowfile run worker  # Start only the worker service")
+        print("  flowfile run runner  # Keep warm processes for scheduled and on-demand runs")
         print("")
         print("  # Options")
         print("  flowfile run ui --host 0.0.0.0 --port 8080  # Custom host/port")
@@ -0,0 +1,404 @@
+"""Warm flow runner: ``flowfile run runner``.
+
+Every ``flowfile run flow`` process imports the whole ``flowfile_core`` stack and
+connects to the database before the flow starts, which for short scheduled flows
+takes longer than the run itself. The runner keeps up to ``FLOWFILE_RUNNER_SIZE``
+spawned members that have paid that import chain once, and accepts run requests
+from ``shared.subprocess_utils.spawn_flow_subprocess`` over a local socket
+(a Unix socket, or a named pipe on Windows). The socket address and a random auth
+key are published in ``runner_address_path()``, readable by the owning user only.
+
+Lifecycle rules, mirroring ``flowfile_worker.pool``:
+
+- A request is answered with the PID of the member offered for it, or ``None``
+  when every member is busy; the caller then spawns a process as before. The
+  member starts the run only once the caller confirms with ``"start"``, so a
+  caller that gave up waiting and spawned the run itself never runs it twice.
+- A member outlives its runs, so its PID does not identify one. Callers ask
+  the runner about a run instead (:meth:`FlowRunner.run_state`), and a cancel
+  (:meth:`FlowRunner.cancel`) ends the member only while it runs that run.
+- Each run writes its stdout/stderr to its own run log, and the member's
+  working directory is restored after it.
+- A member is reused only when it reported the run finished, is still alive
+  and is under its run/RSS budgets; otherwise it is retired and the slot is
+  spawned into on the next request.
+- With ``FLOWFILE_RUNNER_RUN_MEMORY_MB`` set, a run whose member grows past it
+  is failed and the member exits.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import secrets
+import sys
+import threading
+from dataclasses import dataclass
+from multiprocessing import get_context
+from multiprocessing.connection import Connection, Listener
+from multiprocessing.process import BaseProcess
+
+from shared.subprocess_utils import runner_address_path
+
+logger = logging.getLogger("flowfile.runner")
+
+mp_context = get_context("spawn")
+
+_DISPOSE_JOIN_TIMEOUT = 5.0
+# How long an offered member waits for the submitter's "start" before going back to the pool.
+_START_TIMEOUT_SECONDS = 10.0
+_MEMORY_POLL_SECONDS = 1.0
+
+
+def _int_env(name: str, default: int) -> int:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={raw!r}; using {default}")
+        return default
+
+
+def _rss_mb(pid: int) -> float | None:
+    """Resident set size in MB, or None when psutil is unavailable (budget skipped)."""
+    try:
+        import psutil
+
+        return psutil.Process(pid).memory_info().rss / 1e6
+    except Exception:
+        return None
+
+
+# Member side
+
+
+def _start_orphan_watch(poll_interval: float = 5.0) -> None:
+    """Exit the member when the runner dies without shutting it down."""
+    import multiprocessing
+    from time import sleep
+
+    parent = multiprocessing.parent_process()
+
+    def watch() -> None:
+        while parent.is_alive():
+            sleep(poll_interval)
+        os._exit(1)
+
+    threading.Thread(target=watch, daemon=True, name="runner-orphan-watch").start()
+
+
+def _watch_memory(run_id: int, limit_mb: int, done: threading.Event) -> None:
+    """Fail the run and end the member once its RSS passes *limit_mb*."""
+    from flowfile.__main__ import _complete_run_if_needed
+
+    pid = os.getpid()
+    while not done.wait(_MEMORY_POLL_SECONDS):
+        rss_mb = _rss_mb(pid)
+        if rss_mb is not None and rss_mb > limit_mb:
+            print(f"Error: run {run_id} exceeded the memory cap of {limit_mb} MB ({rss_mb:.0f} MB)", file=sys.stderr)
+            sys.stderr.flush()
+            _complete_run_if_needed(run_id, success=False, nodes_completed=0)
+            os._exit(1)
+
+
+def _run_isolated(flow_path: str, run_id: int, memory_limit_mb: int) -> int:
+    """Run one flow with its output in the run log, as a spawned ``flowfile run flow`` would."""
+    from flowfile.__main__ import _complete_run_if_needed, run_flow
+    from shared.run_logs import run_log_path
+
+    log_file = run_log_path(run_id)
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    cwd = os.getcwd()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved_stdout, saved_stderr = os.dup(1), os.dup(2)
+    fd = os.open(str(log_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    # Redirect the fds, not sys.stdout/sys.stderr, so native and logging-handler output lands in the log too.
+    os.dup2(fd, 1)
+    os.dup2(fd, 2)
+    os.close(fd)
+    done = threading.Event()
+    if memory_limit_mb:
+        threading.Thread(
+            target=_watch_memory, args=(run_id, memory_limit_mb, done), daemon=True, name="runner-memory-watch"
+        ).start()
+    try:
+        return run_flow(flow_path, run_id=run_id)
+    except Exception as e:
+        print(f"Error running flow: {e}", file=sys.stderr)
+        _complete_run_if_needed(run_id, success=False, nodes_completed=0)
+        return 1
+    finally:
+        done.set()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(saved_stdout, 1)
+        os.dup2(saved_stderr, 2)
+        os.close(saved_stdout)
+        os.close(saved_stderr)
+        os.chdir(cwd)
+
+
+def member_loop(conn: Connection, memory_limit_mb: int) -> None:
+    """Child entrypoint: run flows until the ``None`` shutdown sentinel.
+
+    The heavy import chain is paid once here, before the first request.
+    """
+    import flowfile.__main__  # noqa: F401
+    import flowfile_core.flowfile.manage.io_flowfile  # noqa: F401
+
+    _start_orphan_watch()
+    while True:
+        request = conn.recv()
+        if request is None:
+            return
+        conn.send(_run_isolated(request["flow_path"], request["run_id"], memory_limit_mb))
+
+
+# Runner side
+
+
+@dataclass
+class RunnerMember:
+    process: BaseProcess
+    conn: Connection
+    runs_served: int = 0
+    run_id: int | None = None
+
+
+class FlowRunner:
+    """Fixed-capacity set of warm members, spawned on demand up to *size*."""
+
+    def __init__(self, size: int, max_runs_per_member: int, rss_limit_mb: int, run_memory_limit_mb: int = 0):
+        self._size = size
+        self._max_runs = max_runs_per_member
+        self._rss_limit_mb = rss_limit_mb
+        self._run_memory_limit_mb = run_memory_limit_mb
+        self._idle: list[RunnerMember] = []
+        self._busy: dict[int, RunnerMember] = {}
+        self._total = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._address: str | None = None
+        self._authkey = secrets.token_bytes(32)
+
+    def acquire(self) -> RunnerMember | None:
+        """Lease an idle member, spawning into a free slot; None when all are busy."""
+        dead: list[RunnerMember] = []
+        member: RunnerMember | None = None
+        with self._lock:
+            while self._idle:
+                candidate = self._idle.pop()
+                if candidate.process.is_alive():
+                    member = candidate
+                    break
+                dead.append(candidate)
+                self._total -= 1
+            if member is None and self._total < self._size:
+                member = self._spawn_member()
+                self._total += 1
+        for zombie in dead:
+            self._dispose(zombie)
+        return member
+
+    def checkin(self, member: RunnerMember, reusable: bool) -> None:
+        """Return a member after its run: back to the idle set, or retired."""
+        if reusable and member.process.is_alive() and self._under_budget(member) and not self._stop.is_set():
+            with self._lock:
+                self._idle.append(member)
+            return
+        with self._lock:
+            self._total -= 1
+        self._dispose(member)
+
+    def prewarm(self) -> None:
+        """Fill every slot at startup so even the first run is warm."""
+        with self._lock:
+            while self._total < self._size:
+                self._idle.append(self._spawn_member())
+                self._total += 1
+        logger.info(f"Flow runner prewarmed to {self._size} member(s)")
+
+    def run_state(self, run_id: int, pid: int | None) -> str | None:
+        """``"running"`` while a member runs *run_id*; ``"finished"`` when *pid* is a member
+        that is not running it; ``None`` when *pid* is not a member of this runner.
+        """
+        with self._lock:
+            member = self._busy.get(run_id)
+            if member is not None and member.process.is_alive():
+                return "running"
+            members = [*self._idle, *self._busy.values()]
+        return "finished" if any(m.process.pid == pid for m in members) else None
+
+    def cancel(self, run_id: int) -> bool:
+        """End the member running *run_id*; a member that moved on to another run is left alone."""
+        with self._lock:
+            member = self._busy.get(run_id)
+            if member is None:
+                return False
+            # Under the lock: the member cannot be handed a new run before it is terminated.
+            member.process.terminate()
+        logger.info(f"Cancelled run {run_id} on member pid={member.process.pid}")
+        return True
+
+    def serve_forever(self) -> None:
+        """Accept run requests until :meth:`shutdown`; publishes the address file meanwhile."""
+        address_file = runner_address_path()
+        with Listener(authkey=self._authkey) as listener:
+            self._address = listener.address
+            address_file.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(str(address_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"address": listener.address, "authkey": self._authkey.hex(), "pid": os.getpid()}, f)
+            logger.info(f"Flow runner listening on {listener.address}")
+            try:
+                self.prewarm()
+                while not self._stop.is_set():
+                    try:
+                        conn = listener.accept()
+                    except OSError:
+                        if self._stop.is_set():
+                            break
+                        logger.exception("Flow runner failed to accept a connection")
+                        continue
+                    if self._stop.is_set():
+                        conn.close()
+                        break
+                    threading.Thread(target=self._handle, args=(conn,), daemon=True, name="runner-request").start()
+            finally:
+                address_file.unlink(missing_ok=True)
+                self._dispose_idle()
+
+    def shutdown(self) -> None:
+        """Stop accepting requests and retire idle members; busy members finish their run first."""
+        from multiprocessing.connection import Client
+
+        self._stop.set()
+        if self._address is None:
+            return
+        try:
+            # Wake the blocking accept() so serve_forever sees the stop flag.
+            Client(self._address, authkey=self._authkey).close()
+        except Exception:
+            pass
+
+    def _handle(self, conn: Connection) -> None:
+        with conn:
+            try:
+                request = conn.recv()
+                op = request.get("op", "submit")
+                if op == "status":
+                    conn.send(self.run_state(int(request["run_id"]), request.get("pid")))
+                elif op == "cancel":
+                    conn.send(self.cancel(int(request["run_id"])))
+                else:
+                    self._offer(conn, request)
+            except (EOFError, OSError, KeyError, TypeError, ValueError, AttributeError):
+                logger.exception("Flow runner received a bad request")
+
+    def _offer(self, conn: Connection, request: dict) -> None:
+        """Offer a member for *request* and start the run once the submitter confirms."""
+        run_id = int(request["run_id"])
+        member = self.acquire()
+        if member is None:
+            conn.send(None)
+            return
+        try:
+            conn.send(member.process.pid)
+            confirmed = conn.poll(_START_TIMEOUT_SECONDS) and conn.recv() == "start"
+        except (EOFError, OSError):
+            confirmed = False
+        if not confirmed:
+            logger.warning(f"Submitter of run {run_id} gave up; returning member pid={member.process.pid}")
+            self.checkin(member, reusable=True)
+            return
+        self._dispatch(member, request)
+
+    def _dispatch(self, member: RunnerMember, request: dict) -> None:
+        run_id = int(request["run_id"])
+        member.runs_served += 1
+        member.run_id = run_id
+        with self._lock:
+            self._busy[run_id] = member
+        try:
+            member.conn.send({"flow_path": request["flow_path"], "run_id": run_id})
+        except OSError:
+            self._release(member)
+            self.checkin(member, reusable=False)
+            return
+        threading.Thread(target=self._await_run, args=(member,), daemon=True, name="runner-await-run").start()
+
+    def _release(self, member: RunnerMember) -> None:
+        with self._lock:
+            self._busy.pop(member.run_id, None)
+        member.run_id = None
+
+    def _await_run(self, member: RunnerMember) -> None:
+        run_id = member.run_id
+        try:
+            exit_code = member.conn.recv()
+            reusable = True
+        except (EOFError, OSError):
+            # Cancelled, over its memory cap, or crashed: the run row is closed by the
+            # canceller, the watchdog or the orphan reaper, as for a spawned process.
+            exit_code, reusable = None, False
+        self._release(member)
+        logger.info(f"Member pid={member.process.pid} finished run {run_id} (exit code {exit_code})")
+        self.checkin(member, reusable)
+
+    def _spawn_member(self) -> RunnerMember:
+        parent_conn, child_conn = mp_context.Pipe()
+        # Not daemonic: flows may start processes of their own, which daemonic children cannot.
+        process = mp_context.Process(
+            target=member_loop, args=(child_conn, self._run_memory_limit_mb), name="flowfile-runner-member"
+        )
+        process.start()
+        child_conn.close()
+        logger.info(f"Flow runner member spawned (pid={process.pid})")
+        return RunnerMember(process=process, conn=parent_conn)
+
+    def _under_budget(self, member: RunnerMember) -> bool:
+        if member.runs_served >= self._max_runs:
+            return False
+        rss_mb = _rss_mb(member.process.pid)
+        return rss_mb is None or rss_mb <= self._rss_limit_mb
+
+    def _dispose(self, member: RunnerMember) -> None:
+        """Tear a member down; it is already off the books. Never called under the lock."""
+        process = member.process
+        if process.is_alive():
+            try:
+                member.conn.send(None)
+                process.join(timeout=_DISPOSE_JOIN_TIMEOUT)
+            except OSError:
+                pass
+            if process.is_alive():
+                process.terminate()
+        process.join()
+        member.conn.close()
+        logger.info(f"Flow runner member disposed (pid={process.pid}, runs_served={member.runs_served})")
+
+    def _dispose_idle(self) -> None:
+        with self._lock:
+            members, self._idle = self._idle, []
+            self._total -= len(members)
+        for member in members:
+            self._dispose(member)
+
+
+def run_runner() -> None:
+    """Entrypoint of ``flowfile run runner``; runs until interrupted."""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    runner = FlowRunner(
+        size=max(1, _int_env("FLOWFILE_RUNNER_SIZE", 2)),
+        max_runs_per_member=max(1, _int_env("FLOWFILE_RUNNER_MAX_RUNS", 50)),
+        rss_limit_mb=_int_env("FLOWFILE_RUNNER_RSS_MB", 2048),
+        run_memory_limit_mb=_int_env("FLOWFILE_RUNNER_RUN_MEMORY_MB", 0),
+    )
+    try:
+        runner.serve_forever()
+    except KeyboardInterrupt:
+        runner.shutdown()
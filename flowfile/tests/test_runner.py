@@ -0,0 +1,145 @@
+"""
+Tests for the warm flow runner ('flowfile run runner').
+
+Run with:
+    pytest flowfile/tests/test_runner.py -v
+"""
+
+import json
+import threading
+import time
+from multiprocessing.connection import Client
+from pathlib import Path
+
+import pytest
+import yaml
+
+from flowfile.runner import FlowRunner
+from shared.run_logs import run_log_path
+from shared.subprocess_utils import cancel_runner_run, runner_address_path, runner_run_state, submit_flow_to_runner
+
+RUN_IDS = (987_001, 987_002)
+
+
+@pytest.fixture
+def flow_yaml(tmp_path: Path) -> Path:
+    flow_data = {
+        "flowfile_version": "0.5.0",
+        "flowfile_id": 1,
+        "flowfile_name": "runner_flow",
+        "flowfile_settings": {
+            "execution_mode": "Development",
+            "execution_location": "local",
+            "auto_save": False,
+            "show_detailed_progress": False,
+        },
+        "nodes": [
+            {
+                "id": 1,
+                "type": "manual_input",
+                "is_start_node": True,
+                "x_position": 0,
+                "y_position": 0,
+                "inputs": None,
+                "outputs": [],
+                "setting_input": {
+                    "cache_results": False,
+                    "raw_data_format": {
+                        "columns": [{"name": "id", "data_type": "Int64"}],
+                        "data": [[1, 2, 3]],
+                    },
+                },
+            },
+        ],
+    }
+    path = tmp_path / "runner_flow.yaml"
+    path.write_text(yaml.dump(flow_data))
+    return path
+
+
+@pytest.fixture
+def runner():
+    flow_runner = FlowRunner(size=1, max_runs_per_member=10, rss_limit_mb=1_000_000)
+    thread = threading.Thread(target=flow_runner.serve_forever, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 30
+    while not runner_address_path().exists():
+        assert time.monotonic() < deadline, "runner did not publish its address"
+        time.sleep(0.05)
+    yield flow_runner
+    flow_runner.shutdown()
+    thread.join(timeout=30)
+    for run_id in RUN_IDS:
+        run_log_path(run_id).unlink(missing_ok=True)
+
+
+def _wait_for_log(run_id: int, text: str, timeout: float = 120) -> str:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        log_file = run_log_path(run_id)
+        content = log_file.read_text() if log_file.exists() else ""
+        if text in content:
+            return content
+        time.sleep(0.2)
+    raise AssertionError(f"{text!r} not in the log of run {run_id}")
+
+
+def _submit_when_free(flow_yaml: Path, run_id: int, timeout: float = 30) -> int:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        pid = submit_flow_to_runner(str(flow_yaml), run_id)
+        if pid is not None:
+            return pid
+        time.sleep(0.1)
+    raise AssertionError(f"no runner member became free for run {run_id}")
+
+
+def test_no_runner_falls_back():
+    assert not runner_address_path().exists()
+    assert submit_flow_to_runner("/nonexistent/flow.yaml", RUN_IDS[0]) is None
+    assert runner_run_state(RUN_IDS[0], 12345) is None
+    assert not cancel_runner_run(RUN_IDS[0])
+
+
+def test_runs_reuse_a_warm_member(runner, flow_yaml: Path):
+    first_pid = submit_flow_to_runner(str(flow_yaml), RUN_IDS[0])
+    assert first_pid is not None
+    # The only member is busy until the first run reports back.
+    assert "Running flow: runner_flow" in _wait_for_log(RUN_IDS[0], "Flow completed successfully")
+
+    second_pid = _submit_when_free(flow_yaml, RUN_IDS[1])
+    assert second_pid == first_pid
+    # Each run writes its own log; the second does not append to the first.
+    _wait_for_log(RUN_IDS[1], "Flow completed successfully")
+    assert run_log_path(RUN_IDS[0]).read_text().count("Running flow:") == 1
+
+
+def test_busy_runner_declines(runner, flow_yaml: Path):
+    assert submit_flow_to_runner(str(flow_yaml), RUN_IDS[0]) is not None
+    assert submit_flow_to_runner(str(flow_yaml), RUN_IDS[1]) is None
+    _wait_for_log(RUN_IDS[0], "Flow completed successfully")
+
+
+def test_offer_without_start_is_not_run(runner, flow_yaml: Path):
+    info = json.loads(runner_address_path().read_text(encoding="utf-8"))
+    with Client(info["address"], authkey=bytes.fromhex(info["authkey"])) as conn:
+        conn.send({"op": "submit", "flow_path": str(flow_yaml), "run_id": RUN_IDS[0]})
+        offered_pid = conn.recv()
+    # The submitter went away without "start": the member goes back to the pool unused.
+    assert _submit_when_free(flow_yaml, RUN_IDS[1]) == offered_pid
+    _wait_for_log(RUN_IDS[1], "Flow completed successfully")
+    assert not run_log_path(RUN_IDS[0]).exists()
+
+
+def test_member_pid_does_not_keep_a_finished_run_alive(runner, flow_yaml: Path):
+    pid = submit_flow_to_runner(str(flow_yaml), RUN_IDS[0])
+    _wait_for_log(RUN_IDS[0], "Flow completed successfully")
+
+    deadline = time.monotonic() + 30
+    while runner_run_state(RUN_IDS[0], pid) != "finished":
+        assert time.monotonic() < deadline, "runner still reports the run as running"
+        time.sleep(0.1)
+    # Cancelling the finished run leaves the member, and the next run on it, alone.
+    assert not cancel_runner_run(RUN_IDS[0])
+    assert _submit_when_free(flow_yaml, RUN_IDS[1]) == pid
+    _wait_for_log(RUN_IDS[1], "Flow completed successfully")
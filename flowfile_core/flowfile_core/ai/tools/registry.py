@@ -204,8 +204,8 @@ def _node_settings_to_tool_spec(node_type: str, settings_cls: type) -> ToolSpec:
 #   does not need to fill them.
 # * ``cache_results`` / ``pos_x`` / ``pos_y`` / ``group_id`` / ``is_setup``
 #   / ``description`` / ``node_reference`` / ``user_id`` / ``is_flow_output``
-#   / ``is_user_defined`` / ``output_field_config`` — NodeBase metadata not
-#   needed for stage-3 settings authoring. All have safe defaults; positions
+#   / ``is_user_defined`` / ``output_field_config`` / ``memory_limit_mb`` —
+#   NodeBase metadata not needed for stage-3 settings authoring. All have safe defaults; positions
 #   and ``user_id`` are filled by other planner machinery. ``group_id`` is
 #   visual group membership (organizational only, no execution impact) — the
 #   agent leaves new nodes ungrouped at the ``None`` default. Stripping it
@@ -229,6 +229,7 @@ _PLANNER_INJECTED_SETTINGS_FIELDS: Final[frozenset[str]] = frozenset(
         "is_flow_output",
         "is_user_defined",
         "output_field_config",
+        "memory_limit_mb",
     }
 )
 
@@ -12,10 +12,9 @@ import shutil
 from pathlib import Path
 
 import pyarrow as pa
-from deltalake import DeltaTable
 
 from shared.delta_models import SourceTableVersion
-from shared.delta_utils import get_delta_size_bytes
+from shared.delta_utils import get_delta_size_bytes, get_delta_version, invalidate_delta_table, open_delta_table
 
 logger = logging.getLogger(__name__)
 
@@ -46,7 +45,7 @@ def check_source_versions_current(source_table_versions_json: str | None) -> boo
 
     for sv in versions:
         try:
-            current_version = DeltaTable(sv.file_path, without_files=True).version()
+            current_version = get_delta_version(sv.file_path)
             if current_version != sv.version:
                 logger.info(
                     "Source table %d at %s changed: expected version %d, current %d",
@@ -69,7 +68,7 @@ def get_live_delta_version(path: str | Path, storage_options: dict | None = None
     latter). Raises on unreadable/missing tables; callers decide the failure
     semantics (fail-open re-run vs cache fallback).
     """
-    return DeltaTable(str(path), without_files=True, storage_options=storage_options).version()
+    return get_delta_version(path, storage_options=storage_options)
 
 
 def is_delta_table(path: str | Path) -> bool:
@@ -99,7 +98,7 @@ def get_delta_table_size_bytes(path: str | Path) -> int:
 
 def read_delta_preview(path: str, n_rows: int = 100) -> pa.Table:
     """Read the first N rows from a Delta table using PyArrow."""
-    dt = DeltaTable(str(path))
+    dt = open_delta_table(path)
 
     dataset = dt.to_pyarrow_dataset()
 
@@ -113,3 +112,4 @@ def delete_table_storage(path: str | Path) -> None:
         shutil.rmtree(p)
     elif p.is_file():
         p.unlink()
+    invalidate_delta_table(p)
@@ -0,0 +1,213 @@
+"""Incremental reads of catalog Delta tables for the catalog reader node.
+
+A catalog reader in ``incremental`` mode reads only the rows a table gained since
+the version the same reader last consumed, instead of the whole table:
+
+1. The last consumed version is kept per state name in a small JSON file under the
+   cache directory, together with the table path it belongs to.
+2. The increment is the set of data files in the table's current version that were
+   not in the consumed version (an add-file diff of the two snapshots). Each added
+   file is scanned natively, with its partition values from the Delta log, so the
+   frame stays lazy and serializable. A compaction or Z-order (``OPTIMIZE``) only
+   rearranges rows, so the diff is taken around it: its new files are skipped, and
+   rows added since the consumed version that it absorbed are read from the files
+   they were first written to, which stay on storage until the table is vacuumed.
+3. The new version is written back only after the whole flow succeeded (see
+   :func:`make_increment_commit_callback`), so a failed run re-reads the same rows.
+
+Without a usable state (first run, another table, or a consumed version that can
+no longer be loaded, or whose files were vacuumed) the whole table is read. For appends the increment is exact.
+An overwrite, merge or delete rewrites files, and the increment then also holds the
+unchanged rows of the rewritten files; downstream should merge rather than append
+when the table is not append-only.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import polars as pl
+from deltalake import DeltaTable
+
+from shared.cloud_storage.uri import is_cloud_uri
+from shared.delta_utils import get_delta_version, open_delta_table, scan_delta_table
+from shared.storage_config import storage
+
+logger = logging.getLogger(__name__)
+
+INCREMENTAL_STATE_DIR = storage.cache_directory / "catalog_reader_state"
+
+
+@dataclass
+class DeltaIncrement:
+    """The rows to read, and the table version they bring the reader up to."""
+
+    lf: pl.LazyFrame
+    version: int
+    full: bool  # True when the whole table is read
+
+
+def _state_path(state_name: str) -> Path:
+    return INCREMENTAL_STATE_DIR / f"{state_name}.json"
+
+
+def read_consumed_version(state_name: str, table_path: str) -> int | None:
+    """The version of *table_path* last consumed under *state_name*, if any."""
+    path = _state_path(state_name)
+    if not path.exists():
+        return None
+    try:
+        state = json.loads(path.read_text())
+    except (OSError, ValueError):
+        logger.warning("Ignoring unreadable incremental read state %s", path)
+        return None
+    if state.get("table_path") != table_path:
+        return None
+    return state.get("version")
+
+
+def write_consumed_version(state_name: str, table_path: str, version: int) -> None:
+    INCREMENTAL_STATE_DIR.mkdir(parents=True, exist_ok=True)
+    path = _state_path(state_name)
+    tmp_path = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+    tmp_path.write_text(json.dumps({"table_path": table_path, "version": version}))
+    os.replace(tmp_path, path)
+
+
+def _file_paths(table: DeltaTable) -> list[str]:
+    return table.get_add_actions(flatten=True).column("path").to_pylist()
+
+
+def _added_files_frame(
+    table: DeltaTable, table_path: str, added: set[str], schema: pl.Schema, storage_options: dict | None
+) -> pl.LazyFrame:
+    """Scan the *added* data files of *table*, with their partition values as columns."""
+    actions = table.get_add_actions(flatten=True)
+    partition_values = {
+        column: actions.column(f"partition.{column}").to_pylist() for column in table.metadata().partition_columns
+    }
+    frames = [pl.LazyFrame(schema=schema)]
+    for idx, path in enumerate(actions.column("path").to_pylist()):
+        if path not in added:
+            continue
+        lf = pl.scan_parquet(f"{table_path.rstrip('/')}/{path}", storage_options=storage_options)
+        if partition_values:
+            lf = lf.with_columns(
+                pl.lit(values[idx]).cast(schema[column]).alias(column) for column, values in partition_values.items()
+            )
+        frames.append(lf)
+    # Seeded with the table schema so files written before a schema change get the newer columns as nulls.
+    return pl.concat(frames, how="diagonal_relaxed").select(pl.col(name).cast(dtype) for name, dtype in schema.items())
+
+
+def _compaction_versions(table: DeltaTable, since_version: int, version: int) -> list[int]:
+    """The commits after *since_version*, up to *version*, that only rearranged data files."""
+    return sorted(
+        commit["version"]
+        for commit in table.history(version - since_version)
+        if since_version < commit.get("version", -1) <= version and commit.get("operation") == "OPTIMIZE"
+    )
+
+
+def _data_changes(
+    table_path: str,
+    table: DeltaTable,
+    consumed: set[str],
+    compactions: list[int],
+    storage_options: dict | None,
+) -> list[tuple[DeltaTable, set[str]]]:
+    """The files added between the consumed snapshot and *table*, outside *compactions*.
+
+    One entry per stretch of commits between compactions, with the snapshot that
+    lists the files. Files a compaction removed are read from storage, so a
+    vacuumed local file raises ``FileNotFoundError``.
+    """
+    changes = []
+    start_files = consumed
+    for compaction in compactions:
+        before = open_delta_table(table_path, version=compaction - 1, storage_options=storage_options)
+        added = set(_file_paths(before)) - start_files
+        if not is_cloud_uri(table_path) and not all(os.path.exists(os.path.join(table_path, p)) for p in added):
+            raise FileNotFoundError(f"Data files of {table_path} added before version {compaction} were vacuumed")
+        changes.append((before, added))
+        after = open_delta_table(table_path, version=compaction, storage_options=storage_options)
+        start_files = set(_file_paths(after))
+    changes.append((table, set(_file_paths(table)) - start_files))
+    return changes
+
+
+def read_delta_increment(
+    table_path: str, since_version: int | None, storage_options: dict | None = None
+) -> DeltaIncrement:
+    """The rows *table_path* gained after *since_version* (the whole table when ``None``)."""
+    version = get_delta_version(table_path, storage_options)
+    # Pinned: the shared latest-version handle advances in place when another reader
+    # refreshes it, and the file list, partition values and schema must agree.
+    table = open_delta_table(table_path, version=version, storage_options=storage_options)
+    full_read = scan_delta_table(table_path, version=version, storage_options=storage_options)
+    if since_version is None or since_version > version:
+        return DeltaIncrement(full_read, version, full=True)
+
+    try:
+        consumed_table = open_delta_table(table_path, version=since_version, storage_options=storage_options)
+        consumed = set(_file_paths(consumed_table))
+        current = set(_file_paths(table))
+        # Without rewritten files there was no compaction that could mix consumed rows into new files.
+        compactions = _compaction_versions(table, since_version, version) if consumed - current else []
+        changes = _data_changes(table_path, table, consumed, compactions, storage_options)
+    except Exception:
+        logger.warning(
+            "Version %d of %s or the files added since can no longer be loaded; reading the whole table",
+            since_version,
+            table_path,
+        )
+        return DeltaIncrement(full_read, version, full=True)
+
+    if consumed - current and not compactions:
+        logger.info(
+            "%s rewrote %d file(s) since version %d; the increment includes their unchanged rows",
+            table_path,
+            len(consumed - current),
+            since_version,
+        )
+    schema = full_read.collect_schema()
+    frames = [_added_files_frame(snapshot, table_path, added, schema, storage_options) for snapshot, added in changes]
+    return DeltaIncrement(pl.concat(frames), version, full=False)
+
+
+def read_catalog_increment(table_path: str, state_name: str, storage_options: dict | None = None) -> DeltaIncrement:
+    """Read the rows of *table_path* not yet consumed under *state_name*."""
+    return read_delta_increment(table_path, read_consumed_version(state_name, table_path), storage_options)
+
+
+def make_increment_commit_callback(
+    state_name: str,
+    table_path: str,
+    version: int,
+    node_id: int | str,
+    flow_logger,
+) -> Callable[[bool], None]:
+    """Create a post-execution callback that records *version* as consumed on success.
+
+    Stored on ``FlowNode._on_flow_complete``, like the Kafka offset commit.
+    """
+
+    def _on_complete(success: bool) -> None:
+        if not success:
+            flow_logger.warning(
+                f"Incremental read state NOT advanced for node {node_id} (downstream failure or cancel)"
+            )
+            return
+        try:
+            write_consumed_version(state_name, table_path, version)
+            flow_logger.info(f"Node {node_id}: consumed table version {version} ({state_name})")
+        except Exception as e:
+            flow_logger.error(f"Failed to record the consumed table version for node {node_id}: {e}")
+
+    return _on_complete
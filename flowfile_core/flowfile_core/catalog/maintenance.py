@@ -0,0 +1,353 @@
+"""Background compaction and Z-order maintenance for catalog Delta tables.
+
+Frequent small writes (scheduled merges, SCD2 batches, appends) leave catalog
+tables with many small data files, and reads slow down until someone optimizes
+them by hand. :class:`CatalogMaintenance` does that in the background:
+
+1. File-count and size metrics per table come from its Delta log
+   (:func:`table_file_stats`).
+2. The columns flows filter a catalog table on are counted whenever a flow runs
+   (:func:`record_filter_columns`); the most-filtered ones become the Z-order key.
+3. A pass runs only inside the quiet-hours window and while no flow run is active.
+   It picks the tables past the thresholds, most small files first, and compacts
+   them (or Z-orders them when their most-filtered columns changed), then vacuums
+   the replaced files with Delta's default retention, until the pass's table and
+   byte budgets are spent. A maintained table is left alone for a cooldown period.
+
+Maintenance goes through ``CatalogService.optimize_table`` / ``vacuum_table``, so
+it runs on the worker when offloading is on and leaves ``updated_at`` untouched
+(table-trigger schedules do not fire).
+
+Filter counts are kept per table in small JSON files under the cache directory.
+Flows record them from their own processes, so a count can be lost when two runs
+finish at the same moment; they only rank columns, which tolerates that.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import threading
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from flowfile_core.catalog import CatalogService
+from flowfile_core.catalog.delta_utils import is_delta_table
+from flowfile_core.catalog.repository import CatalogRepository, SQLAlchemyCatalogRepository
+from flowfile_core.catalog.storage_backend import _is_cloud_uri, resolve_for_namespace
+from flowfile_core.database.connection import get_db_context
+from shared.delta_utils import open_delta_table
+from shared.storage_config import storage
+
+if TYPE_CHECKING:
+    from deltalake import DeltaTable
+
+    from flowfile_core.database.models import CatalogTable
+    from flowfile_core.schemas import input_schema
+
+logger = logging.getLogger(__name__)
+
+
+def _int_env(name: str, default: int) -> int:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={raw!r}; using {default}")
+        return default
+
+
+MAINTENANCE_STATE_DIR = storage.cache_directory / "catalog_maintenance"
+
+# Local hours ("start-end", end exclusive, may wrap midnight) in which passes run.
+QUIET_HOURS = os.environ.get("FLOWFILE_CATALOG_MAINTENANCE_HOURS", "1-5")
+PASS_INTERVAL_SECONDS = _int_env("FLOWFILE_CATALOG_MAINTENANCE_INTERVAL_SECONDS", 3600)
+# Budget per pass: tables maintained, and bytes rewritten.
+MAX_TABLES_PER_PASS = _int_env("FLOWFILE_CATALOG_MAINTENANCE_MAX_TABLES", 2)
+MAX_BYTES_PER_PASS = _int_env("FLOWFILE_CATALOG_MAINTENANCE_MAX_GB", 10) * 1024**3
+
+SMALL_FILE_BYTES = 32 * 1024**2
+MIN_SMALL_FILES = 50  # small files that make a table due for compaction
+MIN_ZORDER_FILES = 8  # below this, clustering the data buys nothing
+MIN_FILTER_READS = 5  # runs filtering on a column before it becomes a Z-order key
+ZORDER_MAX_COLUMNS = 2
+COOLDOWN = timedelta(hours=24)
+VACUUM_RETENTION_HOURS = 168
+
+# A ``[column]`` reference. List literals such as ``is_in([1, 2])``, ``["a"]`` or ``[3]``
+# hold quotes, commas or a single number, and are skipped.
+_BRACKETED_COLUMN = re.compile(r"""\[([^\[\]"',]+)\]""")
+_POLARS_COLUMN = re.compile(r"""pl\.col\(\s*["']([^"']+)["']\s*\)""")
+
+
+@dataclass
+class TableFileStats:
+    """The data-file layout of a Delta table's current version."""
+
+    file_count: int
+    total_bytes: int
+    small_file_count: int
+    small_file_bytes: int
+    median_file_bytes: int
+
+
+def table_file_stats(table: DeltaTable) -> TableFileStats:
+    sizes = sorted(
+        size for size in table.get_add_actions(flatten=True).column("size_bytes").to_pylist() if size is not None
+    )
+    small = [size for size in sizes if size < SMALL_FILE_BYTES]
+    return TableFileStats(
+        file_count=len(sizes),
+        total_bytes=sum(sizes),
+        small_file_count=len(small),
+        small_file_bytes=sum(small),
+        median_file_bytes=sizes[len(sizes) // 2] if sizes else 0,
+    )
+
+
+# Filter-column tracking
+
+
+def _is_number(text: str) -> bool:
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+
+def filter_columns(settings: input_schema.NodeFilter) -> set[str]:
+    """The columns a filter node's condition refers to."""
+    filter_input = settings.filter_input
+    if filter_input.is_advanced():
+        expression = filter_input.advanced_filter or ""
+        bracketed = {name for name in _BRACKETED_COLUMN.findall(expression) if not _is_number(name)}
+        return bracketed | set(_POLARS_COLUMN.findall(expression))
+    if filter_input.basic_filter is not None and filter_input.basic_filter.field:
+        return {filter_input.basic_filter.field}
+    return set()
+
+
+def _write_json(path: Path, payload: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+    tmp_path.write_text(json.dumps(payload))
+    os.replace(tmp_path, path)
+
+
+def _read_json(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        logger.warning("Ignoring unreadable catalog maintenance state %s", path)
+        return {}
+
+
+def _filter_counts_path(table_id: int) -> Path:
+    return MAINTENANCE_STATE_DIR / "filter_columns" / f"{table_id}.json"
+
+
+def record_filter_columns(table_id: int, columns: Iterable[str]) -> None:
+    """Count one more run filtering catalog table *table_id* on each of *columns*."""
+    path = _filter_counts_path(table_id)
+    counts = _read_json(path)
+    for column in columns:
+        counts[column] = counts.get(column, 0) + 1
+    _write_json(path, counts)
+
+
+def most_filtered_columns(table_id: int, limit: int = ZORDER_MAX_COLUMNS) -> list[str]:
+    """The columns most often filtered on, seen in at least ``MIN_FILTER_READS`` runs."""
+    counts = _read_json(_filter_counts_path(table_id))
+    ranked = sorted((c for c, n in counts.items() if n >= MIN_FILTER_READS), key=lambda c: (-counts[c], c))
+    return ranked[:limit]
+
+
+# Maintenance records
+
+
+@dataclass
+class MaintenanceRecord:
+    maintained_at: datetime
+    z_order_columns: list[str] = field(default_factory=list)
+
+
+def _record_path(table_id: int) -> Path:
+    return MAINTENANCE_STATE_DIR / "maintained" / f"{table_id}.json"
+
+
+def read_maintenance_record(table_id: int) -> MaintenanceRecord | None:
+    state = _read_json(_record_path(table_id))
+    if "maintained_at" not in state:
+        return None
+    return MaintenanceRecord(datetime.fromisoformat(state["maintained_at"]), state.get("z_order_columns", []))
+
+
+def write_maintenance_record(table_id: int, record: MaintenanceRecord) -> None:
+    _write_json(
+        _record_path(table_id),
+        {"maintained_at": record.maintained_at.isoformat(), "z_order_columns": record.z_order_columns},
+    )
+
+
+# Planning
+
+
+@dataclass
+class MaintenancePlan:
+    """What a pass would do to one table, and how many bytes it rewrites."""
+
+    table_id: int
+    table_name: str
+    z_order_columns: list[str]
+    rewrite_bytes: int
+    small_file_count: int
+    clustered_by: list[str]  # the Z-order the table keeps afterwards
+
+
+def in_quiet_hours(now: datetime, window: str = QUIET_HOURS) -> bool:
+    """Whether *now* falls in the ``"start-end"`` hour window (end exclusive, may wrap midnight)."""
+    try:
+        start, end = (int(hour) for hour in window.split("-"))
+    except ValueError:
+        logger.warning("Invalid catalog maintenance hours %r; maintenance is paused", window)
+        return False
+    if start <= end:
+        return start <= now.hour < end
+    return now.hour >= start or now.hour < end
+
+
+def plan_table_maintenance(
+    table_id: int,
+    table_name: str,
+    stats: TableFileStats,
+    z_order_candidates: list[str],
+    last: MaintenanceRecord | None,
+) -> MaintenancePlan | None:
+    """Decide whether a table needs maintenance, or ``None`` when it does not.
+
+    Compaction is due past ``MIN_SMALL_FILES`` small files. A Z-order rewrites the
+    whole table, so it only runs when the most-filtered columns differ from the
+    ones the table was last Z-ordered on; otherwise compaction keeps that order.
+    """
+    last_z_order = last.z_order_columns if last is not None else []
+    z_order_due = bool(z_order_candidates) and z_order_candidates != last_z_order
+    z_order_due = z_order_due and stats.file_count >= MIN_ZORDER_FILES
+    if not z_order_due and stats.small_file_count < MIN_SMALL_FILES:
+        return None
+    return MaintenancePlan(
+        table_id=table_id,
+        table_name=table_name,
+        z_order_columns=z_order_candidates if z_order_due else [],
+        rewrite_bytes=stats.total_bytes if z_order_due else stats.small_file_bytes,
+        small_file_count=stats.small_file_count,
+        clustered_by=z_order_candidates if z_order_due else last_z_order,
+    )
+
+
+def _plan_for_table(table: CatalogTable, now: datetime) -> MaintenancePlan | None:
+    if getattr(table, "table_type", "physical") == "virtual" or table.storage_format != "delta" or not table.file_path:
+        return None
+    last = read_maintenance_record(table.id)
+    if last is not None and now - last.maintained_at < COOLDOWN:
+        return None
+    is_cloud = _is_cloud_uri(table.file_path)
+    if not is_cloud and not is_delta_table(table.file_path):
+        return None
+    storage_options = (resolve_for_namespace(table.namespace_id).storage_options or None) if is_cloud else None
+
+    delta = open_delta_table(table.file_path, storage_options=storage_options)
+    # Delta cannot Z-order on partition columns.
+    eligible = {f.name for f in delta.schema().fields} - set(delta.metadata().partition_columns)
+    z_order = [column for column in most_filtered_columns(table.id) if column in eligible]
+    return plan_table_maintenance(table.id, table.name, table_file_stats(delta), z_order, last)
+
+
+def plan_maintenance(repo: CatalogRepository, now: datetime) -> list[MaintenancePlan]:
+    """The tables due for maintenance, most small files first."""
+    plans: list[MaintenancePlan] = []
+    for table in repo.list_tables():
+        try:
+            plan = _plan_for_table(table, now)
+        except Exception:
+            logger.warning("Could not read the file layout of catalog table %s", table.name, exc_info=True)
+            continue
+        if plan is not None:
+            plans.append(plan)
+    plans.sort(key=lambda plan: (-plan.small_file_count, plan.table_id))
+    return plans
+
+
+# Background service
+
+
+class CatalogMaintenance:
+    """Runs maintenance passes on a background thread every ``interval_seconds``."""
+
+    def __init__(self, interval_seconds: int = PASS_INTERVAL_SECONDS) -> None:
+        self.interval_seconds = interval_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="catalog-maintenance", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.run_pass()
+            except Exception:
+                logger.exception("Catalog maintenance pass failed")
+
+    def run_pass(self, now: datetime | None = None) -> list[MaintenancePlan]:
+        """Maintain the tables that are due, within the pass budget. Returns what was done."""
+        now = now or datetime.now()
+        if not in_quiet_hours(now, QUIET_HOURS):
+            return []
+        done: list[MaintenancePlan] = []
+        bytes_left = MAX_BYTES_PER_PASS
+        with get_db_context() as db:
+            repo = SQLAlchemyCatalogRepository(db)
+            service = CatalogService(repo)
+            for plan in plan_maintenance(repo, now):
+                if len(done) >= MAX_TABLES_PER_PASS or self._stop.is_set():
+                    break
+                if plan.rewrite_bytes > bytes_left:
+                    continue
+                if repo.list_active_runs():
+                    logger.info("Catalog maintenance paused: a flow run is active")
+                    break
+                try:
+                    service.optimize_table(plan.table_id, plan.z_order_columns or None)
+                    service.vacuum_table(plan.table_id, retention_hours=VACUUM_RETENTION_HOURS, dry_run=False)
+                except Exception:
+                    logger.warning("Maintenance of catalog table %s failed", plan.table_name, exc_info=True)
+                    continue
+                write_maintenance_record(plan.table_id, MaintenanceRecord(now, plan.clustered_by))
+                logger.info(
+                    "Maintained catalog table %s (%d small files%s)",
+                    plan.table_name,
+                    plan.small_file_count,
+                    f", Z-ordered by {', '.join(plan.z_order_columns)}" if plan.z_order_columns else "",
+                )
+                bytes_left -= plan.rewrite_bytes
+                done.append(plan)
+        return done
@@ -6,7 +6,6 @@ import logging
 from pathlib import Path
 
 import polars as pl
-from deltalake import DeltaTable
 from deltalake.exceptions import DeltaError
 
 from flowfile_core.catalog.delta_utils import (
@@ -39,7 +38,7 @@ from flowfile_core.schemas.catalog_schema import (
     DeltaTableHistory,
 )
 from flowfile_core.utils.arrow_reader import read_top_n
-from shared.delta_utils import validate_catalog_path
+from shared.delta_utils import open_delta_table, scan_delta_table, validate_catalog_path
 from shared.storage_config import storage
 
 logger = logging.getLogger(__name__)
@@ -194,7 +193,7 @@ class TablePreviewService:
                 logger.warning("Worker delta version preview failed, falling back to local", exc_info=True)
 
         try:
-            delta_table = DeltaTable(table_path, version=version, storage_options=storage_options)
+            delta_table = open_delta_table(table_path, version=version, storage_options=storage_options)
             pa_table = delta_table.to_pyarrow_dataset().head(limit)
         except (FileNotFoundError, DeltaError) as exc:
             logger.info("Delta version %s unavailable for %s: %s", version, table_path, exc)
@@ -221,7 +220,7 @@ class TablePreviewService:
             except (RuntimeError, OSError, ValueError, KeyError):
                 logger.warning("Worker delta preview failed, falling back to local", exc_info=True)
 
-        pa_table = pl.scan_delta(table_path, storage_options=storage_options).head(limit).collect().to_arrow()
+        pa_table = scan_delta_table(table_path, storage_options=storage_options).head(limit).collect().to_arrow()
         return format_pyarrow_preview(pa_table, total_rows=total_rows)
 
     def get_table_history(self, table_id: int, limit: int | None = None) -> DeltaTableHistory:
@@ -247,7 +246,7 @@ class TablePreviewService:
             except (RuntimeError, OSError, ValueError, KeyError):
                 logger.warning("Worker delta history read failed, falling back to local", exc_info=True)
 
-        delta_table = DeltaTable(table_path, without_files=True, storage_options=storage_options)
+        delta_table = open_delta_table(table_path, storage_options=storage_options, without_files=True)
         raw_history = delta_table.history(limit)
         current_version = delta_table.version()
         history = parse_delta_history(raw_history)
@@ -23,7 +23,7 @@ from flowfile_core.schemas.catalog_schema import (
     PaginatedFlowRuns,
 )
 from shared.run_logs import SUBPROCESS_RUN_TYPES, run_log_path
-from shared.subprocess_utils import spawn_flow_subprocess
+from shared.subprocess_utils import cancel_runner_run, runner_run_state, spawn_flow_subprocess
 
 logger = logging.getLogger(__name__)
 
@@ -324,7 +324,13 @@ class FlowRunService:
         if run is None:
             raise RunNotFoundError(run_id=run_id)
 
-        if run.pid is not None:
+        if run.pid is not None and runner_run_state(run_id, run.pid) is not None:
+            # A warm runner member: its PID outlives the run, so only the runner may stop it.
+            if cancel_runner_run(run_id):
+                logger.info("Cancelled run %s on flow runner member pid %s", run_id, run.pid)
+            else:
+                logger.info("Run %s is no longer running on flow runner member pid %s", run_id, run.pid)
+        elif run.pid is not None:
             try:
                 os.kill(run.pid, signal.SIGTERM)
                 logger.info("Sent SIGTERM to pid %s for run %s", run.pid, run_id)
@@ -31,6 +31,15 @@ def _project_sync_schedule(registration_id: int, owner_id: int) -> None:
     project_sync.schedule_changed(registration_id, owner_id)
 
 
+def _wake_scheduler() -> None:
+    """Have the embedded scheduler tick now (no-op when it runs standalone or not at all)."""
+    from flowfile_core.scheduler import get_scheduler
+
+    scheduler = get_scheduler()
+    if scheduler is not None:
+        scheduler.wake()
+
+
 class ScheduleService:
     """Owns schedule CRUD, manual triggers, and the push path of table_trigger fan-out."""
 
@@ -178,6 +187,7 @@ class ScheduleService:
             self.repo.set_trigger_table_ids(schedule.id, trigger_table_ids)
 
         _project_sync_schedule(registration_id, owner_id)
+        _wake_scheduler()
         return self._schedule_to_out(schedule)
 
     def update_schedule(
@@ -216,6 +226,7 @@ class ScheduleService:
             schedule.description = description
         schedule = self.repo.update_schedule(schedule)
         _project_sync_schedule(schedule.registration_id, schedule.owner_id)
+        _wake_scheduler()
         return self._schedule_to_out(schedule)
 
     def delete_schedule(self, schedule_id: int) -> None:
@@ -226,6 +237,7 @@ class ScheduleService:
         registration_id, owner_id = schedule.registration_id, schedule.owner_id
         self.repo.delete_schedule(schedule_id)
         _project_sync_schedule(registration_id, owner_id)
+        _wake_scheduler()
 
     def get_schedule(self, schedule_id: int) -> FlowScheduleOut:
         """Get a schedule by ID."""
@@ -319,7 +331,9 @@ class ScheduleService:
 
         Routes through the facade's ``_fire_table_trigger_schedules`` when
         bound so test monkeypatches on that method (used to mock subprocess
-        spawning) take effect.
+        spawning) take effect. The embedded scheduler is woken afterwards so
+        table_set_trigger schedules, which have no push path, see the write
+        without waiting for the next poll.
         """
         try:
             if self._facade is not None:
@@ -328,3 +342,4 @@ class ScheduleService:
                 self.fire_table_trigger_schedules(table_id, table_updated_at)
         except Exception:
             logger.exception("Push trigger fan-out failed for table %s", table_id)
+        _wake_scheduler()
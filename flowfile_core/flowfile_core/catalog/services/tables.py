@@ -9,7 +9,6 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
-from deltalake import DeltaTable
 from pyarrow import dataset as ds
 from sqlalchemy.orm.attributes import flag_modified
 
@@ -59,6 +58,7 @@ from flowfile_core.schemas.catalog_schema import (
     VacuumTableResponse,
     scd2_system_columns_missing,
 )
+from shared.delta_utils import open_delta_table
 from shared.storage_config import storage
 
 if TYPE_CHECKING:
@@ -289,7 +289,7 @@ class TableService:
         path = Path(table_path)
 
         if storage_format == "delta" or (storage_format is None and is_delta_table(path)):
-            delta_table = DeltaTable(str(path))
+            delta_table = open_delta_table(path)
             pa_schema = delta_table.schema().to_arrow()
             schema_list = [{"name": field.name, "dtype": str(field.type)} for field in pa_schema]
             row_count = delta_table.to_pyarrow_dataset().count_rows()
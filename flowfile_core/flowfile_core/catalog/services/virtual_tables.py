@@ -42,7 +42,7 @@ from flowfile_core.flowfile.flow_data_engine.subprocess_operations.subprocess_op
     trigger_resolve_virtual_table,
 )
 from flowfile_core.schemas.catalog_schema import CatalogTableMaterializeResult, CatalogTableOut
-from shared.delta_utils import validate_catalog_path
+from shared.delta_utils import scan_delta_table, validate_catalog_path
 from shared.storage_config import storage
 
 if TYPE_CHECKING:
@@ -409,9 +409,9 @@ class VirtualTableService:
             return None
         if t.file_path and _is_cloud_uri(t.file_path):
             target = resolve_for_namespace(t.namespace_id)
-            return pl.scan_delta(t.file_path, storage_options=target.storage_options or None)
+            return scan_delta_table(t.file_path, storage_options=target.storage_options or None)
         if t.file_path and is_delta_table(Path(t.file_path)):
-            return pl.scan_delta(t.file_path)
+            return scan_delta_table(t.file_path)
         return None
 
     def resolve_virtual_flow_table(
@@ -21,6 +21,12 @@ SINGLE_FILE_MODE: MutableBool = MutableBool(os.environ.get("FLOWFILE_SINGLE_FILE
 # Offload to worker flag, this determines if the worker should handle processing tasks.
 OFFLOAD_TO_WORKER: MutableBool = MutableBool(os.environ.get("FLOWFILE_OFFLOAD_TO_WORKER", "1") == "1")
 
+# Opt-in: key worker results of deterministic nodes on a flow-independent hash, so flows
+# that share sub-plans (same sources, same steps) compute them once and reuse the result.
+SHARE_WORKER_RESULTS: MutableBool = MutableBool(
+    os.environ.get("FLOWFILE_SHARE_WORKER_RESULTS", "0").strip().lower() in ("true", "1", "yes", "on")
+)
+
 # Master switch gating the entire `/ai/*` router; mutable so the admin endpoint can flip it live.
 FEATURE_FLAG_AI: MutableBool = MutableBool(
     os.environ.get("FEATURE_FLAG_AI", "1").strip().lower() in ("true", "1", "yes", "on")
@@ -118,6 +124,18 @@ def get_community_artifact_fallback() -> str:
     )
 
 
+def get_join_max_estimated_rows() -> int:
+    """Opt-in limit: joins with verify_integrity estimated over it are refused. 0 (the default) skips the check.
+
+    Saved joins default to verify_integrity, so the estimate (a profiling pass over both
+    inputs) only runs where this limit is set.
+    """
+    try:
+        return max(0, int(os.environ.get("FLOWFILE_JOIN_MAX_ESTIMATED_ROWS", "0")))
+    except ValueError:
+        return 0
+
+
 def get_community_cache_ttl() -> int:
     try:
         return int(os.environ.get("FLOWFILE_COMMUNITY_CACHE_TTL", "3600"))
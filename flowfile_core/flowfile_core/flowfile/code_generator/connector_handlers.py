@@ -140,6 +140,8 @@ class ConnectorHandlersMixin(ConverterMixinBase):
             self._add_code(f"    schema_name={self._py_str(db_settings.schema_name)},")
         if db_settings.if_exists:
             self._add_code(f"    if_exists={self._py_str(db_settings.if_exists)},")
+        if db_settings.merge_keys:
+            self._add_code(f"    merge_keys={db_settings.merge_keys!r},")
         self._add_code(")")
         self._add_code(f"{var_name} = {input_df}")
         self._add_code("")
@@ -263,6 +265,8 @@ class ConnectorHandlersMixin(ConverterMixinBase):
             p["max_records"] = pagination.max_records
         if pagination.page_delay_seconds:
             p["page_delay_seconds"] = pagination.page_delay_seconds
+        if pagination.max_concurrency != 1:
+            p["max_concurrency"] = pagination.max_concurrency
         return repr(p)
 
     def _handle_catalog_reader(
@@ -288,6 +292,8 @@ class ConnectorHandlersMixin(ConverterMixinBase):
 
         suffix = ".data" if self.framework == "pl" else ""
         self._add_code(f"# Read from catalog table: {table_name}")
+        if settings.read_mode == "incremental":
+            self._add_code("# Incremental read mode is not exported: this reads the whole table")
         self._add_code(f"{var_name} = ff.read_catalog_table(")
         self._add_code(f"    {self._py_str(table_name)},")
         if settings.catalog_namespace_id is not None:
@@ -23,6 +23,7 @@ from pyarrow.parquet import ParquetFile
 
 from flowfile_core.configs import logger
 from flowfile_core.configs.flow_logger import NodeLogger
+from flowfile_core.configs.settings import get_join_max_estimated_rows
 from flowfile_core.flowfile.flow_data_engine import utils
 from flowfile_core.flowfile.flow_data_engine.cloud_storage_reader import (
     CloudStorageReader,
@@ -41,9 +42,13 @@ from flowfile_core.flowfile.flow_data_engine.flow_file_column.utils import (
 )
 from flowfile_core.flowfile.flow_data_engine.fuzzy_matching.prepare_for_fuzzy_match import prepare_for_fuzzy_match
 from flowfile_core.flowfile.flow_data_engine.join import (
+    JoinEstimate,
+    check_join_estimate,
+    estimate_join,
     get_col_name_to_delete,
     get_join_map_problems,
     get_undo_rename_mapping_join,
+    profile_join_keys,
     rename_df_table_for_join,
     verify_join_select_integrity,
 )
@@ -53,7 +58,8 @@ from flowfile_core.flowfile.flow_data_engine.subprocess_operations.subprocess_op
     ExternalCreateFetcher,
     ExternalDfFetcher,
     ExternalFuzzyMatchFetcher,
-    fetch_unique_values,
+    ExternalGraphSolverFetcher,
+    clear_task_from_worker,
 )
 from flowfile_core.flowfile.flow_data_engine.threaded_processes import write_threaded
 from flowfile_core.flowfile.schema_callbacks import _ensure_all_columns_have_select
@@ -61,7 +67,6 @@ from flowfile_core.flowfile.sources.external_sources.base_class import ExternalD
 from flowfile_core.schemas import cloud_storage_schemas, input_schema
 from flowfile_core.schemas import transform_schema as transform_schemas
 from flowfile_core.schemas.schemas import ExecutionLocationsLiteral, get_global_execution_location
-from flowfile_core.utils.arrow_reader import read as arrow_read
 from flowfile_core.utils.utils import ensure_similarity_dicts
 from shared.cloud_storage import (
     get_lazy_frame_from_gcs_pyarrow_dataset,
@@ -70,6 +75,8 @@ from shared.cloud_storage import (
 from shared.cloud_storage.utils import normalize_delta_path
 from shared.cloud_storage.writers import write_to_cloud
 from shared.db_writer import write_dataframe_to_database
+from shared.fuzzy_blocking import blocked_fuzzy_match
+from shared.graph_components import GRAPH_STATE_DIR, connected_components, label_rows
 from shared.path_utils import DirectoryScanUnsupportedError, assert_directory_scan_supported, is_url
 
 T = TypeVar("T", pl.DataFrame, pl.LazyFrame)
@@ -462,7 +469,9 @@ class FlowDataEngine:
             logger=logger,
         )
 
-    def to_database_obj(self, *, database_type: str, uri: str, table_name: str, if_exists: str) -> None:
+    def to_database_obj(
+        self, *, database_type: str, uri: str, table_name: str, if_exists: str, merge_keys: list[str] | None = None
+    ) -> None:
         """Writes the DataFrame to a SQL database in-process (local execution path)."""
         logger.info(f"Writing to {database_type} table {table_name}")
         write_dataframe_to_database(
@@ -471,6 +480,7 @@ class FlowDataEngine:
             uri=uri,
             table_name=table_name,
             if_exists=if_exists,
+            merge_keys=merge_keys,
         )
 
     @classmethod
@@ -1412,30 +1422,20 @@ class FlowDataEngine:
     def do_pivot(self, pivot_input: transform_schemas.PivotInput, node_logger: NodeLogger = None) -> FlowDataEngine:
         """Converts the DataFrame from a long to a wide format, aggregating values.
 
+        The data is aggregated per index and pivot value in a single group-by, run on the
+        worker when one is available. The native Polars pivot then spreads that result
+        into one column per pivot value, found while spreading, so there is no separate
+        pass to discover the values and no cap on how many there are. A null pivot value
+        gets no column, matching the pivot schema callback; its index rows are still kept.
+
         Args:
             pivot_input: A `PivotInput` object defining the index, pivot, and value
                 columns, along with the aggregation logic.
-            node_logger: An optional logger for reporting warnings, e.g., if the
-                pivot column has too many unique values.
+            node_logger: An optional logger for reporting progress.
 
         Returns:
             A new, pivoted `FlowDataEngine` instance.
         """
-        max_unique_vals = 200
-        new_cols_unique = fetch_unique_values(
-            self.data_frame.select(pivot_input.pivot_column)
-            .unique()
-            .sort(pivot_input.pivot_column)
-            .limit(max_unique_vals)
-            .cast(pl.String)
-        )
-        if len(new_cols_unique) >= max_unique_vals:
-            if node_logger:
-                node_logger.warning(
-                    "Pivot column has too many unique values. Please consider using a different column."
-                    f" Max unique values: {max_unique_vals}"
-                )
-
         if len(pivot_input.index_columns) == 0:
             no_index_cols = True
             pivot_input.index_columns = ["__temp__"]
@@ -1444,36 +1444,37 @@ class FlowDataEngine:
             no_index_cols = False
             ff = self
 
-        index_columns = pivot_input.get_index_columns()
         grouped_ff = ff.do_group_by(pivot_input.get_group_by_input(), False)
-        pivot_column = pivot_input.get_pivot_column()
+        grouped = self._collect_off_core(grouped_ff.data_frame.lazy(), node_logger)
+        if node_logger:
+            node_logger.info(f"Pivoting {grouped.height} aggregated rows")
 
-        input_df = grouped_ff.data_frame.with_columns(pivot_column.cast(pl.String).alias(pivot_input.pivot_column))
-        number_of_aggregations = len(pivot_input.aggregations)
+        # Output columns follow the pivot values' own sort order (numbers numerically), named as text.
+        pivot_values = (
+            grouped.get_column(pivot_input.pivot_column).unique().drop_nulls().sort().cast(pl.String).to_list()
+        )
+        aggregations = pivot_input.aggregations
+        wide = grouped.with_columns(pl.col(pivot_input.pivot_column).cast(pl.String)).pivot(
+            on=pivot_input.pivot_column,
+            index=pivot_input.index_columns,
+            values=aggregations,
+            aggregate_function=None,
+        )
         # Aggregations where missing combinations should be filled with 0 to match
         # native polars pivot behavior (polars >= 1.32)
         _zero_fill_aggs = {"sum", "count", "len"}
-        df = (
-            input_df.select(*index_columns, pivot_column, pivot_input.get_values_expr())
-            .group_by(*index_columns)
-            .agg(
-                [
-                    (pl.col("vals").filter(pivot_column == new_col_value)).first().alias(new_col_value)
-                    for new_col_value in new_cols_unique
-                ]
-            )
-            .select(
-                *index_columns,
-                *[
-                    (
-                        pl.col(new_col).struct.field(agg).fill_null(0)
-                        if agg in _zero_fill_aggs
-                        else pl.col(new_col).struct.field(agg)
-                    ).alias(f'{new_col + "_" + agg if number_of_aggregations > 1 else new_col}')
-                    for new_col in new_cols_unique
-                    for agg in pivot_input.aggregations
-                ],
-            )
+        number_of_aggregations = len(aggregations)
+        df = wide.select(
+            *pivot_input.index_columns,
+            *[
+                (
+                    pl.col(value if number_of_aggregations == 1 else f"{agg}_{value}").fill_null(0)
+                    if agg in _zero_fill_aggs
+                    else pl.col(value if number_of_aggregations == 1 else f"{agg}_{value}")
+                ).alias(f"{value}_{agg}" if number_of_aggregations > 1 else value)
+                for value in pivot_values
+                for agg in aggregations
+            ],
         )
 
         if no_index_cols:
@@ -1482,6 +1483,29 @@ class FlowDataEngine:
 
         return FlowDataEngine(df, calculate_schema_stats=False)
 
+    @staticmethod
+    def _collect_off_core(lf: pl.LazyFrame, node_logger: NodeLogger | None = None) -> pl.DataFrame:
+        """Collects *lf* on the worker, tagged with *node_logger*'s flow and node.
+
+        The result is read into memory and the worker's result file is cleared straight
+        away. When the worker cannot deliver, *lf* is collected in core with the streaming
+        engine and a warning says so, since that collect now competes for core memory.
+        """
+        flow_id, node_id = (node_logger.flow_id, node_logger.node_id) if node_logger else (-1, -1)
+        external = None
+        try:
+            external = ExternalDfFetcher(lf=lf, flow_id=flow_id, node_id=node_id, wait_on_completion=True)
+            if external.status is not None and external.status.status == "Completed":
+                return pl.read_ipc(external.status.file_ref, memory_map=False)
+            reason = external.error_description or f"status {external.status.status if external.status else None}"
+        except Exception as e:  # noqa: BLE001 - fall back to core below, loudly
+            reason = str(e)
+        finally:
+            if external is not None:
+                clear_task_from_worker(external.file_ref)
+        (node_logger or logger).warning(f"Worker collect failed ({reason}); collecting in the core process instead")
+        return lf.collect(engine="streaming")
+
     def do_filter(self, predicate: str) -> FlowDataEngine:
         """Filters rows based on a predicate expression.
 
@@ -1939,6 +1963,7 @@ class FlowDataEngine:
             wait_on_completion=False,
             flow_id=flow_id,
             node_id=node_id,
+            blocking=fuzzy_match_input_manager.blocking,
         )
 
     def fuzzy_join_external(
@@ -1964,6 +1989,7 @@ class FlowDataEngine:
             wait_on_completion=False,
             flow_id=flow_id,
             node_id=node_id,
+            blocking=fuzzy_match_input_manager.blocking,
         )
         return FlowDataEngine(external_tracker.get_result())
 
@@ -1978,11 +2004,15 @@ class FlowDataEngine:
             left=self, right=other, fuzzy_match_input_manager=fuzzy_match_input_manager
         )
         fuzzy_mappings = [FuzzyMapping(**fm.__dict__) for fm in fuzzy_match_input_manager.fuzzy_maps]
-        return FlowDataEngine(
-            fuzzy_match_dfs(
-                left_df, right_df, fuzzy_maps=fuzzy_mappings, logger=node_logger.logger if node_logger else logger
-            ).lazy()
-        )
+        match_logger = node_logger.logger if node_logger else logger
+        blocking = fuzzy_match_input_manager.blocking
+        if blocking is not None:
+            matches = blocked_fuzzy_match(
+                left_df, right_df, fuzzy_maps=fuzzy_mappings, blocking=blocking, logger=match_logger
+            )
+        else:
+            matches = fuzzy_match_dfs(left_df, right_df, fuzzy_maps=fuzzy_mappings, logger=match_logger)
+        return FlowDataEngine(matches.lazy())
 
     def do_cross_join(
         self,
@@ -1998,7 +2028,8 @@ class FlowDataEngine:
         Args:
             cross_join_input: A `CrossJoinInput` object specifying column selections.
             auto_generate_selection: If True, automatically renames columns to avoid conflicts.
-            verify_integrity: If True, checks if the resulting join would be too large.
+            verify_integrity: If True and `FLOWFILE_JOIN_MAX_ESTIMATED_ROWS` is set, checks if the
+                resulting join would be too large.
             other: The right `FlowDataEngine` to join with.
 
         Returns:
@@ -2010,6 +2041,13 @@ class FlowDataEngine:
         """
         self.lazy = True
         other.lazy = True
+        max_rows = get_join_max_estimated_rows()
+        if verify_integrity and max_rows:
+            left_rows = self.get_number_of_records(calculate_in_worker_process=True)
+            right_rows = other.get_number_of_records(calculate_in_worker_process=True)
+            if left_rows >= 0 and right_rows >= 0:
+                # A cross join multiplies by design, so only the hard limit applies, not the explosion warning.
+                check_join_estimate(JoinEstimate("cross", left_rows, right_rows, left_rows * right_rows, []), max_rows)
         cross_join_input_manager = transform_schemas.CrossJoinInputManager(cross_join_input)
         _ensure_all_columns_have_select(
             left_cols=self.columns, right_cols=other.columns, manager=cross_join_input_manager
@@ -2048,8 +2086,16 @@ class FlowDataEngine:
         auto_generate_selection: bool,
         verify_integrity: bool,
         other: FlowDataEngine,
+        node_logger: NodeLogger = None,
+        input_hashes: tuple[str, str] | None = None,
     ) -> FlowDataEngine:
-        """Performs a standard SQL-style join with another DataFrame."""
+        """Performs a standard SQL-style join with another DataFrame.
+
+        With `verify_integrity` and the opt-in `FLOWFILE_JOIN_MAX_ESTIMATED_ROWS` set, the output
+        size is estimated from sketches of both inputs' join keys first. The join is refused
+        when the estimate exceeds the limit, and many-to-many explosions are logged with their
+        hot keys. `input_hashes` (the input nodes' data fingerprints) lets unchanged inputs reuse their sketch.
+        """
         join_manager = transform_schemas.JoinInputManager(join_input)
         _ensure_all_columns_have_select(left_cols=self.columns, right_cols=other.columns, manager=join_manager)
         join_manager.set_join_keys()
@@ -2076,6 +2122,9 @@ class FlowDataEngine:
             # -1 = unknown (not 0): a 0 here reads as a real "empty result" count.
             return FlowDataEngine(joined_df, calculate_schema_stats=False, number_of_records=-1, streamable=False)
 
+        if verify_integrity:
+            self._verify_join_size(other, join_manager, input_hashes or (None, None), node_logger)
+
         if auto_generate_selection:
             join_manager.auto_rename()
 
@@ -2129,6 +2178,61 @@ class FlowDataEngine:
         # -1 = unknown (not 0): a 0 here reads as a real "empty result" count.
         return FlowDataEngine(joined_df, calculate_schema_stats=False, number_of_records=-1, streamable=False)
 
+    def _verify_join_size(
+        self,
+        other: FlowDataEngine,
+        join_manager: transform_schemas.JoinInputManager,
+        input_hashes: tuple[str | None, str | None],
+        node_logger: NodeLogger | None,
+    ) -> None:
+        """Estimate the join's output from key sketches; raise when it is over the limit."""
+        max_rows = get_join_max_estimated_rows()
+        known_rows = [n for n in (self.number_of_records, other.number_of_records) if n is not None and n >= 0]
+        # Both sizes known and even a full cross product fits: nothing to estimate.
+        if not max_rows or (len(known_rows) == 2 and known_rows[0] * known_rows[1] <= max_rows):
+            return
+        left_schema, right_schema = self.data_frame.collect_schema(), other.data_frame.collect_schema()
+        left_keys, right_keys = [], []
+        for i, jm in enumerate(join_manager.join_mapping):
+            left_type, right_type = left_schema[jm.left_col], right_schema[jm.right_col]
+            # Hashes only line up when both sides hash the same type.
+            if left_type == right_type:
+                cast_to = None
+            elif left_type.is_numeric() and right_type.is_numeric():
+                cast_to = pl.Float64
+            else:
+                cast_to = pl.String
+            left_col, right_col = pl.col(jm.left_col), pl.col(jm.right_col)
+            if cast_to is not None:
+                left_col, right_col = left_col.cast(cast_to), right_col.cast(cast_to)
+            left_keys.append(left_col.alias(f"key_{i}"))
+            right_keys.append(right_col.alias(f"key_{i}"))
+        key_names = [f"key_{i}" for i in range(len(left_keys))]
+        key_spec = str(left_keys + right_keys)
+        left_hash, right_hash = input_hashes
+
+        def collect(lf: pl.LazyFrame) -> pl.DataFrame:
+            return self._collect_off_core(lf, node_logger)
+
+        left_profile = profile_join_keys(
+            self.data_frame.select(left_keys),
+            key_names,
+            collect=collect,
+            cache_key=f"{left_hash}:{key_spec}" if left_hash else None,
+        )
+        right_profile = profile_join_keys(
+            other.data_frame.select(right_keys),
+            key_names,
+            collect=collect,
+            cache_key=f"{right_hash}:{key_spec}" if right_hash else None,
+        )
+        estimate = estimate_join(left_profile, right_profile, join_manager.how)
+        (node_logger or logger).info(
+            f"Join estimate: about {estimate.output_rows:,} rows from {estimate.left_rows:,} x {estimate.right_rows:,}"
+        )
+        if (warning := check_join_estimate(estimate, max_rows)) is not None:
+            (node_logger or logger).warning(warning)
+
     def solve_graph(self, graph_solver_input: transform_schemas.GraphSolverInput) -> FlowDataEngine:
         """Solves a graph problem represented by 'from' and 'to' columns.
 
@@ -2136,11 +2240,17 @@ class FlowDataEngine:
 
         Args:
             graph_solver_input: A `GraphSolverInput` object defining the source,
-                destination, and output column names.
+                destination, and output column names, and the solving strategy.
 
         Returns:
             A new `FlowDataEngine` instance with the solved graph data.
         """
+        g = graph_solver_input
+        if g.strategy == "partitioned" or g.state_name:
+            state_path = GRAPH_STATE_DIR / f"{g.state_name}.parquet" if g.state_name else None
+            lf = self.data_frame.lazy()
+            labels = connected_components(lf, g.col_from, g.col_to, state_path=state_path)
+            return FlowDataEngine(label_rows(lf, g.col_from, g.col_to, labels, g.output_column_name))
         lf = self.data_frame.with_columns(
             graph_solver(graph_solver_input.col_from, graph_solver_input.col_to).alias(
                 graph_solver_input.output_column_name
@@ -2148,6 +2258,39 @@ class FlowDataEngine:
         )
         return FlowDataEngine(lf)
 
+    def start_solve_graph(
+        self,
+        graph_solver_input: transform_schemas.GraphSolverInput,
+        file_ref: str,
+        flow_id: int = -1,
+        node_id: int | str = -1,
+    ) -> ExternalGraphSolverFetcher:
+        """Starts the partitioned graph solver in a worker process.
+
+        Args:
+            graph_solver_input: A `GraphSolverInput` object defining the source,
+                destination, and output column names, and the state table.
+            file_ref: A reference string for temporary files.
+            flow_id: The flow ID for tracking.
+            node_id: The node ID for tracking.
+
+        Returns:
+            An `ExternalGraphSolverFetcher` object that can be used to track the
+            progress and retrieve the labelled data.
+        """
+        g = graph_solver_input
+        return ExternalGraphSolverFetcher(
+            self.data_frame,
+            col_from=g.col_from,
+            col_to=g.col_to,
+            output_column_name=g.output_column_name,
+            state_name=g.state_name,
+            flow_id=flow_id,
+            node_id=node_id,
+            file_ref=file_ref + "_gs",
+            wait_on_completion=False,
+        )
+
     def add_new_values(self, values: Iterable, col_name: str = None) -> FlowDataEngine:
         """Adds a new column with the provided values.
 
@@ -2635,38 +2778,22 @@ class FlowDataEngine:
         FlowDataEngine._assert_rename_has_no_duplicates(rename_map, columns)
         return rename_map
 
-    def _peek_first_row_as_dict(self) -> dict[str, Any]:
+    def _peek_first_row_as_dict(self, node_logger: NodeLogger | None = None) -> dict[str, Any]:
         """Return the first row of the underlying frame keyed by column name.
 
-        Runs on the external worker via `ExternalDfFetcher` to keep the heavy
-        compute out of the core process (same pattern as `fetch_unique_values`
-        used by `do_pivot`). Falls back to an in-core collect only if the
-        external fetcher is unavailable. Raises `ValueError` if the frame is
-        empty.
+        Runs on the external worker via `_collect_off_core` to keep the heavy
+        compute out of the core process. Raises `ValueError` if the frame is empty.
         """
         df = self.data_frame
         lf = df.lazy() if isinstance(df, pl.DataFrame) else df
-        head_lf = lf.head(1)
-
-        table = None
-        try:
-            external = ExternalDfFetcher(lf=head_lf, flow_id=1, node_id=-1, wait_on_completion=True)
-            if external.status is not None and external.status.status == "Completed":
-                table = arrow_read(external.status.file_ref)
-        except Exception as e:  # noqa: BLE001 - worker availability is best-effort
-            logger.debug(f"ExternalDfFetcher unavailable for first_row peek ({e}); using in-core fallback")
-
-        if table is not None:
-            if table.num_rows == 0:
-                raise ValueError("Dynamic rename (first_row) requires at least one row in the input; got 0.")
-            return {name: table.column(name)[0].as_py() for name in table.column_names}
-
-        head = head_lf.collect()
+        head = self._collect_off_core(lf.head(1), node_logger)
         if head.height == 0:
             raise ValueError("Dynamic rename (first_row) requires at least one row in the input; got 0.")
         return dict(zip(head.columns, head.row(0), strict=True))
 
-    def apply_dynamic_rename(self, settings: transform_schemas.DynamicRenameInput) -> FlowDataEngine:
+    def apply_dynamic_rename(
+        self, settings: transform_schemas.DynamicRenameInput, node_logger: NodeLogger | None = None
+    ) -> FlowDataEngine:
         """Renames a subset of columns according to a single rule.
 
         Supports prefix, suffix, flowfile-formula, and first-row rename modes, with
@@ -2676,6 +2803,7 @@ class FlowDataEngine:
 
         Args:
             settings: The dynamic rename configuration.
+            node_logger: An optional logger; tags the worker task that reads the first row.
 
         Returns:
             A new `FlowDataEngine` with the renamed columns (or this instance's DataFrame
@@ -2684,7 +2812,7 @@ class FlowDataEngine:
         columns = [(c.column_name, c.data_type_group) for c in self.schema]
         first_row_values = None
         if settings.rename_mode == "first_row":
-            first_row_values = self._peek_first_row_as_dict()
+            first_row_values = self._peek_first_row_as_dict(node_logger)
         rename_map = self.resolve_dynamic_rename_map(columns, settings, first_row_values=first_row_values)
         new_df = self.data_frame.rename(rename_map) if rename_map else self.data_frame
         if settings.rename_mode == "first_row":
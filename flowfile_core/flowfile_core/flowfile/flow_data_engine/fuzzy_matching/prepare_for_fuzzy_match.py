@@ -4,6 +4,7 @@ import polars as pl
 
 from flowfile_core.flowfile.flow_data_engine.join import get_join_map_problems, verify_join_select_integrity
 from flowfile_core.schemas.transform_schema import FuzzyMatchInputManager, JoinInputs, SelectInput
+from shared.fuzzy_blocking import block_key_selects
 
 if TYPE_CHECKING:
     from flowfile_core.flowfile.flow_data_engine.flow_data_engine import FlowDataEngine
@@ -58,7 +59,8 @@ def prepare_for_fuzzy_match(
         right: Right FlowDataEngine for fuzzy join
         fuzzy_match_input: Parameters for fuzzy matching configuration
     Returns:
-        Tuple[pl.LazyFrame, pl.LazyFrame]: Prepared left and right lazy frames
+        Tuple[pl.LazyFrame, pl.LazyFrame]: Prepared left and right lazy frames, carrying the exact blocking
+            keys (if any) as extra columns
     """
     left.lazy = True
     right.lazy = True
@@ -73,6 +75,13 @@ def prepare_for_fuzzy_match(
     )
     if join_map_problems:
         raise Exception("Join is not valid: " + "; ".join(join_map_problems))
+    blocking = fuzzy_match_input_manager.blocking
+    if blocking is not None:
+        missing = [k.left_col for k in blocking.exact_keys if k.left_col not in left.columns] + [
+            k.right_col for k in blocking.exact_keys if k.right_col not in right.columns
+        ]
+        if missing:
+            raise Exception(f"Blocking columns not found: {', '.join(missing)}")
 
     fuzzy_match_input_manager.auto_rename()
 
@@ -82,10 +91,11 @@ def prepare_for_fuzzy_match(
     left_select = [
         v.old_name for v in fuzzy_match_input_manager.left_select.renames if (v.keep or v.join_key) and v.is_available
     ]
-    left_df: pl.LazyFrame | pl.DataFrame = left.data_frame.select(left_select).rename(
+    left_block_keys, right_block_keys = block_key_selects(blocking)
+    left_df: pl.LazyFrame | pl.DataFrame = left.data_frame.select(left_select + left_block_keys).rename(
         fuzzy_match_input_manager.left_select.rename_table
     )
-    right_df: pl.LazyFrame | pl.DataFrame = right.data_frame.select(right_select).rename(
+    right_df: pl.LazyFrame | pl.DataFrame = right.data_frame.select(right_select + right_block_keys).rename(
         fuzzy_match_input_manager.right_select.rename_table
     )
     return left_df, right_df
@@ -1,3 +1,15 @@
+from flowfile_core.flowfile.flow_data_engine.join.cardinality import (
+    JoinEstimate as JoinEstimate,
+)
+from flowfile_core.flowfile.flow_data_engine.join.cardinality import (
+    check_join_estimate as check_join_estimate,
+)
+from flowfile_core.flowfile.flow_data_engine.join.cardinality import (
+    estimate_join as estimate_join,
+)
+from flowfile_core.flowfile.flow_data_engine.join.cardinality import (
+    profile_join_keys as profile_join_keys,
+)
 from flowfile_core.flowfile.flow_data_engine.join.utils import (
     get_col_name_to_delete as get_col_name_to_delete,
 )
@@ -0,0 +1,186 @@
+"""Join output-size and skew estimates backing ``verify_integrity``.
+
+Each join input is profiled on its join keys in at most two streaming passes:
+
+1. A bucket sketch: the keys' hash is bucketed into ``_BUCKETS`` buckets, and each
+   bucket records its row count and approximate (HyperLogLog) distinct count. A
+   bucket's row count bounds the count of every key in it.
+2. Only for buckets at or over the hot threshold: the keys in them are counted
+   exactly, which gives the hot keys with their values.
+
+The estimated inner-join size is ``sum(L(k) * R(k))`` over the hot keys of either
+side, plus ``L_rest * R_rest / max(D_left_rest, D_right_rest)`` for the remaining keys.
+That is the textbook uniform estimate, applied only where the data is not skewed.
+Left, right and outer joins keep at least their preserved side.
+
+Profiles are small and are cached per input (node hash + join keys), so a re-run only
+profiles the input that changed.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from threading import Lock
+
+import polars as pl
+
+_BUCKETS = 4096
+_MIN_HOT_ROWS = 1000
+_HOT_KEYS_REPORTED = 5
+_MAX_CACHED_PROFILES = 256
+# Joins that return this many times their larger input are reported as many-to-many explosions.
+WARN_EXPANSION = 10
+
+_BUCKET = "__join_bucket"
+_HASH = "__join_hash"
+
+_profile_cache: OrderedDict[tuple, JoinKeyProfile] = OrderedDict()
+_profile_cache_lock = Lock()
+
+
+@dataclass
+class JoinKeyProfile:
+    """Row and key counts of one join input, with its hot keys counted exactly."""
+
+    n_rows: int
+    n_null_keys: int
+    n_distinct: int
+    bucket_rows: dict[int, int]
+    hot_keys: dict[int, tuple[int, tuple]] = field(default_factory=dict)
+
+    @property
+    def n_matchable(self) -> int:
+        return self.n_rows - self.n_null_keys
+
+    def key_count(self, key_hash: int) -> float:
+        """Exact count of a hot key, otherwise the average key count capped by its bucket."""
+        if key_hash in self.hot_keys:
+            return self.hot_keys[key_hash][0]
+        bucket_rows = self.bucket_rows.get(key_hash % _BUCKETS, 0)
+        return min(bucket_rows, self.n_matchable / max(self.n_distinct, 1))
+
+
+@dataclass
+class JoinEstimate:
+    """Estimated output of a join, with the keys that contribute most to it."""
+
+    how: str
+    left_rows: int
+    right_rows: int
+    output_rows: int
+    hot_keys: list[tuple[tuple, int, int]]
+
+    @property
+    def expansion(self) -> float:
+        return self.output_rows / max(self.left_rows, self.right_rows, 1)
+
+    def describe_hot_keys(self) -> str:
+        return ", ".join(f"{values} ({left:,} x {right:,} rows)" for values, left, right in self.hot_keys)
+
+
+def _collect_streaming(lf: pl.LazyFrame) -> pl.DataFrame:
+    return lf.collect(engine="streaming")
+
+
+def _hot_threshold(n_rows: int) -> int:
+    return max(_MIN_HOT_ROWS, 2 * n_rows // _BUCKETS)
+
+
+def profile_join_keys(
+    lf: pl.LazyFrame,
+    keys: Sequence[str],
+    collect: Callable[[pl.LazyFrame], pl.DataFrame] = _collect_streaming,
+    cache_key: str | None = None,
+) -> JoinKeyProfile:
+    """Profile *lf* on *keys*; with *cache_key* (the input's data fingerprint) the profile is reused."""
+    cache_id = (cache_key, tuple(keys)) if cache_key else None
+    if cache_id is not None:
+        with _profile_cache_lock:
+            if cache_id in _profile_cache:
+                _profile_cache.move_to_end(cache_id)
+                return _profile_cache[cache_id]
+
+    key_hash = pl.struct(list(keys)).hash() if len(keys) > 1 else pl.col(keys[0]).hash()
+    bucket = pl.when(pl.all_horizontal(pl.col(list(keys)).is_not_null())).then(pl.col(_HASH) % _BUCKETS)
+    hashed = lf.select(*keys, key_hash.alias(_HASH)).with_columns(bucket.alias(_BUCKET))
+    sketch = collect(
+        hashed.group_by(_BUCKET).agg(pl.len().alias("rows"), pl.col(_HASH).approx_n_unique().alias("distinct"))
+    )
+    bucket_rows = {b: n for b, n in sketch.select(_BUCKET, "rows").iter_rows() if b is not None}
+    profile = JoinKeyProfile(
+        n_rows=int(sketch["rows"].sum()),
+        n_null_keys=int(sketch.filter(pl.col(_BUCKET).is_null())["rows"].sum()),
+        n_distinct=int(sketch.filter(pl.col(_BUCKET).is_not_null())["distinct"].sum()),
+        bucket_rows=bucket_rows,
+    )
+    threshold = _hot_threshold(profile.n_rows)
+    hot_buckets = [b for b, n in bucket_rows.items() if n >= threshold]
+    if hot_buckets:
+        hot = collect(
+            hashed.filter(pl.col(_BUCKET).is_in(hot_buckets))
+            .group_by(_HASH)
+            .agg(pl.len().alias("rows"), *(pl.col(k).first() for k in keys))
+            .filter(pl.col("rows") >= threshold)
+        )
+        profile.hot_keys = {row[0]: (row[1], tuple(row[2:])) for row in hot.iter_rows()}
+
+    if cache_id is not None:
+        with _profile_cache_lock:
+            _profile_cache[cache_id] = profile
+            while len(_profile_cache) > _MAX_CACHED_PROFILES:
+                _profile_cache.popitem(last=False)
+    return profile
+
+
+def estimate_join(left: JoinKeyProfile, right: JoinKeyProfile, how: str) -> JoinEstimate:
+    """Estimate the rows a *how* join of the two profiled inputs returns."""
+    hot_hashes = left.hot_keys.keys() | right.hot_keys.keys()
+    contributions = []
+    for key_hash in hot_hashes:
+        left_count, right_count = left.key_count(key_hash), right.key_count(key_hash)
+        values = (left.hot_keys.get(key_hash) or right.hot_keys[key_hash])[1]
+        contributions.append((left_count * right_count, values, int(left_count), int(right_count)))
+    contributions.sort(key=lambda c: c[0], reverse=True)
+
+    left_rest = max(left.n_matchable - sum(left.key_count(k) for k in hot_hashes), 0)
+    right_rest = max(right.n_matchable - sum(right.key_count(k) for k in hot_hashes), 0)
+    distinct_rest = max(left.n_distinct - len(hot_hashes), right.n_distinct - len(hot_hashes), 1)
+    inner = sum(c[0] for c in contributions) + left_rest * right_rest / distinct_rest
+
+    if how == "left":
+        output = max(inner, left.n_rows)
+    elif how == "right":
+        output = max(inner, right.n_rows)
+    elif how in ("outer", "full"):
+        output = max(inner, left.n_rows, right.n_rows)
+    else:
+        output = inner
+    return JoinEstimate(
+        how=how,
+        left_rows=left.n_rows,
+        right_rows=right.n_rows,
+        output_rows=int(output),
+        hot_keys=[(values, lc, rc) for _, values, lc, rc in contributions[:_HOT_KEYS_REPORTED] if lc and rc],
+    )
+
+
+def check_join_estimate(estimate: JoinEstimate, max_rows: int) -> str | None:
+    """Raise when the join would return more than *max_rows* rows; return a warning for explosive joins.
+
+    A *max_rows* of 0 turns the limit off; the explosion warning still applies.
+    """
+    hot = f" Hot keys: {estimate.describe_hot_keys()}." if estimate.hot_keys else ""
+    if max_rows and estimate.output_rows > max_rows:
+        raise Exception(
+            f"Join would return about {estimate.output_rows:,} rows from {estimate.left_rows:,} x "
+            f"{estimate.right_rows:,} input rows, over the limit of {max_rows:,}.{hot} "
+            f"Check the join keys, or disable verify integrity on this node to run it anyway."
+        )
+    if estimate.expansion >= WARN_EXPANSION:
+        return (
+            f"Join returns about {estimate.output_rows:,} rows, {estimate.expansion:,.0f}x its larger input: "
+            f"the keys are duplicated on both sides (many-to-many).{hot}"
+        )
+    return None
@@ -28,12 +28,18 @@ from flowfile_core.flowfile.flow_data_engine.subprocess_operations.subprocess_op
 from flowfile_core.flowfile.flow_data_engine.subprocess_operations.subprocess_operations import (
     ExternalSampler as ExternalSampler,
 )
+from flowfile_core.flowfile.flow_data_engine.subprocess_operations.subprocess_operations import (
+    acquire_results as acquire_results,
+)
 from flowfile_core.flowfile.flow_data_engine.subprocess_operations.subprocess_operations import (
     cancel_task as cancel_task,
 )
 from flowfile_core.flowfile.flow_data_engine.subprocess_operations.subprocess_operations import (
     clear_task_from_worker as clear_task_from_worker,
 )
+from flowfile_core.flowfile.flow_data_engine.subprocess_operations.subprocess_operations import (
+    clear_tasks_from_worker as clear_tasks_from_worker,
+)
 from flowfile_core.flowfile.flow_data_engine.subprocess_operations.subprocess_operations import (
     fetch_kafka_offsets as fetch_kafka_offsets,
 )
@@ -52,6 +58,12 @@ from flowfile_core.flowfile.flow_data_engine.subprocess_operations.subprocess_op
 from flowfile_core.flowfile.flow_data_engine.subprocess_operations.subprocess_operations import (
     get_status as get_status,
 )
+from flowfile_core.flowfile.flow_data_engine.subprocess_operations.subprocess_operations import (
+    prefetched_results_exist as prefetched_results_exist,
+)
+from flowfile_core.flowfile.flow_data_engine.subprocess_operations.subprocess_operations import (
+    release_results as release_results,
+)
 from flowfile_core.flowfile.flow_data_engine.subprocess_operations.subprocess_operations import (
     results_exists as results_exists,
 )
@@ -4,6 +4,8 @@ from typing import Annotated, Any, Literal
 from pl_fuzzy_frame_match.models import FuzzyMapping
 from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, PlainSerializer
 
+from shared.fuzzy_blocking import FuzzyBlocking
+
 OperationType = Literal[
     "store",
     "calculate_schema",
@@ -49,6 +51,7 @@ class FuzzyJoinInput(BaseModel):
     left_df_operation: PolarsOperation
     right_df_operation: PolarsOperation
     fuzzy_maps: list[FuzzyMapping]
+    blocking: FuzzyBlocking | None = None
     flowfile_node_id: int | str
     flowfile_flow_id: int
 
@@ -111,6 +114,20 @@ class ApplyModelInput(BaseModel):
     flowfile_flow_id: int
 
 
+class GraphSolverInput(BaseModel):
+    """Outgoing payload for ``POST /solve_graph`` on the worker."""
+
+    task_id: str | None = None
+    cache_dir: str | None = None
+    df_operation: PolarsOperation
+    col_from: str
+    col_to: str
+    output_column_name: str
+    state_name: str | None = Field(default=None, pattern=r"^[\w-]+$")
+    flowfile_node_id: int | str
+    flowfile_flow_id: int
+
+
 class Status(BaseModel):
     background_task_id: str
     status: Literal[
@@ -64,6 +64,7 @@ def _build_metadata(
     flow_id: int,
     node_id: int | str,
     kwargs: dict | None,
+    estimated_input_bytes: int | None = None,
 ) -> dict:
     """Build the JSON metadata message for the WebSocket protocol."""
     metadata = {
@@ -74,6 +75,9 @@ def _build_metadata(
     }
     if kwargs:
         metadata["kwargs"] = kwargs
+    if estimated_input_bytes:
+        # Sizes the task for the worker's admission control.
+        metadata["estimated_input_bytes"] = estimated_input_bytes
     return metadata
 
 
@@ -176,8 +180,8 @@ def _receive_raw_result(
 def _deserialize_and_populate_status(raw_result: Any, status: Status) -> tuple[Any, Status]:
     """Deserialize the raw result and fill ``status.results``.
 
-    For polars results (bytes): deserializes into a LazyFrame and stores
-    the b64-encoded bytes in ``status.results`` (matching REST behaviour).
+    For polars results (bytes): deserializes into a LazyFrame and stores the
+    b64-encoded bytes in ``status.results`` (matching REST behaviour).
     For other results: stores the value directly in ``status.results``.
     """
     if raw_result is None:
@@ -198,6 +202,7 @@ def streaming_start(
     node_id: int | str,
     lf_bytes: bytes,
     kwargs: dict | None = None,
+    estimated_input_bytes: int | None = None,
 ):
     """Open a WebSocket connection and send the task.
 
@@ -208,7 +213,7 @@ def streaming_start(
     Raises immediately on connection failure or send error.
     """
     ws_url = _get_ws_url() + "/ws/submit"
-    metadata = _build_metadata(task_id, operation_type, flow_id, node_id, kwargs)
+    metadata = _build_metadata(task_id, operation_type, flow_id, node_id, kwargs, estimated_input_bytes)
 
     ws = connect(ws_url)
     try:
@@ -2,8 +2,11 @@
 import io
 import json
 import os
+import queue
 import threading
 from base64 import b64decode
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from time import monotonic
 from typing import Any, Literal
 from uuid import uuid4
@@ -18,6 +21,7 @@ from flowfile_core.flowfile.flow_data_engine.subprocess_operations.models import
     ApplyModelInput,
     CustomNodeExecuteInput,
     FuzzyJoinInput,
+    GraphSolverInput,
     OperationType,
     PolarsOperation,
     Status,
@@ -28,6 +32,8 @@ from flowfile_core.flowfile.flow_data_engine.subprocess_operations.streaming imp
     streaming_receive,
     streaming_start,
 )
+from flowfile_core.flowfile.flow_data_engine.subprocess_operations.worker_events import worker_events
+from flowfile_core.flowfile.flow_data_engine.subprocess_operations.worker_http import worker_session
 from flowfile_core.flowfile.sources.external_sources.sql_source.models import (
     DatabaseExternalReadSettings,
     DatabaseExternalWriteSettings,
@@ -35,7 +41,8 @@ from flowfile_core.flowfile.sources.external_sources.sql_source.models import (
 from flowfile_core.schemas.catalog_schema import CatalogTablePreview, DeltaTableHistory
 from flowfile_core.schemas.cloud_storage_schemas import CloudStorageWriteSettingsWorkerInterface
 from flowfile_core.schemas.input_schema import ReceivedTable
-from flowfile_core.utils.arrow_reader import read
+from flowfile_core.utils.arrow_reader import mapped_readers, read
+from shared.fuzzy_blocking import FuzzyBlocking
 from shared.viz_protocol import HTTP_TIMEOUT_SECONDS
 
 # (connect, read) timeout for the short worker control calls so a dead/wedged
@@ -45,6 +52,10 @@ _WORKER_TIMEOUT = (5, 30)
 # Generous so large offloads aren't killed; 0 disables. Env-tunable.
 _POLL_DEADLINE_SECONDS = float(os.getenv("FLOWFILE_WORKER_POLL_TIMEOUT", "3600"))
 
+# results_exists answers fetched up front for a whole execution plan (see prefetched_results_exist).
+_prefetched_results: dict[str, bool] = {}
+_prefetched_results_lock = threading.Lock()
+
 
 def trigger_df_operation(
     flow_id: int,
@@ -53,6 +64,7 @@ def trigger_df_operation(
     file_ref: str,
     operation_type: OperationType = "store",
     kwargs: dict | None = None,
+    estimated_input_bytes: int | None = None,
 ) -> Status:
     # Send raw bytes directly - no base64 encoding overhead
     headers = {
@@ -64,7 +76,11 @@ def trigger_df_operation(
     }
     if kwargs:
         headers["X-Kwargs"] = json.dumps(kwargs)
-    v = requests.post(url=f"{WORKER_URL}/submit_query/", data=lf.serialize(), headers=headers, timeout=_WORKER_TIMEOUT)
+    if estimated_input_bytes:
+        headers["X-Estimated-Input-Bytes"] = str(estimated_input_bytes)
+    v = worker_session.post(
+        url=f"{WORKER_URL}/submit_query/", data=lf.serialize(), headers=headers, timeout=_WORKER_TIMEOUT
+    )
     if not v.ok:
         raise Exception(f"trigger_df_operation: Could not cache the data, {v.text}")
     return Status(**v.json())
@@ -82,7 +98,9 @@ def trigger_sample_operation(
         "X-Flow-Id": str(flow_id),
         "X-Node-Id": str(node_id),
     }
-    v = requests.post(url=f"{WORKER_URL}/store_sample/", data=lf.serialize(), headers=headers, timeout=_WORKER_TIMEOUT)
+    v = worker_session.post(
+        url=f"{WORKER_URL}/store_sample/", data=lf.serialize(), headers=headers, timeout=_WORKER_TIMEOUT
+    )
     if not v.ok:
         raise Exception(f"trigger_sample_operation: Could not cache the data, {v.text}")
     return Status(**v.json())
@@ -95,6 +113,7 @@ def trigger_fuzzy_match_operation(
     file_ref: str,
     flow_id: int,
     node_id: int | str,
+    blocking: FuzzyBlocking | None = None,
 ) -> Status:
     # Use raw bytes - Pydantic will handle single base64 encoding for JSON transport
     left_serializable_object = PolarsOperation(operation=left_df.serialize())
@@ -103,18 +122,19 @@ def trigger_fuzzy_match_operation(
         left_df_operation=left_serializable_object,
         right_df_operation=right_serializable_object,
         fuzzy_maps=fuzzy_maps,
+        blocking=blocking,
         task_id=file_ref,
         flowfile_flow_id=flow_id,
         flowfile_node_id=node_id,
     )
-    v = requests.post(f"{WORKER_URL}/add_fuzzy_join", data=fuzzy_join_input.model_dump_json())
+    v = worker_session.post(f"{WORKER_URL}/add_fuzzy_join", data=fuzzy_join_input.model_dump_json())
     if not v.ok:
         raise Exception(f"trigger_fuzzy_match_operation: Could not cache the data, {v.text}")
     return Status(**v.json())
 
 
 def trigger_custom_node_operation(request: CustomNodeExecuteInput) -> Status:
-    v = requests.post(
+    v = worker_session.post(
         f"{WORKER_URL}/execute_custom_node",
         data=request.model_dump_json(),
         headers={"Content-Type": "application/json"},
@@ -151,7 +171,7 @@ def trigger_train_model_operation(
         flowfile_flow_id=flow_id,
         flowfile_node_id=node_id,
     )
-    v = requests.post(f"{WORKER_URL}/train_ml_model", data=payload.model_dump_json())
+    v = worker_session.post(f"{WORKER_URL}/train_ml_model", data=payload.model_dump_json())
     if not v.ok:
         raise Exception(f"trigger_train_model_operation: Could not start training, {v.text}")
     return Status(**v.json())
@@ -174,19 +194,46 @@ def trigger_apply_model_operation(
         flowfile_flow_id=flow_id,
         flowfile_node_id=node_id,
     )
-    v = requests.post(f"{WORKER_URL}/apply_ml_model", data=payload.model_dump_json())
+    v = worker_session.post(f"{WORKER_URL}/apply_ml_model", data=payload.model_dump_json())
     if not v.ok:
         raise Exception(f"trigger_apply_model_operation: Could not start scoring, {v.text}")
     return Status(**v.json())
 
 
+def trigger_graph_solver_operation(
+    lf: pl.LazyFrame,
+    col_from: str,
+    col_to: str,
+    output_column_name: str,
+    state_name: str | None,
+    file_ref: str,
+    flow_id: int,
+    node_id: int | str,
+) -> Status:
+    """Submit a partitioned connected-components job to the worker."""
+    payload = GraphSolverInput(
+        df_operation=PolarsOperation(operation=lf.serialize()),
+        col_from=col_from,
+        col_to=col_to,
+        output_column_name=output_column_name,
+        state_name=state_name,
+        task_id=file_ref,
+        flowfile_flow_id=flow_id,
+        flowfile_node_id=node_id,
+    )
+    v = worker_session.post(f"{WORKER_URL}/solve_graph", data=payload.model_dump_json())
+    if not v.ok:
+        raise Exception(f"trigger_graph_solver_operation: Could not start the graph solver, {v.text}")
+    return Status(**v.json())
+
+
 def trigger_create_operation(
     flow_id: int,
     node_id: int | str,
     received_table: ReceivedTable,
     file_type: str = Literal["csv", "parquet", "json", "excel", "ipc", "ndjson", "avro"],
 ):
-    f = requests.post(
+    f = worker_session.post(
         url=f"{WORKER_URL}/create_table/{file_type}",
         data=received_table.model_dump_json(),
         params={"flowfile_flow_id": flow_id, "flowfile_node_id": node_id},
@@ -197,7 +244,7 @@ def trigger_create_operation(
 
 
 def trigger_database_read_collector(database_external_read_settings: DatabaseExternalReadSettings):
-    f = requests.post(
+    f = worker_session.post(
         url=f"{WORKER_URL}/store_database_read_result", data=database_external_read_settings.model_dump_json()
     )
     if not f.ok:
@@ -207,7 +254,7 @@ def trigger_database_read_collector(database_external_read_settings: DatabaseExt
 
 def trigger_kafka_read(kafka_read_settings) -> Status:
     """Send a Kafka read request to the worker service."""
-    f = requests.post(url=f"{WORKER_URL}/store_kafka_read_result", data=kafka_read_settings.model_dump_json())
+    f = worker_session.post(url=f"{WORKER_URL}/store_kafka_read_result", data=kafka_read_settings.model_dump_json())
     if not f.ok:
         raise Exception(f"trigger_kafka_read: Could not read from Kafka, {f.text}")
     return Status(**f.json())
@@ -220,7 +267,7 @@ def fetch_kafka_offsets(task_id: str) -> dict | None:
     KafkaReadResult that was saved as a sidecar file, or ``None`` if no
     offsets were recorded (e.g. empty topic).
     """
-    f = requests.get(f"{WORKER_URL}/kafka_offsets/{task_id}")
+    f = worker_session.get(f"{WORKER_URL}/kafka_offsets/{task_id}")
     if not f.ok:
         logger.warning("Failed to fetch Kafka offsets for task %s: %s", task_id, f.text)
         return None
@@ -230,7 +277,9 @@ def fetch_kafka_offsets(task_id: str) -> dict | None:
 
 def trigger_google_analytics_read(ga_read_settings) -> Status:
     """Send a Google Analytics 4 read request to the worker service."""
-    f = requests.post(url=f"{WORKER_URL}/store_google_analytics_read_result", data=ga_read_settings.model_dump_json())
+    f = worker_session.post(
+        url=f"{WORKER_URL}/store_google_analytics_read_result", data=ga_read_settings.model_dump_json()
+    )
     if not f.ok:
         raise Exception(f"trigger_google_analytics_read: Could not read from GA, {f.text}")
     return Status(**f.json())
@@ -238,7 +287,7 @@ def trigger_google_analytics_read(ga_read_settings) -> Status:
 
 def trigger_rest_api_read(settings) -> Status:
     """Send a REST API read request to the worker service."""
-    f = requests.post(
+    f = worker_session.post(
         url=f"{WORKER_URL}/store_rest_api_read_result", data=settings.model_dump_json(), timeout=_WORKER_TIMEOUT
     )
     if not f.ok:
@@ -247,7 +296,7 @@ def trigger_rest_api_read(settings) -> Status:
 
 
 def trigger_database_write(database_external_write_settings: DatabaseExternalWriteSettings):
-    f = requests.post(
+    f = worker_session.post(
         url=f"{WORKER_URL}/store_database_write_result", data=database_external_write_settings.model_dump_json()
     )
     if not f.ok:
@@ -256,7 +305,9 @@ def trigger_database_write(database_external_write_settings: DatabaseExternalWri
 
 
 def trigger_cloud_storage_write(database_external_write_settings: CloudStorageWriteSettingsWorkerInterface):
-    f = requests.post(url=f"{WORKER_URL}/write_data_to_cloud", data=database_external_write_settings.model_dump_json())
+    f = worker_session.post(
+        url=f"{WORKER_URL}/write_data_to_cloud", data=database_external_write_settings.model_dump_json()
+    )
     if not f.ok:
         raise Exception(f"trigger_cloud_storage_write: Could not cache the data, {f.text}")
     return Status(**f.json())
@@ -276,7 +327,7 @@ def trigger_write_output(
     from base64 import encodebytes
 
     serializable_df = lf.serialize()
-    r = requests.post(
+    r = worker_session.post(
         f"{WORKER_URL}/write_results/",
         json={
             "operation": encodebytes(serializable_df).decode(),
@@ -306,7 +357,7 @@ def trigger_catalog_materialize(
     }
     if storage is not None:
         payload["storage"] = storage
-    response = requests.post(f"{WORKER_URL}/catalog/materialize", json=payload)
+    response = worker_session.post(f"{WORKER_URL}/catalog/materialize", json=payload)
     return response
 
 
@@ -332,7 +383,7 @@ def trigger_resolve_virtual_table(
         "source_versions_hash": source_versions_hash,
         "target": target,
     }
-    response = requests.post(f"{WORKER_URL}/flow/resolve_virtual_table", json=payload, timeout=300)
+    response = worker_session.post(f"{WORKER_URL}/flow/resolve_virtual_table", json=payload, timeout=300)
     if not response.ok:
         raise RuntimeError(f"Worker resolve_virtual_table failed: {response.text}")
     return response.json()
@@ -358,7 +409,7 @@ def trigger_sql_query(
         payload["virtual_refs"] = virtual_refs
     if storage is not None:
         payload["storage"] = storage
-    response = requests.post(f"{WORKER_URL}/catalog/sql_query", json=payload)
+    response = worker_session.post(f"{WORKER_URL}/catalog/sql_query", json=payload)
     if not response.ok:
         raise RuntimeError(f"Worker SQL query execution failed: {response.text}")
     return response.json()
@@ -381,7 +432,7 @@ def trigger_visualize_query(worker_source: dict, payload: dict, max_rows: int) -
         max_rows,
     )
     body = {"source": worker_source, "payload": payload, "max_rows": max_rows}
-    response = requests.post(f"{WORKER_URL}/catalog/visualize_query", json=body, timeout=HTTP_TIMEOUT_SECONDS)
+    response = worker_session.post(f"{WORKER_URL}/catalog/visualize_query", json=body, timeout=HTTP_TIMEOUT_SECONDS)
     if not response.ok:
         logger.warning(
             "[viz] <- worker /catalog/visualize_query session_key=%s status=%d body=%s",
@@ -411,7 +462,7 @@ def trigger_visualize_fields(worker_source: dict) -> dict:
         worker_source.get("kind"),
     )
     body = {"source": worker_source}
-    response = requests.post(f"{WORKER_URL}/catalog/visualize_fields", json=body, timeout=30)
+    response = worker_session.post(f"{WORKER_URL}/catalog/visualize_fields", json=body, timeout=30)
     if not response.ok:
         logger.warning(
             "[viz] <- worker /catalog/visualize_fields session_key=%s status=%d body=%s",
@@ -442,7 +493,9 @@ def trigger_visualize_column_stats(worker_source: dict, column: str, limit: int)
         limit,
     )
     body = {"source": worker_source, "column": column, "limit": limit}
-    response = requests.post(f"{WORKER_URL}/catalog/visualize_column_stats", json=body, timeout=HTTP_TIMEOUT_SECONDS)
+    response = worker_session.post(
+        f"{WORKER_URL}/catalog/visualize_column_stats", json=body, timeout=HTTP_TIMEOUT_SECONDS
+    )
     if not response.ok:
         logger.warning(
             "[viz] <- worker /catalog/visualize_column_stats session_key=%s status=%d body=%s",
@@ -475,7 +528,7 @@ def trigger_read_table_metadata(table_name: str, storage: dict | None = None) ->
     payload = {"table_path": table_name}
     if storage is not None:
         payload["storage"] = storage
-    response = requests.post(f"{WORKER_URL}/catalog/table_metadata", json=payload)
+    response = worker_session.post(f"{WORKER_URL}/catalog/table_metadata", json=payload)
     if not response.ok:
         raise RuntimeError(f"Worker table metadata read failed: {response.text}")
     return response.json()
@@ -494,7 +547,7 @@ def trigger_delta_history(
     payload = {"table_path": table_name, "limit": limit}
     if storage is not None:
         payload["storage"] = storage
-    response = requests.post(f"{WORKER_URL}/catalog/delta_history", json=payload)
+    response = worker_session.post(f"{WORKER_URL}/catalog/delta_history", json=payload)
     if not response.ok:
         raise RuntimeError(f"Worker delta history read failed: {response.text}")
     return DeltaTableHistory.model_validate(response.json())
@@ -514,7 +567,7 @@ def trigger_delta_version_preview(
     payload = {"table_path": table_name, "version": version, "n_rows": n_rows}
     if storage is not None:
         payload["storage"] = storage
-    response = requests.post(f"{WORKER_URL}/catalog/delta_version_preview", json=payload)
+    response = worker_session.post(f"{WORKER_URL}/catalog/delta_version_preview", json=payload)
     if response.status_code == 404:
         from flowfile_core.catalog.exceptions import TableVersionUnavailableError
 
@@ -537,7 +590,7 @@ def trigger_delta_preview(
     payload = {"table_path": table_name, "n_rows": n_rows}
     if storage is not None:
         payload["storage"] = storage
-    response = requests.post(f"{WORKER_URL}/catalog/delta_preview", json=payload)
+    response = worker_session.post(f"{WORKER_URL}/catalog/delta_preview", json=payload)
     if not response.ok:
         raise RuntimeError(f"Worker delta preview failed: {response.text}")
     return CatalogTablePreview.model_validate(response.json())
@@ -556,7 +609,7 @@ def trigger_optimize_catalog_table(
     payload = {"table_path": table_name, "z_order_columns": z_order_columns}
     if storage is not None:
         payload["storage"] = storage
-    response = requests.post(f"{WORKER_URL}/catalog/optimize", json=payload, timeout=600)
+    response = worker_session.post(f"{WORKER_URL}/catalog/optimize", json=payload, timeout=600)
     if not response.ok:
         raise RuntimeError(f"Worker optimize failed: {response.text}")
     return response.json()
@@ -576,7 +629,7 @@ def trigger_vacuum_catalog_table(
     payload = {"table_path": table_name, "retention_hours": retention_hours, "dry_run": dry_run}
     if storage is not None:
         payload["storage"] = storage
-    response = requests.post(f"{WORKER_URL}/catalog/vacuum", json=payload, timeout=600)
+    response = worker_session.post(f"{WORKER_URL}/catalog/vacuum", json=payload, timeout=600)
     if not response.ok:
         raise RuntimeError(f"Worker vacuum failed: {response.text}")
     return response.json()
@@ -620,7 +673,7 @@ def trigger_apply_table_edits(
     if storage is not None:
         payload["storage"] = storage
     try:
-        response = requests.post(f"{WORKER_URL}/catalog/apply_edits", json=payload, timeout=600)
+        response = worker_session.post(f"{WORKER_URL}/catalog/apply_edits", json=payload, timeout=600)
     except requests.RequestException as exc:
         from flowfile_core.catalog.exceptions import WorkerUnavailableError
 
@@ -643,7 +696,7 @@ def trigger_add_key_column(
     if storage is not None:
         payload["storage"] = storage
     try:
-        response = requests.post(f"{WORKER_URL}/catalog/add_key_column", json=payload, timeout=600)
+        response = worker_session.post(f"{WORKER_URL}/catalog/add_key_column", json=payload, timeout=600)
     except requests.RequestException as exc:
         from flowfile_core.catalog.exceptions import WorkerUnavailableError
 
@@ -655,7 +708,7 @@ def trigger_add_key_column(
 
 
 def get_results(file_ref: str) -> Status | None:
-    f = requests.get(f"{WORKER_URL}/status/{file_ref}", timeout=_WORKER_TIMEOUT)
+    f = worker_session.get(f"{WORKER_URL}/status/{file_ref}", timeout=_WORKER_TIMEOUT)
     if f.status_code == 200:
         return Status(**f.json())
     else:
@@ -666,8 +719,13 @@ def results_exists(file_ref: str):
     if not OFFLOAD_TO_WORKER:
         return False
 
+    with _prefetched_results_lock:
+        prefetched = _prefetched_results.pop(file_ref, None)
+    if prefetched is not None:
+        return prefetched
+
     try:
-        f = requests.get(f"{WORKER_URL}/status/{file_ref}", timeout=_WORKER_TIMEOUT)
+        f = worker_session.get(f"{WORKER_URL}/status/{file_ref}", timeout=_WORKER_TIMEOUT)
         if f.status_code == 200:
             if f.json()["status"] == "Completed":
                 return True
@@ -679,11 +737,51 @@ def results_exists(file_ref: str):
         return False
 
 
-def clear_task_from_worker(file_ref: str) -> bool:
+def _fetch_status_batch(file_refs: list[str]) -> dict[str, dict | None] | None:
+    """Raw statuses for *file_refs* in one request; None when the worker can't be asked."""
+    try:
+        f = worker_session.post(f"{WORKER_URL}/status/batch", json={"task_ids": file_refs}, timeout=_WORKER_TIMEOUT)
+        if f.status_code == 200:
+            return f.json()["statuses"]
+        logger.error(f"Failed to fetch task statuses: HTTP {f.status_code}: {f.text}")
+    except requests.RequestException as e:
+        logger.error(f"Failed to fetch task statuses: {str(e)}")
+    return None
+
+
+@contextmanager
+def prefetched_results_exist(file_refs: Iterable[str]) -> Iterator[None]:
+    """
+    Answer the ``results_exists`` checks of an execution plan with a single worker request.
+
+    Each prefetched answer serves the first ``results_exists`` call for its file_ref only;
+    later calls (e.g. after the node stored a new result) go to the worker again. Answers
+    still unused when the block exits are dropped. If the batch request fails, nothing is
+    prefetched and every check falls back to its own request.
+    Args:
+        file_refs: The unique identifiers of the tasks that will be checked.
+    """
+    refs = list(dict.fromkeys(file_refs))
+    statuses = _fetch_status_batch(refs) if OFFLOAD_TO_WORKER and refs else None
+    if statuses is not None:
+        with _prefetched_results_lock:
+            for ref in refs:
+                _prefetched_results[ref] = (statuses.get(ref) or {}).get("status") == "Completed"
+    try:
+        yield
+    finally:
+        if statuses is not None:
+            with _prefetched_results_lock:
+                for ref in refs:
+                    _prefetched_results.pop(ref, None)
+
+
+def clear_task_from_worker(file_ref: str, holder: str | None = None) -> bool:
     """
     Clears a task from the worker service by making a DELETE request. It also removes associated cached files.
     Args:
         file_ref (str): The unique identifier of the task to clear.
+        holder (str | None): Release this holder's hold first; a result other flows still hold is kept.
 
     Returns:
         bool: True if the task was successfully cleared, False otherwise.
@@ -693,9 +791,16 @@ def clear_task_from_worker(file_ref: str) -> bool:
     if not OFFLOAD_TO_WORKER:
         return False
 
+    with _prefetched_results_lock:
+        _prefetched_results.pop(file_ref, None)
     try:
-        f = requests.delete(f"{WORKER_URL}/clear_task/{file_ref}", timeout=_WORKER_TIMEOUT)
+        f = worker_session.delete(
+            f"{WORKER_URL}/clear_task/{file_ref}",
+            params={"holder": holder} if holder is not None else None,
+            timeout=_WORKER_TIMEOUT,
+        )
         if f.status_code == 200:
+            mapped_readers.invalidate_missing()
             return True
         return False
     except requests.RequestException as e:
@@ -703,6 +808,94 @@ def clear_task_from_worker(file_ref: str) -> bool:
         return False
 
 
+def clear_tasks_from_worker(file_refs: Iterable[str], holder: str | None = None) -> list[str]:
+    """
+    Clears many tasks from the worker service in one request, including their cached files.
+    Args:
+        file_refs: The unique identifiers of the tasks to clear.
+        holder: Release this holder's holds first; results other flows still hold are kept.
+
+    Returns:
+        list[str]: The file_refs the worker actually cleared; unknown tasks are skipped.
+    """
+    from flowfile_core.configs.settings import OFFLOAD_TO_WORKER
+
+    refs = list(dict.fromkeys(file_refs))
+    if not OFFLOAD_TO_WORKER or not refs:
+        return []
+
+    with _prefetched_results_lock:
+        for ref in refs:
+            _prefetched_results.pop(ref, None)
+    try:
+        f = worker_session.post(
+            f"{WORKER_URL}/clear_tasks", json={"task_ids": refs, "holder": holder}, timeout=_WORKER_TIMEOUT
+        )
+        if f.status_code == 200:
+            cleared = f.json()["cleared"]
+            if cleared:
+                mapped_readers.invalidate_missing()
+            return cleared
+        return []
+    except requests.RequestException as e:
+        logger.error(f"Failed to remove results: {str(e)}")
+        return []
+
+
+def acquire_results(file_refs: Iterable[str], holder: str) -> list[str]:
+    """
+    Holds completed worker results for *holder*, so eviction and other flows' clears keep them.
+    Args:
+        file_refs: The unique identifiers of the results to hold.
+        holder: Who reads the results; core uses the flow's uuid.
+
+    Returns:
+        list[str]: The file_refs that have a completed result and are now held.
+    """
+    from flowfile_core.configs.settings import OFFLOAD_TO_WORKER
+
+    refs = list(dict.fromkeys(file_refs))
+    if not OFFLOAD_TO_WORKER or not refs:
+        return []
+    try:
+        f = worker_session.post(
+            f"{WORKER_URL}/results/acquire", json={"holder": holder, "task_ids": refs}, timeout=_WORKER_TIMEOUT
+        )
+        if f.status_code == 200:
+            return f.json()["task_ids"]
+        logger.error(f"Failed to hold results: HTTP {f.status_code}: {f.text}")
+    except requests.RequestException as e:
+        logger.error(f"Failed to hold results: {str(e)}")
+    return []
+
+
+def release_results(holder: str, file_refs: Iterable[str] | None = None) -> list[str]:
+    """
+    Releases *holder*'s holds; the results stay cached for other flows until evicted.
+    Args:
+        holder: The holder passed to acquire_results.
+        file_refs: The results to release, or None for all of the holder's.
+
+    Returns:
+        list[str]: The file_refs that were released.
+    """
+    from flowfile_core.configs.settings import OFFLOAD_TO_WORKER
+
+    if not OFFLOAD_TO_WORKER:
+        return []
+    refs = list(dict.fromkeys(file_refs)) if file_refs is not None else None
+    try:
+        f = worker_session.post(
+            f"{WORKER_URL}/results/release", json={"holder": holder, "task_ids": refs}, timeout=_WORKER_TIMEOUT
+        )
+        if f.status_code == 200:
+            return f.json()["task_ids"]
+        logger.error(f"Failed to release results: HTTP {f.status_code}: {f.text}")
+    except requests.RequestException as e:
+        logger.error(f"Failed to release results: {str(e)}")
+    return []
+
+
 def get_df_result(result_b64: str) -> pl.LazyFrame:
     # Results are base64-encoded string from JSON response, decode once
     return pl.LazyFrame.deserialize(io.BytesIO(b64decode(result_b64)))
@@ -719,7 +912,7 @@ def get_external_df_result(file_ref: str) -> pl.LazyFrame | None:
 
 
 def get_status(file_ref: str) -> Status:
-    status_response = requests.get(f"{WORKER_URL}/status/{file_ref}", timeout=_WORKER_TIMEOUT)
+    status_response = worker_session.get(f"{WORKER_URL}/status/{file_ref}", timeout=_WORKER_TIMEOUT)
     if status_response.status_code == 200:
         return Status(**status_response.json())
     else:
@@ -740,7 +933,7 @@ def cancel_task(file_ref: str) -> bool:
         Exception: If there's an error communicating with the worker service
     """
     try:
-        response = requests.post(f"{WORKER_URL}/cancel_task/{file_ref}", timeout=_WORKER_TIMEOUT)
+        response = worker_session.post(f"{WORKER_URL}/cancel_task/{file_ref}", timeout=_WORKER_TIMEOUT)
         if response.ok:
             return True
         return False
@@ -816,32 +1009,73 @@ class BaseFetcher:
             self._thread.start()
             self._started = True
 
+    def _handle_final_status(self, status: Status) -> bool:
+        """Apply a Completed/Error/Unknown Error status; False while the task is still running."""
+        if status.status == "Completed":
+            self._handle_completion(status)
+        elif status.status == "Error":
+            self._handle_error(1, status.error_message)
+        elif status.status == "Unknown Error":
+            self._handle_error(
+                -1,
+                "There was an unknown error with the process, and the process got killed by the server",
+            )
+        else:
+            return False
+        return True
+
+    def _await_pushed_status(self, start: float) -> bool:
+        """Wait for the worker to push this task's final status over the shared event channel.
+
+        Returns:
+            True when the fetch was resolved (result, error, deadline or cancellation);
+            False when the channel is unavailable or dropped, so the caller should poll.
+        """
+        events: queue.Queue = queue.Queue()
+        if not worker_events.subscribe(self.file_ref, events.put):
+            return False
+        try:
+            while True:
+                if self._stop_event.is_set():
+                    self._handle_cancellation()
+                    return True
+                if _POLL_DEADLINE_SECONDS and (monotonic() - start) > _POLL_DEADLINE_SECONDS:
+                    self._handle_error(
+                        2,
+                        f"Worker task exceeded the {_POLL_DEADLINE_SECONDS:.0f}s poll deadline "
+                        "while still reporting 'Processing'; giving up.",
+                    )
+                    return True
+                try:
+                    # Short timeout only so cancellation and the deadline are noticed.
+                    event = events.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                if event["type"] == "channel_lost":
+                    return False
+                if event["type"] == "not_found":
+                    self._handle_error(2, "HTTP 404: Task not found")
+                    return True
+                if event["type"] == "status" and self._handle_final_status(Status(**event["status"])):
+                    return True
+        finally:
+            worker_events.unsubscribe(self.file_ref, events.put)
+
     def _fetch_cached_df(self):
-        """Background thread that polls for results."""
+        """Background thread that waits for results: pushed by the worker when possible, polled otherwise."""
         sleep_time = 0.5
         start = monotonic()
 
         # Don't check _running here - subclasses already set it
         try:
+            if self._await_pushed_status(start):
+                return
             while not self._stop_event.is_set():
                 try:
-                    r = requests.get(f"{WORKER_URL}/status/{self.file_ref}", timeout=10)
+                    r = worker_session.get(f"{WORKER_URL}/status/{self.file_ref}", timeout=10)
 
                     if r.status_code == 200:
-                        status = Status(**r.json())
-
-                        if status.status == "Completed":
-                            self._handle_completion(status)
-                            return
-                        elif status.status == "Error":
-                            self._handle_error(1, status.error_message)
-                            return
-                        elif status.status == "Unknown Error":
-                            self._handle_error(
-                                -1,
-                                "There was an unknown error with the process, "
-                                "and the process got killed by the server",
-                            )
+                        if self._handle_final_status(Status(**r.json())):
                             return
                     else:
                         self._handle_error(2, f"HTTP {r.status_code}: {r.text}")
@@ -1003,6 +1237,7 @@ class BaseFetcher:
         lf_bytes: bytes,
         kwargs: dict | None = None,
         blocking: bool = True,
+        estimated_input_bytes: int | None = None,
     ) -> None:
         """Execute via WebSocket streaming - no polling, binary result transfer.
 
@@ -1011,6 +1246,8 @@ class BaseFetcher:
                 and sets self._result directly.  If False, opens the
                 connection, sends the task, and hands off to a background
                 thread that will set self._result when done.
+            estimated_input_bytes: Input size the worker's admission control
+                sizes the task by; None lets the worker estimate on its own.
 
         Raises on connection or send error so the caller can fall back to REST.
         """
@@ -1022,6 +1259,7 @@ class BaseFetcher:
                 node_id=node_id,
                 lf_bytes=lf_bytes,
                 kwargs=kwargs,
+                estimated_input_bytes=estimated_input_bytes,
             )
             # Store the socket so cancel() can close it mid-receive, and pass the
             # stop event so the bounded receive loop observes cancellation too.
@@ -1053,6 +1291,7 @@ class BaseFetcher:
                 node_id=node_id,
                 lf_bytes=lf_bytes,
                 kwargs=kwargs,
+                estimated_input_bytes=estimated_input_bytes,
             )
             with self._lock:
                 self._ws = ws
@@ -1103,6 +1342,7 @@ class ExternalDfFetcher(BaseFetcher):
         operation_type: OperationType = "store",
         offload_to_worker: bool = True,
         kwargs: dict | None = None,
+        estimated_input_bytes: int | None = None,
     ):
         super().__init__(file_ref=file_ref)
         lf = lf.lazy() if isinstance(lf, pl.DataFrame) else lf
@@ -1115,6 +1355,7 @@ class ExternalDfFetcher(BaseFetcher):
                 lf_bytes=lf.serialize(),
                 kwargs=kwargs,
                 blocking=wait_on_completion,
+                estimated_input_bytes=estimated_input_bytes,
             )
             return
         except WorkerStreamInterrupted:
@@ -1132,6 +1373,7 @@ class ExternalDfFetcher(BaseFetcher):
             node_id=node_id,
             flow_id=flow_id,
             kwargs=kwargs,
+            estimated_input_bytes=estimated_input_bytes,
         )
         self.running = r.status == "Processing"
         if wait_on_completion:
@@ -1188,6 +1430,7 @@ class ExternalFuzzyMatchFetcher(BaseFetcher):
         node_id: int | str,
         file_ref: str = None,
         wait_on_completion: bool = True,
+        blocking: FuzzyBlocking | None = None,
     ):
         super().__init__(file_ref=file_ref)
 
@@ -1198,6 +1441,7 @@ class ExternalFuzzyMatchFetcher(BaseFetcher):
             file_ref=file_ref,
             flow_id=flow_id,
             node_id=node_id,
+            blocking=blocking,
         )
         self.file_ref = r.background_task_id
         self.running = r.status == "Processing"
@@ -1274,6 +1518,39 @@ class MLApplyFetcher(BaseFetcher):
             _ = self.get_result()
 
 
+class ExternalGraphSolverFetcher(BaseFetcher):
+    """Fetches the labelled LazyFrame produced by :func:`trigger_graph_solver_operation`."""
+
+    def __init__(
+        self,
+        lf: pl.LazyFrame | pl.DataFrame,
+        col_from: str,
+        col_to: str,
+        output_column_name: str,
+        state_name: str | None,
+        flow_id: int,
+        node_id: int | str,
+        file_ref: str,
+        wait_on_completion: bool = True,
+    ):
+        super().__init__(file_ref=file_ref)
+        lf = lf.lazy() if isinstance(lf, pl.DataFrame) else lf
+        r = trigger_graph_solver_operation(
+            lf=lf,
+            col_from=col_from,
+            col_to=col_to,
+            output_column_name=output_column_name,
+            state_name=state_name,
+            file_ref=file_ref,
+            flow_id=flow_id,
+            node_id=node_id,
+        )
+        self.file_ref = r.background_task_id
+        self.running = r.status == "Processing"
+        if wait_on_completion:
+            _ = self.get_result()
+
+
 class ExternalCustomNodeFetcher(BaseFetcher):
     """Runs a custom node's process() in the worker; result is the JSON payload
     with per-output IPC paths and row counts (result_type="other")."""
@@ -0,0 +1,159 @@
+"""
+Push-based task completion for the REST offload path.
+
+Every REST-submitted task (store, sample, fuzzy match, ML, database, cloud writes, ...)
+is awaited by a ``BaseFetcher`` thread. Instead of each of them polling
+``/status/{task_id}``, the fetchers share ONE WebSocket to the worker's
+``/ws/events`` channel: a fetcher subscribes to its task id and blocks on a queue
+until the worker pushes the terminal status. Several fetchers may wait on the same
+task id; each event is delivered to all of them.
+
+The channel is best-effort. When it can't be opened, or drops while a fetcher is
+waiting, subscribers receive ``{"type": "channel_lost"}`` and fall back to polling.
+Disable entirely with ``FLOWFILE_WORKER_PUSH_EVENTS=0``.
+"""
+
+import json
+import os
+import threading
+from collections.abc import Callable
+from time import monotonic
+
+from websockets.exceptions import ConnectionClosed, InvalidHandshake
+from websockets.sync.client import ClientConnection, connect
+
+from flowfile_core.configs import logger
+from flowfile_core.flowfile.flow_data_engine.subprocess_operations.streaming import _get_ws_url
+
+_PUSH_EVENTS_ENABLED = os.getenv("FLOWFILE_WORKER_PUSH_EVENTS", "1") == "1"
+
+# After a failed connect, don't retry (and block a fetcher on it) for this long.
+_RECONNECT_BACKOFF_SECONDS = 5.0
+_CONNECT_TIMEOUT_SECONDS = 5.0
+
+EventCallback = Callable[[dict], None]
+
+CHANNEL_LOST = {"type": "channel_lost"}
+
+
+class WorkerEventChannel:
+    """A single, lazily opened, multiplexed subscription to the worker's task events."""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._ws: ClientConnection | None = None
+        self._subscribers: dict[str, list[EventCallback]] = {}
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._connect_lock = threading.Lock()
+        self._retry_after = 0.0
+
+    def subscribe(self, task_id: str, callback: EventCallback) -> bool:
+        """Route events for *task_id* to *callback*; False when the channel is unavailable."""
+        if not self.enabled:
+            return False
+        ws = self._ensure_connected()
+        if ws is None:
+            return False
+        with self._lock:
+            if self._ws is not ws:
+                # Dropped again before we could subscribe; the caller polls instead.
+                return False
+            callbacks = self._subscribers.setdefault(task_id, [])
+            callbacks.append(callback)
+            # The worker keeps one subscription per task id for the whole connection.
+            first = len(callbacks) == 1
+        if first and not self._send(ws, {"type": "subscribe", "task_id": task_id}):
+            self._remove(task_id, callback)
+            return False
+        return True
+
+    def unsubscribe(self, task_id: str, callback: EventCallback) -> None:
+        """Stop routing events for *task_id* to *callback*; other subscribers keep theirs."""
+        if self._remove(task_id, callback):
+            with self._lock:
+                ws = self._ws
+            if ws is not None:
+                self._send(ws, {"type": "unsubscribe", "task_id": task_id})
+
+    def close(self) -> None:
+        """Close the connection; the receiver thread releases any waiting subscribers."""
+        with self._lock:
+            ws = self._ws
+        if ws is not None:
+            ws.close()
+
+    def _remove(self, task_id: str, callback: EventCallback) -> bool:
+        """Drop *callback* for *task_id*; True when it was the task's last subscriber."""
+        with self._lock:
+            callbacks = self._subscribers.get(task_id)
+            if callbacks is None or callback not in callbacks:
+                return False
+            callbacks.remove(callback)
+            if callbacks:
+                return False
+            del self._subscribers[task_id]
+            return True
+
+    def _ensure_connected(self) -> ClientConnection | None:
+        """Open the connection if needed.
+
+        The (up to ``_CONNECT_TIMEOUT_SECONDS``) connect runs outside ``_lock``, so events and
+        unsubscribes keep flowing meanwhile; ``_connect_lock`` makes concurrent callers share one attempt.
+        """
+        with self._lock:
+            if self._ws is not None:
+                return self._ws
+        with self._connect_lock:
+            with self._lock:
+                if self._ws is not None:
+                    return self._ws
+                if monotonic() < self._retry_after:
+                    return None
+            try:
+                ws = connect(_get_ws_url() + "/ws/events", max_size=None, open_timeout=_CONNECT_TIMEOUT_SECONDS)
+            except (OSError, InvalidHandshake, TimeoutError) as e:
+                logger.debug(f"Worker event channel unavailable, polling instead: {e}")
+                with self._lock:
+                    self._retry_after = monotonic() + _RECONNECT_BACKOFF_SECONDS
+                return None
+            with self._lock:
+                self._ws = ws
+        threading.Thread(target=self._receive_loop, args=(ws,), daemon=True, name="worker-events").start()
+        return ws
+
+    def _send(self, ws: ClientConnection, message: dict) -> bool:
+        try:
+            with self._send_lock:
+                ws.send(json.dumps(message))
+            return True
+        except (ConnectionClosed, OSError):
+            return False
+
+    def _receive_loop(self, ws: ClientConnection) -> None:
+        try:
+            for raw in ws:
+                event = json.loads(raw)
+                task_id = event.get("task_id")
+                with self._lock:
+                    if event.get("type") in ("status", "not_found"):
+                        callbacks = self._subscribers.pop(task_id, [])
+                    else:
+                        callbacks = list(self._subscribers.get(task_id, []))
+                for callback in callbacks:
+                    callback(event)
+        except (ConnectionClosed, OSError, ValueError) as e:
+            logger.debug(f"Worker event channel closed: {e}")
+        finally:
+            orphaned: list[EventCallback] = []
+            with self._lock:
+                # Subscriptions made on a newer connection are not affected.
+                if self._ws is ws:
+                    self._ws = None
+                    orphaned = [callback for callbacks in self._subscribers.values() for callback in callbacks]
+                    self._subscribers.clear()
+            for callback in orphaned:
+                callback(CHANNEL_LOST)
+
+
+worker_events = WorkerEventChannel(enabled=_PUSH_EVENTS_ENABLED)
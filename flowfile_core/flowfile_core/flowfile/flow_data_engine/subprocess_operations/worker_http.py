@@ -0,0 +1,28 @@
+"""
+Shared keep-alive HTTP session for core → worker calls.
+
+A bare ``requests.post``/``requests.get`` opens (and tears down) a TCP connection per
+call. ``worker_session`` keeps a pool of connections to the worker alive instead, so
+the many short control calls of a flow run (submit, status, clear, catalog ops) reuse
+them. ``requests.Session`` is safe to share between the fetcher threads; the pool is
+sized for the run scheduler's parallelism. Tune with ``FLOWFILE_WORKER_HTTP_POOL_SIZE``.
+"""
+
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+
+_POOL_SIZE = int(os.getenv("FLOWFILE_WORKER_HTTP_POOL_SIZE", "32"))
+
+
+def create_worker_session(pool_size: int = _POOL_SIZE) -> requests.Session:
+    session = requests.Session()
+    # Core talks to a single worker, so one host pool of pool_size connections suffices.
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+worker_session = create_worker_session()
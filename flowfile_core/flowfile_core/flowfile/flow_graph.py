@@ -1,13 +1,14 @@
 import datetime
 import functools
 import hashlib
+import heapq
 import io as _io
 import json
 import os
 import re
 import threading
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from copy import deepcopy
 from functools import partial
 from pathlib import Path
@@ -29,6 +30,8 @@ from flowfile_core.catalog.delta_utils import (
     get_live_delta_version,
     is_delta_table,
 )
+from flowfile_core.catalog.incremental_reads import make_increment_commit_callback, read_catalog_increment
+from flowfile_core.catalog.maintenance import filter_columns, record_filter_columns
 from flowfile_core.catalog.repository import SQLAlchemyCatalogRepository
 from flowfile_core.catalog.storage_backend import _is_cloud_uri, resolve_for_namespace, serialized_frame_uses_cloud
 from flowfile_core.configs import logger
@@ -36,6 +39,7 @@ from flowfile_core.configs.app_settings import get_google_oauth_config
 from flowfile_core.configs.flow_logger import FlowLogger, NodeLogger
 from flowfile_core.configs.node_store import CUSTOM_NODE_STORE, register_missing_node_template
 from flowfile_core.configs.node_store.nodes import get_source_node_types, get_source_node_types_str
+from flowfile_core.configs.settings import SHARE_WORKER_RESULTS
 from flowfile_core.database import models as db_models
 from flowfile_core.database.connection import get_db_context
 from flowfile_core.flowfile.analytics.utils import create_graphic_walker_node_from_node_promise
@@ -74,7 +78,10 @@ from flowfile_core.flowfile.flow_data_engine.subprocess_operations.subprocess_op
     ExternalRestApiFetcher,
     MLApplyFetcher,
     MLTrainFetcher,
+    clear_tasks_from_worker,
     fetch_kafka_offsets,
+    prefetched_results_exist,
+    release_results,
 )
 from flowfile_core.flowfile.flow_node.flow_node import FlowNode, data_needed_block_reason, kernel_block_reason
 from flowfile_core.flowfile.flow_node.input_handles import input_handle, input_handle_index
@@ -127,7 +134,13 @@ from flowfile_core.flowfile.user_defined.registry import (
 )
 from flowfile_core.flowfile.user_defined.registry import registry as user_defined_registry
 from flowfile_core.flowfile.util.calculate_layout import calculate_layered_layout
-from flowfile_core.flowfile.util.execution_orderer import ExecutionPlan, ExecutionStage, compute_execution_plan
+from flowfile_core.flowfile.util.execution_orderer import (
+    ExecutionPlan,
+    ExecutionStage,
+    compute_critical_path_lengths,
+    compute_execution_plan,
+    compute_fused_node_ids,
+)
 from flowfile_core.flowfile.utils import snake_case_to_camel_case
 from flowfile_core.kafka.connection_manager import (
     build_consumer_config,
@@ -162,7 +175,14 @@ from flowfile_core.secret_manager.secret_manager import (
 )
 from shared._version import get_version
 from shared.db_dialects import get_dialect_or_generic
-from shared.delta_utils import get_delta_partition_columns, get_delta_size_bytes, merge_into_delta, scd2_into_delta
+from shared.delta_utils import (
+    get_delta_partition_columns,
+    get_delta_size_bytes,
+    get_delta_version,
+    merge_into_delta,
+    scan_delta_table,
+    scd2_into_delta,
+)
 from shared.delta_utils import write_delta as _write_delta
 from shared.google_analytics.models import (
     GoogleAnalyticsFilter as WorkerGoogleAnalyticsFilter,
@@ -1049,8 +1069,6 @@ def _collect_source_table_versions(graph: "FlowGraph") -> str | None:
     Returns a JSON string of SourceTableVersion entries ("[]" when none), or
     None when unfingerprintable.
     """
-    from deltalake import DeltaTable as _DeltaTable
-
     from shared.delta_models import SourceTableVersion
 
     versions: list[SourceTableVersion] = []
@@ -1089,7 +1107,7 @@ def _collect_source_table_versions(graph: "FlowGraph") -> str | None:
                             versions.append(sv)
                 elif table_record.file_path and is_delta_table(table_record.file_path):
                     try:
-                        current_version = _DeltaTable(table_record.file_path, without_files=True).version()
+                        current_version = get_delta_version(table_record.file_path)
                         versions.append(
                             SourceTableVersion(
                                 table_id=table_id,
@@ -1585,6 +1603,20 @@ class _NodeOwners(NamedTuple):
         return self.by_node_id.get(node_id, self.session_owner)
 
 
+def _cache_state_path(flow_path: str | Path) -> Path:
+    """Where this core keeps a saved flow's cache identity: its cache directory, not the portable file."""
+    digest = hashlib.sha256(str(Path(flow_path).absolute()).encode("utf-8")).hexdigest()[:16]
+    return storage.get_cache_file_path(f"flow_cache_state_{digest}.json")
+
+
+def load_cache_state(flow_path: str | Path) -> schemas.FlowfileCacheState | None:
+    """The cache identity this core saved for the flow at *flow_path* (see ``FlowGraph.save_flow``), if any."""
+    try:
+        return schemas.FlowfileCacheState.model_validate_json(_cache_state_path(flow_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
 class FlowGraph:
     """A class representing a Directed Acyclic Graph (DAG) for data processing pipelines.
 
@@ -3266,8 +3298,29 @@ class FlowGraph:
                 and the specific algorithm to apply.
         """
 
+        graph_solver_input = graph_solver_settings.graph_solver_input
+        partitioned = graph_solver_input.strategy == "partitioned" or graph_solver_input.state_name
+
         def _func(fl: FlowDataEngine) -> FlowDataEngine:
-            return fl.solve_graph(graph_solver_settings.graph_solver_input)
+            if not partitioned or self.execution_location == "local":
+                return fl.solve_graph(graph_solver_input)
+
+            node = self.get_node(node_id=graph_solver_settings.node_id)
+            f = fl.start_solve_graph(
+                graph_solver_input,
+                file_ref=node.hash,
+                flow_id=self.flow_id,
+                node_id=graph_solver_settings.node_id,
+            )
+            node._fetch_cached_df = f  # Add to the node so it can be cancelled and fetch later if needed
+            return FlowDataEngine(f.get_result())
+
+        def schema_callback():
+            # The partitioned strategy solves in a worker task, so its schema is predicted rather than run.
+            node = self.get_node(graph_solver_settings.node_id)
+            output_name = graph_solver_input.output_column_name
+            input_columns = [c for c in node.node_inputs.main_inputs[0].schema if c.name != output_name]
+            return input_columns + [FlowfileColumn.from_input(output_name, "UInt32")]
 
         self.add_node_step(
             node_id=graph_solver_settings.node_id,
@@ -3275,6 +3328,7 @@ class FlowGraph:
             node_type="graph_solver",
             setting_input=graph_solver_settings,
             input_node_ids=[graph_solver_settings.depending_on_id],
+            schema_callback=schema_callback if partitioned else None,
         )
 
     @with_history_capture(HistoryActionType.UPDATE_SETTINGS)
@@ -3339,7 +3393,7 @@ class FlowGraph:
             return main.do_cross_join(
                 cross_join_input=cross_join_settings.cross_join_input,
                 auto_generate_selection=cross_join_settings.auto_generate_selection,
-                verify_integrity=False,
+                verify_integrity=cross_join_settings.verify_integrity,
                 other=right,
             )
 
@@ -3380,11 +3434,17 @@ class FlowGraph:
                 left_select.is_available = True if left_select.old_name in main.schema else False
             for right_select in join_input.right_select.renames:
                 right_select.is_available = True if right_select.old_name in right.schema else False
+            node = self.get_node(node_id=join_settings.node_id)
             return main.join(
                 join_input=join_input,
                 auto_generate_selection=join_settings.auto_generate_selection,
-                verify_integrity=False,
+                verify_integrity=join_settings.verify_integrity,
                 other=right,
+                node_logger=self.flow_logger.get_node_logger(join_settings.node_id),
+                input_hashes=(
+                    node.node_inputs.main_inputs[0].data_fingerprint,
+                    node.node_inputs.right_input.data_fingerprint,
+                ),
             )
 
         def schema_callback():
@@ -4104,7 +4164,9 @@ class FlowGraph:
         """
 
         def _func(table: FlowDataEngine) -> FlowDataEngine:
-            return table.apply_dynamic_rename(settings.dynamic_rename_input)
+            return table.apply_dynamic_rename(
+                settings.dynamic_rename_input, self.flow_logger.get_node_logger(settings.node_id)
+            )
 
         self.add_node_step(
             node_id=settings.node_id,
@@ -4570,9 +4632,9 @@ class FlowGraph:
             ctx = pl.SQLContext()
             for name, path in table_paths.items():
                 if _is_cloud_uri(path):
-                    ctx.register(name, pl.scan_delta(path, storage_options=storage_options_by_name.get(name)))
+                    ctx.register(name, scan_delta_table(path, storage_options=storage_options_by_name.get(name)))
                 else:
-                    ctx.register(name, pl.scan_delta(path))
+                    ctx.register(name, scan_delta_table(path))
             for name, (is_opt, ser_lf, tid, stv) in virtual_tables.items():
                 ctx.register(
                     name,
@@ -4656,6 +4718,27 @@ class FlowGraph:
         def _apply_scd2_filter(lf: pl.LazyFrame) -> FlowDataEngine:
             return FlowDataEngine(lf if _scd2_filter is None else lf.filter(_scd2_filter))
 
+        def _read_increment() -> pl.LazyFrame:
+            """Rows added since the last successful run; the consumed version advances once the flow succeeds."""
+            if not (_is_cloud_uri(resolved_path) or is_delta_table(resolved_path)):
+                raise ValueError("Incremental reads need a Delta catalog table")
+            state_name = (
+                node_catalog_reader.incremental_state_name
+                or f"flowfile-{node_catalog_reader.flow_id}-node-{node_catalog_reader.node_id}"
+            )
+            increment = read_catalog_increment(resolved_path, state_name, storage_options=_reader_storage_options)
+            node_logger = self.flow_logger.get_node_logger(node_catalog_reader.node_id)
+            if increment.full:
+                node_logger.info(
+                    f"Nothing consumed under '{state_name}' yet; reading version {increment.version} in full"
+                )
+            else:
+                node_logger.info(f"Reading rows added up to version {increment.version} ('{state_name}')")
+            self.get_node(node_catalog_reader.node_id)._on_flow_complete = make_increment_commit_callback(
+                state_name, resolved_path, increment.version, node_catalog_reader.node_id, self.flow_logger
+            )
+            return increment.lf
+
         def _func() -> FlowDataEngine:
             if not _authorized:
                 raise PermissionError(
@@ -4676,16 +4759,15 @@ class FlowGraph:
 
             if not resolved_path:
                 raise ValueError("Catalog table could not be resolved — no file path found")
-            scan_kwargs = {}
-            if delta_version is not None:
-                scan_kwargs["version"] = delta_version
+            if node_catalog_reader.read_mode == "incremental":
+                return _apply_scd2_filter(_read_increment())
             if _is_cloud_uri(resolved_path):
                 # Cloud catalog table: scan directly (stays lazy ⇒ no collect in core).
                 return _apply_scd2_filter(
-                    pl.scan_delta(resolved_path, storage_options=_reader_storage_options, **scan_kwargs)
+                    scan_delta_table(resolved_path, version=delta_version, storage_options=_reader_storage_options)
                 )
             if is_delta_table(resolved_path):
-                return _apply_scd2_filter(pl.scan_delta(resolved_path, **scan_kwargs))
+                return _apply_scd2_filter(scan_delta_table(resolved_path, version=delta_version))
             return _apply_scd2_filter(pl.scan_parquet(resolved_path))
 
         self.add_node_step(
@@ -4763,6 +4845,7 @@ class FlowGraph:
                     ),
                     table_name=table_name,
                     if_exists=database_settings.if_exists or "append",
+                    merge_keys=database_settings.merge_keys,
                 )
                 return df
 
@@ -4855,6 +4938,7 @@ class FlowGraph:
                     fields=node_database_reader.fields,
                     cancel_check=lambda: self.flow_settings.is_canceled or node._execution_state.is_canceled,
                     database_type=database_connection.database_type,
+                    partitioning=database_settings.partitioning,
                 )
                 fl = FlowDataEngine(local_source.get_pl_df())
                 fl.lazy = True
@@ -6005,6 +6089,7 @@ class FlowGraph:
         performance_mode: bool,
         run_info_lock: threading.Lock,
         params: dict[str, ParamValue] | None = None,
+        fused: bool = False,
     ) -> tuple[NodeResult, FlowNode]:
         """Executes a single node, records its result, and returns both.
 
@@ -6015,6 +6100,7 @@ class FlowGraph:
             performance_mode: Whether to run in performance mode.
             run_info_lock: Lock protecting shared RunInformation state.
             params: Optional parameter dict for ${name} substitution in node settings.
+            fused: Whether the node is fused into its downstream node (see compute_fused_node_ids).
 
         Returns:
             A (NodeResult, FlowNode) tuple for post-stage failure propagation.
@@ -6057,6 +6143,7 @@ class FlowGraph:
                 run_location=self.flow_settings.execution_location,
                 performance_mode=performance_mode,
                 node_logger=node_logger,
+                fused=fused,
             )
         finally:
             # Restore original ${...} refs so the saved flow is unchanged
@@ -6141,18 +6228,38 @@ class FlowGraph:
                         sorted(node_ids_for_kernel),
                     )
 
-    def _execute_stages(
+    def _previous_node_run_times(self) -> dict[str | int, float]:
+        """Returns the per-node run time (ms) of the previous run, used as scheduling cost estimate."""
+        if self.latest_run_info is None:
+            return {}
+        return {
+            node_result.node_id: float(node_result.run_time_ms)
+            for node_result in self.latest_run_info.node_step_result
+            if node_result.run_time_ms and node_result.run_time_ms > 0
+        }
+
+    def _execute_plan(
         self,
         execution_plan: ExecutionPlan,
         performance_mode: bool,
         params: dict[str, ParamValue],
         skip_node_ids: set[str | int],
+        node_costs: dict[str | int, float] | None = None,
     ) -> set[str | int]:
-        """Execute all stages in the plan, running independent nodes in parallel.
+        """Execute all nodes in the plan, starting each node as soon as its own upstreams finish.
+
+        There is no barrier between stages: a slow node only delays the nodes that
+        depend on it. Ready nodes are submitted to a single bounded thread pool that
+        lives for the whole run, ordered by their critical path (longest remaining
+        chain of downstream work, weighted by ``node_costs`` when known). In local
+        execution, or with ``max_parallel_workers == 1``, nodes run sequentially on
+        the calling thread in that same priority order.
+
+        Chains of narrow nodes are fused (see ``compute_fused_node_ids``): only the node
+        that ends a chain sends the combined plan to the worker.
 
-        Iterates through stages sequentially. Within each stage, independent
-        nodes are executed in parallel (or sequentially if parallelism is
-        disabled). Failed nodes cause their dependents to be skipped.
+        Failed nodes cause their dependents to be skipped, and ``skip_node_ids`` is
+        updated in place so post-execution callbacks see the full set.
 
         Returns:
             Set of node IDs that failed during execution.
@@ -6160,47 +6267,69 @@ class FlowGraph:
         run_info_lock = threading.Lock()
         failed_node_ids: set[str | int] = set()
 
-        for stage in execution_plan.stages:
-            if self.flow_settings.is_canceled:
-                self.flow_logger.info("Flow canceled")
-                break
-
-            nodes_to_run = [n for n in stage.nodes if n.node_id not in skip_node_ids]
-
-            for skipped in stage.nodes:
-                if skipped.node_id in skip_node_ids:
-                    node_logger = self.flow_logger.get_node_logger(skipped.node_id)
-                    node_logger.info(f"Skipping node {skipped.node_id}")
-
-            if not nodes_to_run:
-                continue
+        pending_upstreams, dependents = execution_plan.dependency_map()
+        priorities = compute_critical_path_lengths(execution_plan.all_nodes, node_costs)
+        topological_index = {node.node_id: i for i, node in enumerate(execution_plan.all_nodes)}
+        is_local = self.flow_settings.execution_location == "local"
+        fused_node_ids = set() if is_local else compute_fused_node_ids(execution_plan)
+        ready: list[tuple[float, int, FlowNode]] = []
+
+        def push_ready(node: FlowNode) -> None:
+            heapq.heappush(ready, (-priorities[node.node_id], topological_index[node.node_id], node))
+
+        def complete(node: FlowNode) -> None:
+            for next_node in dependents[node.node_id]:
+                pending_upstreams[next_node.node_id] -= 1
+                if pending_upstreams[next_node.node_id] == 0:
+                    push_ready(next_node)
+
+        def record_result(node_result: NodeResult, node: FlowNode) -> None:
+            if not node_result.success:
+                failed_node_ids.add(node.node_id)
+                skip_node_ids.add(node.node_id)
+                for dep in node.get_all_dependent_nodes():
+                    skip_node_ids.add(dep.node_id)
+            complete(node)
+
+        for node in execution_plan.all_nodes:
+            if pending_upstreams[node.node_id] == 0:
+                push_ready(node)
+
+        max_workers = 1 if is_local else self.flow_settings.max_parallel_workers
+        executor = ThreadPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+        running: dict[Future, FlowNode] = {}
+        try:
+            while ready or running:
+                while ready and len(running) < max_workers and not self.flow_settings.is_canceled:
+                    _, _, node = heapq.heappop(ready)
+                    if node.node_id in skip_node_ids:
+                        self.flow_logger.get_node_logger(node.node_id).info(f"Skipping node {node.node_id}")
+                        complete(node)
+                        continue
+                    fused = node.node_id in fused_node_ids
+                    if executor is None:
+                        record_result(
+                            *self._execute_single_node(node, performance_mode, run_info_lock, params or None, fused)
+                        )
+                        continue
+                    future = executor.submit(
+                        self._execute_single_node, node, performance_mode, run_info_lock, params or None, fused
+                    )
+                    running[future] = node
 
-            is_local = self.flow_settings.execution_location == "local"
-            max_workers = 1 if is_local else self.flow_settings.max_parallel_workers
-            if len(nodes_to_run) == 1 or max_workers == 1:
-                stage_results = [
-                    self._execute_single_node(node, performance_mode, run_info_lock, params or None)
-                    for node in nodes_to_run
-                ]
-            else:
-                stage_results: list[tuple[NodeResult, FlowNode]] = []
-                workers = min(max_workers, len(nodes_to_run))
-                with ThreadPoolExecutor(max_workers=workers) as executor:
-                    futures = {
-                        executor.submit(
-                            self._execute_single_node, node, performance_mode, run_info_lock, params or None
-                        ): node
-                        for node in nodes_to_run
-                    }
-                    for future in as_completed(futures):
-                        stage_results.append(future.result())
+                if not running:
+                    if self.flow_settings.is_canceled:
+                        self.flow_logger.info("Flow canceled")
+                        break
+                    continue
 
-            for node_result, node in stage_results:
-                if not node_result.success:
-                    failed_node_ids.add(node.node_id)
-                    skip_node_ids.add(node.node_id)
-                    for dep in node.get_all_dependent_nodes():
-                        skip_node_ids.add(dep.node_id)
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    running.pop(future)
+                    record_result(*future.result())
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
 
         return failed_node_ids
 
@@ -6234,6 +6363,29 @@ class FlowGraph:
                 self.flow_logger.error(f"Post-execution callback failed for node {n.node_id}: {e}")
             n._on_flow_complete = None
 
+    def _record_catalog_filter_columns(self) -> None:
+        """Count the columns each catalog table is filtered on right after its reader.
+
+        Feeds the Z-order choice of the background catalog maintenance. Best-effort:
+        a failure here never fails the run.
+        """
+        try:
+            for node in self.nodes:
+                if node.node_type != "catalog_reader":
+                    continue
+                setting = node.setting_input
+                table_id = getattr(setting, "catalog_table_id", None)
+                if not table_id or getattr(setting, "sql_query", None):
+                    continue
+                columns: set[str] = set()
+                for child in node.leads_to_nodes:
+                    if child.node_type == "filter":
+                        columns |= filter_columns(child.setting_input)
+                if columns:
+                    record_filter_columns(table_id, columns)
+        except Exception:
+            logger.warning("Could not record catalog filter columns", exc_info=True)
+
     def _refresh_catalog_reader_freshness(self) -> None:
         """Invalidate catalog_reader nodes whose Delta sources changed since their last run.
 
@@ -6297,12 +6449,23 @@ class FlowGraph:
             node.reset()
             self.flow_logger.info(f"Node {node.node_id}: source files changed; invalidating cached result")
 
+    def _refresh_shared_source_hashes(self) -> None:
+        """Re-key sources whose shared hash folds in a data version that moved since it was memoized.
+
+        A shared hash names the result by the source's current version, so a stale memo could
+        adopt another flow's result over older data. needs_reset() recomputes the hash from the
+        live version; reset() then cascades the new key downstream.
+        """
+        for node in self.nodes:
+            if node.node_type in ("read", "catalog_reader") and node.needs_reset():
+                node.reset()
+
     def run_graph(self) -> RunInformation | None:
         """Executes the entire data flow graph from start to finish.
 
-        Independent nodes within the same execution stage are run in parallel
-        using threads. Stages are processed sequentially so that all dependencies
-        are satisfied before a stage begins.
+        Nodes are scheduled as soon as all of their upstream nodes have finished,
+        so independent branches run in parallel on a bounded thread pool without
+        waiting for unrelated slow nodes. Ready nodes on the critical path go first.
 
         Returns:
             A RunInformation object summarizing the execution results.
@@ -6319,6 +6482,8 @@ class FlowGraph:
 
             self._refresh_catalog_reader_freshness()
             self._refresh_read_source_freshness()
+            if SHARE_WORKER_RESULTS:
+                self._refresh_shared_source_hashes()
 
             execution_plan = compute_execution_plan(
                 nodes=self.nodes, flow_starts=self._flow_starts + self.get_implicit_starter_nodes()
@@ -6327,6 +6492,7 @@ class FlowGraph:
             plan_skip_ids: set[str | int] = {n.node_id for n in execution_plan.skip_nodes}
             self._prepare_rerun_artifacts(plan_skip_ids)
 
+            previous_run_times = self._previous_node_run_times()
             self.latest_run_info = self.create_initial_run_information(execution_plan.node_count, "full_run")
             skip_node_message(self.flow_logger, execution_plan.skip_nodes)
             execution_order_message(self.flow_logger, execution_plan.stages)
@@ -6334,9 +6500,15 @@ class FlowGraph:
             performance_mode = self.flow_settings.execution_mode == "Performance"
             params: dict[str, ParamValue] = {p.name: p.typed_default() for p in self.flow_settings.parameters}
 
-            failed_node_ids = self._execute_stages(execution_plan, performance_mode, params, plan_skip_ids)
+            # One worker round trip answers every cached node's "is my result still there?" check.
+            cached_hashes = [n.hash for n in execution_plan.all_nodes if n.node_settings.cache_results]
+            with prefetched_results_exist(cached_hashes):
+                failed_node_ids = self._execute_plan(
+                    execution_plan, performance_mode, params, plan_skip_ids, node_costs=previous_run_times
+                )
             if not self.flow_settings.is_canceled:
                 self._run_post_execution_callbacks(failed_node_ids, plan_skip_ids)
+                self._record_catalog_filter_columns()
 
             self.latest_run_info.end_time = datetime.datetime.now()
             self.flow_logger.info("Flow completed!")
@@ -6399,7 +6571,55 @@ class FlowGraph:
         node = self._node_db[node_id]
         return node.get_node_data(flow_id=self.flow_id, include_example=include_example)
 
+    def get_hash_index(self) -> dict[int, str]:
+        """Maps every node id to its hash, the key its results are cached under on the worker.
+
+        Each node hash folds in its inputs' hashes, so the index behaves like a Merkle
+        tree: hashes are memoized per node, a settings change only drops the memos of the
+        changed node and its downstream subtree, and settings digests are reused until the
+        settings themselves change.
+        """
+        return {node.node_id: node.hash for node in self.nodes}
+
+    def get_cache_state(self) -> schemas.FlowfileCacheState:
+        """The flow's cache identity, kept by ``save_flow`` so a reopened flow reproduces its hashes."""
+        return schemas.FlowfileCacheState(
+            cache_key=self.uuid,
+            nodes=[state for node in self.nodes if (state := node.get_cache_state()) is not None],
+        )
+
+    def set_cache_key(self, cache_key: str) -> None:
+        """Replaces the flow's uuid, which every node hash folds in, and drops the hash memos."""
+        self.uuid = cache_key
+        for node in self.nodes:
+            node.parent_uuid = cache_key
+            node._hash = None
+
+    def _save_cache_state(self, flow_path: str) -> None:
+        """Keeps the flow's cache identity for this core (see ``load_cache_state``); best effort."""
+        path = _cache_state_path(flow_path)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(self.get_cache_state().model_dump_json(), encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"Could not save the cache state of {flow_path}: {e}")
+
+    def restore_cache_state(self, cache_state: schemas.FlowfileCacheState) -> None:
+        """Adopts the cache identity saved with the flow (see ``get_cache_state``).
+
+        Reusing the saved cache key and cache epochs reproduces the node hashes of the
+        session that saved the flow, so results the worker still holds for them are found
+        again after a restart. Settings digests are recomputed once, not trusted from the
+        file, so a hand-edited flow can never hit a stale result.
+        """
+        saved = {node_state.node_id: node_state for node_state in cache_state.nodes}
+        for node in self.nodes:
+            if node.node_id in saved:
+                node.restore_cache_state(saved[node.node_id])
+        self.set_cache_key(cache_state.cache_key)
+
     def get_flowfile_data(self) -> schemas.FlowfileData:
+        """Serializes the graph into the flowfile save format."""
         start_node_ids = {v.node_id for v in self._flow_starts}
 
         nodes = []
@@ -6479,10 +6699,18 @@ class FlowGraph:
             node.cancel()
 
     def close_flow(self):
-        """Performs cleanup operations, such as clearing node caches."""
+        """Performs cleanup operations, such as clearing node caches.
 
-        for node in self.nodes:
-            node.remove_cache()
+        Shared results (see ``FlowNode.shares_results``) are only released: other flows may
+        reuse them, and the worker evicts them once nobody holds them. Every other hold this
+        flow took (e.g. on a result from before a node's settings changed) is released too.
+        """
+
+        shared = [node.shares_results for node in self.nodes]
+        clear_tasks_from_worker(
+            (node.hash for node, is_shared in zip(self.nodes, shared, strict=True) if not is_shared), holder=self.uuid
+        )
+        release_results(self.uuid)
 
     def _handle_flow_renaming(self, new_name: str, new_path: Path):
         """Adopt the target file's stem as the flow name, but only when a save relocates the flow.
@@ -6550,6 +6778,7 @@ class FlowGraph:
             raise
 
         self.flow_settings.path = flow_path
+        self._save_cache_state(flow_path)
         self._sync_catalog_read_links()
         # Record the current state as the clean baseline for dirty tracking
         self.mark_as_saved()
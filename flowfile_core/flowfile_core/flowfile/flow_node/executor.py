@@ -94,6 +94,7 @@ class NodeExecutor:
         retry: bool = True,
         node_logger: NodeLogger = None,
         optimize_for_downstream: bool = True,
+        fused: bool = False,
     ) -> None:
         """
         Main execution entry point.
@@ -108,6 +109,7 @@ class NodeExecutor:
             retry: Allow retry on recoverable errors
             node_logger: Logger for this node's execution
             optimize_for_downstream: Cache wide transforms for downstream nodes
+            fused: The node sits inside a fused narrow chain (see compute_fused_node_ids)
         """
         if node_logger is None:
             raise ValueError("node_logger is required")
@@ -119,6 +121,7 @@ class NodeExecutor:
 
         decision = self._decide_execution(state, run_location, performance_mode, reset_cache)
         decision = self._override_for_downstream(decision, run_location, optimize_for_downstream)
+        decision = self._override_for_fusion(decision, fused)
         if not decision.should_run:
             return
 
@@ -176,6 +179,13 @@ class NodeExecutor:
             return ExecutionDecision(True, ExecutionStrategy.REMOTE, decision.reason)
         return decision
 
+    @staticmethod
+    def _override_for_fusion(decision: ExecutionDecision, fused: bool) -> ExecutionDecision:
+        """Defer the preview sample of a node whose lazy plan is absorbed by its single downstream consumer."""
+        if fused and decision.should_run and decision.strategy == ExecutionStrategy.LOCAL_WITH_SAMPLING:
+            return ExecutionDecision(True, ExecutionStrategy.LOCAL_FUSED, decision.reason)
+        return decision
+
     def _decide_execution(
         self,
         state: NodeExecutionState,
@@ -280,6 +290,8 @@ class NodeExecutor:
                 self._do_full_local(state, performance_mode)
             case ExecutionStrategy.LOCAL_WITH_SAMPLING:
                 self._do_local_with_sampling(state, performance_mode, node_logger.flow_id)
+            case ExecutionStrategy.LOCAL_FUSED:
+                self._do_local_with_sampling(state, performance_mode, node_logger.flow_id, defer_sampling=True)
             case ExecutionStrategy.REMOTE:
                 self._do_remote(state, performance_mode, node_logger)
 
@@ -295,14 +307,17 @@ class NodeExecutor:
             if self.node.results.resulting_data is not None:
                 state.result_schema = self.node.results.resulting_data.schema
 
-    def _do_local_with_sampling(self, state: NodeExecutionState, performance_mode: bool, flow_id: int) -> None:
+    def _do_local_with_sampling(
+        self, state: NodeExecutionState, performance_mode: bool, flow_id: int, defer_sampling: bool = False
+    ) -> None:
         """
         In-process execution with external sampler for preview data.
 
         The main computation runs locally, but sample data is generated
-        via an external process for the UI preview.
+        via an external process for the UI preview. With ``defer_sampling``
+        (fused chains) the sampler only runs once the preview is requested.
         """
-        self.node._do_execute_local_with_sampling(performance_mode, flow_id)
+        self.node._do_execute_local_with_sampling(performance_mode, flow_id, defer_sampling=defer_sampling)
         if self.node.results.resulting_data is not None:
             state.result_schema = self.node.results.resulting_data.schema
         if self.node.results.errors is None and not self.node.node_stats.is_canceled:
@@ -5,9 +5,11 @@ from time import sleep
 from typing import Any, Literal, Optional
 
 import polars as pl
+import pyarrow as pa
 
 from flowfile_core.configs import logger, node_store
 from flowfile_core.configs.flow_logger import NodeLogger
+from flowfile_core.configs.settings import SHARE_WORKER_RESULTS
 from flowfile_core.flowfile.flow_data_engine.column_stats import ColumnStatsUnavailable, compute_column_stats
 from flowfile_core.flowfile.flow_data_engine.flow_data_engine import FlowDataEngine
 from flowfile_core.flowfile.flow_data_engine.flow_file_column.main import FlowfileColumn
@@ -18,8 +20,11 @@ from flowfile_core.flowfile.flow_data_engine.subprocess_operations import (
     ExternalDfFetcher,
     ExternalOutputWriter,
     ExternalSampler,
+    acquire_results,
     clear_task_from_worker,
+    get_df_result,
     get_external_df_result,
+    get_results,
     results_exists,
 )
 from flowfile_core.flowfile.flow_node.executor import NodeExecutor
@@ -43,11 +48,11 @@ from flowfile_core.flowfile.flow_node.multi_output import (
 from flowfile_core.flowfile.flow_node.output_field_config_applier import apply_output_field_config
 from flowfile_core.flowfile.flow_node.schema_callback import SingleExecutionFuture
 from flowfile_core.flowfile.flow_node.schema_utils import create_schema_callback_with_output_config
-from flowfile_core.flowfile.flow_node.state import NodeExecutionState
+from flowfile_core.flowfile.flow_node.state import NodeExecutionState, SourceFileInfo
 from flowfile_core.flowfile.param_types import ParamValue
 from flowfile_core.flowfile.parameter_resolver import apply_parameters_in_place, restore_parameters
 from flowfile_core.flowfile.setting_generator import setting_generator, setting_updator
-from flowfile_core.flowfile.utils import get_hash
+from flowfile_core.flowfile.utils import HASH_EXCLUDED_FIELDS, get_hash, get_hash_snapshot, json_dumps
 from flowfile_core.schemas import input_schema, schemas
 from flowfile_core.schemas.output_model import FileColumn, NodeData, TableExample
 from flowfile_core.utils.arrow_reader import get_read_top_n
@@ -56,6 +61,49 @@ ExternalTaskHandle = (
     ExternalDfFetcher | ExternalDatabaseFetcher | ExternalDatabaseWriter | ExternalCloudWriter | ExternalOutputWriter
 )
 
+# Node types whose result depends only on their settings, their inputs and - for sources - a
+# fingerprintable source, so SHARE_WORKER_RESULTS can key them on a flow-independent hash.
+# User code (polars_code, sql_query) is left out: it can read files or the clock.
+_SHAREABLE_NODE_TYPES = frozenset(
+    {
+        "manual_input",
+        "read",
+        "catalog_reader",
+        "select",
+        "filter",
+        "formula",
+        "sort",
+        "unique",
+        "sample",
+        "record_id",
+        "dynamic_rename",
+        "text_to_rows",
+        "group_by",
+        "window_functions",
+        "pivot",
+        "unpivot",
+        "record_count",
+        "join",
+        "cross_join",
+        "union",
+        "fuzzy_match",
+        "graph_solver",
+    }
+)
+# Identity, layout and wiring fields that never change a node's result. Wiring is already
+# covered by the input hashes; user_id only matters where it scopes access (catalog reads).
+_SHARED_HASH_EXCLUDED_FIELDS = HASH_EXCLUDED_FIELDS | {
+    "flow_id",
+    "node_id",
+    "group_id",
+    "node_reference",
+    "is_setup",
+    "cache_results",
+    "depending_on_id",
+    "depending_on_ids",
+    "user_id",
+}
+
 
 def kernel_block_reason(node: "FlowNode", include_self: bool) -> str | None:
     """Name the first un-run kernel node a data-needing prediction would execute.
@@ -153,6 +201,7 @@ class FlowNode:
 
     _hash: str | None
     _cache_epoch: int  # bumped by invalidate_cache() to bust the hash
+    _settings_digest: tuple[frozenset[str], Any, str] | None  # (exclude, snapshot, digest) of the last hash
     _fetch_cached_df: ExternalTaskHandle | None
     _cache_progress: ExternalTaskHandle | None
 
@@ -245,6 +294,7 @@ class FlowNode:
 
         self._hash = None
         self._cache_epoch = 0
+        self._settings_digest = None
         self._cache_progress = None
         self._fetch_cached_df = None
 
@@ -718,9 +768,64 @@ class FlowNode:
             ]
         else:
             depends_on_hashes = [_node.hash for _node in self.all_inputs]
-        node_data_hash = get_hash(setting_input)
+        shared_scope = self._shared_hash_scope(setting_input)
+        if shared_scope is not None:
+            exclude = _SHARED_HASH_EXCLUDED_FIELDS
+            if self.node_type == "catalog_reader":
+                exclude = exclude - {"user_id"}
+            node_data_hash = self._get_settings_digest(setting_input, exclude)
+            # The epoch stays in, so invalidate_cache() also moves the node off a shared result.
+            return get_hash(depends_on_hashes + [node_data_hash, self.node_type, shared_scope, self._cache_epoch])
+        node_data_hash = self._get_settings_digest(setting_input)
         return get_hash(depends_on_hashes + [node_data_hash, self.parent_uuid, self._cache_epoch])
 
+    def _get_settings_digest(self, setting_input: Any, exclude: frozenset[str] = HASH_EXCLUDED_FIELDS) -> str:
+        """Returns ``get_hash(setting_input, exclude)``, reusing the last digest while the settings are unchanged.
+
+        Comparing snapshots is far cheaper than re-serializing large settings (manual-input
+        data, long code strings), which ``needs_reset`` and every ``reset`` would otherwise
+        do on each settings update anywhere upstream.
+        """
+        snapshot = get_hash_snapshot(setting_input, exclude)
+        cached = self._settings_digest
+        if snapshot is not None and cached is not None and cached[0] == exclude and cached[1] == snapshot:
+            return cached[2]
+        digest = get_hash(setting_input, exclude)
+        if snapshot is not None:
+            self._settings_digest = (exclude, snapshot, digest)
+        return digest
+
+    def _shared_hash_scope(self, setting_input: Any) -> str | None:
+        """What a flow-independent hash folds in instead of the flow's uuid.
+
+        Sources fold in their data version (file stats, Delta versions), which is what the
+        cache epoch tracks for flow-local hashes. None keeps the node's hash flow-local:
+        sharing is off, the node type is not shareable, its source cannot be fingerprinted,
+        or it reads incrementally.
+        Downstream of a flow-local node every hash is flow-local too, as it folds in that hash.
+        """
+        if not SHARE_WORKER_RESULTS or self.node_type not in _SHAREABLE_NODE_TYPES:
+            return None
+        if getattr(setting_input, "is_user_defined", False):
+            return None
+        if self.node_type == "read":
+            source_info = self.executor._snapshot_source(self.executor._get_source_path())
+            return json_dumps(source_info.to_dict()) if source_info is not None else None
+        if self.node_type == "catalog_reader":
+            # Incremental reads advance a per-flow/node offset, which the shared hash drops.
+            if setting_input.read_mode == "incremental":
+                return None
+            if not setting_input.sql_query and setting_input.delta_version is not None:
+                return "pinned"
+            # Probed by FlowGraph._refresh_catalog_reader_freshness; None until the first run.
+            return self._execution_state.source_version_info
+        return "shared"
+
+    @property
+    def shares_results(self) -> bool:
+        """Whether the node's worker results are keyed on a flow-independent hash (see SHARE_WORKER_RESULTS)."""
+        return self._shared_hash_scope(self.setting_input) is not None
+
     @property
     def hash(self) -> str:
         """Gets the cached hash for the node, calculating it if it doesn't exist.
@@ -732,6 +837,32 @@ class FlowNode:
             self._hash = self.calculate_hash(self.setting_input)
         return self._hash
 
+    @property
+    def data_fingerprint(self) -> str:
+        """The hash plus the source fingerprints recorded by this node and its upstreams.
+
+        A flow-local hash does not move when a read node's file or a catalog table
+        changes underneath it, so anything keyed on the data (rather than the worker
+        result) folds in the file stats and Delta versions captured at the last run.
+        """
+        sources: list[str] = []
+        stack: list[FlowNode] = [self]
+        seen: set[int] = set()
+        while stack:
+            current = stack.pop()
+            if current.node_id in seen:
+                continue
+            seen.add(current.node_id)
+            state = current._execution_state
+            if state.source_file_info is not None:
+                sources.append(f"{current.node_id}:{json_dumps(state.source_file_info.to_dict())}")
+            if state.source_version_info is not None:
+                sources.append(f"{current.node_id}:{state.source_version_info}")
+            stack.extend(current.all_inputs)
+        if not sources:
+            return self.hash
+        return get_hash([self.hash] + sorted(sources))
+
     def add_node_connection(
         self,
         from_node: "FlowNode",
@@ -1333,10 +1464,10 @@ class FlowNode:
 
         Unguarded by results_exists: a task whose result file is already gone
         still holds a worker status entry, and that is exactly the case that
-        needs clearing.
+        needs clearing. A shared result other flows still hold is kept for them.
         """
 
-        clear_task_from_worker(self.hash)
+        clear_task_from_worker(self.hash, holder=self.parent_uuid)
 
     def needs_run(
         self,
@@ -1409,7 +1540,9 @@ class FlowNode:
             self.node_schema.result_schema = self.results.resulting_data.schema
             self.node_stats.has_completed_last_run = True
 
-    def _do_execute_local_with_sampling(self, performance_mode: bool = False, flow_id: int = None):
+    def _do_execute_local_with_sampling(
+        self, performance_mode: bool = False, flow_id: int = None, defer_sampling: bool = False
+    ):
         """Executes the node's logic locally with external sampling.
 
         Internal method called by NodeExecutor.
@@ -1417,13 +1550,21 @@ class FlowNode:
         Args:
             performance_mode: If True, skips generating example data.
             flow_id: The ID of the parent flow.
+            defer_sampling: If True, the sample is only taken once the preview is requested.
+                Used for nodes inside a fused narrow chain, whose plan runs as part of
+                the downstream node's worker task anyway.
 
         Raises:
             Exception: Propagates exceptions from the execution.
         """
         try:
             resulting_data = self.get_resulting_data()
-            if not performance_mode:
+            if not performance_mode and defer_sampling:
+                self.results.example_data_generator = self._deferred_example_data_generator(
+                    resulting_data.data_frame, flow_id
+                )
+                self.node_stats.has_run_with_current_setup = True
+            elif not performance_mode:
                 external_sampler = ExternalSampler(
                     lf=resulting_data.data_frame,
                     file_ref=self.hash,
@@ -1449,6 +1590,34 @@ class FlowNode:
                 if not self.node_settings.streamable:
                     step.node_settings.streamable = self.node_settings.streamable
 
+    def _deferred_example_data_generator(self, lf: pl.LazyFrame, flow_id: int) -> Callable[[], pa.Table]:
+        """Returns an example data getter that runs the external sampler on its first call only.
+
+        The sampler result then replaces the getter, exactly as for an eagerly sampled node.
+        """
+        file_ref = self.hash
+        lock = threading.Lock()
+
+        def get_example_data() -> pa.Table:
+            with lock:
+                if self.results.example_data_generator is not get_example_data:
+                    # Already sampled, or the node was reset since this run.
+                    getter = self.results.example_data_generator
+                    return getter() if getter is not None else pa.table({})
+                try:
+                    external_sampler = ExternalSampler(
+                        lf=lf, file_ref=file_ref, wait_on_completion=True, node_id=self.node_id, flow_id=flow_id
+                    )
+                except Exception as e:
+                    logger.error(f"Could not sample step {self.__name__}: {e}")
+                    return pa.table({})
+                self.store_example_data_generator(external_sampler)
+                if self.results.example_data_generator is get_example_data:
+                    return pa.table({})
+                return self.results.example_data_generator()
+
+        return get_example_data
+
     _INFER_SCHEMA_RUNGS = (10_000, 100_000)
 
     @staticmethod
@@ -1508,7 +1677,11 @@ class FlowNode:
         """
         if node_logger is None:
             raise Exception("Node logger is not defined")
+        if self.shares_results and self._reuse_shared_result():
+            node_logger.info("Reusing the shared worker result of an identical sub-plan")
+            return
         if self.node_settings.cache_results and results_exists(self.hash):
+            acquire_results([self.hash], self.parent_uuid)
             try:
                 self.results.resulting_data = FlowDataEngine(get_external_df_result(self.hash))
                 self._cache_progress = None
@@ -1540,6 +1713,8 @@ class FlowNode:
             store_frame = self.get_resulting_data().data_frame
             current_infer = self._eligible_infer_length()
             file_ref = self.hash
+            memory_limit_mb = getattr(self.setting_input, "memory_limit_mb", None)
+            estimated_input_bytes = self._estimated_input_bytes()
 
             while True:
                 external_df_fetcher = ExternalDfFetcher(
@@ -1548,6 +1723,8 @@ class FlowNode:
                     wait_on_completion=False,
                     flow_id=node_logger.flow_id,
                     node_id=self.node_id,
+                    kwargs={"memory_limit_mb": memory_limit_mb} if memory_limit_mb else None,
+                    estimated_input_bytes=estimated_input_bytes,
                 )
                 self._fetch_cached_df = external_df_fetcher
 
@@ -1561,6 +1738,8 @@ class FlowNode:
                     )
                     self.store_example_data_generator(external_df_fetcher)
                     self.node_stats.has_run_with_current_setup = True
+                    # The scan_ipc plan above reads the worker's file: hold it so eviction leaves it be.
+                    acquire_results([file_ref], self.parent_uuid)
                     break
 
                 except Exception as e:
@@ -1614,6 +1793,38 @@ class FlowNode:
                 finally:
                     self._fetch_cached_df = None
 
+    def _estimated_input_bytes(self) -> int | None:
+        """Size of the source files behind this node and its computed inputs, for worker admission control."""
+        frames = [self.results.resulting_data] + [node.results.resulting_data for node in self.all_inputs]
+        try:
+            total = sum(frame.get_estimated_file_size() for frame in frames if frame is not None)
+        except OSError:
+            return None
+        return total or None
+
+    def _reuse_shared_result(self) -> bool:
+        """Adopts a completed worker result stored under this node's shared hash, by any flow.
+
+        The result is held for this flow first, so the worker can neither evict it nor let
+        another flow's clear delete it while this flow reads it; ``FlowGraph.close_flow``
+        releases the hold.
+        """
+        if not acquire_results([self.hash], self.parent_uuid):
+            return False
+        try:
+            status = get_results(self.hash)
+            self.results.resulting_data = FlowDataEngine(
+                get_df_result(status.results), number_of_records=status.number_of_records
+            )
+        except Exception as e:
+            logger.warning(f"Could not read the shared result for node {self.node_id}, rerunning: {e}")
+            return False
+        self.results.example_data_path = status.file_ref
+        self.results.example_data_generator = get_read_top_n(file_path=status.file_ref, n=100)
+        self.node_stats.has_run_with_current_setup = True
+        self._cache_progress = None
+        return True
+
     # Backward-compatible aliases for renamed methods
     def execute_full_local(self, performance_mode: bool = False) -> None:
         """Backward-compatible alias for _do_execute_full_local."""
@@ -1672,6 +1883,7 @@ class FlowNode:
         retry: bool = True,
         node_logger: NodeLogger | None = None,
         optimize_for_downstream: bool = True,
+        fused: bool = False,
     ) -> None:
         """Execute the node based on its current state and settings.
 
@@ -1685,6 +1897,7 @@ class FlowNode:
             retry: Allow retry on recoverable errors
             node_logger: Logger for this node's execution
             optimize_for_downstream: Cache wide transforms for downstream nodes
+            fused: The node sits inside a fused narrow chain; its preview is sampled on demand
         """
         if node_logger is None:
             raise ValueError("node_logger is required")
@@ -1699,6 +1912,7 @@ class FlowNode:
             retry=retry,
             node_logger=node_logger,
             optimize_for_downstream=optimize_for_downstream,
+            fused=fused,
         )
 
     def store_example_data_generator(self, external_df_fetcher: ExternalDfFetcher | ExternalSampler):
@@ -1778,6 +1992,31 @@ class FlowNode:
         self.node_stats.has_run_with_current_setup = False
         self.node_stats.has_completed_last_run = False
 
+    def get_cache_state(self) -> schemas.FlowfileNodeCacheState | None:
+        """The node's hash and freshness inputs worth saving with the flow, or None if all are defaults."""
+        state = self._execution_state
+        if not self._cache_epoch and state.source_file_info is None and state.source_version_info is None:
+            return None
+        return schemas.FlowfileNodeCacheState(
+            node_id=self.node_id,
+            cache_epoch=self._cache_epoch,
+            source_file_info=state.source_file_info.to_dict() if state.source_file_info else None,
+            source_version_info=state.source_version_info,
+        )
+
+    def restore_cache_state(self, cache_state: schemas.FlowfileNodeCacheState) -> None:
+        """Re-applies the cache epoch and source fingerprints saved by ``get_cache_state``.
+
+        Restoring the fingerprints keeps freshness checks honest: a source that changed
+        while the flow was closed still invalidates the node instead of serving the
+        worker's cached result.
+        """
+        self._cache_epoch = cache_state.cache_epoch
+        if cache_state.source_file_info:
+            self._execution_state.source_file_info = SourceFileInfo.from_dict(cache_state.source_file_info)
+        self._execution_state.source_version_info = cache_state.source_version_info
+        self._hash = None
+
     def delete_lead_to_node(self, node_id: int) -> bool:
         """Removes a connection to a specific downstream node.
 
@@ -17,6 +17,7 @@ class ExecutionStrategy(Enum):
     SKIP = auto()  # Already up-to-date, don't execute
     FULL_LOCAL = auto()  # 100% in-process (WASM, simple cases)
     LOCAL_WITH_SAMPLING = auto()  # In-process + external sampler for preview
+    LOCAL_FUSED = auto()  # In-process inside a fused narrow chain, preview sampled on demand
     REMOTE = auto()  # Full external worker execution
 
 
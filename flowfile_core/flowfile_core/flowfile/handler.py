@@ -3,6 +3,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from uuid import uuid1
 
 from flowfile_core.flowfile.flow_graph import FlowGraph
 from flowfile_core.flowfile.manage.io_flowfile import open_flow
@@ -84,7 +85,10 @@ class FlowfileHandler:
         session, so project import doesn't auto-open every flow on the canvas."""
         if isinstance(flow_path, str):
             flow_path = Path(flow_path)
-        imported_flow = open_flow(flow_path, user_id=user_id)
+        imported_flow = open_flow(flow_path, user_id=user_id, restore_cache_state=True)
+        if any(flow.uuid == imported_flow.uuid for flow in self._flows.values()):
+            # The same file is already open; two graphs must never share worker task ids.
+            imported_flow.set_cache_key(str(uuid1()))
         self._flows[imported_flow.flow_id] = imported_flow
         imported_flow.flow_settings = self.get_flow_info(imported_flow.flow_id)
         # The stored id is machine-local and a copied file carries the original's; callers
@@ -3,7 +3,7 @@ from pathlib import Path
 
 from flowfile_core.configs.node_store import CUSTOM_NODE_STORE, register_missing_node_template
 from flowfile_core.configs.settings import is_docker_mode
-from flowfile_core.flowfile.flow_graph import FlowGraph, restore_dynamic_input_connections
+from flowfile_core.flowfile.flow_graph import FlowGraph, load_cache_state, restore_dynamic_input_connections
 from flowfile_core.flowfile.flow_node.multi_output import DEFAULT_OUTPUT_HANDLE
 from flowfile_core.flowfile.manage.compatibility_enhancements import ensure_compatibility, load_flowfile_pickle
 from flowfile_core.schemas import input_schema, schemas
@@ -301,7 +301,7 @@ def _resolve_flow_name(flow_path: Path, stored_name: str | None) -> str:
     return flow_path.stem
 
 
-def open_flow(flow_path: Path, user_id: int | None = None) -> FlowGraph:
+def open_flow(flow_path: Path, user_id: int | None = None, restore_cache_state: bool = False) -> FlowGraph:
     """
     Open a flowfile from a given path.
 
@@ -313,6 +313,9 @@ def open_flow(flow_path: Path, user_id: int | None = None) -> FlowGraph:
     Args:
         flow_path (Path): The absolute or relative path to the flowfile
         user_id (int | None): The ID of the user importing the flow, used to resolve cloud connections.
+        restore_cache_state (bool): Adopt the cache identity this core saved for the flow, so node hashes (and
+            the worker results cached under them) carry over from the session that saved it. Only for
+            the editor's copy of a flow: graphs sharing a cache key share worker task ids.
     Returns:
         FlowGraph: The flowfile object
     """
@@ -405,6 +408,9 @@ def open_flow(flow_path: Path, user_id: int | None = None) -> FlowGraph:
     # add_<type>(setting_input); legacy pickles may lack the field entirely.
     new_flow.restore_groups(getattr(flow_storage_obj, "groups", None) or [])
 
+    if restore_cache_state and (cache_state := load_cache_state(flow_path)) is not None:
+        new_flow.restore_cache_state(cache_state)
+
     new_flow.mark_as_saved()
     return new_flow
 
@@ -5,7 +5,6 @@ from pl_fuzzy_frame_match.output_column_name_utils import set_name_in_fuzzy_mapp
 from pl_fuzzy_frame_match.pre_process import rename_fuzzy_right_mapping
 from polars import datatypes
 
-from flowfile_core.configs.flow_logger import main_logger
 from flowfile_core.flowfile.flow_data_engine.flow_file_column.main import FlowfileColumn, PlType
 from flowfile_core.flowfile.flow_data_engine.subprocess_operations.subprocess_operations import fetch_unique_values
 from flowfile_core.schemas import input_schema, transform_schema
@@ -273,19 +272,14 @@ def pre_calculate_pivot_schema(
         ]
 
     else:
-        max_unique_vals = 200
+        # Same columns as FlowDataEngine.do_pivot: every non-null value, in sorted order.
         unique_vals = fetch_unique_values(
             input_lf.select(pivot_input.pivot_column)
             .unique()
+            .drop_nulls()
             .sort(pivot_input.pivot_column)
-            .limit(max_unique_vals)
             .cast(pl.String)
         )
-        if len(unique_vals) >= max_unique_vals:
-            main_logger.warning(
-                "Pivot column has too many unique values. Please consider using a different column."
-                f" Max unique values: {max_unique_vals}"
-            )
         pl_output_fields = []
         for val in unique_vals:
             if len(pivot_input.aggregations) == 1:
@@ -95,6 +95,7 @@ def build_rest_api_worker_settings(
         max_pages=p.max_pages,
         max_records=p.max_records,
         page_delay_seconds=p.page_delay_seconds,
+        max_concurrency=p.max_concurrency,
     )
     return RestApiReadSettings(
         url=s.url,
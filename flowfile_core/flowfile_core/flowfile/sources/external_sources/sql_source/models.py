@@ -10,6 +10,7 @@ from flowfile_core.schemas.input_schema import (
     NodeDatabaseReader,
     NodeDatabaseWriter,
 )
+from shared.db_reader import DbReadPartitioning
 
 
 # Custom type for bytes that serializes to/from base64 string in JSON
@@ -40,7 +41,8 @@ class DatabaseExternalWriteSettings(BaseModel):
 
     connection: ExtDatabaseConnection
     table_name: str
-    if_exists: Literal["append", "replace", "fail"] | None = "append"
+    if_exists: Literal["append", "replace", "fail", "upsert", "update", "delete"] | None = "append"
+    merge_keys: list[str] = []
     flowfile_flow_id: int = 1
     flowfile_node_id: int | str = -1
     operation: Base64Bytes  # Accepts bytes or base64 string, serializes to base64
@@ -75,6 +77,7 @@ class DatabaseExternalWriteSettings(BaseModel):
             connection=ext_database_connection,
             table_name=table_name,
             if_exists=node_database_writer.database_write_settings.if_exists,
+            merge_keys=node_database_writer.database_write_settings.merge_keys,
             flowfile_flow_id=node_database_writer.flow_id,
             flowfile_node_id=node_database_writer.node_id,
             operation=lf.serialize(),  # Pass raw bytes, Base64Bytes handles encoding
@@ -86,6 +89,7 @@ class DatabaseExternalReadSettings(BaseModel):
 
     connection: ExtDatabaseConnection
     query: str
+    partitioning: DbReadPartitioning | None = None
     flowfile_flow_id: int = 1
     flowfile_node_id: int | str = -1
 
@@ -116,6 +120,7 @@ class DatabaseExternalReadSettings(BaseModel):
         return cls(
             connection=ext_database_connection,
             query=query,
+            partitioning=node_database_reader.database_settings.partitioning,
             flowfile_flow_id=node_database_reader.flow_id,
             flowfile_node_id=node_database_reader.node_id,
         )
@@ -17,6 +17,7 @@ from flowfile_core.flowfile.sources.external_sources.sql_source.utils import (
 from flowfile_core.schemas.input_schema import DatabaseSettings, MinimalFieldInfo
 from flowfile_core.secret_manager.secret_manager import decrypt_secret, get_encrypted_secret
 from shared.db_dialects import DbDialect, get_dialect_or_generic, read_sql
+from shared.db_reader import DbReadPartitioning, read_sql_partitioned
 from shared.sql_validation import UnsafeSQLError, validate_sql_query
 
 QueryMode = Literal["table", "query"]
@@ -199,6 +200,7 @@ class SqlSource(BaseSqlSource, ExternalDataSource):
         fields: list[MinimalFieldInfo] | None = None,
         cancel_check: Callable[[], bool] | None = None,
         database_type: str | None = None,
+        partitioning: DbReadPartitioning | None = None,
     ):
         if database_type is None and connection_string and "://" in connection_string:
             # URIs built by construct_sql_uri carry the database_type as their scheme.
@@ -215,6 +217,7 @@ class SqlSource(BaseSqlSource, ExternalDataSource):
         self.connection_string = connection_string
         self.read_result = None
         self.cancel_check = cancel_check
+        self.partitioning = partitioning
 
     def get_initial_data(self) -> list[dict[str, Any]]:
         return []
@@ -277,6 +280,16 @@ class SqlSource(BaseSqlSource, ExternalDataSource):
         return (r for r in rows)
 
     def get_pl_df(self) -> pl.DataFrame:
+        if self.read_result is None and self.partitioning is not None:
+            partitions = read_sql_partitioned(
+                self.query,
+                self.connection_string,
+                logger,
+                self.partitioning,
+                database_type=self.database_type,
+                cancel_check=self.cancel_check,
+            )
+            self.read_result = pl.concat(partitions, how="vertical_relaxed")
         if self.read_result is None:
             self.read_result = read_sql(
                 self.query,
@@ -35,6 +35,28 @@ class ExecutionPlan:
     def node_count(self) -> int:
         return sum(len(stage) for stage in self.stages)
 
+    def dependency_map(self) -> tuple[dict[str | int, int], dict[str | int, list[FlowNode]]]:
+        """Builds the per-node dependency counts and dependents restricted to the planned nodes.
+
+        Edges to or from nodes outside the plan (skip nodes, unreachable nodes) are
+        ignored, matching how the stages themselves were derived.
+
+        Returns:
+            A tuple containing:
+                - pending_upstreams: A mapping of node ID to the number of planned upstream nodes.
+                - dependents: A mapping of node ID to its planned downstream nodes.
+        """
+        planned_ids = {node.node_id for node in self.all_nodes}
+        pending_upstreams: dict[str | int, int] = {node_id: 0 for node_id in planned_ids}
+        dependents: dict[str | int, list[FlowNode]] = {node_id: [] for node_id in planned_ids}
+        for node in self.all_nodes:
+            for next_node in node.leads_to_nodes:
+                if next_node.node_id not in planned_ids:
+                    continue
+                dependents[node.node_id].append(next_node)
+                pending_upstreams[next_node.node_id] += 1
+        return pending_upstreams, dependents
+
 
 def compute_execution_plan(nodes: list[FlowNode], flow_starts: list[FlowNode] = None) -> ExecutionPlan:
     """Computes the execution plan: nodes to skip and parallelizable execution stages.
@@ -238,3 +260,89 @@ def perform_topological_sort(
             stages.append(ExecutionStage(nodes=stage_nodes))
 
     return stages
+
+
+def compute_fused_node_ids(plan: ExecutionPlan) -> set[str | int]:
+    """Finds the planned nodes that can be fused into their downstream node.
+
+    Narrow nodes are already built lazily in-process; what each one still costs is a
+    worker sample task of its own preview. A narrow node whose only consumer is another
+    transform (narrow or wide) is an interior link of a chain: its lazy plan is absorbed
+    into that consumer, so the whole chain goes to the worker as one plan at the first
+    branch point, wide transform or output. Such nodes skip the eager sample and only
+    sample once their preview is requested.
+
+    A node is NOT fused (it materializes its preview as before) when it:
+        - is not a narrow transform, or has more than one output handle,
+        - has ``cache_results`` enabled (it must be stored in full),
+        - feeds more than one node (branch point), or nothing (end of the chain),
+        - feeds a node outside the plan, an output node or a non-transform node.
+
+    Args:
+        plan: The execution plan of the run.
+
+    Returns:
+        The IDs of the fused nodes.
+    """
+    planned_ids = {node.node_id for node in plan.all_nodes}
+    fused_ids: set[str | int] = set()
+    for node in plan.all_nodes:
+        if not _is_fusible_transform(node) or node.node_template.output != 1 or node.node_settings.cache_results:
+            continue
+        if len(node.leads_to_nodes) != 1:
+            continue
+        consumer = node.leads_to_nodes[0]
+        if consumer.node_id not in planned_ids or consumer.node_template.node_group == "output":
+            continue
+        if consumer.node_default is None or consumer.node_default.transform_type not in ("narrow", "wide"):
+            continue
+        fused_ids.add(node.node_id)
+    if fused_ids:
+        logger.info(f"Fusing narrow nodes into their downstream task: {sorted(fused_ids, key=str)}")
+    return fused_ids
+
+
+def _is_fusible_transform(node: FlowNode) -> bool:
+    return node.node_default is not None and node.node_default.transform_type == "narrow"
+
+
+def compute_critical_path_lengths(
+    nodes: list[FlowNode], node_costs: dict[str | int, float] | None = None
+) -> dict[str | int, float]:
+    """Computes, per node, the cost of the longest path from that node to any sink.
+
+    Used to prioritise ready nodes in the dependency-driven scheduler: a node with
+    a long tail of downstream work should start before a cheap leaf so the total
+    wall-clock time approaches the longest path through the graph.
+
+    Args:
+        nodes: The nodes to consider. Edges to nodes outside this list are ignored.
+        node_costs: Optional cost per node ID (e.g. the previous run time). Nodes
+            without a known cost count as 1.
+
+    Returns:
+        A mapping of node ID to the critical path cost starting at (and including) that node.
+    """
+    node_costs = node_costs or {}
+    node_ids = {node.node_id for node in nodes}
+    lengths: dict[str | int, float] = {}
+    for node in reversed(_topological_order(nodes)):
+        downstream = [lengths[n.node_id] for n in node.leads_to_nodes if n.node_id in node_ids]
+        lengths[node.node_id] = max(node_costs.get(node.node_id, 1.0), 1.0) + max(downstream, default=0.0)
+    return lengths
+
+
+def _topological_order(nodes: list[FlowNode]) -> list[FlowNode]:
+    """Returns the nodes in a topological order (Kahn's algorithm over all zero in-degree nodes)."""
+    node_map = build_node_map(nodes)
+    in_degree, adjacency_list = compute_in_degrees_and_adjacency_list(nodes, node_map)
+    queue = deque(node.node_id for node in nodes if in_degree[node.node_id] == 0)
+    order: list[FlowNode] = []
+    while queue:
+        node_id = queue.popleft()
+        order.append(node_map[node_id])
+        for next_node_id in adjacency_list.get(node_id, []):
+            in_degree[next_node_id] -= 1
+            if in_degree[next_node_id] == 0:
+                queue.append(next_node_id)
+    return order
@@ -8,6 +8,7 @@ import socket
 import time
 import uuid
 from decimal import Decimal
+from enum import Enum
 
 
 def generate_sha256_hash(data: bytes):
@@ -54,16 +55,59 @@ def json_dumps(thing) -> str:
     )
 
 
-def get_hash(val):
+HASH_EXCLUDED_FIELDS = frozenset({"pos_x", "pos_y", "description", "memory_limit_mb"})
+
+
+def get_hash(val, exclude: frozenset[str] = HASH_EXCLUDED_FIELDS):
     if hasattr(val, "overridden_hash") and val.overridden_hash():
         val = hash(val)
     elif hasattr(val, "__dict__"):
-        val = {k: v for k, v in val.__dict__.items() if k not in {"pos_x", "pos_y", "description"}}
+        val = {k: v for k, v in val.__dict__.items() if k not in exclude}
     elif hasattr(val, "json"):
         pass
     return generate_sha256_hash(json_dumps(val).encode("utf-8"))
 
 
+_SNAPSHOT_SCALAR_TYPES = frozenset(
+    {str, int, float, bool, type(None), Decimal, datetime.datetime, datetime.date, datetime.time}
+)
+
+
+def _snapshot(val):
+    if type(val) in _SNAPSHOT_SCALAR_TYPES or isinstance(val, Enum):
+        return type(val), val
+    if isinstance(val, list | tuple):
+        types = tuple(map(type, val))
+        if _SNAPSHOT_SCALAR_TYPES.issuperset(types):
+            # Flat columns (raw data, field lists) are copied in one C-level pass.
+            return list, tuple(val), types
+        return list, tuple(_snapshot(v) for v in val)
+    if isinstance(val, dict):
+        return dict, tuple((k, _snapshot(v)) for k, v in val.items())
+    if isinstance(val, set | frozenset):
+        # Copied like any container, in an order that does not depend on insertion.
+        return type(val), tuple(sorted((_snapshot(v) for v in val), key=repr))
+    if hasattr(val, "__dict__"):
+        return _snapshot(val.__dict__)
+    return type(val), val
+
+
+def get_hash_snapshot(val, exclude: frozenset[str] = HASH_EXCLUDED_FIELDS):
+    """Cheap, comparable copy of everything ``get_hash`` serializes for *val*.
+
+    Two snapshots compare equal only when ``get_hash`` would produce the same digest, so a
+    caller can keep a digest until the snapshot changes instead of re-serializing large
+    settings (raw data, long code strings) on every check. Containers are copied, so
+    in-place edits (e.g. parameter substitution) are caught. Returns None for values that
+    override their hash, which are not snapshot-able. *exclude* must match ``get_hash``'s.
+    """
+    if hasattr(val, "overridden_hash") and val.overridden_hash():
+        return None
+    if hasattr(val, "__dict__"):
+        val = {k: v for k, v in val.__dict__.items() if k not in exclude}
+    return _snapshot(val)
+
+
 def cleanup(start_location: str = "temp_storage"):
     def get_all_files_and_folders(_start_location) -> list[str]:
         inspect_items = [_start_location]
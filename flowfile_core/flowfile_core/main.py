@@ -108,6 +108,15 @@ async def shutdown_handler(app: FastAPI):
         set_scheduler(scheduler)
         print("Flow scheduler started")
 
+    # Background compaction / Z-order of catalog tables, opt-in like the scheduler.
+    maintenance = None
+    if os.environ.get("FLOWFILE_CATALOG_MAINTENANCE_ENABLED", "").lower() in ("true", "1", "yes"):
+        from flowfile_core.catalog.maintenance import CatalogMaintenance
+
+        maintenance = CatalogMaintenance()
+        maintenance.start()
+        print("Catalog maintenance started")
+
     # Warm the kernel manager off the request path: its first construction makes
     # slow Docker daemon calls that would otherwise land on the first /kernels/.
     if os.environ.get("FLOWFILE_KERNEL_WARMUP", "1").lower() in ("true", "1", "yes"):
@@ -125,6 +134,9 @@ async def shutdown_handler(app: FastAPI):
             set_scheduler(None)
             print("Flow scheduler stopped")
 
+        if maintenance is not None:
+            maintenance.stop()
+
         print("Cleaning up core service resources...")
         _shutdown_kernels()
         _shutdown_local_model()
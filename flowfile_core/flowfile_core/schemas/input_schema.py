@@ -31,6 +31,7 @@ from flowfile_core.schemas.yaml_types import (
 )
 from flowfile_core.types import DataTypeStr
 from flowfile_core.utils.utils import ensure_similarity_dicts, standardize_col_dtype
+from shared.db_reader import DbReadPartitioning
 from shared.path_utils import default_scan_extension, ensure_glob_pattern, is_url
 
 SecretRef = Annotated[
@@ -459,6 +460,7 @@ class NodeBase(BaseModel):
     is_flow_output: bool | None = False
     is_user_defined: bool | None = False  # Indicator if the node is a user defined node
     output_field_config: OutputFieldConfig | None = None
+    memory_limit_mb: int | None = None  # Worker memory ceiling for this node's result; None uses the worker default
 
     @field_validator("node_reference", mode="before")
     @classmethod
@@ -1042,6 +1044,8 @@ class DatabaseSettings(BaseModel):
     table_name: str | None = None
     query: str | None = None
     query_mode: Literal["query", "table", "reference"] = "table"
+    # Read as concurrent range queries on a column instead of one query.
+    partitioning: DbReadPartitioning | None = None
 
     @field_validator("table_name", "schema_name", mode="before")
     @classmethod
@@ -1077,7 +1081,14 @@ class DatabaseWriteSettings(BaseModel):
     database_connection_name: str | None = None
     table_name: str
     schema_name: str | None = None
-    if_exists: Literal["append", "replace", "fail"] | None = "append"
+    if_exists: Literal["append", "replace", "fail", "upsert", "update", "delete"] | None = "append"
+    merge_keys: list[str] = Field(default_factory=list)
+
+    @model_validator(mode="after")
+    def _validate_merge_keys(self) -> "DatabaseWriteSettings":
+        if self.if_exists in ("upsert", "update", "delete") and not self.merge_keys:
+            raise ValueError(f"merge_keys must be non-empty when if_exists is '{self.if_exists}'")
+        return self
 
     @field_validator("table_name", "schema_name", mode="before")
     @classmethod
@@ -1307,6 +1318,8 @@ class RestApiPaginationSettings(BaseModel):
     max_pages: int = 1000
     max_records: int | None = None
     page_delay_seconds: float = 0.0
+    # pages fetched at once (offset / page only)
+    max_concurrency: int = Field(default=1, ge=1)
 
 
 class RestApiSettings(BaseModel):
@@ -1777,6 +1790,16 @@ class NodeCatalogReader(NodeBase):
     scd2_as_of: str | None = None  # ISO-8601 instant, required when scd2_view == "active_at"
     sql_query: str | None = None
     is_virtual_optimized: bool | None = None
+    # "incremental" reads only the rows added since this reader's last successful run (Delta tables).
+    # The consumed version is kept under ``incremental_state_name``, by default one key per flow and node.
+    read_mode: Literal["full", "incremental"] = "full"
+    incremental_state_name: str | None = Field(default=None, pattern=r"^[\w-]+$")
+
+    @model_validator(mode="after")
+    def _validate_incremental(self) -> "NodeCatalogReader":
+        if self.read_mode == "incremental" and (self.delta_version is not None or self.sql_query):
+            raise ValueError("read_mode 'incremental' cannot be combined with delta_version or sql_query")
+        return self
 
     @model_validator(mode="after")
     def _validate_scd2_view(self) -> "NodeCatalogReader":
@@ -1803,6 +1826,8 @@ class NodeCatalogReader(NodeBase):
                 suffix += " [active]"
             elif self.scd2_view == "active_at" and self.scd2_as_of:
                 suffix += f" [as of {self.scd2_as_of}]"
+            if self.read_mode == "incremental":
+                suffix += " [incremental]"
             return f"Catalog: {display}{suffix}"
         return "Read from Catalog"
 
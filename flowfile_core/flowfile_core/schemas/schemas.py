@@ -384,6 +384,28 @@ class FlowfileGroup(_GroupFields):
     """Serialized representation of a visual node group (YAML/JSON)."""
 
 
+class FlowfileNodeCacheState(BaseModel):
+    """Per-node hash and freshness inputs saved with a flow (cache epoch, source fingerprints)."""
+
+    node_id: int
+    cache_epoch: int = 0
+    source_file_info: dict[str, Any] | None = None
+    source_version_info: str | None = None
+
+
+class FlowfileCacheState(BaseModel):
+    """Cache identity of a saved flow, letting a reopened flow reproduce its node hashes.
+
+    ``cache_key`` is the ``FlowGraph.uuid`` of the session that saved the flow. It is local to
+    this core instance, so it is kept in the core's cache directory (see
+    ``flow_graph.load_cache_state``), never in the portable flow file. Nodes whose inputs are
+    all defaults are omitted.
+    """
+
+    cache_key: str
+    nodes: list[FlowfileNodeCacheState] = Field(default_factory=list)
+
+
 class FlowfileData(BaseModel):
     """Root model for flowfile serialization (YAML/JSON)."""
 
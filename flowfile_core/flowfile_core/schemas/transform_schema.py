@@ -19,6 +19,7 @@ from flowfile_core.schemas.yaml_types import (
     SelectInputYaml,
 )
 from flowfile_core.types import DataType, DataTypeStr
+from shared.fuzzy_blocking import FuzzyBlocking
 
 
 class FilterOperator(str, Enum):
@@ -749,6 +750,7 @@ class FuzzyMatchInput(BaseModel):
     right_select: JoinInputs
     how: JoinStrategy = "inner"
     aggregate_output: bool = False
+    blocking: FuzzyBlocking | None = None
 
     def __init__(
         self,
@@ -766,13 +768,16 @@ class FuzzyMatchInput(BaseModel):
 
     def to_yaml_dict(self) -> FuzzyMatchInputYaml:
         """Serialize for YAML output."""
-        return {
+        result: FuzzyMatchInputYaml = {
             "join_mapping": [asdict(jm) for jm in self.join_mapping],
             "left_select": self.left_select.to_yaml_dict(),
             "right_select": self.right_select.to_yaml_dict(),
             "how": self.how,
             "aggregate_output": self.aggregate_output,
         }
+        if self.blocking is not None and self.blocking.enabled:
+            result["blocking"] = self.blocking.model_dump(exclude_defaults=True)
+        return result
 
     def add_new_select_column(self, select_input: SelectInput, side: str) -> None:
         """Adds a new column to the selection for either the left or right side."""
@@ -1138,11 +1143,20 @@ class UniqueInput(BaseModel):
 
 
 class GraphSolverInput(BaseModel):
-    """Defines settings for a graph-solving operation (e.g., finding connected components)."""
+    """Defines settings for a graph-solving operation (e.g., finding connected components).
+
+    The `in_memory` strategy solves the whole edge list in one call. `partitioned` spills the
+    edges to the cache and solves them in parallel chunks, for edge lists that do not fit in
+    memory. Setting `state_name` keeps the component labels in a named table between runs, so
+    each run only processes edges that connect new or separate components; it implies
+    `partitioned`.
+    """
 
     col_from: str
     col_to: str
     output_column_name: str | None = "graph_group"
+    strategy: Literal["in_memory", "partitioned"] = "in_memory"
+    state_name: str | None = Field(default=None, pattern=r"^[\w-]+$")
 
 
 RenameMode = Literal["prefix", "suffix", "formula", "first_row"]
@@ -1775,6 +1789,12 @@ class FuzzyMatchInputManager(JoinInputManager):
         """Backward compatibility: Access aggregate_output setting."""
         return self.fuzzy_input.aggregate_output
 
+    @property
+    def blocking(self) -> FuzzyBlocking | None:
+        """Candidate blocking settings, or None when every pair is compared."""
+        blocking = self.fuzzy_input.blocking
+        return blocking if blocking is not None and blocking.enabled else None
+
     def to_fuzzy_match_input(self) -> FuzzyMatchInput:
         """Creates a new FuzzyMatchInput instance based on the current manager settings.
 
@@ -1790,4 +1810,5 @@ class FuzzyMatchInputManager(JoinInputManager):
             right_select=JoinInputs(renames=self.input.right_select.renames.copy()),
             how=self.fuzzy_input.how,
             aggregate_output=self.fuzzy_input.aggregate_output,
+            blocking=self.fuzzy_input.blocking,
         )
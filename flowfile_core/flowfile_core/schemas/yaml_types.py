@@ -67,7 +67,7 @@ class FuzzyMappingYaml(TypedDict, total=False):
     valid: bool
 
 
-class FuzzyMatchInputYaml(TypedDict):
+class _FuzzyMatchInputBaseYaml(TypedDict):
     join_mapping: list[FuzzyMappingYaml]
     left_select: JoinInputsYaml
     right_select: JoinInputsYaml
@@ -75,6 +75,10 @@ class FuzzyMatchInputYaml(TypedDict):
     aggregate_output: bool
 
 
+class FuzzyMatchInputYaml(_FuzzyMatchInputBaseYaml, total=False):
+    blocking: dict
+
+
 # === Input Schema YAML Types ===
 
 
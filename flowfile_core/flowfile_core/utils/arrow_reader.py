@@ -1,9 +1,20 @@
+import os
+import sys
+import threading
+from collections import OrderedDict
 from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import NamedTuple
 
 import pyarrow as pa
 
 from flowfile_core.configs import logger
 
+# Memory-mapped readers keep the mapping open, which on Windows blocks the worker
+# from deleting or overwriting the file; there every read opens and closes a plain handle.
+_MEMORY_MAP_SUPPORTED = sys.platform != "win32"
+_MAX_MAPPED_FILES = int(os.environ.get("FLOWFILE_MAX_MAPPED_RESULT_FILES", "16"))
+
 
 def open_validated_file(file_path: str, n: int) -> pa.OSFile:
     """
@@ -76,6 +87,112 @@ def create_reader(source: pa.OSFile) -> pa.ipc.RecordBatchFileReader:
         raise ValueError("Invalid Arrow file format") from None
 
 
+class _MappedReader(NamedTuple):
+    identity: tuple
+    source: pa.MemoryMappedFile
+    reader: pa.ipc.RecordBatchFileReader
+    lock: threading.Lock
+
+
+class MappedReaderRegistry:
+    """Process-wide LRU of memory-mapped Arrow IPC readers.
+
+    Previews, column stats and full reads of the same worker result attach to one
+    shared mapping instead of re-opening and re-reading the file: record batches of
+    an uncompressed IPC file are zero-copy views onto the OS page cache the worker
+    wrote into. An entry is keyed on the file's identity (inode, size, mtime), so a
+    result rewritten under the same path is re-mapped rather than served stale, and
+    every ``open`` drops the mappings of files the worker has since deleted (evicted or
+    cleared results), so their disk space is reclaimed. A reader is not safe to share
+    between threads: ``open`` serialises its use behind a per-file lock.
+    """
+
+    def __init__(self, max_files: int = _MAX_MAPPED_FILES):
+        self.max_files = max_files
+        self._readers: OrderedDict[str, _MappedReader] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def open(self, file_path: str) -> Iterator[pa.ipc.RecordBatchFileReader]:
+        """Yield the shared reader over *file_path*, holding it for this thread until the block exits."""
+        self.invalidate_missing()
+        entry = self._entry(file_path)
+        with entry.lock:
+            yield entry.reader
+
+    def get(self, file_path: str) -> pa.ipc.RecordBatchFileReader:
+        """Return the (possibly shared) reader over the memory-mapped file; callers serialise its use."""
+        return self._entry(file_path).reader
+
+    def _entry(self, file_path: str) -> _MappedReader:
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            self.invalidate(file_path)
+            logger.error(f"File not found: {file_path}")
+            raise FileNotFoundError(f"Could not find file: {file_path}") from None
+        identity = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            cached = self._readers.get(file_path)
+            if cached is not None and cached.identity == identity:
+                self._readers.move_to_end(file_path)
+                return cached
+        source = pa.memory_map(file_path, "r")
+        try:
+            entry = _MappedReader(identity, source, create_reader(source), threading.Lock())
+        except ValueError:
+            source.close()
+            raise
+        with self._lock:
+            previous = self._readers.pop(file_path, None)
+            self._readers[file_path] = entry
+            evicted = [previous] if previous is not None else []
+            while len(self._readers) > self.max_files:
+                evicted.append(self._readers.popitem(last=False)[1])
+        for old in evicted:
+            old.source.close()
+        return entry
+
+    def invalidate(self, file_path: str) -> None:
+        """Drop the mapping for *file_path*, if any."""
+        with self._lock:
+            cached = self._readers.pop(file_path, None)
+        if cached is not None:
+            cached.source.close()
+
+    def invalidate_missing(self) -> None:
+        """Drop mappings whose file has been deleted, so the disk space can be reclaimed."""
+        with self._lock:
+            missing = [path for path in self._readers if not os.path.exists(path)]
+        for path in missing:
+            self.invalidate(path)
+
+    def clear(self) -> None:
+        with self._lock:
+            cached = list(self._readers.values())
+            self._readers.clear()
+        for entry in cached:
+            entry.source.close()
+
+
+mapped_readers = MappedReaderRegistry()
+
+
+@contextmanager
+def open_reader(file_path: str, n: int = 0) -> Iterator[pa.ipc.RecordBatchFileReader]:
+    """Yield an IPC reader for *file_path*: a shared memory-mapped one where supported."""
+    if _MEMORY_MAP_SUPPORTED:
+        if n < 0:
+            raise ValueError("Number of rows must be non-negative")
+        if not isinstance(file_path, str):
+            raise TypeError("file_path must be a string")
+        with mapped_readers.open(file_path) as reader:
+            yield reader
+        return
+    with open_validated_file(file_path, n) as source:
+        yield create_reader(source)
+
+
 def iter_batches(reader: pa.ipc.RecordBatchFileReader, n: int, rows_collected: int) -> Iterator[pa.RecordBatch]:
     """
     Iterator over record batches with row limit handling.
@@ -177,8 +294,7 @@ def read(file_path: str) -> pa.Table:
         >>> print(f"Columns: {table.column_names}")
     """
     logger.info(f"Reading entire file: {file_path}")
-    with open_validated_file(file_path, 0) as source:
-        reader = create_reader(source)
+    with open_reader(file_path) as reader:
         batches, total_rows = collect_batches(reader, float("inf"))
         table = pa.Table.from_batches(batches, schema=reader.schema)
         logger.info(f"Successfully read {total_rows} rows from {file_path}")
@@ -213,8 +329,7 @@ def read_top_n(file_path: str, n: int = 1000, strict: bool = False) -> pa.Table:
         >>> table = read_top_n("data.arrow", n=500, strict=True)
     """
     logger.info(f"Reading top {n} rows from {file_path} (strict={strict})")
-    with open_validated_file(file_path, n) as source:
-        reader = create_reader(source)
+    with open_reader(file_path, n) as reader:
         batches, rows_collected = collect_batches(reader, n)
 
         if strict and rows_collected < n:
@@ -214,6 +214,7 @@ class TestExecutionStrategy:
         assert ExecutionStrategy.SKIP is not None
         assert ExecutionStrategy.FULL_LOCAL is not None
         assert ExecutionStrategy.LOCAL_WITH_SAMPLING is not None
+        assert ExecutionStrategy.LOCAL_FUSED is not None
         assert ExecutionStrategy.REMOTE is not None
 
     def test_strategy_values_are_distinct(self):
@@ -222,6 +223,7 @@ class TestExecutionStrategy:
             ExecutionStrategy.SKIP,
             ExecutionStrategy.FULL_LOCAL,
             ExecutionStrategy.LOCAL_WITH_SAMPLING,
+            ExecutionStrategy.LOCAL_FUSED,
             ExecutionStrategy.REMOTE,
         ]
         assert len(strategies) == len(set(strategies))
@@ -843,6 +845,52 @@ class TestWideVsNarrowTransformStrategy:
         assert strategy == ExecutionStrategy.FULL_LOCAL
 
 
+class TestFusedNarrowChains:
+    """Nodes inside a fused narrow chain defer their preview sample until it is requested."""
+
+    def test_fused_sampling_node_defers_its_sample(self):
+        decision = ExecutionDecision(True, ExecutionStrategy.LOCAL_WITH_SAMPLING, InvalidationReason.NEVER_RAN)
+        fused = NodeExecutor._override_for_fusion(decision, fused=True)
+        assert fused.strategy == ExecutionStrategy.LOCAL_FUSED
+        assert fused.reason == InvalidationReason.NEVER_RAN
+
+    def test_unfused_or_other_strategies_are_untouched(self):
+        sampling = ExecutionDecision(True, ExecutionStrategy.LOCAL_WITH_SAMPLING, InvalidationReason.NEVER_RAN)
+        remote = ExecutionDecision(True, ExecutionStrategy.REMOTE, InvalidationReason.NEVER_RAN)
+        skip = ExecutionDecision(False, ExecutionStrategy.SKIP, None)
+        assert NodeExecutor._override_for_fusion(sampling, fused=False) is sampling
+        assert NodeExecutor._override_for_fusion(remote, fused=True) is remote
+        assert NodeExecutor._override_for_fusion(skip, fused=True) is skip
+
+    def test_fused_select_samples_only_on_preview(self, monkeypatch, tmp_path):
+        import polars as pl
+
+        from flowfile_core.flowfile.flow_node import flow_node as flow_node_module
+
+        sample_path = tmp_path / "sample.arrow"
+        pl.DataFrame({"name": ["a"]}).write_ipc(sample_path)
+        samplers = []
+
+        class _Sampler:
+            status = MagicMock(file_ref=str(sample_path))
+
+            def __init__(self, **kwargs):
+                samplers.append(kwargs)
+
+        monkeypatch.setattr(flow_node_module, "ExternalSampler", _Sampler)
+        graph = create_graph_with_select()
+        select_node = graph.get_node(2)
+        select_node._do_execute_local_with_sampling(flow_id=1, defer_sampling=True)
+
+        assert samplers == []
+        assert select_node.node_stats.has_run_with_current_setup
+        deferred = select_node.results.example_data_generator
+        assert deferred().to_pylist() == [{"name": "a"}]
+        assert deferred().to_pylist() == [{"name": "a"}]
+        assert len(samplers) == 1
+        assert select_node.results.example_data_path == str(sample_path)
+
+
 class TestNodesWithDefaults:
     """Verify that all nodes registered in nodes_with_defaults get
     LOCAL_WITH_SAMPLING and nodes outside that set get REMOTE."""
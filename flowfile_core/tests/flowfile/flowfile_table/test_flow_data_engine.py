@@ -5,6 +5,7 @@ from pl_fuzzy_frame_match.models import FuzzyMapping
 from flowfile_core.flowfile.flow_data_engine.flow_data_engine import FlowDataEngine, execute_polars_code
 from flowfile_core.flowfile.flow_data_engine.polars_code_parser import PolarsCodeParser, remove_comments_and_docstrings
 from flowfile_core.schemas import transform_schema
+from shared.fuzzy_blocking import FuzzyBlocking
 
 
 def create_sample_data():
@@ -99,6 +100,27 @@ def test_fuzzy_match_auto_select_columns_not_selected(fuzzy_test_data_left, fuzz
     assert fuzzy_match_result.number_of_fields == 4
 
 
+def test_fuzzy_match_with_blocking(fuzzy_test_data_left, fuzzy_test_data_right):
+    left_select = [transform_schema.SelectInput(c) for c in fuzzy_test_data_left.columns[:-1]]
+    right_select = [transform_schema.SelectInput(c) for c in fuzzy_test_data_right.columns[:-1]]
+    join_mapping = [FuzzyMapping(left_col='company_name', right_col='organization', threshold_score=50)]
+    full = fuzzy_test_data_left.fuzzy_join(
+        transform_schema.FuzzyMatchInput(join_mapping=join_mapping, left_select=left_select,
+                                         right_select=right_select),
+        fuzzy_test_data_right,
+    )
+    blocked = fuzzy_test_data_left.fuzzy_join(
+        transform_schema.FuzzyMatchInput(join_mapping=join_mapping, left_select=left_select,
+                                         right_select=right_select,
+                                         blocking=FuzzyBlocking(method='lsh', rows_per_band=1, persist_index=False)),
+        fuzzy_test_data_right,
+    )
+    assert blocked.columns == full.columns, 'Blocking must not change the output columns'
+    blocked_pairs = set(blocked.data_frame.select('id', 'id_right').collect().iter_rows())
+    assert (1, 101) in blocked_pairs
+    assert blocked_pairs <= set(full.data_frame.select('id', 'id_right').collect().iter_rows())
+
+
 def test_fuzzy_match_external():
     r = transform_schema.SelectInputs([transform_schema.SelectInput(old_name='column_0', new_name='name')])
     left_flowfile_table = FlowDataEngine(['edward', 'eduward', 'court']).do_select(r)
@@ -244,6 +266,67 @@ def test_pivot_string_concat():
     output.assert_equal(expected_output)
 
 
+def test_pivot_has_no_cap_on_pivot_values():
+    fl_table = FlowDataEngine(pl.DataFrame({
+        'sku': [i % 500 for i in range(2000)],
+        'month': ['jan', 'feb'] * 1000,
+        'qty': [1] * 2000,
+    }))
+    pivot_input = transform_schema.PivotInput(pivot_column='sku', value_col='qty', index_columns=['month'],
+                                              aggregations=['sum'])
+    output = fl_table.do_pivot(pivot_input)
+    # Numeric pivot values keep their numeric order.
+    assert output.columns == ['month'] + [str(i) for i in range(500)]
+    assert output.get_number_of_records() == 2
+
+
+def test_pivot_multiple_aggregations():
+    fl_table = FlowDataEngine(pl.DataFrame({
+        'id': [1, 1, 2, 2, 2, 1, 1],
+        'category': ['A', 'A', 'B', 'B', 'C', 'C', 'A'],
+        'value': [10, 20, 15, 25, 30, 5, 10],
+    }))
+    pivot_input = transform_schema.PivotInput(pivot_column='category', value_col='value', index_columns=['id'],
+                                              aggregations=['sum', 'max'])
+    output = fl_table.do_pivot(pivot_input)
+    expected_output = FlowDataEngine([{'id': 1, 'A_sum': 40, 'A_max': 20, 'B_sum': 0, 'B_max': None,
+                                       'C_sum': 5, 'C_max': 5},
+                                      {'id': 2, 'A_sum': 0, 'A_max': None, 'B_sum': 40, 'B_max': 25,
+                                       'C_sum': 30, 'C_max': 30}])
+    assert output.columns == expected_output.columns
+    output.assert_equal(expected_output)
+
+
+def test_pivot_drops_null_pivot_values():
+    fl_table = FlowDataEngine(pl.DataFrame({
+        'id': [1, 1, 2],
+        'category': ['A', None, None],
+        'value': [10, 5, 7],
+    }))
+    pivot_input = transform_schema.PivotInput(pivot_column='category', value_col='value', index_columns=['id'],
+                                              aggregations=['sum'])
+    output = fl_table.do_pivot(pivot_input)
+    # A null pivot value gets no column; its index rows are still kept.
+    assert output.columns == ['id', 'A']
+    assert output.collect().sort('id').rows() == [(1, 10), (2, 0)]
+
+
+def test_collect_off_core_falls_back_loudly(monkeypatch):
+    from types import SimpleNamespace
+
+    import flowfile_core.flowfile.flow_data_engine.flow_data_engine as fde
+
+    def worker_down(**kwargs):
+        raise ConnectionError('worker down')
+
+    monkeypatch.setattr(fde, 'ExternalDfFetcher', worker_down)
+    warnings = []
+    node_logger = SimpleNamespace(flow_id=3, node_id=4, warning=warnings.append)
+    result = FlowDataEngine._collect_off_core(pl.LazyFrame({'a': [1, 2]}), node_logger)
+    assert result['a'].to_list() == [1, 2]
+    assert len(warnings) == 1 and 'worker down' in warnings[0]
+
+
 def test_split_to_rows():
     fl_table = FlowDataEngine(pl.DataFrame(pl.DataFrame([["1,2,3", "1,2,3"], [1, 2]]), schema=['text', 'rank']))
     split_input = transform_schema.TextToRowsInput(column_to_split='text', output_column_name='splitted')
@@ -0,0 +1,114 @@
+"""Tests for the join size estimates behind ``verify_integrity`` (join/cardinality.py)."""
+
+import polars as pl
+import pytest
+
+from flowfile_core.flowfile.flow_data_engine import flow_data_engine
+from flowfile_core.flowfile.flow_data_engine.flow_data_engine import FlowDataEngine
+from flowfile_core.flowfile.flow_data_engine.join import (
+    JoinEstimate,
+    cardinality,
+    check_join_estimate,
+    estimate_join,
+    profile_join_keys,
+)
+from flowfile_core.schemas import transform_schema
+
+
+def _collect(lf: pl.LazyFrame) -> pl.DataFrame:
+    return lf.collect()
+
+
+def _profile(df: pl.DataFrame, keys=("id",), **kwargs):
+    return profile_join_keys(df.lazy(), list(keys), collect=_collect, **kwargs)
+
+
+def test_one_to_one_join_is_estimated_near_its_true_size():
+    left = _profile(pl.DataFrame({"id": range(20_000)}))
+    right = _profile(pl.DataFrame({"id": range(19_999, -1, -1)}))
+    assert left.n_distinct == pytest.approx(20_000, rel=0.05)
+    assert not left.hot_keys
+
+    estimate = estimate_join(left, right, "inner")
+    assert estimate.output_rows == pytest.approx(20_000, rel=0.1)
+    assert check_join_estimate(estimate, max_rows=1_000_000) is None
+
+
+def test_hot_keys_are_counted_exactly_and_reported():
+    left = _profile(pl.DataFrame({"id": [0] * 5_000 + list(range(1, 5_001))}))
+    right = _profile(pl.DataFrame({"id": [0] * 2_000 + list(range(1, 2_001))}))
+    assert [count for count, _ in left.hot_keys.values()] == [5_000]
+
+    estimate = estimate_join(left, right, "inner")
+    assert estimate.hot_keys[0] == ((0,), 5_000, 2_000)
+    assert estimate.output_rows >= 10_000_000
+    warning = check_join_estimate(estimate, max_rows=0)
+    assert "many-to-many" in warning and "(0,)" in warning
+
+
+def test_null_keys_never_match_but_outer_joins_keep_them():
+    left = _profile(pl.DataFrame({"a": [None] * 10 + [1, 2], "b": ["x"] * 12}), keys=("a", "b"))
+    right = _profile(pl.DataFrame({"a": [1, 2], "b": ["x", "x"]}), keys=("a", "b"))
+    assert left.n_null_keys == 10
+    assert estimate_join(left, right, "inner").output_rows == pytest.approx(2, abs=1)
+    assert estimate_join(left, right, "left").output_rows >= 12
+
+
+def test_estimate_over_the_limit_raises():
+    estimate = JoinEstimate("inner", left_rows=1_000, right_rows=1_000, output_rows=1_000_000, hot_keys=[])
+    with pytest.raises(Exception, match="over the limit"):
+        check_join_estimate(estimate, max_rows=10_000)
+
+
+def test_profiles_are_reused_per_cache_key():
+    calls = []
+
+    def counting_collect(lf: pl.LazyFrame) -> pl.DataFrame:
+        calls.append(1)
+        return lf.collect()
+
+    df = pl.DataFrame({"id": range(100)})
+    first = profile_join_keys(df.lazy(), ["id"], collect=counting_collect, cache_key="node-hash-1")
+    again = profile_join_keys(df.lazy(), ["id"], collect=counting_collect, cache_key="node-hash-1")
+    assert again is first
+    assert len(calls) == 1
+    profile_join_keys(df.lazy(), ["id"], collect=counting_collect, cache_key="node-hash-2")
+    assert len(calls) == 2
+    cardinality._profile_cache.clear()
+
+
+def test_join_with_verify_integrity_refuses_an_exploding_join(monkeypatch):
+    monkeypatch.setattr(flow_data_engine, "get_join_max_estimated_rows", lambda: 1_000)
+    join_input = transform_schema.JoinInput(
+        join_mapping="key",
+        left_select=[transform_schema.SelectInput("key"), transform_schema.SelectInput("value")],
+        right_select=[transform_schema.SelectInput("key", "key_right"), transform_schema.SelectInput("value", "right")],
+        how="inner",
+    )
+    left = FlowDataEngine(pl.DataFrame({"key": ["a"] * 100, "value": range(100)}))
+    right = FlowDataEngine(pl.DataFrame({"key": ["a"] * 100, "value": range(100)}))
+
+    with pytest.raises(Exception, match="over the limit"):
+        left.join(join_input=join_input, other=right, verify_integrity=True, auto_generate_selection=True)
+    result = left.join(join_input=join_input, other=right, verify_integrity=False, auto_generate_selection=True)
+    assert result.count() == 10_000
+
+
+def test_size_check_is_off_unless_a_limit_is_set(monkeypatch):
+    monkeypatch.delenv("FLOWFILE_JOIN_MAX_ESTIMATED_ROWS", raising=False)
+
+    def no_profiling(*args, **kwargs):
+        raise AssertionError("profiled the join inputs without a configured limit")
+
+    monkeypatch.setattr(flow_data_engine, "profile_join_keys", no_profiling)
+    join_input = transform_schema.JoinInput(
+        join_mapping="key",
+        left_select=[transform_schema.SelectInput("key")],
+        right_select=[transform_schema.SelectInput("key", "key_right")],
+        how="inner",
+    )
+    left = FlowDataEngine(pl.DataFrame({"key": ["a"] * 10}).lazy())
+    right = FlowDataEngine(pl.DataFrame({"key": ["a"] * 10}).lazy())
+
+    result = left.join(join_input=join_input, other=right, verify_integrity=True, auto_generate_selection=True)
+    assert result.count() == 100
@@ -1,13 +1,18 @@
 """Tests for execution_orderer: ExecutionStage, ExecutionPlan, and parallel stage grouping."""
 
+import threading
+from types import SimpleNamespace
 from unittest.mock import MagicMock, PropertyMock
 
 import pytest
 
+from flowfile_core.flowfile.flow_graph import FlowGraph
 from flowfile_core.flowfile.util.execution_orderer import (
     ExecutionPlan,
     ExecutionStage,
+    compute_critical_path_lengths,
     compute_execution_plan,
+    compute_fused_node_ids,
     determine_execution_order,
 )
 from flowfile_core.schemas.schemas import FlowGraphConfig, FlowSettings
@@ -288,6 +293,162 @@ class TestComputeExecutionPlan:
         assert plan.node_count == 2
 
 
+# dependency map and critical path
+
+
+class TestDependencyMap:
+    def test_counts_only_planned_edges(self):
+        """Edges into nodes outside the plan do not count as dependencies."""
+        outside = _make_node(99)
+        n3 = _make_node(3)
+        n2 = _make_node(2, leads_to=[n3, outside])
+        n1 = _make_node(1, leads_to=[n2, n3])
+        plan = ExecutionPlan(skip_nodes=[], stages=determine_execution_order([n1, n2, n3]))
+        pending, dependents = plan.dependency_map()
+        assert pending == {1: 0, 2: 1, 3: 2}
+        assert [n.node_id for n in dependents[2]] == [3]
+        assert 99 not in pending
+
+
+class TestCriticalPathLengths:
+    def test_linear_chain(self):
+        n3 = _make_node(3)
+        n2 = _make_node(2, leads_to=[n3])
+        n1 = _make_node(1, leads_to=[n2])
+        assert compute_critical_path_lengths([n1, n2, n3]) == {1: 3.0, 2: 2.0, 3: 1.0}
+
+    def test_longer_branch_gets_higher_priority(self):
+        """A → B → C and A → D: B lies on the critical path, D does not."""
+        n3 = _make_node(3)
+        n2 = _make_node(2, leads_to=[n3])
+        n4 = _make_node(4)
+        n1 = _make_node(1, leads_to=[n2, n4])
+        lengths = compute_critical_path_lengths([n1, n2, n3, n4])
+        assert lengths[2] > lengths[4]
+        assert lengths[1] == 3.0
+
+    def test_node_costs_weight_the_path(self):
+        n2 = _make_node(2)
+        n1 = _make_node(1)
+        lengths = compute_critical_path_lengths([n1, n2], node_costs={2: 500.0})
+        assert lengths[2] > lengths[1]
+
+
+def _make_transform(node_id: int, transform_type: str = "narrow", leads_to=None, **overrides):
+    """A mock node carrying the attributes compute_fused_node_ids inspects."""
+    node = _make_node(node_id, leads_to=leads_to)
+    node.node_default.transform_type = transform_type
+    node.node_template.output = overrides.get("outputs", 1)
+    node.node_template.node_group = overrides.get("node_group", "transform")
+    node.node_settings.cache_results = overrides.get("cache_results", False)
+    return node
+
+
+class TestComputeFusedNodeIds:
+    def test_narrow_chain_fuses_up_to_its_last_link(self):
+        """read → select → filter → formula: only formula (end of chain) samples eagerly."""
+        formula = _make_transform(4)
+        filter_ = _make_transform(3, leads_to=[formula])
+        select = _make_transform(2, leads_to=[filter_])
+        read = _make_transform(1, "other", leads_to=[select])
+        plan = compute_execution_plan([read, select, filter_, formula])
+        assert compute_fused_node_ids(plan) == {2, 3}
+
+    def test_narrow_node_feeding_a_wide_node_is_fused(self):
+        group_by = _make_transform(2, "wide")
+        select = _make_transform(1, leads_to=[group_by])
+        assert compute_fused_node_ids(compute_execution_plan([select, group_by])) == {1}
+
+    def test_branch_points_outputs_and_cached_nodes_materialize(self):
+        a, b = _make_transform(10), _make_transform(11)
+        branch = _make_transform(1, leads_to=[a, b])
+        output = _make_transform(12, "other", node_group="output")
+        before_output = _make_transform(2, leads_to=[output])
+        cached_next = _make_transform(13)
+        cached = _make_transform(3, leads_to=[cached_next], cache_results=True)
+        split_next = _make_transform(14)
+        split = _make_transform(4, leads_to=[split_next], outputs=2)
+        nodes = [a, b, branch, output, before_output, cached_next, cached, split_next, split]
+        assert compute_fused_node_ids(compute_execution_plan(nodes)) == set()
+
+    def test_consumer_outside_the_plan_ends_the_chain(self):
+        skipped = _make_transform(2)
+        select = _make_transform(1, leads_to=[skipped])
+        plan = ExecutionPlan(skip_nodes=[skipped], stages=[ExecutionStage(nodes=[select])])
+        assert compute_fused_node_ids(plan) == set()
+
+
+# dependency-driven scheduler
+
+
+def _make_scheduler_host(execute_single_node, max_parallel_workers: int = 4, location: str = "remote"):
+    """A stand-in for FlowGraph carrying only what _execute_plan touches."""
+    return SimpleNamespace(
+        flow_settings=SimpleNamespace(
+            execution_location=location, max_parallel_workers=max_parallel_workers, is_canceled=False
+        ),
+        flow_logger=MagicMock(),
+        _execute_single_node=execute_single_node,
+    )
+
+
+class TestExecutePlanScheduling:
+    def test_fast_branch_does_not_wait_for_slow_sibling(self):
+        """Chains A → B and C → D: D must be able to finish while A is still running."""
+        n_b, n_d = _make_node(2), _make_node(4)
+        n_a, n_c = _make_node(1, leads_to=[n_b]), _make_node(3, leads_to=[n_d])
+        d_done = threading.Event()
+        observed = {}
+
+        def execute(node, performance_mode, lock, params, fused=False):
+            if node.node_id == 1:
+                observed["d_finished_first"] = d_done.wait(timeout=5)
+            if node.node_id == 4:
+                d_done.set()
+            return SimpleNamespace(success=True), node
+
+        plan = compute_execution_plan([n_a, n_b, n_c, n_d])
+        failed = FlowGraph._execute_plan(_make_scheduler_host(execute), plan, False, {}, set())
+        assert failed == set()
+        assert observed["d_finished_first"] is True
+
+    def test_failure_skips_dependents_only(self):
+        n_b, n_d = _make_node(2), _make_node(4)
+        n_a, n_c = _make_node(1, leads_to=[n_b]), _make_node(3, leads_to=[n_d])
+        n_a.get_all_dependent_nodes.return_value = [n_b]
+        ran = []
+        lock = threading.Lock()
+
+        def execute(node, performance_mode, run_lock, params, fused=False):
+            with lock:
+                ran.append(node.node_id)
+            return SimpleNamespace(success=node.node_id != 1), node
+
+        skip_ids: set = set()
+        plan = compute_execution_plan([n_a, n_b, n_c, n_d])
+        failed = FlowGraph._execute_plan(_make_scheduler_host(execute), plan, False, {}, skip_ids)
+        assert failed == {1}
+        assert skip_ids == {1, 2}
+        assert sorted(ran) == [1, 3, 4]
+
+    def test_sequential_mode_follows_critical_path(self):
+        """Local execution runs inline, starting the head of the longest chain first."""
+        n4 = _make_node(4)
+        n3 = _make_node(3, leads_to=[n4])
+        n2 = _make_node(2, leads_to=[n3])
+        n_short = _make_node(1)
+        ran = []
+
+        def execute(node, performance_mode, lock, params, fused=False):
+            ran.append(node.node_id)
+            return SimpleNamespace(success=True), node
+
+        plan = compute_execution_plan([n_short, n2, n3, n4])
+        FlowGraph._execute_plan(_make_scheduler_host(execute, location="local"), plan, False, {}, set())
+        assert ran[:2] == [2, 3]
+        assert sorted(ran) == [1, 2, 3, 4]
+
+
 # max_parallel_workers setting
 
 
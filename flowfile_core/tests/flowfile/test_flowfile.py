@@ -537,6 +537,24 @@ def test_adding_graph_solver(execution_location):
     output_data.assert_equal(expected_data)
 
 
+def test_adding_partitioned_graph_solver(execution_location):
+    graph = create_graph(execution_location=execution_location)
+    input_data = [{'from': 'a', 'to': 'b'}, {'from': 'b', 'to': 'c'}, {'from': 'g', 'to': 'd'}]
+    add_manual_input(graph, data=input_data)
+    add_node_promise_on_type(graph, 'graph_solver', 2)
+    node_connection = input_schema.NodeConnection.create_from_simple_input(from_id=1, to_id=2)
+    add_connection(graph, node_connection)
+    graph_solver_input = transform_schema.GraphSolverInput(
+        col_from='from', col_to='to', output_column_name='g', strategy='partitioned'
+    )
+    graph.add_graph_solver(input_schema.NodeGraphSolver(flow_id=1, node_id=2, graph_solver_input=graph_solver_input))
+    graph.run_graph()
+    output_data = graph.get_node(2).get_resulting_data()
+    assert output_data.columns == ['from', 'to', 'g']
+    groups = output_data.collect()['g'].to_list()
+    assert groups[0] == groups[1] != groups[2]
+
+
 def test_add_formula_no_type(execution_location):
     graph = create_graph(execution_location=execution_location)
     input_data = [{'name': 'eduward'},
@@ -0,0 +1,169 @@
+"""Tests for the incremental node hashing (settings digest cache, hash index, persisted cache state)."""
+
+from pathlib import Path
+
+import pytest
+
+from flowfile_core.flowfile.flow_graph import FlowGraph, add_connection, load_cache_state
+from flowfile_core.flowfile.flow_node import flow_node as flow_node_module
+from flowfile_core.flowfile.handler import FlowfileHandler
+from flowfile_core.flowfile.manage.io_flowfile import open_flow
+from flowfile_core.flowfile.parameter_resolver import apply_parameters_in_place, restore_parameters
+from flowfile_core.flowfile.utils import get_hash_snapshot
+from flowfile_core.schemas import input_schema, schemas, transform_schema
+
+from tests.flowfile.conftest import add_test_manual_input
+
+SAMPLE = [{"a": 1, "b": 2}, {"a": 3, "b": 4}]
+
+
+@pytest.fixture
+def handler():
+    return FlowfileHandler()
+
+
+def _register(handler: FlowfileHandler, flow_path: Path, flow_id: int = 1) -> FlowGraph:
+    handler.register_flow(
+        schemas.FlowSettings(flow_id=flow_id, name="hashes", path=str(flow_path), execution_mode="Development")
+    )
+    return handler.get_flow(flow_id)
+
+
+def _add_polars_code(graph: FlowGraph, code: str, node_id: int = 2, depending_on_id: int = 1):
+    graph.add_polars_code(
+        input_schema.NodePolarsCode(
+            flow_id=graph.flow_id,
+            node_id=node_id,
+            polars_code_input=transform_schema.PolarsCodeInput(polars_code=code),
+            depending_on_ids=[depending_on_id],
+        )
+    )
+    add_connection(graph, input_schema.NodeConnection.create_from_simple_input(depending_on_id, node_id))
+
+
+def test_snapshot_tracks_values_not_identity():
+    data = {"columns": [[1, 2, 3], ["x", "y", "z"]], "pos_x": 1}
+    snapshot = get_hash_snapshot(data)
+    assert get_hash_snapshot({"columns": [[1, 2, 3], ["x", "y", "z"]], "pos_x": 1}) == snapshot
+    data["columns"][1][0] = "changed"
+    assert get_hash_snapshot(data) != snapshot
+    # 1 and 1.0 serialize differently, so they must not compare equal.
+    assert get_hash_snapshot([1]) != get_hash_snapshot([1.0])
+
+
+def test_snapshot_copies_sets():
+    data = {"keys": {"b", "a"}}
+    snapshot = get_hash_snapshot(data)
+    assert get_hash_snapshot({"keys": {"a", "b"}}) == snapshot
+    data["keys"].add("c")
+    assert get_hash_snapshot(data) != snapshot
+
+
+def test_settings_digest_is_reused_until_settings_change(handler, tmp_path, monkeypatch):
+    graph = _register(handler, tmp_path / "f.yaml")
+    add_test_manual_input(graph, SAMPLE)
+    node = graph.get_node(1)
+    _ = node.hash
+
+    hashed_settings = []
+    original_get_hash = flow_node_module.get_hash
+
+    def counting_get_hash(val):
+        if val is node.setting_input:
+            hashed_settings.append(val)
+        return original_get_hash(val)
+
+    monkeypatch.setattr(flow_node_module, "get_hash", counting_get_hash)
+    assert not node.needs_reset()
+    node.reset(deep=True)
+    _ = node.hash
+    assert hashed_settings == []
+
+
+def test_in_place_parameter_substitution_changes_the_hash(handler, tmp_path):
+    graph = _register(handler, tmp_path / "f.yaml")
+    add_test_manual_input(graph, SAMPLE)
+    _add_polars_code(graph, "output_df = input_df.filter(pl.col('a') > ${threshold})")
+    node = graph.get_node(2)
+    original_hash = node.hash
+
+    restorations = apply_parameters_in_place(node.setting_input, {"threshold": "1"})
+    assert node.needs_reset()
+    restore_parameters(restorations)
+    assert not node.needs_reset()
+    assert node.calculate_hash(node.setting_input) == original_hash
+
+
+def test_hash_index_recomputes_only_the_dirty_subtree(handler, tmp_path):
+    graph = _register(handler, tmp_path / "f.yaml")
+    add_test_manual_input(graph, SAMPLE)
+    _add_polars_code(graph, "output_df = input_df")
+    before = graph.get_hash_index()
+
+    graph.add_polars_code(
+        input_schema.NodePolarsCode(
+            flow_id=graph.flow_id,
+            node_id=2,
+            polars_code_input=transform_schema.PolarsCodeInput(polars_code="output_df = input_df.select('a')"),
+            depending_on_ids=[1],
+        )
+    )
+    after = graph.get_hash_index()
+    assert after[1] == before[1]
+    assert after[2] != before[2]
+
+
+def test_data_fingerprint_follows_upstream_source_changes(handler, tmp_path):
+    graph = _register(handler, tmp_path / "f.yaml")
+    add_test_manual_input(graph, SAMPLE)
+    _add_polars_code(graph, "output_df = input_df")
+    node = graph.get_node(2)
+    hash_before, fingerprint_before = node.hash, node.data_fingerprint
+    assert fingerprint_before == hash_before
+
+    graph.get_node(1)._execution_state.source_version_info = '{"sales": 4}'
+    assert node.hash == hash_before
+    assert node.data_fingerprint != fingerprint_before
+
+
+def test_reopened_flow_reproduces_node_hashes(handler, tmp_path):
+    path = tmp_path / "f.yaml"
+    graph = _register(handler, path)
+    add_test_manual_input(graph, SAMPLE)
+    graph.get_node(1).invalidate_cache()
+    _add_polars_code(graph, "output_df = input_df")
+    graph.save_flow(str(path))
+    saved = graph.get_hash_index()
+
+    assert open_flow(path, restore_cache_state=True).get_hash_index() == saved
+    assert open_flow(path).get_hash_index() != saved
+    # The cache state is kept by this core, not written into the portable file.
+    assert graph.uuid not in path.read_text(encoding="utf-8")
+    assert load_cache_state(path).cache_key == graph.uuid
+    assert graph.has_unsaved_changes() is False
+
+
+def test_copied_flow_file_does_not_carry_the_cache_state(handler, tmp_path):
+    path = tmp_path / "f.yaml"
+    graph = _register(handler, path)
+    add_test_manual_input(graph, SAMPLE)
+    graph.save_flow(str(path))
+    copy = tmp_path / "copy.yaml"
+    copy.write_bytes(path.read_bytes())
+
+    assert load_cache_state(copy) is None
+    assert open_flow(copy, restore_cache_state=True).uuid != graph.uuid
+
+
+def test_handler_never_shares_a_cache_key_between_open_flows(handler, tmp_path):
+    path = tmp_path / "f.yaml"
+    graph = _register(handler, path)
+    add_test_manual_input(graph, SAMPLE)
+    graph.save_flow(str(path))
+
+    fresh_handler = FlowfileHandler()
+    first = fresh_handler.get_flow(fresh_handler.import_flow(path))
+    second = fresh_handler.get_flow(fresh_handler.import_flow(path))
+    assert first.uuid == graph.uuid
+    assert second.uuid != first.uuid
+    assert second.get_node(1).hash != first.get_node(1).hash
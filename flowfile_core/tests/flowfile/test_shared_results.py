@@ -0,0 +1,111 @@
+"""Tests for cross-flow result sharing (flow-independent hashes, holds released on close)."""
+
+import pytest
+
+from flowfile_core.flowfile.flow_graph import FlowGraph, add_connection
+from flowfile_core.flowfile.flow_node import flow_node as flow_node_module
+from flowfile_core.schemas import input_schema, schemas, transform_schema
+
+from tests.flowfile.conftest import add_test_manual_input
+
+SAMPLE = [{"a": 1, "b": 2}, {"a": 3, "b": 4}]
+
+
+def _graph(flow_id: int) -> FlowGraph:
+    graph = FlowGraph(flow_settings=schemas.FlowSettings(flow_id=flow_id, name=f"shared_{flow_id}"))
+    add_test_manual_input(graph, SAMPLE)
+    graph.add_sort(
+        input_schema.NodeSort(
+            flow_id=flow_id,
+            node_id=2,
+            depending_on_id=1,
+            sort_input=[transform_schema.SortByInput(column="a", how="desc")],
+        )
+    )
+    add_connection(graph, input_schema.NodeConnection.create_from_simple_input(1, 2))
+    return graph
+
+
+@pytest.fixture
+def sharing(monkeypatch):
+    monkeypatch.setattr(flow_node_module, "SHARE_WORKER_RESULTS", True)
+
+
+def test_identical_sub_plans_share_a_hash_across_flows(sharing):
+    first, second = _graph(1), _graph(2)
+    assert first.uuid != second.uuid
+    assert first.get_node(2).shares_results
+    assert first.get_hash_index() == second.get_hash_index()
+
+
+def test_user_code_is_not_shared(sharing):
+    graph = _graph(1)
+    graph.add_polars_code(
+        input_schema.NodePolarsCode(
+            flow_id=1,
+            node_id=3,
+            polars_code_input=transform_schema.PolarsCodeInput(polars_code="output_df = input_df.select('a')"),
+            depending_on_ids=[2],
+        )
+    )
+    add_connection(graph, input_schema.NodeConnection.create_from_simple_input(2, 3))
+    assert graph.get_node(2).shares_results
+    assert not graph.get_node(3).shares_results
+
+
+def test_incremental_catalog_reads_are_not_shared(sharing):
+    graph = _graph(1)
+    graph.add_node_promise(input_schema.NodePromise(flow_id=1, node_id=3, node_type="catalog_reader"))
+    node = graph.get_node(3)
+
+    def reader(**kwargs) -> input_schema.NodeCatalogReader:
+        return input_schema.NodeCatalogReader(flow_id=1, node_id=3, catalog_table_id=1, **kwargs)
+
+    assert node._shared_hash_scope(reader(delta_version=4)) == "pinned"
+    assert node._shared_hash_scope(reader(read_mode="incremental")) is None
+
+
+def test_invalidate_cache_moves_off_the_shared_result(sharing):
+    first, second = _graph(1), _graph(2)
+    first.get_node(2).invalidate_cache()
+    assert first.get_node(2).shares_results
+    assert first.get_node(2).hash != second.get_node(2).hash
+    assert first.get_node(1).hash == second.get_node(1).hash
+
+
+def test_hashes_stay_flow_local_without_sharing():
+    first, second = _graph(1), _graph(2)
+    assert not first.get_node(2).shares_results
+    assert first.get_node(1).hash != second.get_node(1).hash
+
+
+def test_close_flow_releases_shared_results_instead_of_clearing(sharing, monkeypatch):
+    graph = _graph(1)
+    calls = []
+    monkeypatch.setattr(
+        "flowfile_core.flowfile.flow_graph.clear_tasks_from_worker",
+        lambda refs, holder=None: calls.append(("clear", list(refs), holder)),
+    )
+    monkeypatch.setattr(
+        "flowfile_core.flowfile.flow_graph.release_results",
+        lambda holder, file_refs=None: calls.append(("release", holder)),
+    )
+
+    graph.close_flow()
+    assert calls == [("clear", [], graph.uuid), ("release", graph.uuid)]
+
+
+def test_close_flow_releases_holds_without_sharing(monkeypatch):
+    graph = _graph(1)
+    calls = []
+    monkeypatch.setattr(
+        "flowfile_core.flowfile.flow_graph.clear_tasks_from_worker",
+        lambda refs, holder=None: calls.append(("clear", list(refs), holder)),
+    )
+    monkeypatch.setattr(
+        "flowfile_core.flowfile.flow_graph.release_results",
+        lambda holder, file_refs=None: calls.append(("release", holder)),
+    )
+
+    graph.close_flow()
+    assert calls == [("clear", [node.hash for node in graph.nodes], graph.uuid), ("release", graph.uuid)]
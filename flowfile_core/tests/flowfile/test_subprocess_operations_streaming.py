@@ -4,7 +4,15 @@ No worker needed: they exercise Status construction from a raw 'complete' frame,
 covering the row-count ride-along being present or absent.
 """
 
-from flowfile_core.flowfile.flow_data_engine.subprocess_operations.streaming import _handle_complete_message
+import os
+
+import polars as pl
+
+from flowfile_core.flowfile.flow_data_engine.subprocess_operations.streaming import (
+    _deserialize_and_populate_status,
+    _handle_complete_message,
+)
+from flowfile_core.utils.arrow_reader import mapped_readers, read_top_n
 
 
 def test_handle_complete_message_with_count():
@@ -30,3 +38,38 @@ def test_handle_complete_message_without_count():
     }
     status = _handle_complete_message(data, "task-2")
     assert status.number_of_records is None
+
+
+def test_polars_result_uses_the_sent_plan(tmp_path):
+    path = tmp_path / "task-3.arrow"
+    pl.DataFrame({"a": [1, 2, 3]}).write_ipc(path)
+    status = _handle_complete_message({"result_type": "polars", "file_ref": str(path)}, "task-3")
+
+    lf, status = _deserialize_and_populate_status(pl.scan_ipc(path).serialize(), status)
+
+    assert lf.collect()["a"].to_list() == [1, 2, 3]
+    assert status.results is not None
+
+
+def test_mapped_reader_is_shared_and_remapped_on_rewrite(tmp_path):
+    path = str(tmp_path / "result.arrow")
+    pl.DataFrame({"a": list(range(10))}).write_ipc(path)
+    assert read_top_n(path, n=3).num_rows == 3
+    assert mapped_readers.get(path) is mapped_readers.get(path)
+
+    pl.DataFrame({"a": list(range(25))}).write_ipc(path)
+    assert read_top_n(path, n=100).num_rows == 25
+    mapped_readers.invalidate(path)
+
+
+def test_mapped_reader_of_a_deleted_file_is_dropped(tmp_path):
+    evicted, live = str(tmp_path / "evicted.arrow"), str(tmp_path / "live.arrow")
+    for path in (evicted, live):
+        pl.DataFrame({"a": [1]}).write_ipc(path)
+        read_top_n(path, n=1)
+    os.remove(evicted)
+
+    read_top_n(live, n=1)
+
+    assert evicted not in mapped_readers._readers
+    mapped_readers.invalidate(live)
@@ -0,0 +1,96 @@
+"""Unit tests for the batched worker calls (status prefetch, bulk clear).
+
+No worker needed: the shared worker session is replaced by a fake that records requests.
+"""
+
+import pytest
+import requests
+
+from flowfile_core.flowfile.flow_data_engine.subprocess_operations import subprocess_operations
+from flowfile_core.flowfile.flow_data_engine.subprocess_operations.subprocess_operations import (
+    clear_task_from_worker,
+    clear_tasks_from_worker,
+    prefetched_results_exist,
+    results_exists,
+)
+
+
+class _Response:
+    def __init__(self, payload: dict | None = None, status_code: int = 200):
+        self._payload = payload
+        self.status_code = status_code
+        self.text = ""
+
+    def json(self):
+        return self._payload
+
+
+class _FakeSession:
+    def __init__(self, statuses: dict[str, str | None]):
+        self.statuses = statuses
+        self.calls: list[tuple[str, str]] = []
+
+    def post(self, url, json=None, timeout=None):
+        self.calls.append(("post", url))
+        if url.endswith("/status/batch"):
+            return _Response(
+                {
+                    "statuses": {
+                        t: {"status": self.statuses[t]} if self.statuses.get(t) else None for t in json["task_ids"]
+                    }
+                }
+            )
+        return _Response({"cleared": [t for t in json["task_ids"] if self.statuses.get(t)]})
+
+    def get(self, url, timeout=None):
+        self.calls.append(("get", url))
+        status = self.statuses.get(url.rsplit("/", 1)[-1])
+        return _Response({"status": status}) if status else _Response(status_code=404)
+
+    def delete(self, url, params=None, timeout=None):
+        self.calls.append(("delete", url))
+        return _Response({})
+
+
+@pytest.fixture
+def session(monkeypatch):
+    fake = _FakeSession({"done": "Completed", "busy": "Processing", "gone": None})
+    monkeypatch.setattr(subprocess_operations, "worker_session", fake)
+    monkeypatch.setattr(subprocess_operations, "OFFLOAD_TO_WORKER", True)
+    monkeypatch.setattr("flowfile_core.configs.settings.OFFLOAD_TO_WORKER", True)
+    return fake
+
+
+def test_prefetched_answers_serve_the_first_check_only(session):
+    with prefetched_results_exist(["done", "busy", "gone"]):
+        assert results_exists("done") is True
+        assert results_exists("busy") is False
+        assert len(session.calls) == 1
+        # A second check for the same ref asks the worker again.
+        assert results_exists("done") is True
+        assert len(session.calls) == 2
+    # Unused answers do not outlive the block.
+    assert results_exists("gone") is False
+    assert len(session.calls) == 3
+
+
+def test_clearing_a_task_drops_its_prefetched_answer(session):
+    with prefetched_results_exist(["done"]):
+        clear_task_from_worker("done")
+        session.statuses["done"] = None
+        assert results_exists("done") is False
+
+
+def test_failed_batch_falls_back_to_single_checks(session, monkeypatch):
+    def post(*args, **kwargs):
+        raise requests.ConnectionError("Connection refused")
+
+    monkeypatch.setattr(session, "post", post)
+    with prefetched_results_exist(["done"]):
+        assert results_exists("done") is True
+    assert session.calls == [("get", f"{subprocess_operations.WORKER_URL}/status/done")]
+
+
+def test_clear_tasks_is_one_request(session):
+    assert clear_tasks_from_worker(["done", "busy", "gone"]) == ["done", "busy"]
+    assert len(session.calls) == 1
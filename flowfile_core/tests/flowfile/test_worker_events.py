@@ -0,0 +1,222 @@
+"""Unit tests for push-based task completion (worker_events + BaseFetcher).
+
+No worker needed: the shared event channel is replaced by a fake that delivers
+events the way the receiver thread does.
+"""
+
+import json
+import queue
+import threading
+
+import polars as pl
+import pytest
+
+from flowfile_core.flowfile.flow_data_engine.subprocess_operations import subprocess_operations
+from flowfile_core.flowfile.flow_data_engine.subprocess_operations.subprocess_operations import BaseFetcher
+from flowfile_core.flowfile.flow_data_engine.subprocess_operations.worker_events import (
+    CHANNEL_LOST,
+    WorkerEventChannel,
+)
+
+
+class _FakeChannel:
+    def __init__(self, events: list[dict] | None, available: bool = True):
+        self.events = events or []
+        self.available = available
+        self.unsubscribed: list[str] = []
+
+    def subscribe(self, task_id, callback) -> bool:
+        if not self.available:
+            return False
+        for event in self.events:
+            callback({"task_id": task_id, **event})
+        return True
+
+    def unsubscribe(self, task_id, callback) -> None:
+        self.unsubscribed.append(task_id)
+
+
+class _FakeWebSocket:
+    """Stands in for the worker's ``/ws/events`` connection."""
+
+    def __init__(self):
+        self.sent: list[dict] = []
+        self._incoming: queue.Queue = queue.Queue()
+
+    def send(self, raw: str) -> None:
+        self.sent.append(json.loads(raw))
+
+    def push(self, event: dict) -> None:
+        self._incoming.put(json.dumps(event))
+
+    def close(self) -> None:
+        self._incoming.put(None)
+
+    def __iter__(self):
+        while (raw := self._incoming.get()) is not None:
+            yield raw
+
+
+class _Response:
+    status_code = 200
+
+    def __init__(self, payload: dict):
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+def _status(task_id: str, **fields) -> dict:
+    return {"background_task_id": task_id, "file_ref": "", "results": None, **fields}
+
+
+@pytest.fixture
+def no_polling(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("fetcher polled /status although the result was pushed")
+
+    monkeypatch.setattr(subprocess_operations.worker_session, "get", fail)
+
+
+def test_pushed_completion_resolves_without_polling(monkeypatch, no_polling, tmp_path):
+    path = tmp_path / "push-1.arrow"
+    pl.DataFrame({"a": [1, 2]}).write_ipc(path)
+    channel = _FakeChannel(
+        [
+            {"type": "progress", "status": "Processing", "progress": 50},
+            {
+                "type": "status",
+                "status": _status("push-1", status="Completed", file_ref=str(path), result_type="polars"),
+            },
+        ]
+    )
+    monkeypatch.setattr(subprocess_operations, "worker_events", channel)
+
+    result = BaseFetcher(file_ref="push-1").get_result()
+
+    assert result.collect()["a"].to_list() == [1, 2]
+    assert channel.unsubscribed == ["push-1"]
+
+
+def test_pushed_error_and_not_found(monkeypatch, no_polling):
+    monkeypatch.setattr(
+        subprocess_operations,
+        "worker_events",
+        _FakeChannel([{"type": "status", "status": _status("push-2", status="Error", error_message="boom")}]),
+    )
+    fetcher = BaseFetcher(file_ref="push-2")
+    with pytest.raises(Exception, match="boom"):
+        fetcher.get_result()
+    assert fetcher.error_code == 1
+
+    monkeypatch.setattr(subprocess_operations, "worker_events", _FakeChannel([{"type": "not_found"}]))
+    fetcher = BaseFetcher(file_ref="push-3")
+    with pytest.raises(Exception, match="404"):
+        fetcher.get_result()
+    assert fetcher.error_code == 2
+
+
+@pytest.mark.parametrize("channel", [_FakeChannel(None, available=False), _FakeChannel([CHANNEL_LOST])])
+def test_falls_back_to_polling_when_channel_is_unavailable(monkeypatch, channel):
+    polled = []
+
+    def get(url, timeout):
+        polled.append(url)
+        return _Response(_status("push-4", status="Completed", results="done", result_type="other"))
+
+    monkeypatch.setattr(subprocess_operations, "worker_events", channel)
+    monkeypatch.setattr(subprocess_operations.worker_session, "get", get)
+
+    assert BaseFetcher(file_ref="push-4").get_result() == "done"
+    assert len(polled) == 1
+
+
+def test_disabled_channel_never_connects(monkeypatch):
+    def connect(*args, **kwargs):
+        raise AssertionError("disabled channel tried to connect")
+
+    monkeypatch.setattr("flowfile_core.flowfile.flow_data_engine.subprocess_operations.worker_events.connect", connect)
+    assert WorkerEventChannel(enabled=False).subscribe("push-5", lambda event: None) is False
+
+
+def test_unreachable_worker_backs_off(monkeypatch):
+    attempts = []
+
+    def connect(*args, **kwargs):
+        attempts.append(args)
+        raise OSError("connection refused")
+
+    monkeypatch.setattr("flowfile_core.flowfile.flow_data_engine.subprocess_operations.worker_events.connect", connect)
+    channel = WorkerEventChannel()
+    assert channel.subscribe("push-6", lambda event: None) is False
+    assert channel.subscribe("push-7", lambda event: None) is False
+    assert len(attempts) == 1
+
+
+@pytest.fixture
+def fake_ws(monkeypatch) -> _FakeWebSocket:
+    ws = _FakeWebSocket()
+    monkeypatch.setattr(
+        "flowfile_core.flowfile.flow_data_engine.subprocess_operations.worker_events.connect",
+        lambda *args, **kwargs: ws,
+    )
+    return ws
+
+
+def test_events_fan_out_to_every_waiter_on_a_task(fake_ws):
+    channel = WorkerEventChannel()
+    first, second = queue.Queue(), queue.Queue()
+    assert channel.subscribe("push-8", first.put)
+    assert channel.subscribe("push-8", second.put)
+    assert fake_ws.sent == [{"type": "subscribe", "task_id": "push-8"}]
+
+    fake_ws.push({"type": "progress", "task_id": "push-8", "status": "Processing", "progress": 50})
+    fake_ws.push({"type": "status", "task_id": "push-8", "status": _status("push-8", status="Completed")})
+    for waiter in (first, second):
+        assert waiter.get(timeout=5)["type"] == "progress"
+        assert waiter.get(timeout=5)["type"] == "status"
+    channel.close()
+
+
+def test_unsubscribing_one_waiter_keeps_the_other(fake_ws):
+    channel = WorkerEventChannel()
+    first, second = queue.Queue(), queue.Queue()
+    channel.subscribe("push-9", first.put)
+    channel.subscribe("push-9", second.put)
+
+    channel.unsubscribe("push-9", first.put)
+    assert {"type": "unsubscribe", "task_id": "push-9"} not in fake_ws.sent
+    fake_ws.push({"type": "status", "task_id": "push-9", "status": _status("push-9", status="Completed")})
+    assert second.get(timeout=5)["type"] == "status"
+    assert first.empty()
+
+    channel.subscribe("push-10", first.put)
+    channel.unsubscribe("push-10", first.put)
+    assert fake_ws.sent[-1] == {"type": "unsubscribe", "task_id": "push-10"}
+    channel.close()
+
+
+def test_connecting_does_not_hold_the_subscriber_lock(monkeypatch):
+    connecting, release = threading.Event(), threading.Event()
+    ws = _FakeWebSocket()
+
+    def connect(*args, **kwargs):
+        connecting.set()
+        release.wait(timeout=5)
+        return ws
+
+    monkeypatch.setattr("flowfile_core.flowfile.flow_data_engine.subprocess_operations.worker_events.connect", connect)
+    channel = WorkerEventChannel()
+    subscriber = threading.Thread(target=channel.subscribe, args=("push-11", lambda event: None))
+    subscriber.start()
+    assert connecting.wait(timeout=5)
+
+    acquired = channel._lock.acquire(timeout=1)
+    if acquired:
+        channel._lock.release()
+    release.set()
+    subscriber.join(timeout=5)
+    assert acquired
+    assert ws.sent == [{"type": "subscribe", "task_id": "push-11"}]
+    channel.close()
@@ -0,0 +1,203 @@
+"""Tests for flowfile_core.catalog.maintenance.
+
+Covers the quiet-hours window, filter-column extraction and ranking, the
+compaction / Z-order decision, and a maintenance pass over a real Delta table
+registered in the catalog (budget, cooldown and the quiet-hours gate).
+"""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from flowfile_core.catalog import CatalogService, maintenance
+from flowfile_core.catalog.maintenance import (
+    CatalogMaintenance,
+    MaintenanceRecord,
+    TableFileStats,
+    filter_columns,
+    in_quiet_hours,
+    most_filtered_columns,
+    plan_table_maintenance,
+    read_maintenance_record,
+    record_filter_columns,
+)
+from flowfile_core.catalog.repository import SQLAlchemyCatalogRepository
+from flowfile_core.database.connection import get_db_context
+from flowfile_core.database.models import (
+    CatalogNamespace,
+    CatalogTable,
+    CatalogTableReadLink,
+    FlowFavorite,
+    FlowFollow,
+    FlowRegistration,
+    FlowRun,
+    FlowSchedule,
+    ScheduleTriggerTable,
+    TableFavorite,
+)
+from flowfile_core.schemas import input_schema, transform_schema
+from shared.delta_utils import open_delta_table
+
+QUIET = datetime(2026, 6, 1, 2, 0, 0)
+
+
+@pytest.fixture(autouse=True)
+def state_dir(tmp_path: Path, monkeypatch) -> Path:
+    path = tmp_path / "maintenance"
+    monkeypatch.setattr(maintenance, "MAINTENANCE_STATE_DIR", path)
+    monkeypatch.setattr(maintenance, "QUIET_HOURS", "1-5")
+    return path
+
+
+def _cleanup_catalog():
+    with get_db_context() as db:
+        db.query(ScheduleTriggerTable).delete()
+        db.query(FlowSchedule).delete()
+        db.query(TableFavorite).delete()
+        db.query(CatalogTableReadLink).delete()
+        db.query(CatalogTable).delete()
+        db.query(FlowFollow).delete()
+        db.query(FlowFavorite).delete()
+        db.query(FlowRun).delete()
+        db.query(FlowRegistration).delete()
+        db.query(CatalogNamespace).delete()
+        db.commit()
+
+
+@pytest.fixture()
+def clean_catalog():
+    _cleanup_catalog()
+    yield
+    _cleanup_catalog()
+
+
+def _filter_node(**filter_input) -> input_schema.NodeFilter:
+    return input_schema.NodeFilter(flow_id=1, node_id=2, filter_input=transform_schema.FilterInput(**filter_input))
+
+
+def _stats(file_count: int, small_file_count: int) -> TableFileStats:
+    return TableFileStats(
+        file_count=file_count,
+        total_bytes=file_count * 100,
+        small_file_count=small_file_count,
+        small_file_bytes=small_file_count * 10,
+        median_file_bytes=10,
+    )
+
+
+def test_quiet_hours():
+    assert in_quiet_hours(QUIET, "1-5")
+    assert not in_quiet_hours(QUIET.replace(hour=5), "1-5")
+    assert in_quiet_hours(QUIET.replace(hour=23), "22-4")
+    assert in_quiet_hours(QUIET.replace(hour=3), "22-4")
+    assert not in_quiet_hours(QUIET.replace(hour=12), "22-4")
+    assert not in_quiet_hours(QUIET, "nightly")
+
+
+def test_filter_columns():
+    basic = _filter_node(
+        mode="basic", basic_filter=transform_schema.BasicFilter(field="region", operator="equals", value="eu")
+    )
+    assert filter_columns(basic) == {"region"}
+    advanced = _filter_node(mode="advanced", advanced_filter="([amount] > 10) and pl.col('day') == '2026-01-01'")
+    assert filter_columns(advanced) == {"amount", "day"}
+    literals = _filter_node(mode="advanced", advanced_filter="[region].is_in(['eu', 'us']) and [id].is_in([1, 2, 3])")
+    assert filter_columns(literals) == {"region", "id"}
+    assert filter_columns(_filter_node(mode="advanced", advanced_filter="[amount].is_in([10])")) == {"amount"}
+
+
+def test_most_filtered_columns_need_enough_runs(monkeypatch):
+    monkeypatch.setattr(maintenance, "MIN_FILTER_READS", 2)
+    record_filter_columns(7, ["region", "day"])
+    record_filter_columns(7, ["region", "amount"])
+    record_filter_columns(7, ["region", "day"])
+
+    assert most_filtered_columns(7) == ["region", "day"]
+    assert most_filtered_columns(7, limit=1) == ["region"]
+    assert most_filtered_columns(8) == []
+
+
+def test_plan_compacts_small_files(monkeypatch):
+    monkeypatch.setattr(maintenance, "MIN_SMALL_FILES", 10)
+    assert plan_table_maintenance(1, "t", _stats(9, 9), [], None) is None
+
+    plan = plan_table_maintenance(1, "t", _stats(12, 10), [], None)
+    assert plan.z_order_columns == []
+    assert plan.rewrite_bytes == 100
+
+
+def test_plan_z_orders_when_the_filter_columns_change(monkeypatch):
+    monkeypatch.setattr(maintenance, "MIN_SMALL_FILES", 10)
+    monkeypatch.setattr(maintenance, "MIN_ZORDER_FILES", 4)
+    last = MaintenanceRecord(QUIET - timedelta(days=2), ["region"])
+
+    plan = plan_table_maintenance(1, "t", _stats(5, 0), ["day"], last)
+    assert plan.z_order_columns == ["day"]
+    assert plan.rewrite_bytes == 500
+
+    assert plan_table_maintenance(1, "t", _stats(5, 0), ["region"], last) is None
+    compaction = plan_table_maintenance(1, "t", _stats(20, 10), ["region"], last)
+    assert compaction.z_order_columns == []
+    assert compaction.clustered_by == ["region"]
+    assert plan_table_maintenance(1, "t", _stats(3, 0), ["day"], last) is None
+
+
+def _register_fragmented_table(tmp_path: Path, name: str, writes: int) -> tuple[int, str]:
+    path = str(tmp_path / name)
+    for i in range(writes):
+        pl.DataFrame({"id": [i], "region": ["eu" if i % 2 else "us"]}).write_delta(path, mode="append")
+    with get_db_context() as db:
+        namespace = CatalogNamespace(name="MaintCat", level=0, owner_id=1)
+        db.add(namespace)
+        db.commit()
+        db.refresh(namespace)
+        schema = CatalogNamespace(name="MaintSch", level=1, parent_id=namespace.id, owner_id=1)
+        db.add(schema)
+        db.commit()
+        db.refresh(schema)
+        out = CatalogService(SQLAlchemyCatalogRepository(db)).register_table_from_data(
+            name=name,
+            table_path=path,
+            owner_id=1,
+            namespace_id=schema.id,
+            storage_format="delta",
+            schema=[{"name": "id", "dtype": "Int64"}, {"name": "region", "dtype": "String"}],
+            row_count=writes,
+            column_count=2,
+            size_bytes=1,
+        )
+    return out.id, path
+
+
+def test_pass_compacts_a_fragmented_table(clean_catalog, tmp_path, monkeypatch):
+    import flowfile_core.catalog.services.tables as tables_mod
+
+    monkeypatch.setattr(tables_mod, "_should_offload", lambda: False)
+    monkeypatch.setattr(maintenance, "MIN_SMALL_FILES", 4)
+    table_id, path = _register_fragmented_table(tmp_path, "fragmented", writes=6)
+    runner = CatalogMaintenance()
+
+    assert runner.run_pass(QUIET.replace(hour=12)) == []
+
+    done = runner.run_pass(QUIET)
+    assert [plan.table_id for plan in done] == [table_id]
+    assert len(open_delta_table(path).file_uris()) == 1
+    assert pl.scan_delta(path).collect().height == 6
+    assert read_maintenance_record(table_id).maintained_at == QUIET
+
+    # Cooling down: an hour later the table is left alone.
+    assert runner.run_pass(QUIET + timedelta(hours=1)) == []
+
+
+def test_pass_respects_the_byte_budget(clean_catalog, tmp_path, monkeypatch):
+    import flowfile_core.catalog.services.tables as tables_mod
+
+    monkeypatch.setattr(tables_mod, "_should_offload", lambda: False)
+    monkeypatch.setattr(maintenance, "MIN_SMALL_FILES", 4)
+    monkeypatch.setattr(maintenance, "MAX_BYTES_PER_PASS", 1)
+    _table_id, path = _register_fragmented_table(tmp_path, "over_budget", writes=6)
+
+    assert CatalogMaintenance().run_pass(QUIET) == []
+    assert len(open_delta_table(path).file_uris()) == 6
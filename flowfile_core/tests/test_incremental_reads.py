@@ -0,0 +1,170 @@
+"""Tests for flowfile_core.catalog.incremental_reads.
+
+Covers the add-file diff between Delta versions (plain and partitioned tables,
+schema evolution, rewrites, compactions), the full-read fallbacks, and the consumed-version
+state that only advances when the flow succeeds.
+"""
+
+from pathlib import Path
+
+import polars as pl
+import pytest
+from deltalake import DeltaTable
+
+from flowfile_core.catalog import incremental_reads
+from flowfile_core.catalog.incremental_reads import (
+    make_increment_commit_callback,
+    read_catalog_increment,
+    read_consumed_version,
+    read_delta_increment,
+    write_consumed_version,
+)
+
+
+@pytest.fixture(autouse=True)
+def state_dir(tmp_path: Path, monkeypatch) -> Path:
+    path = tmp_path / "state"
+    monkeypatch.setattr(incremental_reads, "INCREMENTAL_STATE_DIR", path)
+    return path
+
+
+@pytest.fixture()
+def table_path(tmp_path: Path) -> str:
+    dest = str(tmp_path / "events")
+    pl.DataFrame({"id": [1, 2, 3], "region": ["eu", "us", "eu"]}).write_delta(dest, mode="error")
+    return dest
+
+
+class _Logger:
+    def __init__(self):
+        self.messages: list[str] = []
+
+    def info(self, msg: str) -> None:
+        self.messages.append(msg)
+
+    warning = error = info
+
+
+def test_no_version_reads_the_whole_table(table_path):
+    increment = read_delta_increment(table_path, None)
+    assert increment.full
+    assert increment.version == 0
+    assert increment.lf.collect()["id"].sort().to_list() == [1, 2, 3]
+
+
+def test_reads_only_appended_rows(table_path):
+    pl.DataFrame({"id": [4, 5], "region": ["us", "us"]}).write_delta(table_path, mode="append")
+    pl.DataFrame({"id": [6], "region": ["eu"]}).write_delta(table_path, mode="append")
+
+    increment = read_delta_increment(table_path, 0)
+    assert not increment.full
+    assert increment.version == 2
+    result = increment.lf.collect()
+    assert result.columns == ["id", "region"]
+    assert result["id"].sort().to_list() == [4, 5, 6]
+
+
+def test_unchanged_table_gives_an_empty_frame_with_the_schema(table_path):
+    result = read_delta_increment(table_path, 0).lf.collect()
+    assert result.is_empty()
+    assert result.schema == pl.Schema({"id": pl.Int64, "region": pl.String})
+
+
+def test_partition_values_come_from_the_log(tmp_path):
+    dest = str(tmp_path / "partitioned")
+    pl.DataFrame({"id": [1], "region": ["eu"]}).write_delta(
+        dest, mode="error", delta_write_options={"partition_by": ["region"]}
+    )
+    pl.DataFrame({"id": [2, 3], "region": ["us", "eu"]}).write_delta(
+        dest, mode="append", delta_write_options={"partition_by": ["region"]}
+    )
+
+    result = read_delta_increment(dest, 0).lf.collect().sort("id")
+    assert result.columns == ["id", "region"]
+    assert result.rows() == [(2, "us"), (3, "eu")]
+
+
+def test_columns_added_later_are_null_in_older_files(table_path):
+    pl.DataFrame({"id": [4], "region": ["us"], "score": [1.5]}).write_delta(
+        table_path, mode="append", delta_write_options={"schema_mode": "merge"}
+    )
+    pl.DataFrame({"id": [5], "region": ["eu"]}).write_delta(
+        table_path, mode="append", delta_write_options={"schema_mode": "merge"}
+    )
+
+    result = read_delta_increment(table_path, 0).lf.collect().sort("id")
+    assert result.columns == ["id", "region", "score"]
+    assert result["score"].to_list() == [1.5, None]
+
+
+def test_overwrite_reads_the_rewritten_files(table_path):
+    pl.DataFrame({"id": [7, 8], "region": ["eu", "eu"]}).write_delta(table_path, mode="overwrite")
+    increment = read_delta_increment(table_path, 0)
+    assert not increment.full
+    assert increment.lf.collect()["id"].sort().to_list() == [7, 8]
+
+
+def test_compaction_between_reads_gives_an_empty_increment(table_path):
+    pl.DataFrame({"id": [4], "region": ["us"]}).write_delta(table_path, mode="append")
+    first = read_delta_increment(table_path, 0)
+    assert first.lf.collect()["id"].to_list() == [4]
+
+    DeltaTable(table_path).optimize.compact()
+    second = read_delta_increment(table_path, first.version)
+    assert not second.full
+    assert second.version == first.version + 1
+    assert second.lf.collect().is_empty()
+
+
+def test_rows_absorbed_by_a_compaction_are_read_once(table_path):
+    pl.DataFrame({"id": [4], "region": ["us"]}).write_delta(table_path, mode="append")
+    pl.DataFrame({"id": [5], "region": ["eu"]}).write_delta(table_path, mode="append")
+    DeltaTable(table_path).optimize.z_order(["id"])
+    pl.DataFrame({"id": [6], "region": ["us"]}).write_delta(table_path, mode="append")
+
+    increment = read_delta_increment(table_path, 0)
+    assert not increment.full
+    assert increment.lf.collect()["id"].sort().to_list() == [4, 5, 6]
+
+
+def test_vacuumed_files_fall_back_to_a_full_read(table_path):
+    pl.DataFrame({"id": [4], "region": ["us"]}).write_delta(table_path, mode="append")
+    table = DeltaTable(table_path)
+    table.optimize.compact()
+    table.vacuum(retention_hours=0, enforce_retention_duration=False, dry_run=False)
+
+    increment = read_delta_increment(table_path, 0)
+    assert increment.full
+    assert increment.lf.collect()["id"].sort().to_list() == [1, 2, 3, 4]
+
+
+def test_newer_consumed_version_falls_back_to_a_full_read(table_path):
+    increment = read_delta_increment(table_path, 5)
+    assert increment.full
+    assert increment.lf.collect().height == 3
+
+
+def test_state_is_per_table(table_path):
+    write_consumed_version("daily", table_path, 0)
+    assert read_consumed_version("daily", table_path) == 0
+    assert read_consumed_version("daily", table_path + "_other") is None
+    assert read_consumed_version("unknown", table_path) is None
+
+
+def test_callback_advances_state_only_on_success(table_path):
+    pl.DataFrame({"id": [4], "region": ["us"]}).write_delta(table_path, mode="append")
+    flow_logger = _Logger()
+
+    first = read_catalog_increment(table_path, "hourly")
+    assert first.full and first.version == 1
+
+    make_increment_commit_callback("hourly", table_path, first.version, 1, flow_logger)(False)
+    assert read_consumed_version("hourly", table_path) is None
+
+    make_increment_commit_callback("hourly", table_path, first.version, 1, flow_logger)(True)
+    assert read_consumed_version("hourly", table_path) == 1
+
+    pl.DataFrame({"id": [5], "region": ["eu"]}).write_delta(table_path, mode="append")
+    second = read_catalog_increment(table_path, "hourly")
+    assert not second.full
+    assert second.lf.collect()["id"].to_list() == [5]
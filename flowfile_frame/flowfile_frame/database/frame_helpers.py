@@ -14,6 +14,7 @@ from flowfile_core.flowfile.flow_graph import FlowGraph
 from flowfile_core.schemas import input_schema
 from flowfile_frame.database.connection_manager import get_current_user_id
 from flowfile_frame.utils import generate_node_id
+from shared.db_reader import DbReadPartitioning
 
 if TYPE_CHECKING:
     from flowfile_frame.flow_frame import FlowFrame
@@ -26,6 +27,7 @@ def add_read_from_database(
     table_name: str | None = None,
     schema_name: str | None = None,
     query: str | None = None,
+    partitioning: DbReadPartitioning | None = None,
     description: str | None = None,
 ) -> int:
     """Add a database reader node to the flow graph.
@@ -39,6 +41,7 @@ def add_read_from_database(
         table_name: Name of the table to read from.
         schema_name: Database schema name (e.g., 'public' for PostgreSQL).
         query: SQL query to execute instead of reading a table.
+        partitioning: Read as concurrent range queries on a column.
         description: Optional description for the node.
 
     Returns:
@@ -67,6 +70,7 @@ def add_read_from_database(
             table_name=table_name,
             schema_name=schema_name,
             query=query,
+            partitioning=partitioning,
         ),
     )
 
@@ -81,7 +85,8 @@ def add_write_to_database(
     connection_name: str,
     table_name: str,
     schema_name: str | None = None,
-    if_exists: Literal["append", "replace", "fail"] = "append",
+    if_exists: Literal["append", "replace", "fail", "upsert", "update", "delete"] = "append",
+    merge_keys: list[str] | None = None,
     description: str | None = None,
 ) -> int:
     """Add a database writer node to the flow graph.
@@ -96,6 +101,10 @@ def add_write_to_database(
             - 'append': Add rows to existing table
             - 'replace': Drop and recreate table
             - 'fail': Raise an error
+            - 'upsert': Update rows matching on merge_keys, insert the rest
+            - 'update': Update rows matching on merge_keys only
+            - 'delete': Delete rows matching on merge_keys
+        merge_keys: Key columns for the 'upsert', 'update' and 'delete' modes.
         description: Optional description for the node.
 
     Returns:
@@ -116,6 +125,7 @@ def add_write_to_database(
             table_name=table_name,
             schema_name=schema_name,
             if_exists=if_exists,
+            merge_keys=merge_keys or [],
         ),
     )
 
@@ -129,6 +139,7 @@ def read_database(
     table_name: str | None = None,
     schema_name: str | None = None,
     query: str | None = None,
+    partitioning: DbReadPartitioning | None = None,
     flow_graph: FlowGraph | None = None,
 ) -> FlowFrame:
     """Read data from a database using a stored connection.
@@ -143,6 +154,8 @@ def read_database(
         table_name: Name of the table to read from.
         schema_name: Database schema name (e.g., 'public' for PostgreSQL).
         query: SQL query to execute instead of reading a table.
+        partitioning: Read as concurrent range queries on a column, e.g.
+            ``DbReadPartitioning(column="id", num_partitions=8)``.
         flow_graph: Optional existing FlowGraph to add the node to.
 
     Returns:
@@ -164,6 +177,7 @@ def read_database(
         table_name=table_name,
         schema_name=schema_name,
         query=query,
+        partitioning=partitioning,
     )
 
     return FlowFrame(
@@ -179,7 +193,8 @@ def write_database(
     table_name: str,
     *,
     schema_name: str | None = None,
-    if_exists: Literal["append", "replace", "fail"] = "append",
+    if_exists: Literal["append", "replace", "fail", "upsert", "update", "delete"] = "append",
+    merge_keys: list[str] | None = None,
 ) -> None:
     """Write data to a database using a stored connection.
 
@@ -194,6 +209,10 @@ def write_database(
             - 'append': Add rows to existing table
             - 'replace': Drop and recreate table
             - 'fail': Raise an error
+            - 'upsert': Update rows matching on merge_keys, insert the rest
+            - 'update': Update rows matching on merge_keys only
+            - 'delete': Delete rows matching on merge_keys
+        merge_keys: Key columns for the 'upsert', 'update' and 'delete' modes.
 
     Raises:
         ValueError: If the connection is not found.
@@ -206,4 +225,5 @@ def write_database(
         table_name=table_name,
         schema_name=schema_name,
         if_exists=if_exists,
+        merge_keys=merge_keys,
     )
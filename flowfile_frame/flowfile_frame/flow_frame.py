@@ -36,6 +36,7 @@ from flowfile_frame.utils import (
     stringify_values,
 )
 from flowfile_frame.utils import data as node_id_data
+from shared.fuzzy_blocking import FuzzyBlocking
 
 
 def can_be_expr(param: inspect.Parameter) -> bool:
@@ -2371,7 +2372,8 @@ class FlowFrame:
         table_name: str,
         *,
         schema_name: str | None = None,
-        if_exists: Literal["append", "replace", "fail"] = "append",
+        if_exists: Literal["append", "replace", "fail", "upsert", "update", "delete"] = "append",
+        merge_keys: list[str] | None = None,
         description: str | None = None,
     ) -> FlowFrame:
         """Write the data frame to a database using a stored connection.
@@ -2380,7 +2382,9 @@ class FlowFrame:
             connection_name: Name of the stored database connection to use.
             table_name: Name of the table to write to.
             schema_name: Database schema name (e.g., 'public' for PostgreSQL).
-            if_exists: What to do if the table already exists.
+            if_exists: What to do if the table already exists, or a merge mode
+                ('upsert', 'update', 'delete') on *merge_keys*.
+            merge_keys: Key columns for the merge modes.
             description: Optional description for this operation.
 
         Returns:
@@ -2395,6 +2399,7 @@ class FlowFrame:
             table_name=table_name,
             schema_name=schema_name,
             if_exists=if_exists,
+            merge_keys=merge_keys,
             description=description,
         )
         return self._create_child_frame(new_node_id)
@@ -2586,6 +2591,8 @@ class FlowFrame:
         col_to: str,
         output_column_name: str = "graph_group",
         *,
+        strategy: Literal["in_memory", "partitioned"] = "in_memory",
+        state_name: str | None = None,
         description: str | None = None,
     ) -> FlowFrame:
         new_node_id = generate_node_id()
@@ -2597,6 +2604,8 @@ class FlowFrame:
                 col_from=col_from,
                 col_to=col_to,
                 output_column_name=output_column_name,
+                strategy=strategy,
+                state_name=state_name,
             ),
             description=description,
         )
@@ -3389,6 +3398,7 @@ class FlowFrame:
         other: FlowFrame,
         fuzzy_mappings: list[FuzzyMapping],
         description: str = None,
+        blocking: FuzzyBlocking | None = None,
     ) -> FlowFrame:
         self._ensure_same_graph(other)
 
@@ -3397,7 +3407,7 @@ class FlowFrame:
             flow_id=self.flow_graph.flow_id,
             node_id=new_node_id,
             join_input=transform_schema.FuzzyMatchInput(
-                join_mapping=fuzzy_mappings, left_select=self.columns, right_select=other.columns
+                join_mapping=fuzzy_mappings, left_select=self.columns, right_select=other.columns, blocking=blocking
             ),
             description=description or "Fuzzy match between two FlowFrames",
             depending_on_ids=[self.node_id, other.node_id],
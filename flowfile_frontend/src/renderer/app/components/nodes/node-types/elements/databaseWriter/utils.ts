@@ -7,6 +7,7 @@ import {
 export const createNodeDatabaseWriter = (flowId: number, nodeId: number): NodeDatabaseWriter => {
   const databaseWriteSettings: DatabaseWriteSettings = {
     if_exists: "replace",
+    merge_keys: [],
     connection_mode: "reference",
     schema_name: undefined,
     table_name: undefined,
@@ -29,6 +29,7 @@ export const createNodeRestApiReader = (flowId: number, nodeId: number): NodeRes
       max_pages: 1000,
       max_records: null,
       page_delay_seconds: 0,
+      max_concurrency: 1,
     },
     record_path: "",
     timeout_seconds: 30,
@@ -715,7 +715,7 @@ export interface DatabaseConnection extends BaseConnection {
   password_ref?: string; // Unused by file-based databases (sqlite, duckdb)
 }
 export type ConnectionModeOption = "inline" | "reference";
-export type IfExistAction = "append" | "replace" | "fail";
+export type IfExistAction = "append" | "replace" | "fail" | "upsert" | "update" | "delete";
 
 export interface DatabaseSettings {
   connection_mode: ConnectionModeOption;
@@ -734,6 +734,7 @@ export interface DatabaseWriteSettings {
   schema_name?: string;
   table_name?: string;
   if_exists: IfExistAction;
+  merge_keys?: string[];
 }
 
 // Cloud Storage Types
@@ -1141,6 +1142,7 @@ export interface RestApiPaginationSettings {
   max_pages: number;
   max_records: number | null;
   page_delay_seconds: number;
+  max_concurrency?: number;
 }
 
 export interface RestApiSettings {
@@ -3,6 +3,11 @@
 This module is intentionally free of flowfile_core imports.  It talks
 directly to the shared SQLite database using lightweight SQLAlchemy
 table reflections defined in ``flowfile_scheduler.models``.
+
+Schedules are kept in a ``ScheduleIndex`` between ticks: a tick only looks
+at the interval/cron schedules that are due, and the loop sleeps until the
+next fire time (at most ``poll_interval``) unless :meth:`FlowScheduler.wake`
+cuts the sleep short.
 """
 
 from __future__ import annotations
@@ -11,11 +16,9 @@ import asyncio
 import logging
 import time
 import uuid
-import zoneinfo
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 
-from croniter import croniter
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
@@ -27,6 +30,7 @@ from flowfile_scheduler.models import (
     SchedulerLock,
     ScheduleTriggerTable,
 )
+from flowfile_scheduler.schedule_index import ScheduleIndex, cron_next_run
 from shared.run_completion import reap_orphaned_runs
 from shared.run_logs import cleanup_old_logs
 from shared.storage_config import get_database_url
@@ -39,6 +43,9 @@ STALE_THRESHOLD = 90
 
 LOG_SWEEP_INTERVAL = 3600
 
+# Floor on the loop's sleep, so a fire time that is already due cannot spin it.
+MIN_SLEEP_SECONDS = 0.5
+
 
 class LaunchOutcome(Enum):
     """Result of a ``_maybe_launch`` attempt.
@@ -68,6 +75,9 @@ class FlowScheduler:
         # None, not 0.0: time.monotonic() is seconds-since-boot on Linux, so a
         # zero seed would skip the first sweep for an hour on a freshly booted host.
         self._last_log_sweep: float | None = None
+        self._index = ScheduleIndex()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake_event: asyncio.Event | None = None
 
         url = get_database_url()
         connect_args = {"check_same_thread": False} if "sqlite" in url else {}
@@ -88,7 +98,9 @@ class FlowScheduler:
         if self._task is not None:
             raise RuntimeError("Scheduler has already been started")
         self._stopping = False
-        self._task = asyncio.get_event_loop().create_task(self._run_loop())
+        self._loop = asyncio.get_running_loop()
+        self._wake_event = asyncio.Event()
+        self._task = self._loop.create_task(self._run_loop())
         logger.info("Scheduler %s started", self._holder_id)
 
     async def run_once(self) -> None:
@@ -102,6 +114,21 @@ class FlowScheduler:
         self._release_lock()
         logger.info("Scheduler %s single tick complete", self._holder_id)
 
+    def wake(self) -> None:
+        """Run the next tick now instead of at the end of the current sleep.
+
+        Called by core after a schedule is created, edited or deleted and after a
+        catalog table is written, so new fire times and table triggers are picked up
+        without waiting out the poll interval. Safe to call from any thread; a no-op
+        when the loop is not running.
+        """
+        if self._loop is None or self._wake_event is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._wake_event.set)
+        except RuntimeError:
+            pass  # loop already closed
+
     async def stop(self) -> None:
         """Signal the loop to stop and release the lock."""
         self._stopping = True
@@ -118,18 +145,41 @@ class FlowScheduler:
 
     async def _run_loop(self) -> None:
         while not self._stopping:
+            self._wake_event.clear()
+            holds_lock = False
             try:
-                await asyncio.to_thread(self._tick)
+                holds_lock = await asyncio.to_thread(self._tick)
             except Exception:
                 logger.exception("Scheduler tick failed")
-            await asyncio.sleep(self._poll_interval)
+            try:
+                await asyncio.wait_for(self._wake_event.wait(), timeout=self._sleep_seconds(holds_lock))
+            except asyncio.TimeoutError:
+                pass
+
+    def _sleep_seconds(self, holds_lock: bool) -> float:
+        """Time until the next tick: the next fire time, capped at the poll interval.
 
-    def _tick(self) -> None:
-        """Single scheduler tick — acquire lock, check schedules, launch."""
+        The poll interval stays the cadence for everything the index cannot see
+        coming — lock takeover, table triggers, and schedule edits made by another
+        process.
+        """
+        if not holds_lock:
+            return self._poll_interval
+        next_fire = self._index.next_fire()
+        if next_fire is None:
+            return self._poll_interval
+        until_fire = (next_fire - _utcnow()).total_seconds()
+        return max(MIN_SLEEP_SECONDS, min(self._poll_interval, until_fire))
+
+    def _tick(self) -> bool:
+        """Single scheduler tick — acquire lock, check schedules, launch.
+
+        Returns whether this instance holds the lock.
+        """
         with self._session_factory() as db:
             if not self._acquire_lock(db):
                 logger.info("Tick skipped — lock held by another instance")
-                return
+                return False
             try:
                 reap_orphaned_runs()
             except Exception:
@@ -152,6 +202,7 @@ class FlowScheduler:
                 logger.info("Tick complete — launched %d flow(s)", launched)
             else:
                 logger.info("Tick complete — no schedules due")
+            return True
 
     # Lock management
 
@@ -199,31 +250,48 @@ class FlowScheduler:
     # Interval schedules
 
     def _process_interval_schedules(self, db: Session) -> int:
-        schedules: list[FlowSchedule] = (
-            db.query(FlowSchedule)
-            .filter(FlowSchedule.enabled.is_(True), FlowSchedule.schedule_type == "interval")
-            .all()
-        )
-        logger.info("Evaluating %d interval schedule(s)", len(schedules))
+        self._index.refresh(db)
+        logger.info("Evaluating %d interval schedule(s)", self._index.count("interval"))
 
         launched = 0
         now = _utcnow()
-        for sched in schedules:
-            if sched.interval_seconds is None:
+        for schedule_id in self._index.pop_due("interval", now):
+            sched = self._indexed_schedule(db, schedule_id, "interval")
+            if sched is None:
                 continue
-
-            if sched.last_triggered_at is not None:
-                last = sched.last_triggered_at.replace(tzinfo=timezone.utc)
-                elapsed = (now - last).total_seconds()
-                remaining = sched.interval_seconds - elapsed
-                if remaining > 0:
-                    logger.info("Schedule %s not due yet (%.0fs remaining)", sched.id, remaining)
+            try:
+                if sched.interval_seconds is None:
                     continue
 
-            if self._maybe_launch(db, sched, now) is LaunchOutcome.LAUNCHED:
-                launched += 1
+                if sched.last_triggered_at is not None:
+                    last = sched.last_triggered_at.replace(tzinfo=timezone.utc)
+                    elapsed = (now - last).total_seconds()
+                    remaining = sched.interval_seconds - elapsed
+                    if remaining > 0:
+                        logger.info("Schedule %s not due yet (%.0fs remaining)", sched.id, remaining)
+                        continue
+
+                if self._maybe_launch(db, sched, now) is LaunchOutcome.LAUNCHED:
+                    launched += 1
+            finally:
+                self._reindex(sched, now)
         return launched
 
+    def _indexed_schedule(self, db: Session, schedule_id: int, schedule_type: str) -> FlowSchedule | None:
+        """The current row of a schedule popped off the index, or ``None`` if it no longer applies."""
+        sched: FlowSchedule | None = db.get(FlowSchedule, schedule_id)
+        if sched is None:
+            self._index.discard(schedule_id)
+            return None
+        if not sched.enabled or sched.schedule_type != schedule_type:
+            self._index.update(sched)
+            return None
+        return sched
+
+    def _reindex(self, sched: FlowSchedule, now: datetime) -> None:
+        """Put an evaluated interval/cron schedule back; one still due retries after a poll interval."""
+        self._index.update(sched, now=now, retry_at=now + timedelta(seconds=self._poll_interval))
+
     # Cron schedules
 
     def _process_cron_schedules(self, db: Session) -> int:
@@ -241,71 +309,40 @@ class FlowScheduler:
         scheduler that was down catches up with a single fire rather than
         backfilling every missed slot.  ``last_triggered_at`` continues to
         record the actual UTC fire time (used for display).
+
+        Only the schedules the index has due are read; each is re-checked
+        against its current row, so an early pop just costs one lookup.
         """
-        schedules: list[FlowSchedule] = (
-            db.query(FlowSchedule)
-            .filter(FlowSchedule.enabled.is_(True), FlowSchedule.schedule_type == "cron")
-            .all()
-        )
-        logger.debug("Evaluating %d cron schedule(s)", len(schedules))
+        self._index.refresh(db)
+        logger.debug("Evaluating %d cron schedule(s)", self._index.count("cron"))
 
         launched = 0
         now = _utcnow()
-        for sched in schedules:
-            if not sched.cron_expression:
-                logger.warning("Cron schedule %s has no expression, skipping", sched.id)
+        for schedule_id in self._index.pop_due("cron", now):
+            sched = self._indexed_schedule(db, schedule_id, "cron")
+            if sched is None:
                 continue
-
             try:
-                tz = zoneinfo.ZoneInfo(sched.cron_timezone or "UTC")
-            except Exception:
-                logger.warning(
-                    "Cron schedule %s has invalid timezone %r, skipping", sched.id, sched.cron_timezone
-                )
-                continue
-
-            # Cron runs in *naive local wall-clock* time: the cursor and
-            # croniter both work in local time with no UTC offset, so the
-            # repeated hour of a fall-back transition is a single instant
-            # ("02:30" fires once) and skipped spring-forward times are caught
-            # at the next tick.
-            base_local = sched.last_cron_slot
-            if base_local is None:
-                # Never fired under the cursor model (or a pre-existing row):
-                # seed from the last real trigger / creation time in local time.
-                base_utc = sched.last_triggered_at or sched.created_at
-                if base_utc is None:
-                    logger.warning(
-                        "Cron schedule %s has no last_triggered_at/created_at, skipping", sched.id
-                    )
+                cron = cron_next_run(sched)
+                if cron is None:
                     continue
-                try:
-                    base_local = base_utc.replace(tzinfo=timezone.utc).astimezone(tz).replace(tzinfo=None)
-                except Exception:
-                    logger.warning("Cron schedule %s has an unusable base timestamp, skipping", sched.id)
-                    continue
-
-            try:
-                next_run = croniter(sched.cron_expression, base_local).get_next(datetime)
-            except Exception:
-                logger.warning(
-                    "Cron schedule %s has invalid expression %r, skipping", sched.id, sched.cron_expression
-                )
-                continue
+                tz, next_run = cron
 
-            now_local = now.astimezone(tz).replace(tzinfo=None)
-            if next_run <= now_local:
-                logger.info(
-                    "Cron schedule %s due (next_run=%s local, now=%s) — triggering", sched.id, next_run, now
-                )
-                if self._maybe_launch(db, sched, now) is LaunchOutcome.LAUNCHED:
-                    # Advance the cursor to *now* (not next_run) so a scheduler
-                    # that was down catches up with a single fire.
-                    sched.last_cron_slot = now_local
-                    db.commit()
-                    launched += 1
-            else:
-                logger.debug("Cron schedule %s not due yet (next_run=%s local)", sched.id, next_run)
+                now_local = now.astimezone(tz).replace(tzinfo=None)
+                if next_run <= now_local:
+                    logger.info(
+                        "Cron schedule %s due (next_run=%s local, now=%s) — triggering", sched.id, next_run, now
+                    )
+                    if self._maybe_launch(db, sched, now) is LaunchOutcome.LAUNCHED:
+                        # Advance the cursor to *now* (not next_run) so a scheduler
+                        # that was down catches up with a single fire.
+                        sched.last_cron_slot = now_local
+                        db.commit()
+                        launched += 1
+                else:
+                    logger.debug("Cron schedule %s not due yet (next_run=%s local)", sched.id, next_run)
+            finally:
+                self._reindex(sched, now)
         return launched
 
     # Table-trigger schedules
@@ -339,61 +376,82 @@ class FlowScheduler:
         A NULL watermark means "never observed", not "changed": the first tick
         that sees such a schedule arms it with the table's current
         ``updated_at`` and launches nothing.
+
+        The watched tables' ``updated_at`` is read in one query and compared
+        with the watermarks held in the index; only schedules whose table moved
+        are loaded.
         """
-        schedules: list[FlowSchedule] = (
-            db.query(FlowSchedule)
-            .filter(FlowSchedule.enabled.is_(True), FlowSchedule.schedule_type == "table_trigger")
-            .all()
-        )
+        self._index.refresh(db)
+        schedules = self._index.trigger_schedules("table_trigger")
         logger.info("Evaluating %d table-trigger schedule(s)", len(schedules))
+        if not schedules:
+            return 0
+        tables = self._table_stamps(db)
 
         launched = 0
-        for sched in schedules:
-            if sched.trigger_table_id is None:
+        for schedule_id, entry in schedules:
+            if entry.trigger_table_id is None:
                 continue
-
-            table: CatalogTable | None = db.get(CatalogTable, sched.trigger_table_id)
-            if table is None:
-                logger.warning("Schedule %s references missing table %s", sched.id, sched.trigger_table_id)
+            if entry.trigger_table_id not in tables:
+                logger.warning("Schedule %s references missing table %s", schedule_id, entry.trigger_table_id)
                 continue
-
-            table_updated = table.updated_at.replace(tzinfo=timezone.utc) if table.updated_at else None
-            last_seen = (
-                sched.last_trigger_table_updated_at.replace(tzinfo=timezone.utc)
-                if sched.last_trigger_table_updated_at
-                else None
-            )
-
-            if table_updated is None:
-                continue
-
-            if last_seen is None:
-                # Arm, don't replay: a pre-existing updated_at is not a change we saw happen.
-                sched.last_trigger_table_updated_at = table_updated
-                db.commit()
+            table_name, table_updated = tables[entry.trigger_table_id]
+            if table_updated is None or (entry.watermark is not None and table_updated <= entry.watermark):
                 continue
 
-            if table_updated <= last_seen:
-                continue
-
-            logger.info(
-                "Table '%s' (id=%s) updated at %s (last seen %s) — triggering schedule %s",
-                table.name,
-                table.id,
-                table_updated,
-                last_seen,
-                sched.id,
-            )
-            outcome = self._maybe_launch(db, sched, _utcnow())
-            if outcome is LaunchOutcome.SKIPPED:
-                # Leave the watermark so the trigger re-fires once the blocking run ends.
+            sched = db.get(FlowSchedule, schedule_id)
+            if sched is None:
+                self._index.discard(schedule_id)
                 continue
+            try:
+                launched += self._evaluate_table_trigger(db, sched, entry.trigger_table_id, table_name, table_updated)
+            finally:
+                self._index.update(sched)
+        return launched
 
+    def _table_stamps(self, db: Session) -> dict[int, tuple[str, datetime | None]]:
+        """Name and UTC ``updated_at`` of every catalog table, by id."""
+        return {
+            table_id: (name, updated_at.replace(tzinfo=timezone.utc) if updated_at else None)
+            for table_id, name, updated_at in db.query(CatalogTable.id, CatalogTable.name, CatalogTable.updated_at)
+        }
+
+    def _evaluate_table_trigger(
+        self, db: Session, sched: FlowSchedule, table_id: int, table_name: str, table_updated: datetime
+    ) -> int:
+        """Arm, skip or launch one table_trigger schedule whose table moved; returns the launch count."""
+        if not sched.enabled or sched.schedule_type != "table_trigger" or sched.trigger_table_id != table_id:
+            return 0
+        last_seen = (
+            sched.last_trigger_table_updated_at.replace(tzinfo=timezone.utc)
+            if sched.last_trigger_table_updated_at
+            else None
+        )
+        if last_seen is None:
+            # Arm, don't replay: a pre-existing updated_at is not a change we saw happen.
             sched.last_trigger_table_updated_at = table_updated
             db.commit()
-            if outcome is LaunchOutcome.LAUNCHED:
-                launched += 1
-        return launched
+            return 0
+
+        if table_updated <= last_seen:
+            return 0
+
+        logger.info(
+            "Table '%s' (id=%s) updated at %s (last seen %s) — triggering schedule %s",
+            table_name,
+            table_id,
+            table_updated,
+            last_seen,
+            sched.id,
+        )
+        outcome = self._maybe_launch(db, sched, _utcnow())
+        if outcome is LaunchOutcome.SKIPPED:
+            # Leave the watermark so the trigger re-fires once the blocking run ends.
+            return 0
+
+        sched.last_trigger_table_updated_at = table_updated
+        db.commit()
+        return 1 if outcome is LaunchOutcome.LAUNCHED else 0
 
     # Table-set-trigger schedules
 
@@ -406,66 +464,81 @@ class FlowScheduler:
         ``max(table.updated_at)`` — never ``now()``, which would swallow a write
         landing between the reads and the stamp.
         """
-        schedules: list[FlowSchedule] = (
-            db.query(FlowSchedule)
-            .filter(FlowSchedule.enabled.is_(True), FlowSchedule.schedule_type == "table_set_trigger")
-            .all()
-        )
+        self._index.refresh(db)
+        schedules = self._index.trigger_schedules("table_set_trigger")
         logger.info("Evaluating %d table-set-trigger schedule(s)", len(schedules))
+        if not schedules:
+            return 0
+        tables = self._table_stamps(db)
+        links: dict[int, list[int]] = {schedule_id: [] for schedule_id, _ in schedules}
+        for schedule_id, table_id in db.query(ScheduleTriggerTable.schedule_id, ScheduleTriggerTable.table_id).filter(
+            ScheduleTriggerTable.schedule_id.in_(links)
+        ):
+            links[schedule_id].append(table_id)
 
         launched = 0
-        for sched in schedules:
-            trigger_links: list[ScheduleTriggerTable] = (
-                db.query(ScheduleTriggerTable).filter(ScheduleTriggerTable.schedule_id == sched.id).all()
-            )
-            table_ids = [link.table_id for link in trigger_links]
+        for schedule_id, entry in schedules:
+            table_ids = links[schedule_id]
             if len(table_ids) < 2:
-                logger.warning("Schedule %s has fewer than 2 trigger tables, skipping", sched.id)
+                logger.warning("Schedule %s has fewer than 2 trigger tables, skipping", schedule_id)
                 continue
 
-            last_seen = (
-                sched.last_trigger_table_updated_at.replace(tzinfo=timezone.utc)
-                if sched.last_trigger_table_updated_at
-                else None
-            )
-
             stamps: list[datetime] = []
             for tid in table_ids:
-                table: CatalogTable | None = db.get(CatalogTable, tid)
-                if table is None:
-                    logger.warning("Schedule %s references missing table %s", sched.id, tid)
+                if tid not in tables:
+                    logger.warning("Schedule %s references missing table %s", schedule_id, tid)
                     break
-                if table.updated_at is None:
+                table_updated = tables[tid][1]
+                if table_updated is None:
                     break
-                stamps.append(table.updated_at.replace(tzinfo=timezone.utc))
+                stamps.append(table_updated)
             if len(stamps) != len(table_ids):
                 continue
-
-            observed = max(stamps)
-            if last_seen is None:
-                # Arm, don't replay: pre-existing timestamps are not changes we saw happen.
-                sched.last_trigger_table_updated_at = observed
-                db.commit()
-                continue
-
-            if not all(stamp > last_seen for stamp in stamps):
+            if entry.watermark is not None and not all(stamp > entry.watermark for stamp in stamps):
                 continue
 
-            logger.info(
-                "All %d trigger tables updated for schedule %s — triggering",
-                len(table_ids),
-                sched.id,
-            )
-            outcome = self._maybe_launch(db, sched, _utcnow())
-            if outcome is LaunchOutcome.SKIPPED:
-                # Leave the watermark so the trigger re-fires once the blocking run ends.
+            sched = db.get(FlowSchedule, schedule_id)
+            if sched is None:
+                self._index.discard(schedule_id)
                 continue
+            try:
+                launched += self._evaluate_table_set_trigger(db, sched, stamps)
+            finally:
+                self._index.update(sched)
+        return launched
 
+    def _evaluate_table_set_trigger(self, db: Session, sched: FlowSchedule, stamps: list[datetime]) -> int:
+        """Arm, skip or launch one table_set_trigger schedule; returns the launch count."""
+        if not sched.enabled or sched.schedule_type != "table_set_trigger":
+            return 0
+        last_seen = (
+            sched.last_trigger_table_updated_at.replace(tzinfo=timezone.utc)
+            if sched.last_trigger_table_updated_at
+            else None
+        )
+        observed = max(stamps)
+        if last_seen is None:
+            # Arm, don't replay: pre-existing timestamps are not changes we saw happen.
             sched.last_trigger_table_updated_at = observed
             db.commit()
-            if outcome is LaunchOutcome.LAUNCHED:
-                launched += 1
-        return launched
+            return 0
+
+        if not all(stamp > last_seen for stamp in stamps):
+            return 0
+
+        logger.info(
+            "All %d trigger tables updated for schedule %s — triggering",
+            len(stamps),
+            sched.id,
+        )
+        outcome = self._maybe_launch(db, sched, _utcnow())
+        if outcome is LaunchOutcome.SKIPPED:
+            # Leave the watermark so the trigger re-fires once the blocking run ends.
+            return 0
+
+        sched.last_trigger_table_updated_at = observed
+        db.commit()
+        return 1 if outcome is LaunchOutcome.LAUNCHED else 0
 
     # Launch helpers
 
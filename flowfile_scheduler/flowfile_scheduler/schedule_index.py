@@ -0,0 +1,239 @@
+"""In-memory index of enabled schedules for ``FlowScheduler``.
+
+Keeps the schedule rows the scheduler needs between ticks so a tick does not
+re-read and re-evaluate every schedule:
+
+- Interval and cron schedules sit in one min-heap per type, keyed on their next
+  fire time (UTC). A tick pops only the due entries, and the scheduler sleeps
+  until the earliest one. A cron expression is parsed when its row changes, not
+  on every tick.
+- Trigger schedules keep their table ids and watermark, so a tick compares them
+  against one batched read of the catalog tables' ``updated_at``.
+
+The index refreshes incrementally: only rows with a new id, or an ``updated_at``
+at or after the newest one seen (core stamps it on every edit), are reloaded,
+and a changed row count drops deleted schedules. Heap entries are invalidated
+lazily through a per-schedule version.
+
+The due check itself stays exact: the engine re-evaluates every popped
+schedule against its fresh row, so the heap only decides *when* to look.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import zoneinfo
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from croniter import croniter
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session
+
+from flowfile_scheduler.models import FlowSchedule
+
+logger = logging.getLogger("flowfile.scheduler")
+
+TIMED_SCHEDULE_TYPES = ("interval", "cron")
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    return value.replace(tzinfo=timezone.utc) if value is not None else None
+
+
+def cron_next_run(sched: FlowSchedule) -> tuple[zoneinfo.ZoneInfo, datetime] | None:
+    """The schedule's timezone and next fire time as naive local wall-clock time.
+
+    Cron runs in *naive local wall-clock* time: the cursor and croniter both
+    work in local time with no UTC offset, so the repeated hour of a fall-back
+    transition is a single instant ("02:30" fires once) and skipped
+    spring-forward times are caught at the next tick. Returns ``None`` (and
+    logs why) when the schedule cannot be evaluated.
+    """
+    if not sched.cron_expression:
+        logger.warning("Cron schedule %s has no expression, skipping", sched.id)
+        return None
+
+    try:
+        tz = zoneinfo.ZoneInfo(sched.cron_timezone or "UTC")
+    except Exception:
+        logger.warning("Cron schedule %s has invalid timezone %r, skipping", sched.id, sched.cron_timezone)
+        return None
+
+    base_local = sched.last_cron_slot
+    if base_local is None:
+        # Never fired under the cursor model (or a pre-existing row):
+        # seed from the last real trigger / creation time in local time.
+        base_utc = sched.last_triggered_at or sched.created_at
+        if base_utc is None:
+            logger.warning("Cron schedule %s has no last_triggered_at/created_at, skipping", sched.id)
+            return None
+        try:
+            base_local = base_utc.replace(tzinfo=timezone.utc).astimezone(tz).replace(tzinfo=None)
+        except Exception:
+            logger.warning("Cron schedule %s has an unusable base timestamp, skipping", sched.id)
+            return None
+
+    try:
+        next_run = croniter(sched.cron_expression, base_local).get_next(datetime)
+    except Exception:
+        logger.warning("Cron schedule %s has invalid expression %r, skipping", sched.id, sched.cron_expression)
+        return None
+    return tz, next_run
+
+
+def next_fire_time(sched: FlowSchedule) -> datetime | None:
+    """When an interval or cron schedule is next due (UTC), or ``None`` if it never is.
+
+    For cron the local time is mapped to its earliest UTC reading (over both folds,
+    so a repeated or skipped wall-clock time), which is never later than the
+    engine's naive local-time check.
+    """
+    if sched.schedule_type == "interval":
+        if sched.interval_seconds is None:
+            return None
+        if sched.last_triggered_at is None:
+            return _EPOCH
+        return _as_utc(sched.last_triggered_at) + timedelta(seconds=sched.interval_seconds)
+    cron = cron_next_run(sched)
+    if cron is None:
+        return None
+    tz, next_local = cron
+    return min(next_local.replace(tzinfo=tz, fold=fold).astimezone(timezone.utc) for fold in (0, 1))
+
+
+def _signature(sched: FlowSchedule) -> tuple:
+    """The columns a timed schedule's next fire time depends on."""
+    return (
+        sched.schedule_type,
+        sched.interval_seconds,
+        sched.cron_expression,
+        sched.cron_timezone,
+        sched.last_triggered_at,
+        sched.last_cron_slot,
+        sched.created_at,
+    )
+
+
+@dataclass
+class IndexedSchedule:
+    schedule_type: str
+    signature: tuple
+    version: int
+    trigger_table_id: int | None = None
+    watermark: datetime | None = None  # last_trigger_table_updated_at, UTC
+
+
+class ScheduleIndex:
+    """Enabled schedules by id, with a next-fire heap per timed schedule type."""
+
+    def __init__(self) -> None:
+        self._entries: dict[int, IndexedSchedule] = {}
+        self._known_ids: set[int] = set()
+        self._heaps: dict[str, list[tuple[datetime, int, int]]] = {t: [] for t in TIMED_SCHEDULE_TYPES}
+        self._versions = itertools.count()
+        self._max_id = 0
+        self._max_updated_at: datetime | None = None
+
+    def refresh(self, db: Session) -> None:
+        """Load the schedules created, edited or deleted since the last refresh."""
+        query = db.query(FlowSchedule)
+        if self._max_updated_at is not None:
+            # ``>=``: edits landing within the same timestamp as the newest seen one still reload.
+            query = query.filter(or_(FlowSchedule.id > self._max_id, FlowSchedule.updated_at >= self._max_updated_at))
+        for sched in query.all():
+            self._known_ids.add(sched.id)
+            self._max_id = max(self._max_id, sched.id)
+            if sched.updated_at is not None and (
+                self._max_updated_at is None or sched.updated_at > self._max_updated_at
+            ):
+                self._max_updated_at = sched.updated_at
+            self.update(sched)
+
+        count = db.query(func.count(FlowSchedule.id)).scalar() or 0
+        if count != len(self._known_ids):
+            existing = {schedule_id for (schedule_id,) in db.query(FlowSchedule.id)}
+            for schedule_id in self._known_ids - existing:
+                self._entries.pop(schedule_id, None)
+            self._known_ids = existing
+
+    def update(self, sched: FlowSchedule, now: datetime | None = None, retry_at: datetime | None = None) -> None:
+        """(Re)index one schedule row.
+
+        Pass *now* and *retry_at* after evaluating a popped schedule: if it is still
+        due at *now* (its launch was skipped or failed), it is queued at *retry_at*
+        instead of being looked at again on every pass.
+        """
+        if not sched.enabled:
+            self._entries.pop(sched.id, None)
+            return
+        signature = _signature(sched)
+        watermark = _as_utc(sched.last_trigger_table_updated_at)
+        current = self._entries.get(sched.id)
+        if current is not None and current.signature == signature and now is None:
+            current.trigger_table_id = sched.trigger_table_id
+            current.watermark = watermark
+            return
+
+        entry = IndexedSchedule(
+            schedule_type=sched.schedule_type,
+            signature=signature,
+            version=next(self._versions),
+            trigger_table_id=sched.trigger_table_id,
+            watermark=watermark,
+        )
+        self._entries[sched.id] = entry
+        if sched.schedule_type not in TIMED_SCHEDULE_TYPES:
+            return
+        fire_at = next_fire_time(sched)
+        if fire_at is None:
+            return
+        if now is not None and retry_at is not None and fire_at <= now:
+            fire_at = retry_at
+        heapq.heappush(self._heaps[sched.schedule_type], (fire_at, entry.version, sched.id))
+
+    def discard(self, schedule_id: int) -> None:
+        """Forget a schedule that no longer exists."""
+        self._entries.pop(schedule_id, None)
+        self._known_ids.discard(schedule_id)
+
+    def pop_due(self, schedule_type: str, now: datetime) -> list[int]:
+        """Take the ids of the *schedule_type* schedules due at *now* off the heap.
+
+        The caller must pass every popped schedule back to :meth:`update`.
+        """
+        heap = self._heaps[schedule_type]
+        due: list[int] = []
+        while heap and heap[0][0] <= now:
+            _, version, schedule_id = heapq.heappop(heap)
+            entry = self._entries.get(schedule_id)
+            if entry is not None and entry.version == version:
+                due.append(schedule_id)
+        return due
+
+    def next_fire(self) -> datetime | None:
+        """The earliest pending fire time over all timed schedules."""
+        earliest: datetime | None = None
+        for heap in self._heaps.values():
+            while heap:
+                fire_at, version, schedule_id = heap[0]
+                entry = self._entries.get(schedule_id)
+                if entry is not None and entry.version == version:
+                    if earliest is None or fire_at < earliest:
+                        earliest = fire_at
+                    break
+                heapq.heappop(heap)
+        return earliest
+
+    def trigger_schedules(self, schedule_type: str) -> list[tuple[int, IndexedSchedule]]:
+        """The enabled ``table_trigger`` / ``table_set_trigger`` schedules, by id."""
+        return sorted(
+            ((i, e) for i, e in self._entries.items() if e.schedule_type == schedule_type), key=lambda item: item[0]
+        )
+
+    def count(self, schedule_type: str) -> int:
+        return sum(1 for e in self._entries.values() if e.schedule_type == schedule_type)
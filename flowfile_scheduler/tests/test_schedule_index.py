@@ -0,0 +1,144 @@
+"""Tests for the schedule index and the event-driven scheduler loop.
+
+These drive ``FlowScheduler`` against a temp SQLite database, with ``_utcnow``
+pinned and ``_spawn_flow`` stubbed, and check that the in-memory index picks up
+schedule edits and deletions, queues skipped launches for a retry, and that the
+loop sleeps until the next fire time unless woken.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from flowfile_scheduler import engine as engine_mod
+from flowfile_scheduler.engine import FlowScheduler
+from shared.models import FlowRegistration, FlowRun, FlowSchedule
+
+BASE_TS = datetime(2026, 5, 25, 9, 0, 0)
+NOW = datetime(2026, 5, 25, 10, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def sched(tmp_path, monkeypatch):
+    """A FlowScheduler bound to a throwaway SQLite DB with subprocess spawning stubbed."""
+    url = f"sqlite:///{tmp_path / 'sched.db'}"
+    monkeypatch.setattr(engine_mod, "get_database_url", lambda: url)
+    s = FlowScheduler(poll_interval=30)
+    s.spawned: list[tuple[str, int]] = []
+    monkeypatch.setattr(s, "_spawn_flow", lambda flow_path, run_id: s.spawned.append((flow_path, run_id)) or 4242)
+    monkeypatch.setattr(engine_mod, "_utcnow", lambda: NOW)
+    return s
+
+
+def _seed(sched: FlowScheduler, **fields) -> tuple[int, int]:
+    """Insert a flow registration + schedule; return (registration id, schedule id)."""
+    with sched._session_factory() as db:
+        reg = FlowRegistration(name="flow", flow_path="/tmp/flow.flowfile", owner_id=1)
+        db.add(reg)
+        db.commit()
+        db.refresh(reg)
+        schedule = FlowSchedule(
+            registration_id=reg.id, owner_id=1, enabled=True, created_at=BASE_TS, updated_at=BASE_TS, **fields
+        )
+        db.add(schedule)
+        db.commit()
+        return reg.id, schedule.id
+
+
+def _edit(sched: FlowScheduler, schedule_id: int, updated_at: datetime, **fields) -> None:
+    """Change a schedule the way core does: the edit bumps ``updated_at``."""
+    with sched._session_factory() as db:
+        schedule = db.get(FlowSchedule, schedule_id)
+        for key, value in fields.items():
+            setattr(schedule, key, value)
+        schedule.updated_at = updated_at
+        db.commit()
+
+
+def _interval(sched: FlowScheduler) -> int:
+    with sched._session_factory() as db:
+        return sched._process_interval_schedules(db)
+
+
+def _cron(sched: FlowScheduler) -> int:
+    with sched._session_factory() as db:
+        return sched._process_cron_schedules(db)
+
+
+def test_next_fire_is_the_earliest_pending_schedule(sched):
+    _seed(sched, schedule_type="interval", interval_seconds=3600, last_triggered_at=datetime(2026, 5, 25, 9, 50, 0))
+    _seed(sched, schedule_type="cron", cron_expression="30 10 * * *", last_triggered_at=BASE_TS)
+
+    assert _interval(sched) == 0
+    assert _cron(sched) == 0
+    assert sched._index.next_fire() == datetime(2026, 5, 25, 10, 30, 0, tzinfo=timezone.utc)
+    assert sched._sleep_seconds(holds_lock=True) == 30
+    assert sched._sleep_seconds(holds_lock=False) == 30
+
+
+def test_sleep_stops_at_the_next_fire_time(sched):
+    _seed(sched, schedule_type="interval", interval_seconds=20, last_triggered_at=datetime(2026, 5, 25, 9, 59, 50))
+
+    assert _interval(sched) == 0
+    assert sched._sleep_seconds(holds_lock=True) == 10
+
+
+def test_edit_is_picked_up(sched):
+    _reg_id, schedule_id = _seed(sched, schedule_type="cron", cron_expression="0 2 * * *", last_triggered_at=BASE_TS)
+    assert _cron(sched) == 0
+
+    _edit(sched, schedule_id, BASE_TS + timedelta(minutes=1), cron_expression="*/15 * * * *")
+    assert _cron(sched) == 1
+    assert sched.spawned
+
+
+def test_deleted_schedule_is_dropped(sched):
+    _seed(sched, schedule_type="interval", interval_seconds=3600, last_triggered_at=datetime(2026, 5, 25, 9, 50, 0))
+    _reg_id, schedule_id = _seed(
+        sched, schedule_type="interval", interval_seconds=3600, last_triggered_at=datetime(2026, 5, 25, 9, 55, 0)
+    )
+    assert _interval(sched) == 0
+    assert sched._index.count("interval") == 2
+
+    with sched._session_factory() as db:
+        db.delete(db.get(FlowSchedule, schedule_id))
+        db.commit()
+    assert _interval(sched) == 0
+    assert sched._index.count("interval") == 1
+
+
+def test_disabled_schedule_leaves_the_index(sched):
+    _reg_id, schedule_id = _seed(sched, schedule_type="interval", interval_seconds=60, last_triggered_at=BASE_TS)
+    _edit(sched, schedule_id, BASE_TS, enabled=False)
+
+    assert _interval(sched) == 0
+    assert sched._index.next_fire() is None
+
+
+def test_skipped_launch_retries_after_a_poll_interval(sched):
+    reg_id, _schedule_id = _seed(sched, schedule_type="interval", interval_seconds=60, last_triggered_at=BASE_TS)
+    with sched._session_factory() as db:
+        db.add(FlowRun(registration_id=reg_id, flow_name="flow", user_id=1, started_at=BASE_TS, run_type="scheduled"))
+        db.commit()
+
+    assert _interval(sched) == 0
+    assert sched._index.next_fire() == NOW + timedelta(seconds=30)
+
+
+@pytest.mark.asyncio
+async def test_wake_starts_the_next_tick_early(sched, monkeypatch):
+    ticks = asyncio.Queue()
+    loop = asyncio.get_running_loop()
+    monkeypatch.setattr(sched, "_tick", lambda: loop.call_soon_threadsafe(ticks.put_nowait, None) or True)
+
+    await sched.start()
+    try:
+        await asyncio.wait_for(ticks.get(), timeout=5)
+        sched.wake()
+        # Well inside the 30s poll interval.
+        await asyncio.wait_for(ticks.get(), timeout=5)
+    finally:
+        await sched.stop()
@@ -0,0 +1,240 @@
+"""Memory-aware admission control for worker tasks.
+
+Every compute task asks for admission before its process starts (fresh spawn or pool
+lease). A task is admitted when its estimated memory fits both the worker's memory
+budget, less what already admitted tasks reserved, and the host's currently available
+RAM, less a headroom; otherwise it waits in FIFO order, so a large task is not starved
+by a stream of small ones. A task is always admitted when nothing else runs: a single
+oversized task must still be able to run, it just runs alone.
+
+A task's estimate is the largest of:
+
+- the peak RSS seen for the same flow, node and operation on an earlier run,
+- the input size core reports (``FlowDataEngine.get_estimated_file_size``) and the
+  plan's own size (embedded data such as manual input), times an expansion factor,
+- a per-task floor for the interpreter and Polars runtime.
+
+Peak RSS is sampled by the task monitors (``sample_rss``) and is also what
+``/memory_usage/{task_id}`` reports.
+
+Configuration (environment, read once at import):
+
+- ``FLOWFILE_WORKER_ADMISSION_CONTROL``: ``0`` disables queueing (default on).
+- ``FLOWFILE_WORKER_MEMORY_BUDGET_MB``: memory all running tasks may reserve together,
+  ``0`` (default) = 80% of the host's RAM.
+- ``FLOWFILE_WORKER_MEMORY_HEADROOM_MB``: RAM to keep free on the host (default 512).
+- ``FLOWFILE_WORKER_MAX_CONCURRENT_TASKS``: ``0`` (default) = no fixed cap.
+"""
+
+import os
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from time import monotonic
+
+from flowfile_worker import PROCESS_MEMORY_USAGE
+from flowfile_worker.configs import logger
+from flowfile_worker.pool import _rss_mb
+
+# Input bytes -> working memory; matches core's own size heuristics for in-memory frames.
+_EXPANSION_FACTOR = 4
+_MIN_TASK_MB = 64.0
+# Available RAM changes without any admission event, so waiters re-check periodically.
+_RECHECK_INTERVAL = 0.5
+_MAX_HISTORY = 4096
+
+
+def _int_env(name: str, default: int) -> int:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={raw!r}; using {default}")
+        return default
+
+
+def _host_memory_mb() -> tuple[float, float] | None:
+    """(total, available) host RAM in MB, or None when psutil is unavailable."""
+    try:
+        import psutil
+
+        memory = psutil.virtual_memory()
+        return memory.total / 1e6, memory.available / 1e6
+    except Exception:
+        return None
+
+
+@dataclass
+class AdmissionTicket:
+    """One task's place in the admission queue, and its reservation once admitted."""
+
+    task_id: str
+    key: tuple
+    estimate_mb: float
+    enqueued_at: float
+    admitted_at: float | None = None
+    withdrawn: bool = False
+
+
+class AdmissionController:
+    """FIFO admission queue that reserves each running task's estimated memory."""
+
+    def __init__(self, enabled: bool, budget_mb: float, headroom_mb: float, max_concurrent: int):
+        self.enabled = enabled
+        self.budget_mb = budget_mb
+        self.headroom_mb = headroom_mb
+        self.max_concurrent = max_concurrent
+        self._cond = threading.Condition()
+        self._waiting: deque[AdmissionTicket] = deque()
+        self._running: dict[str, AdmissionTicket] = {}
+        self._peak_history: OrderedDict[tuple, float] = OrderedDict()
+        self._admitted_total = 0
+        self._queued_total = 0
+        self._withdrawn_total = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+
+    def estimate_mb(
+        self,
+        operation: str,
+        flow_id: int,
+        node_id: int | str,
+        payload_bytes: int = 0,
+        input_bytes: int | None = None,
+    ) -> float:
+        """Estimated memory in MB for one run of *operation* on this flow node."""
+        with self._cond:
+            history_mb = self._peak_history.get((flow_id, node_id, operation), 0.0)
+        data_mb = (payload_bytes + (input_bytes or 0)) * _EXPANSION_FACTOR / 1e6
+        return max(history_mb, data_mb, _MIN_TASK_MB)
+
+    def enqueue(self, task_id: str, operation: str, flow_id: int, node_id: int | str, estimate_mb: float):
+        """Queue a task; returns its ticket for ``wait`` / ``withdraw``."""
+        ticket = AdmissionTicket(task_id, (flow_id, node_id, operation), estimate_mb, monotonic())
+        with self._cond:
+            self._waiting.append(ticket)
+        return ticket
+
+    def wait(self, ticket: AdmissionTicket, timeout: float | None = None) -> bool:
+        """Block until *ticket* is admitted (True) or *timeout* passes (False)."""
+        deadline = None if timeout is None else monotonic() + timeout
+        with self._cond:
+            while ticket.admitted_at is None:
+                if ticket.withdrawn:
+                    return False
+                if self._waiting[0] is ticket and self._fits(ticket):
+                    self._admit(ticket)
+                    break
+                remaining = _RECHECK_INTERVAL if deadline is None else min(_RECHECK_INTERVAL, deadline - monotonic())
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def admit(self, task_id: str, operation: str, flow_id: int, node_id: int | str, estimate_mb: float) -> bool:
+        """Block until the task may start; False when it was withdrawn (cancelled) while queued."""
+        if not self.enabled:
+            return True
+        return self.wait(self.enqueue(task_id, operation, flow_id, node_id, estimate_mb))
+
+    def withdraw(self, task_id: str) -> bool:
+        """Drop a still-queued task (cancelled, or its client went away); False when it is not queued."""
+        with self._cond:
+            for ticket in self._waiting:
+                if ticket.task_id == task_id:
+                    self._waiting.remove(ticket)
+                    ticket.withdrawn = True
+                    self._withdrawn_total += 1
+                    self._cond.notify_all()
+                    return True
+        return False
+
+    def release(self, task_id: str) -> None:
+        """Free a finished task's reservation and remember its peak RSS for the next estimate."""
+        peak_mb = PROCESS_MEMORY_USAGE.get(task_id)
+        with self._cond:
+            ticket = self._running.pop(task_id, None)
+            if ticket is None:
+                return
+            if peak_mb:
+                self._peak_history[ticket.key] = peak_mb
+                self._peak_history.move_to_end(ticket.key)
+                while len(self._peak_history) > _MAX_HISTORY:
+                    self._peak_history.popitem(last=False)
+            self._cond.notify_all()
+
+    def describe(self) -> dict:
+        """Queue depth, reservations and wait metrics, for observability."""
+        host = _host_memory_mb()
+        now = monotonic()
+        with self._cond:
+            waiting = list(self._waiting)
+            running = list(self._running.values())
+            admitted = self._admitted_total
+            return {
+                "enabled": self.enabled,
+                "budget_mb": self._budget_mb(),
+                "headroom_mb": self.headroom_mb,
+                "max_concurrent": self.max_concurrent,
+                "available_mb": host[1] if host else None,
+                "running_tasks": len(running),
+                "reserved_mb": sum(t.estimate_mb for t in running),
+                "queue_depth": len(waiting),
+                "queued_mb": sum(t.estimate_mb for t in waiting),
+                "oldest_wait_seconds": now - waiting[0].enqueued_at if waiting else 0.0,
+                "admitted_total": admitted,
+                "queued_total": self._queued_total,
+                "withdrawn_total": self._withdrawn_total,
+                "mean_wait_seconds": self._wait_seconds_total / admitted if admitted else 0.0,
+                "max_wait_seconds": self._wait_seconds_max,
+            }
+
+    def _budget_mb(self) -> float | None:
+        if self.budget_mb:
+            return self.budget_mb
+        host = _host_memory_mb()
+        return host[0] * 0.8 if host else None
+
+    def _fits(self, ticket: AdmissionTicket) -> bool:
+        if not self._running:
+            return True
+        if self.max_concurrent and len(self._running) >= self.max_concurrent:
+            return False
+        budget_mb = self._budget_mb()
+        reserved_mb = sum(t.estimate_mb for t in self._running.values())
+        if budget_mb is not None and reserved_mb + ticket.estimate_mb > budget_mb:
+            return False
+        host = _host_memory_mb()
+        return host is None or host[1] - ticket.estimate_mb >= self.headroom_mb
+
+    def _admit(self, ticket: AdmissionTicket) -> None:
+        self._waiting.popleft()
+        ticket.admitted_at = monotonic()
+        self._running[ticket.task_id] = ticket
+        waited = ticket.admitted_at - ticket.enqueued_at
+        self._admitted_total += 1
+        if waited >= _RECHECK_INTERVAL:
+            self._queued_total += 1
+            logger.info(f"Admitted task {ticket.task_id} after {waited:.1f}s (estimate {ticket.estimate_mb:.0f} MB)")
+        self._wait_seconds_total += waited
+        self._wait_seconds_max = max(self._wait_seconds_max, waited)
+        self._cond.notify_all()
+
+
+def sample_rss(task_id: str, pid: int | None) -> None:
+    """Record the task process' RSS in ``PROCESS_MEMORY_USAGE`` if it is a new peak."""
+    if pid is None:
+        return
+    rss_mb = _rss_mb(pid)
+    if rss_mb is not None and rss_mb > PROCESS_MEMORY_USAGE.get(task_id, 0.0):
+        PROCESS_MEMORY_USAGE[task_id] = rss_mb
+
+
+admission_controller = AdmissionController(
+    enabled=os.environ.get("FLOWFILE_WORKER_ADMISSION_CONTROL", "1").strip().lower() not in ("0", "false", "no", "off"),
+    budget_mb=_int_env("FLOWFILE_WORKER_MEMORY_BUDGET_MB", 0),
+    headroom_mb=_int_env("FLOWFILE_WORKER_MEMORY_HEADROOM_MB", 512),
+    max_concurrent=_int_env("FLOWFILE_WORKER_MAX_CONCURRENT_TASKS", 0),
+)
@@ -14,7 +14,7 @@ from pathlib import Path
 
 import polars as pl
 
-from shared.delta_utils import validate_catalog_path, validate_catalog_uri
+from shared.delta_utils import scan_delta_table, validate_catalog_path, validate_catalog_uri
 from shared.storage_config import storage
 
 
@@ -38,8 +38,8 @@ def open_catalog_table(
     scanned from object storage with *storage_options*.
     """
     if base_uri is not None:
-        return pl.scan_delta(validate_catalog_uri(name, base_uri), storage_options=storage_options)
-    return pl.scan_delta(str(_catalog_path(name)))
+        return scan_delta_table(validate_catalog_uri(name, base_uri), storage_options=storage_options)
+    return scan_delta_table(_catalog_path(name))
 
 
 def open_virtual_result(name: str) -> pl.LazyFrame:
@@ -15,12 +15,16 @@ import polars as pl
 
 from flowfile_worker.configs import logger
 from flowfile_worker.external_sources.rest_api_source.models import RestApiReadSettings
-from shared.rest_api.fetch import fetch_rest_api
+from shared.rest_api.fetch import fetch_rest_api, fetch_rest_api_to_ipc
 from shared.rest_api.models import AuthType
 
 
-def read_rest_api(settings: RestApiReadSettings) -> pl.DataFrame:
-    """Decrypt the worker-side credential and run the shared fetch engine."""
+def read_rest_api(settings: RestApiReadSettings, spill_path: str | None = None) -> pl.DataFrame | None:
+    """Decrypt the worker-side credential and run the shared fetch engine.
+
+    With a *spill_path*, record batches are streamed into that IPC file as pages arrive
+    and ``None`` is returned.
+    """
     logger.info(
         "Starting REST API read: %s %s (pagination=%s, sample=%s)",
         settings.method.value,
@@ -38,6 +42,10 @@ def read_rest_api(settings: RestApiReadSettings) -> pl.DataFrame:
     elif auth_type == AuthType.BASIC:
         secret = settings.get_basic_password()
 
+    if spill_path is not None:
+        n_records = fetch_rest_api_to_ipc(settings, spill_path, secret=secret)
+        logger.info("REST API read finished — %d records collected", n_records)
+        return None
     df = fetch_rest_api(settings, secret=secret)
     logger.info("REST API read finished — %d records collected", df.height)
     return df
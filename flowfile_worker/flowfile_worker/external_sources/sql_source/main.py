@@ -10,6 +10,7 @@ from flowfile_worker.external_sources.sql_source.models import (
 )
 from flowfile_worker.flow_logger import get_worker_logger
 from shared.db_dialects import get_dialect_or_generic, read_sql
+from shared.db_reader import read_sql_partitioned, write_partitions_ipc
 from shared.db_writer import write_dataframe_to_database
 
 # Default ports per database type for the pre-flight connectivity check.
@@ -54,6 +55,7 @@ def write_df_to_database(df: pl.DataFrame, database_write_settings: DatabaseWrit
         uri=database_write_settings.connection.create_uri(),
         table_name=database_write_settings.table_name,
         if_exists=database_write_settings.if_exists or "append",
+        merge_keys=database_write_settings.merge_keys,
     )
     return True
 
@@ -82,18 +84,32 @@ def read_query_as_pd_df(query: str, uri: str) -> pl.DataFrame:
     return pl.read_database_uri(query, uri)
 
 
-def read_sql_source(database_read_settings: DatabaseReadSettings):
+def read_sql_source(database_read_settings: DatabaseReadSettings, spill_path: str | None = None):
     """
     Connects to a database and executes a query to retrieve data.
+
+    With partitioning and a *spill_path*, the partitions are read concurrently and each
+    one is streamed into the IPC file at *spill_path* as it arrives.
     Args:
         database_read_settings (SQLSourceSettings): The SQL source settings containing connection details and query.
+        spill_path (str | None): IPC file to stream partitions into.
     Returns:
-        pl.DataFrame: The resulting Polars DataFrame.
+        pl.DataFrame | None: The resulting Polars DataFrame, or None when it was written to *spill_path*.
     """
     logger = get_worker_logger(
         database_read_settings.flowfile_flow_id, database_read_settings.flowfile_node_id
     )
     verify_database_reachable(database_read_settings.connection)
+    if database_read_settings.partitioning is not None and spill_path is not None:
+        partitions = read_sql_partitioned(
+            database_read_settings.query,
+            database_read_settings.connection.create_uri(),
+            logger,
+            database_read_settings.partitioning,
+            database_type=database_read_settings.connection.database_type,
+        )
+        write_partitions_ipc(partitions, spill_path)
+        return None
     return read_sql(
         database_read_settings.query,
         database_read_settings.connection.create_uri(),
@@ -3,6 +3,7 @@ from typing import Literal
 from pydantic import BaseModel, SecretStr
 
 from flowfile_worker.secrets import decrypt_secret
+from shared.db_reader import DbReadPartitioning
 from shared.sql_utils import construct_sql_uri, get_sqlalchemy_uri
 
 
@@ -63,6 +64,7 @@ class DatabaseReadSettings(BaseModel):
 
     connection: DataBaseConnection
     query: str
+    partitioning: DbReadPartitioning | None = None
     flowfile_flow_id: int = 1
     flowfile_node_id: int | str = -1
 
@@ -72,6 +74,7 @@ class DatabaseWriteSettings(BaseModel):
 
     connection: DataBaseConnection
     table_name: str
-    if_exists: Literal["append", "replace", "fail"] = "append"
+    if_exists: Literal["append", "replace", "fail", "upsert", "update", "delete"] = "append"
+    merge_keys: list[str] = []
     flowfile_flow_id: int = 1
     flowfile_node_id: int | str = -1
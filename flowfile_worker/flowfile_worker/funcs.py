@@ -23,7 +23,14 @@ import polars as pl
 
 from flowfile_worker import mp_context
 from flowfile_worker.flow_logger import get_worker_logger
-from flowfile_worker.utils import collect_lazy_frame, collect_lazy_frame_and_get_streaming_info
+from flowfile_worker.result_cache import ipc_compression
+from flowfile_worker.utils import (
+    collect_lazy_frame,
+    collect_lazy_frame_and_get_streaming_info,
+    get_default_memory_limit_mb,
+    memory_ceiling,
+    sink_lazy_frame,
+)
 from shared.storage_config import storage
 
 if TYPE_CHECKING:
@@ -33,6 +40,7 @@ if TYPE_CHECKING:
     from flowfile_worker import models
     from flowfile_worker.external_sources.s3_source.models import CloudStorageWriteSettings
     from flowfile_worker.external_sources.sql_source.models import DatabaseWriteSettings
+    from shared.fuzzy_blocking import FuzzyBlocking
 
 
 def _validate_catalog_path(table_name: str) -> Path:
@@ -175,7 +183,7 @@ def apply_model_task(
         lf = pl.LazyFrame.deserialize(io.BytesIO(polars_serializable_object))
         scored_lf = trainer.apply(lf, model, output_column)
         scored_df = collect_lazy_frame(scored_lf)
-        scored_df.write_ipc(file_path)
+        scored_df.write_ipc(file_path, compression=ipc_compression())
         flowfile_logger.info(f"apply_model_task scored {scored_df.height} rows")
     except Exception as e:
         flowfile_logger.error(f"Error during apply_model_task: {str(e)}")
@@ -197,6 +205,49 @@ def apply_model_task(
         progress.value = 100
 
 
+def graph_solver_task(
+    polars_serializable_object: bytes,
+    progress: Value,
+    error_message: Array,
+    queue: Queue,
+    file_path: str,
+    col_from: str,
+    col_to: str,
+    output_column_name: str,
+    state_name: str | None = None,
+    flowfile_flow_id: int = -1,
+    flowfile_node_id: int | str = -1,
+):
+    """Label the connected components of the input's edges with the partitioned solver.
+
+    Writes the labelled rows to *file_path* as IPC and pushes the serialised
+    LazyFrame on the queue (matches ``apply_model_task``).
+    """
+    from shared.graph_components import GRAPH_STATE_DIR, connected_components, label_rows
+
+    flowfile_logger = get_worker_logger(flowfile_flow_id, flowfile_node_id)
+    flowfile_logger.info(f"Starting graph_solver_task, state_name={state_name}")
+    try:
+        lf = pl.LazyFrame.deserialize(io.BytesIO(polars_serializable_object))
+        state_path = GRAPH_STATE_DIR / f"{state_name}.parquet" if state_name else None
+        labels = connected_components(lf, col_from, col_to, state_path=state_path)
+        labelled = label_rows(lf, col_from, col_to, labels, output_column_name)
+        sink_info = sink_lazy_frame(labelled, file_path, "ipc", ipc_compression())
+        flowfile_logger.info(f"graph_solver_task labelled {labels.height} nodes over {sink_info.n_records} rows")
+    except Exception as e:
+        flowfile_logger.error(f"Error during graph_solver_task: {str(e)}")
+        error_msg = str(e).encode()[:1024]
+        with error_message.get_lock():
+            error_message[: len(error_msg)] = error_msg
+        with progress.get_lock():
+            progress.value = -1
+        return
+    lf = pl.scan_ipc(file_path)
+    queue.put(lf.serialize())
+    with progress.get_lock():
+        progress.value = 100
+
+
 def fuzzy_join_task(
     left_serializable_object: bytes,
     right_serializable_object: bytes,
@@ -207,19 +258,27 @@ def fuzzy_join_task(
     queue: Queue,
     flowfile_flow_id: int,
     flowfile_node_id: int | str,
+    blocking: FuzzyBlocking | None = None,
 ):
     from pl_fuzzy_frame_match import fuzzy_match_dfs
 
+    from shared.fuzzy_blocking import blocked_fuzzy_match
+
     flowfile_logger = get_worker_logger(flowfile_flow_id, flowfile_node_id)
     try:
         flowfile_logger.info("Starting fuzzy join operation")
         left_df = pl.LazyFrame.deserialize(io.BytesIO(left_serializable_object))
         right_df = pl.LazyFrame.deserialize(io.BytesIO(right_serializable_object))
-        fuzzy_match_result = fuzzy_match_dfs(
-            left_df=left_df, right_df=right_df, fuzzy_maps=fuzzy_maps, logger=flowfile_logger
-        )
+        if blocking is not None and blocking.enabled:
+            fuzzy_match_result = blocked_fuzzy_match(
+                left_df, right_df, fuzzy_maps=fuzzy_maps, blocking=blocking, logger=flowfile_logger
+            )
+        else:
+            fuzzy_match_result = fuzzy_match_dfs(
+                left_df=left_df, right_df=right_df, fuzzy_maps=fuzzy_maps, logger=flowfile_logger
+            )
         flowfile_logger.info("Fuzzy join operation completed successfully")
-        fuzzy_match_result.write_ipc(file_path)
+        fuzzy_match_result.write_ipc(file_path, compression=ipc_compression())
         with progress.get_lock():
             progress.value = 100
     except Exception as e:
@@ -243,18 +302,26 @@ def process_and_cache(
     error_message: Array,
     file_path: str,
     flowfile_logger: Logger,
+    memory_limit_mb: float | None = None,
 ) -> int | None:
-    """Collect the plan once, cache it as IPC, and return its height (None on error).
+    """Sink the plan once to an IPC cache file and return its height (None on error).
+
+    The streaming engine writes the result batch by batch; only plans it cannot sink are
+    collected in full first. *memory_limit_mb* (default ``FLOWFILE_WORKER_TASK_MEMORY_LIMIT_MB``)
+    stops the task with a clear error instead of letting the OS kill it.
 
     Does NOT flip progress to 100: the caller signals completion only after
     putting the result on the queue (#564 put-before-100 discipline).
     """
+    limit_mb = memory_limit_mb or get_default_memory_limit_mb()
     try:
         lf = pl.LazyFrame.deserialize(polars_serializable_object)
-        df = collect_lazy_frame(lf)
-        df.write_ipc(file_path)
+        with memory_ceiling(limit_mb, _memory_ceiling_exceeded(limit_mb, progress, error_message, flowfile_logger)):
+            sink_info = sink_lazy_frame(lf, file_path, "ipc", ipc_compression())
+        if not sink_info.streamed:
+            flowfile_logger.info("Plan could not be streamed; collected it in memory before writing")
         flowfile_logger.info("Process operation completed successfully")
-        return df.height
+        return sink_info.n_records
     except Exception as e:
         error_msg = str(e).encode()[:1024]
         flowfile_logger.error(f"Error during process and cache operation: {str(e)}")
@@ -265,6 +332,29 @@ def process_and_cache(
         return None
 
 
+def _memory_ceiling_exceeded(
+    limit_mb: float | None, progress: Value, error_message: Array, flowfile_logger: Logger
+) -> Callable[[float], None]:
+    """Fail the task over its memory ceiling: report the error, then end the process.
+
+    The running collect is native and cannot be interrupted (a MemoryError raised here
+    would only end the watchdog thread), so the process exits; the monitor reads
+    progress == -1. ``spawner.lease_member`` runs such tasks in a dedicated child, never a pool member.
+    """
+
+    def on_exceeded(rss_mb: float) -> None:
+        msg = f"Task exceeded its memory limit of {limit_mb:.0f} MB (using {rss_mb:.0f} MB) and was stopped"
+        flowfile_logger.error(msg)
+        error_msg = msg.encode()[:1024]
+        with error_message.get_lock():
+            error_message[: len(error_msg)] = error_msg
+        with progress.get_lock():
+            progress.value = -1
+        os._exit(1)
+
+    return on_exceeded
+
+
 def store_sample(
     polars_serializable_object: bytes,
     progress: Value,
@@ -279,7 +369,7 @@ def store_sample(
     flowfile_logger.info("Starting store sample operation")
     try:
         lf = pl.LazyFrame.deserialize(io.BytesIO(polars_serializable_object))
-        collect_lazy_frame(lf.limit(sample_size)).write_ipc(file_path)
+        collect_lazy_frame(lf.limit(sample_size)).write_ipc(file_path, compression=ipc_compression())
         flowfile_logger.info("Store sample operation completed successfully")
         with progress.get_lock():
             progress.value = 100
@@ -301,11 +391,14 @@ def store(
     file_path: str,
     flowfile_flow_id: int,
     flowfile_node_id: int | str,
+    memory_limit_mb: float | None = None,
 ):
     flowfile_logger = get_worker_logger(flowfile_flow_id, flowfile_node_id)
     flowfile_logger.info("Starting store operation")
     polars_serializable_object_io = io.BytesIO(polars_serializable_object)
-    n_records = process_and_cache(polars_serializable_object_io, progress, error_message, file_path, flowfile_logger)
+    n_records = process_and_cache(
+        polars_serializable_object_io, progress, error_message, file_path, flowfile_logger, memory_limit_mb
+    )
     if n_records is None:
         # An internal error already set progress=-1; the file may be missing.
         return
@@ -618,7 +711,7 @@ def write_parquet(
     flowfile_flow_id: int = -1,
     flowfile_node_id: int | str = -1,
 ):
-    """Collect a serialized LazyFrame and write it to a parquet file.
+    """Sink a serialized LazyFrame to a parquet file.
 
     This offloads the collect() from core to the worker process, producing
     a Polars-version-independent parquet file at *output_path*.
@@ -627,14 +720,13 @@ def write_parquet(
     flowfile_logger.info(f"Starting write_parquet operation to: {output_path}")
     try:
         lf = pl.LazyFrame.deserialize(io.BytesIO(polars_serializable_object))
-        df = collect_lazy_frame(lf)
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        df.write_parquet(output_path)
+        sink_info = sink_lazy_frame(lf, output_path, "parquet")
         # Flush to disk to prevent race conditions when another process reads.
         # "rb+" — os.fsync needs a writable fd on Windows (EBADF on read-only handles)
         with open(output_path, "rb+") as f:
             os.fsync(f.fileno())
-        flowfile_logger.info(f"write_parquet completed: {len(df)} records written to {output_path}")
+        flowfile_logger.info(f"write_parquet completed: {sink_info.n_records} records written to {output_path}")
         with progress.get_lock():
             progress.value = 100
     except Exception as e:
@@ -1197,13 +1289,11 @@ def get_delta_history(
     *table_name* is the bare directory name inside the catalog tables directory,
     or a key under *base_uri* in object storage when set.
     """
-    from deltalake import DeltaTable
-
     from flowfile_worker import models
-    from shared.delta_utils import format_delta_timestamp
+    from shared.delta_utils import format_delta_timestamp, open_delta_table
 
     target = _resolve_catalog_target(table_name, base_uri)
-    dt = DeltaTable(target, storage_options=storage_options)
+    dt = open_delta_table(target, storage_options=storage_options, without_files=True)
     history = dt.history(limit)
     current_version = dt.version()
     entries: list[models.DeltaVersionCommit] = []
@@ -1251,12 +1341,11 @@ def read_delta_version_preview(
     *table_name* is the bare directory name inside the catalog tables directory,
     or a key under *base_uri* in object storage when set.
     """
-    from deltalake import DeltaTable
-
     from flowfile_worker import models
+    from shared.delta_utils import open_delta_table
 
     target = _resolve_catalog_target(table_name, base_uri)
-    dt = DeltaTable(target, version=version, storage_options=storage_options)
+    dt = open_delta_table(target, version=version, storage_options=storage_options)
     columns, dtypes, rows, total_rows = _delta_preview_payload(dt, n_rows)
     return models.DeltaVersionPreviewResponse(
         version=version, columns=columns, dtypes=dtypes, rows=rows, total_rows=total_rows
@@ -1274,12 +1363,11 @@ def read_delta_preview(
     *table_name* is the bare directory name inside the catalog tables directory,
     or a key under *base_uri* in object storage when set.
     """
-    from deltalake import DeltaTable
-
     from flowfile_worker import models
+    from shared.delta_utils import open_delta_table
 
     target = _resolve_catalog_target(table_name, base_uri)
-    dt = DeltaTable(target, storage_options=storage_options)
+    dt = open_delta_table(target, storage_options=storage_options)
     columns, dtypes, rows, total_rows = _delta_preview_payload(dt, n_rows)
     return models.DeltaPreviewResponse(columns=columns, dtypes=dtypes, rows=rows, total_rows=total_rows)
 
@@ -1305,10 +1393,10 @@ def generic_task(
             flowfile_logger.info("Function returned None — file already written")
         elif isinstance(result, pl.LazyFrame):
             df = collect_lazy_frame(result)
-            df.write_ipc(file_path)
+            df.write_ipc(file_path, compression=ipc_compression())
             number_of_records = df.height
         elif isinstance(result, pl.DataFrame):
-            result.write_ipc(file_path)
+            result.write_ipc(file_path, compression=ipc_compression())
             number_of_records = result.height
         else:
             raise Exception("Returned object is not a DataFrame, LazyFrame, or None")
@@ -8,6 +8,7 @@ from fastapi import FastAPI
 from flowfile_worker import mp_context
 from flowfile_worker.configs import FLOWFILE_CORE_URI, SERVICE_HOST, SERVICE_PORT, logger
 from flowfile_worker.pool import task_pool
+from flowfile_worker.result_cache import result_cache
 from flowfile_worker.routes import router
 from flowfile_worker.streaming import streaming_router
 from shared.parent_watcher import start_parent_death_watcher
@@ -22,6 +23,7 @@ async def shutdown_handler(app: FastAPI):
     """Handle application startup and shutdown"""
     logger.info("Starting application...")
     task_pool.prewarm()
+    result_cache.load()
     try:
         yield
     finally:
@@ -44,6 +46,7 @@ async def shutdown_handler(app: FastAPI):
             except Exception as e:
                 logger.error(f"Error cleaning up process: {e}")
 
+        result_cache.save()
         try:
             storage.cleanup_directories()
         except Exception as e:
@@ -8,6 +8,7 @@ from flowfile_worker.external_sources.s3_source.models import CloudStorageWriteS
 from flowfile_worker.external_sources.sql_source.models import DatabaseWriteSettings
 from flowfile_worker.log_models import RawLogInput as RawLogInput  # noqa: F401
 from shared.delta_models import DeltaVersionCommit as DeltaVersionCommit  # noqa: F401
+from shared.fuzzy_blocking import FuzzyBlocking
 
 
 # Custom type for bytes that serializes to/from base64 string in JSON
@@ -101,6 +102,7 @@ class DatabaseScriptWrite(DatabaseWriteSettings):
             connection=self.connection,
             table_name=self.table_name,
             if_exists=self.if_exists,
+            merge_keys=self.merge_keys,
             flowfile_flow_id=self.flowfile_flow_id,
             flowfile_node_id=self.flowfile_node_id,
         )
@@ -133,6 +135,7 @@ class FuzzyJoinInput(BaseModel):
     left_df_operation: PolarsOperation
     right_df_operation: PolarsOperation
     fuzzy_maps: list[FuzzyMapping]
+    blocking: FuzzyBlocking | None = None
     flowfile_flow_id: int | None = 1
     flowfile_node_id: int | str | None = -1
 
@@ -195,6 +198,21 @@ class ApplyModelInput(BaseModel):
     flowfile_node_id: int | str | None = -1
 
 
+class GraphSolverInput(BaseModel):
+    """Input for the /solve_graph endpoint (partitioned connected components)."""
+
+    task_id: str | None = None
+    cache_dir: str | None = None
+    df_operation: PolarsOperation
+    col_from: str
+    col_to: str
+    output_column_name: str
+    # Persisted labels under the graph_components cache directory; a bare name so it cannot escape it.
+    state_name: str | None = Field(default=None, pattern=r"^[\w-]+$")
+    flowfile_flow_id: int | None = 1
+    flowfile_node_id: int | str | None = -1
+
+
 class Status(BaseModel):
     background_task_id: str
     status: Literal["Processing", "Completed", "Error", "Unknown Error", "Starting"]  # Type alias for status
@@ -209,6 +227,35 @@ class Status(BaseModel):
         return hash(self.file_ref)
 
 
+class TaskIdsRequest(BaseModel):
+    """A batch of task ids, so a whole execution plan costs one round trip."""
+
+    task_ids: list[str]
+    # Clearing on behalf of a holder first drops its hold; results other holders still
+    # hold are kept (see ResultCache.acquire).
+    holder: str | None = None
+
+
+class ResultHoldRequest(BaseModel):
+    """Acquire or release holds on cached results; releasing without task ids drops all of the holder's."""
+
+    holder: str
+    task_ids: list[str] | None = None
+
+
+class ResultHoldResponse(BaseModel):
+    task_ids: list[str]
+
+
+class StatusBatchResponse(BaseModel):
+    # None for a task that is unknown or whose result is gone (a 404 on /status/{task_id}).
+    statuses: dict[str, Status | None]
+
+
+class ClearTasksResponse(BaseModel):
+    cleared: list[str]
+
+
 class ColumnSchema(BaseModel):
     name: str
     dtype: str
@@ -0,0 +1,323 @@
+"""Size-bounded, restart-safe index over the worker's IPC result cache.
+
+Completed ``store``-style tasks leave ``CACHE_DIR/{flow_id}/{task_id}.arrow`` behind.
+Core uses the node hash as ``task_id``, so the file name is already a content
+address: this module tracks those files in an LRU index, evicts the least recently
+used results when a disk budget or per-flow quota is exceeded, and (opt-in) keeps
+the index on disk so ``/status/{hash}`` - and thereby core's ``results_exists`` -
+still hits after a worker restart.
+
+Configuration (environment, read once at import):
+
+- ``FLOWFILE_WORKER_CACHE_MAX_BYTES``: total disk budget, ``0`` (default) = unbounded.
+- ``FLOWFILE_WORKER_CACHE_FLOW_MAX_BYTES``: quota per flow, ``0`` (default) = unbounded.
+- ``FLOWFILE_WORKER_CACHE_COMPRESSION``: IPC compression for cached results,
+  ``uncompressed`` (default), ``lz4`` or ``zstd``.
+- ``FLOWFILE_WORKER_CACHE_PERSIST``: ``1`` keeps cached results (and the index) across
+  restarts instead of wiping the cache directory on shutdown.
+
+Results are reference-counted: ``acquire`` records a holder - core holds every result an
+open flow's plans scan, keyed on the flow's uuid - and held results are never evicted, nor
+deleted by another holder's clear (results shared between flows have several holders),
+until every holder has released them. Holds live in memory only; a worker restart drops them.
+
+Spawned task children import this module for ``ipc_compression``, so module-level
+imports must stay light: no models/pydantic, no polars.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import time
+
+from flowfile_worker import CACHE_DIR, status_dict, status_dict_lock
+from flowfile_worker.configs import logger
+from shared.storage_config import worker_cache_persisted
+
+IPC_COMPRESSIONS = ("uncompressed", "lz4", "zstd")
+_INDEX_FILE_NAME = "result_index.json"
+_INDEX_VERSION = 1
+_ACTIVE_STATUSES = ("Starting", "Processing")
+
+
+def _int_env(name: str, default: int) -> int:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={raw!r}; using {default}")
+        return default
+
+
+def ipc_compression() -> str:
+    """The IPC compression to write cached results with (safe to call in spawned children)."""
+    raw = os.environ.get("FLOWFILE_WORKER_CACHE_COMPRESSION", "uncompressed").lower()
+    if raw not in IPC_COMPRESSIONS:
+        logger.warning(f"Ignoring invalid FLOWFILE_WORKER_CACHE_COMPRESSION={raw!r}; writing uncompressed")
+        return "uncompressed"
+    return raw
+
+
+@dataclass
+class CacheEntry:
+    """One cached result file."""
+
+    task_id: str
+    flow_id: str
+    file_ref: str
+    size_bytes: int
+    number_of_records: int | None
+    created: float
+    last_access: float
+
+
+class ResultCache:
+    """LRU index of cached result files with a total budget and per-flow quotas.
+
+    Entries are kept in access order (least recently used first). Tasks that are
+    still running or held are never evicted, nor is the entry being registered: a
+    result larger than the whole budget is served once and evicted by the next insert.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_bytes: int = 0,
+        flow_max_bytes: int = 0,
+        persist: bool = False,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.flow_max_bytes = flow_max_bytes
+        self.persist = persist
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._holds: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def index_path(self) -> Path:
+        return self.cache_dir / _INDEX_FILE_NAME
+
+    def register(self, task_id: str, file_ref: str, number_of_records: int | None = None) -> list[CacheEntry]:
+        """Track a freshly written result and evict whatever no longer fits.
+
+        Files outside the cache directory (e.g. ``write_output`` targets) are ignored.
+
+        Returns:
+            The entries evicted to make room.
+        """
+        path = Path(file_ref)
+        if not file_ref or not path.is_file() or self.cache_dir.resolve() not in path.resolve().parents:
+            return []
+        now = time()
+        entry = CacheEntry(
+            task_id=task_id,
+            flow_id=path.parent.name,
+            file_ref=str(path),
+            size_bytes=path.stat().st_size,
+            number_of_records=number_of_records,
+            created=now,
+            last_access=now,
+        )
+        with self._lock:
+            self._entries.pop(task_id, None)
+            self._entries[task_id] = entry
+            evicted = self._select_evictions(protected=task_id)
+            for victim in evicted:
+                self._entries.pop(victim.task_id, None)
+        self._dispose(evicted)
+        self.save()
+        return evicted
+
+    def touch(self, task_id: str) -> None:
+        """Mark a result as recently used."""
+        with self._lock:
+            entry = self._entries.get(task_id)
+            if entry is not None:
+                entry.last_access = time()
+                self._entries.move_to_end(task_id)
+
+    def get(self, task_id: str) -> CacheEntry | None:
+        """The live entry for *task_id*, dropping it when its file has disappeared."""
+        with self._lock:
+            entry = self._entries.get(task_id)
+        if entry is None:
+            return None
+        if not os.path.exists(entry.file_ref):
+            self.remove(task_id)
+            return None
+        return entry
+
+    def remove(self, task_id: str) -> None:
+        """Forget a result (the caller owns deleting the file)."""
+        with self._lock:
+            removed = self._entries.pop(task_id, None)
+        if removed is not None:
+            self.save()
+
+    def acquire(self, task_id: str, holder: str) -> None:
+        """Record *holder* as reading *task_id*'s result, protecting it from eviction."""
+        with self._lock:
+            self._holds.setdefault(task_id, set()).add(holder)
+
+    def release(self, holder: str, task_ids: list[str] | None = None) -> list[str]:
+        """Drop *holder*'s holds on *task_ids* (all of its holds when None); returns the released ids."""
+        released = []
+        with self._lock:
+            for task_id in list(self._holds) if task_ids is None else task_ids:
+                holders = self._holds.get(task_id)
+                if holders is None or holder not in holders:
+                    continue
+                holders.discard(holder)
+                if not holders:
+                    del self._holds[task_id]
+                released.append(task_id)
+        return released
+
+    def is_held(self, task_id: str) -> bool:
+        with self._lock:
+            return task_id in self._holds
+
+    def restore_status(self, task_id: str):
+        """Rebuild a Completed status for an indexed result the status dict no longer knows.
+
+        This is how a cache hit survives a worker restart: the plan handed back to core
+        is the same ``scan_ipc`` over the cached file that the original task produced.
+        """
+        entry = self.get(task_id)
+        if entry is None:
+            return None
+        from base64 import b64encode
+
+        import polars as pl
+
+        from flowfile_worker.models import Status
+
+        status = Status(
+            background_task_id=task_id,
+            status="Completed",
+            file_ref=entry.file_ref,
+            progress=100,
+            results=b64encode(pl.scan_ipc(entry.file_ref).serialize()).decode("ascii"),
+            result_type="polars",
+            number_of_records=entry.number_of_records,
+        )
+        with status_dict_lock:
+            status_dict.setdefault(task_id, status)
+        self.touch(task_id)
+        return status
+
+    def _select_evictions(self, protected: str) -> list[CacheEntry]:
+        """Pick LRU victims until the flow quota and the total budget hold. Caller holds the lock."""
+        with status_dict_lock:
+            active = {tid for tid, s in status_dict.items() if s.status in _ACTIVE_STATUSES}
+        candidates = [
+            e
+            for e in self._entries.values()
+            if e.task_id != protected and e.task_id not in active and e.task_id not in self._holds
+        ]
+        evicted: list[CacheEntry] = []
+        evicted_ids: set[str] = set()
+
+        if self.flow_max_bytes:
+            flow_id = self._entries[protected].flow_id
+            flow_total = sum(e.size_bytes for e in self._entries.values() if e.flow_id == flow_id)
+            for entry in candidates:
+                if flow_total <= self.flow_max_bytes:
+                    break
+                if entry.flow_id == flow_id:
+                    evicted.append(entry)
+                    evicted_ids.add(entry.task_id)
+                    flow_total -= entry.size_bytes
+
+        if self.max_bytes:
+            total = sum(e.size_bytes for e in self._entries.values() if e.task_id not in evicted_ids)
+            for entry in candidates:
+                if total <= self.max_bytes:
+                    break
+                if entry.task_id not in evicted_ids:
+                    evicted.append(entry)
+                    evicted_ids.add(entry.task_id)
+                    total -= entry.size_bytes
+        return evicted
+
+    @staticmethod
+    def _dispose(entries: list[CacheEntry]) -> None:
+        for entry in entries:
+            for path in (entry.file_ref, entry.file_ref + ".offsets.json"):
+                try:
+                    if os.path.exists(path):
+                        os.remove(path)
+                except OSError as e:
+                    logger.warning(f"Could not remove evicted cache file {path}: {e}")
+            with status_dict_lock:
+                status_dict.pop(entry.task_id, None)
+            logger.info(f"Evicted cached result {entry.task_id} ({entry.size_bytes} bytes)")
+
+    def save(self) -> bool:
+        """Atomically write the index next to the cached files; no-op unless persisting."""
+        if not self.persist:
+            return False
+        with self._lock:
+            payload = {"version": _INDEX_VERSION, "entries": [asdict(e) for e in self._entries.values()]}
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = self.index_path.with_suffix(".json.tmp")
+            tmp.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(tmp, self.index_path)
+            return True
+        except OSError as e:
+            logger.warning(f"Could not persist result cache index to {self.index_path}: {e}")
+            return False
+
+    def load(self) -> int:
+        """Reload a persisted index, skipping entries whose file is gone; returns the entry count."""
+        if not self.persist:
+            return 0
+        try:
+            payload = json.loads(self.index_path.read_text(encoding="utf-8"))
+            if payload.get("version") != _INDEX_VERSION:
+                return 0
+            entries = [CacheEntry(**raw) for raw in payload.get("entries", [])]
+        except (OSError, ValueError, TypeError, AttributeError):
+            return 0
+        with self._lock:
+            self._entries.clear()
+            for entry in sorted(entries, key=lambda e: e.last_access):
+                if os.path.exists(entry.file_ref):
+                    self._entries[entry.task_id] = entry
+            count = len(self._entries)
+        logger.info(f"Loaded {count} cached results from {self.index_path}")
+        return count
+
+    def describe(self) -> dict:
+        """Budget, usage and per-flow totals, for observability."""
+        with self._lock:
+            entries = list(self._entries.values())
+            held = len(self._holds)
+        per_flow: dict[str, int] = {}
+        for entry in entries:
+            per_flow[entry.flow_id] = per_flow.get(entry.flow_id, 0) + entry.size_bytes
+        return {
+            "entries": len(entries),
+            "total_bytes": sum(per_flow.values()),
+            "max_bytes": self.max_bytes,
+            "flow_max_bytes": self.flow_max_bytes,
+            "per_flow_bytes": per_flow,
+            "held_results": held,
+            "compression": ipc_compression(),
+            "persist": self.persist,
+        }
+
+
+result_cache = ResultCache(
+    CACHE_DIR,
+    max_bytes=_int_env("FLOWFILE_WORKER_CACHE_MAX_BYTES", 0),
+    flow_max_bytes=_int_env("FLOWFILE_WORKER_CACHE_FLOW_MAX_BYTES", 0),
+    persist=worker_cache_persisted(),
+)
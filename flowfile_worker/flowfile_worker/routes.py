@@ -6,7 +6,7 @@ import uuid
 from queue import Empty
 
 from deltalake.exceptions import DeltaError
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request, WebSocket, WebSocketDisconnect
 
 from flowfile_worker import (
     CACHE_DIR,
@@ -17,7 +17,9 @@ from flowfile_worker import (
     pool,
     status_dict,
     status_dict_lock,
+    task_events,
 )
+from flowfile_worker.admission import admission_controller
 from flowfile_worker.configs import logger
 from flowfile_worker.create import FileType, table_creator_factory_method
 from flowfile_worker.create.models import ReceivedTable
@@ -28,12 +30,14 @@ from flowfile_worker.external_sources.rest_api_source.main import read_rest_api
 from flowfile_worker.external_sources.rest_api_source.models import RestApiReadSettings
 from flowfile_worker.external_sources.sql_source.main import read_sql_source
 from flowfile_worker.external_sources.sql_source.models import DatabaseReadSettings
+from flowfile_worker.result_cache import result_cache
 from flowfile_worker.spawner import (
     process_manager,
     start_apply_model_process,
     start_custom_node_process,
     start_fuzzy_process,
     start_generic_process,
+    start_graph_solver_process,
     start_process,
     start_train_model_process,
 )
@@ -89,6 +93,7 @@ async def submit_query(request: Request, background_tasks: BackgroundTasks) -> m
 
         kwargs_str = request.headers.get("X-Kwargs")
         kwargs = json.loads(kwargs_str) if kwargs_str else {}
+        estimated_input_bytes = request.headers.get("X-Estimated-Input-Bytes")
 
         default_cache_dir = create_and_get_default_cache_dir(flow_id)
         file_path = os.path.join(default_cache_dir, f"{task_id}.arrow")
@@ -108,6 +113,7 @@ async def submit_query(request: Request, background_tasks: BackgroundTasks) -> m
             flowfile_flow_id=flow_id,
             flowfile_node_id=node_id,
             kwargs=kwargs,
+            estimated_input_bytes=int(estimated_input_bytes) if estimated_input_bytes else None,
         )
         logger.info(f"Started background task: {task_id}")
         return status
@@ -314,7 +320,7 @@ def store_sql_db_result(
             flowfile_flow_id=database_read_settings.flowfile_flow_id,
             flowfile_node_id=database_read_settings.flowfile_node_id,
             task_id=task_id,
-            kwargs=dict(database_read_settings=database_read_settings),
+            kwargs=dict(database_read_settings=database_read_settings, spill_path=file_path),
         )
         return status
 
@@ -425,7 +431,7 @@ def store_rest_api_result(
             flowfile_flow_id=rest_api_read_settings.flowfile_flow_id,
             flowfile_node_id=rest_api_read_settings.flowfile_node_id,
             task_id=task_id,
-            kwargs={"settings": rest_api_read_settings},
+            kwargs={"settings": rest_api_read_settings, "spill_path": file_path},
         )
         return status
 
@@ -1022,10 +1028,36 @@ def validate_result(task_id: str) -> bool | None:
         if os.path.exists(status.file_ref):
             return True
         logger.error(f"Validation failed for task {task_id}: result file is gone ({status.file_ref})")
+        result_cache.remove(task_id)
         return False
     return True
 
 
+def lookup_status(task_id: str) -> models.Status | None:
+    """Current status of a task, or None when it is unknown or its result is gone.
+
+    Args:
+        task_id: Unique identifier of the task
+
+    Returns:
+        models.Status | None: The validated status of the task
+    """
+    status = status_dict.get(task_id)
+    if status is None:
+        # A result cached before a worker restart is still a hit.
+        status = result_cache.restore_status(task_id)
+    if status is None:
+        logger.warning(f"Task not found: {task_id}")
+        return None
+    result_valid = validate_result(task_id)
+    if not result_valid:
+        logger.error(f"Invalid result for task: {task_id}")
+        return None
+    if status.status == "Completed":
+        result_cache.touch(task_id)
+    return status
+
+
 @router.get("/status/{task_id}", response_model=models.Status)
 def get_status(task_id: str) -> models.Status:
     """Get status of a task by ID and validate its result if completed.
@@ -1040,17 +1072,96 @@ def get_status(task_id: str) -> models.Status:
         HTTPException: If task not found or invalid result
     """
     logger.debug(f"Getting status for task: {task_id}")
-    status = status_dict.get(task_id)
+    status = lookup_status(task_id)
     if status is None:
-        logger.warning(f"Task not found: {task_id}")
-        raise HTTPException(status_code=404, detail="Task not found")
-    result_valid = validate_result(task_id)
-    if not result_valid:
-        logger.error(f"Invalid result for task: {task_id}")
         raise HTTPException(status_code=404, detail="Task not found")
     return status
 
 
+@router.post("/status/batch", response_model=models.StatusBatchResponse)
+def get_status_batch(request: models.TaskIdsRequest) -> models.StatusBatchResponse:
+    """Statuses for many tasks at once, with the same validation as ``/status/{task_id}``.
+
+    Args:
+        request: The task ids to look up
+
+    Returns:
+        models.StatusBatchResponse: Status per task id, None where ``/status`` would 404
+    """
+    logger.debug(f"Getting status for {len(request.task_ids)} tasks")
+    return models.StatusBatchResponse(statuses={task_id: lookup_status(task_id) for task_id in request.task_ids})
+
+
+# Terminal statuses end a subscription; "Cancelled" does not (the cancelling side stops waiting itself).
+_TERMINAL_EVENT_STATUSES = ("Completed", "Error", "Unknown Error")
+_EVENT_SWEEP_SECONDS = 0.5
+
+
+@router.websocket("/ws/events")
+async def task_events_channel(websocket: WebSocket):
+    """Multiplexed push channel for task status, shared by all of a core process's fetchers.
+
+    Core keeps one connection open and sends ``{"type": "subscribe", "task_id": ...}``
+    (or ``unsubscribe``) per task. The worker pushes:
+
+    - ``{"type": "progress", "task_id", "status", "progress"}`` while a task runs,
+    - ``{"type": "status", "task_id", "status": <Status>}`` once it is Completed/Error/Unknown Error,
+      after which the subscription ends,
+    - ``{"type": "not_found", "task_id"}`` for an unknown task or a vanished result,
+      mirroring a 404 on ``/status/{task_id}``.
+
+    Status changes wake the channel immediately (``task_events.notify``); a short
+    sweep covers anything that changed without a notification.
+    """
+    await websocket.accept()
+    subscriber = task_events.hub.register(asyncio.get_running_loop())
+    watched: dict[str, tuple[str, int | None] | None] = {}
+
+    async def receive_subscriptions() -> None:
+        while True:
+            message = await websocket.receive_json()
+            task_id = message.get("task_id")
+            if not task_id:
+                continue
+            if message.get("type") == "subscribe":
+                watched[task_id] = None
+                subscriber.event.set()
+            elif message.get("type") == "unsubscribe":
+                watched.pop(task_id, None)
+
+    receiver = asyncio.create_task(receive_subscriptions())
+    try:
+        while not receiver.done():
+            # lookup_status may restore a result from the cache index (serializing a scan plan): keep it off the loop.
+            statuses = await asyncio.to_thread(lambda task_ids: {t: lookup_status(t) for t in task_ids}, list(watched))
+            for task_id, status in statuses.items():
+                if task_id not in watched:
+                    continue
+                if status is None:
+                    watched.pop(task_id, None)
+                    await websocket.send_json({"type": "not_found", "task_id": task_id})
+                    continue
+                state = (status.status, status.progress)
+                if watched.get(task_id) == state:
+                    continue
+                if status.status in _TERMINAL_EVENT_STATUSES:
+                    watched.pop(task_id, None)
+                    await websocket.send_json(
+                        {"type": "status", "task_id": task_id, "status": status.model_dump(mode="json")}
+                    )
+                else:
+                    watched[task_id] = state
+                    await websocket.send_json(
+                        {"type": "progress", "task_id": task_id, "status": status.status, "progress": status.progress}
+                    )
+            await subscriber.wait(_EVENT_SWEEP_SECONDS)
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+    finally:
+        receiver.cancel()
+        task_events.hub.unregister(subscriber)
+
+
 @router.get("/memory_usage/{task_id}")
 async def memory_usage(task_id: str):
     """Get memory usage for a specific task.
@@ -1150,6 +1261,43 @@ async def apply_ml_model(polars_script: models.ApplyModelInput, background_tasks
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@router.post("/solve_graph")
+async def solve_graph(polars_script: models.GraphSolverInput, background_tasks: BackgroundTasks) -> models.Status:
+    """Label the connected components of an edge list with the partitioned graph solver."""
+    logger.info("Starting solve_graph task: state_name=%s", polars_script.state_name)
+    try:
+        default_cache_dir = create_and_get_default_cache_dir(polars_script.flowfile_flow_id)
+        polars_script.task_id = polars_script.task_id or str(uuid.uuid4())
+        polars_script.cache_dir = polars_script.cache_dir or default_cache_dir
+        polars_serializable_object = polars_script.df_operation.polars_serializable_object()
+
+        file_path = os.path.join(polars_script.cache_dir, f"{polars_script.task_id}.arrow")
+        status = models.Status(
+            background_task_id=polars_script.task_id,
+            status="Starting",
+            file_ref=file_path,
+            result_type="polars",
+        )
+        status_dict[polars_script.task_id] = status
+        background_tasks.add_task(
+            start_graph_solver_process,
+            polars_serializable_object=polars_serializable_object,
+            task_id=polars_script.task_id,
+            file_ref=file_path,
+            col_from=polars_script.col_from,
+            col_to=polars_script.col_to,
+            output_column_name=polars_script.output_column_name,
+            state_name=polars_script.state_name,
+            flowfile_flow_id=polars_script.flowfile_flow_id,
+            flowfile_node_id=polars_script.flowfile_node_id,
+        )
+        logger.info(f"Started solve_graph task: {polars_script.task_id}")
+        return status
+    except Exception as e:
+        logger.error(f"Error starting solve_graph: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
 @router.post("/add_fuzzy_join")
 async def add_fuzzy_join(polars_script: models.FuzzyJoinInput, background_tasks: BackgroundTasks) -> models.Status:
     """Start a fuzzy join operation between two dataframes.
@@ -1183,6 +1331,7 @@ async def add_fuzzy_join(polars_script: models.FuzzyJoinInput, background_tasks:
             right_serializable_object=right_serializable_object,
             file_ref=file_path,
             fuzzy_maps=polars_script.fuzzy_maps,
+            blocking=polars_script.blocking,
             task_id=polars_script.task_id,
             flowfile_flow_id=polars_script.flowfile_flow_id,
             flowfile_node_id=polars_script.flowfile_node_id,
@@ -1232,24 +1381,21 @@ async def execute_custom_node(
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
-@router.delete("/clear_task/{task_id}")
-def clear_task(task_id: str):
-    """
-    Clear task data and status by ID.
+def _clear_task(task_id: str, holder: str | None = None) -> bool:
+    """Remove a task's result files and status; False when the task is unknown or still held.
 
-    Args:
-        task_id: Unique identifier of the task to clear
-    Returns:
-        dict: Success message
-    Raises:
-        HTTPException: If task not found
+    Clearing on behalf of *holder* drops its own hold first; a result other holders still
+    read is kept for them.
     """
-
-    logger.info(f"Clearing task: {task_id}")
-    status = status_dict.get(task_id)
+    if holder is not None:
+        result_cache.release(holder, [task_id])
+    if result_cache.is_held(task_id):
+        logger.info(f"Keeping task {task_id}: its result is still held by another flow")
+        return False
+    status = status_dict.get(task_id) or result_cache.restore_status(task_id)
     if not status:
         logger.warning(f"Task not found for clearing: {task_id}")
-        raise HTTPException(status_code=404, detail="Task not found")
+        return False
     try:
         if os.path.exists(status.file_ref):
             os.remove(status.file_ref)
@@ -1260,13 +1406,85 @@ def clear_task(task_id: str):
             logger.debug(f"Removed sidecar: {sidecar}")
     except Exception as e:
         logger.error(f"Error removing file {status.file_ref}: {str(e)}", exc_info=True)
+    result_cache.remove(task_id)
     with status_dict_lock:
         status_dict.pop(task_id, None)
         PROCESS_MEMORY_USAGE.pop(task_id, None)
         logger.info(f"Successfully cleared task: {task_id}")
+    return True
+
+
+@router.delete("/clear_task/{task_id}")
+def clear_task(task_id: str, holder: str | None = None):
+    """
+    Clear task data and status by ID.
+
+    Args:
+        task_id: Unique identifier of the task to clear
+        holder: Release this holder's hold first (see ``/results/acquire``)
+    Returns:
+        dict: Success message
+    Raises:
+        HTTPException: If task not found or its result is still held
+    """
+
+    logger.info(f"Clearing task: {task_id}")
+    if not _clear_task(task_id, holder):
+        raise HTTPException(status_code=404, detail="Task not found")
     return {"message": f"Task {task_id} has been cleared."}
 
 
+@router.post("/clear_tasks", response_model=models.ClearTasksResponse)
+def clear_tasks(request: models.TaskIdsRequest) -> models.ClearTasksResponse:
+    """
+    Clear many tasks in one request; unknown task ids are skipped.
+
+    Args:
+        request: The task ids to clear
+    Returns:
+        models.ClearTasksResponse: The task ids that were actually cleared
+    """
+
+    logger.info(f"Clearing {len(request.task_ids)} tasks")
+    return models.ClearTasksResponse(
+        cleared=[task_id for task_id in request.task_ids if _clear_task(task_id, request.holder)]
+    )
+
+
+@router.post("/results/acquire", response_model=models.ResultHoldResponse)
+def acquire_results(request: models.ResultHoldRequest) -> models.ResultHoldResponse:
+    """
+    Hold completed results for a reader so eviction and other holders' clears leave them alone.
+
+    Args:
+        request: The holder (core passes the flow's uuid) and the task ids it reads
+    Returns:
+        models.ResultHoldResponse: The task ids that have a completed result and are now held
+    """
+
+    held = []
+    for task_id in request.task_ids or []:
+        status = lookup_status(task_id)
+        if status is not None and status.status == "Completed" and status.result_type == "polars":
+            result_cache.acquire(task_id, request.holder)
+            held.append(task_id)
+    return models.ResultHoldResponse(task_ids=held)
+
+
+@router.post("/results/release", response_model=models.ResultHoldResponse)
+def release_results(request: models.ResultHoldRequest) -> models.ResultHoldResponse:
+    """
+    Release a holder's holds; the results stay cached until evicted or cleared.
+
+    Args:
+        request: The holder and the task ids to release, or None for all of its holds
+    Returns:
+        models.ResultHoldResponse: The task ids that were released
+    """
+
+    return models.ResultHoldResponse(task_ids=result_cache.release(request.holder, request.task_ids))
+
+
 def _active_task_count() -> int:
     """Tasks currently in flight on this worker, pooled and spawned alike."""
     with status_dict_lock:
@@ -1291,6 +1509,18 @@ def set_pool_state(payload: models.PoolConfigInput) -> dict:
     return {**pool.task_pool.describe(), "active_tasks": _active_task_count()}
 
 
+@router.get("/cache")
+def get_cache_state() -> dict:
+    """Result-cache usage against its budget and per-flow quotas."""
+    return result_cache.describe()
+
+
+@router.get("/admission")
+def get_admission_state() -> dict:
+    """Admission-control queue depth, memory reservations and wait metrics."""
+    return admission_controller.describe()
+
+
 @router.post("/cancel_task/{task_id}")
 def cancel_task(task_id: str):
     """Cancel a running task by ID.
@@ -1305,13 +1535,15 @@ def cancel_task(task_id: str):
         HTTPException: If task cannot be cancelled
     """
     logger.info(f"Attempting to cancel task: {task_id}")
-    if not process_manager.cancel_process(task_id):
+    # A task still waiting for admission has no process yet: withdrawing it means it never starts.
+    if not process_manager.cancel_process(task_id) and not admission_controller.withdraw(task_id):
         logger.warning(f"Cannot cancel task: {task_id}")
         raise HTTPException(status_code=404, detail="Task not found or already completed")
     with status_dict_lock:
         if task_id in status_dict:
             status_dict[task_id].status = "Cancelled"
             logger.info(f"Successfully cancelled task: {task_id}")
+    task_events.notify(task_id)
     return {"message": f"Task {task_id} has been cancelled."}
 
 
@@ -8,9 +8,12 @@ from multiprocessing.queues import Queue
 from time import monotonic, sleep
 from typing import Any
 
-from flowfile_worker import funcs, models, mp_context, pool, status_dict, status_dict_lock
+from flowfile_worker import funcs, models, mp_context, pool, status_dict, status_dict_lock, task_events
+from flowfile_worker.admission import admission_controller, sample_rss
 from flowfile_worker.pool import PoolMember
 from flowfile_worker.process_manager import ProcessManager
+from flowfile_worker.result_cache import result_cache
+from flowfile_worker.utils import get_default_memory_limit_mb
 
 process_manager = ProcessManager()
 
@@ -79,6 +82,25 @@ def drain_member_envelope(q: Queue, p: Process) -> tuple[bool, Any]:
     return pool.unwrap_envelope(box[0])
 
 
+def await_admission(
+    task_id: str,
+    operation: str,
+    flowfile_flow_id: int,
+    flowfile_node_id: flowfile_node_id_type,
+    payload_bytes: int = 0,
+    estimated_input_bytes: int | None = None,
+) -> bool:
+    """Block until admission control lets the task start (see ``admission``).
+
+    Returns False when the task was cancelled while queued; it then never starts. An
+    admitted task's reservation is freed by ``handle_task`` when it finishes.
+    """
+    estimate_mb = admission_controller.estimate_mb(
+        operation, flowfile_flow_id, flowfile_node_id, payload_bytes, estimated_input_bytes
+    )
+    return admission_controller.admit(task_id, operation, flowfile_flow_id, flowfile_node_id, estimate_mb)
+
+
 def handle_task(
     task_id: str,
     p: Process,
@@ -115,6 +137,7 @@ def handle_task(
         deadline = (monotonic() + _TASK_TIMEOUT) if _TASK_TIMEOUT else None
         timed_out = False
         while p.is_alive():
+            sample_rss(task_id, p.pid)
             with progress.get_lock():
                 current_progress = progress.value
             with status_dict_lock:
@@ -197,6 +220,11 @@ def handle_task(
                         status.error_message = decoded or "Task failed"
                 else:
                     status.status = "Unknown Error"
+            cache_result = status.status == "Completed" and status.result_type == "polars"
+
+        if cache_result:
+            result_cache.register(task_id, status.file_ref, status.number_of_records)
+        task_events.notify(task_id)
 
     finally:
         if member is not None:
@@ -206,10 +234,32 @@ def handle_task(
                 p.terminate()
             p.join()
         process_manager.remove_process(task_id)
+        admission_controller.release(task_id)
         del p, progress, error_message
         gc.collect(0)
 
 
+def lease_member(operation: str, kwargs: dict) -> PoolMember | None:
+    """Lease a pool member for *operation*, or None to spawn a dedicated child.
+
+    A store under a memory ceiling always gets its own child: exceeding the ceiling ends
+    the process (see ``funcs._memory_ceiling_exceeded``), which must never take a pool member down.
+    """
+    if operation == "store" and (kwargs.get("memory_limit_mb") or get_default_memory_limit_mb()):
+        return None
+    return pool.task_pool.acquire(operation)
+
+
+def _start_admitted(task_id: str, p: Process) -> None:
+    """Start an admitted task's process; a failed start frees its admission reservation."""
+    try:
+        p.start()
+    except Exception:
+        admission_controller.release(task_id)
+        raise
+    process_manager.add_process(task_id, p)
+
+
 def start_process(
     polars_serializable_object: bytes,
     task_id: str,
@@ -218,6 +268,7 @@ def start_process(
     flowfile_flow_id: int,
     flowfile_node_id: flowfile_node_id_type,
     kwargs: dict = None,
+    estimated_input_bytes: int | None = None,
 ) -> None:
     """
     Starts a new process for handling Polars dataframe operations.
@@ -230,20 +281,26 @@ def start_process(
         kwargs (dict, optional): Additional arguments for the operation. Defaults to {}
         flowfile_flow_id: id of the flow that started the process
         flowfile_node_id: id of the node that started the process
+        estimated_input_bytes: Input size reported by core, for the admission estimate
 
     Notes:
+        - Waits for admission control first; a task cancelled while queued never starts
         - Leases a warm pool member when the pool is on and the operation is poolable
         - Otherwise creates shared memory objects and spawns a fresh process (default)
         - Delegates to handle_task for process monitoring either way
     """
     if kwargs is None:
         kwargs = {}
+    if not await_admission(
+        task_id, operation, flowfile_flow_id, flowfile_node_id, len(polars_serializable_object), estimated_input_bytes
+    ):
+        return
     kwargs["polars_serializable_object"] = polars_serializable_object
     kwargs["file_path"] = file_ref
     kwargs["flowfile_flow_id"] = flowfile_flow_id
     kwargs["flowfile_node_id"] = flowfile_node_id
 
-    member = pool.task_pool.acquire(operation)
+    member = lease_member(operation, kwargs)
     if member is not None:
         try:
             member.submit(operation, kwargs)
@@ -251,6 +308,7 @@ def start_process(
         except Exception:
             # A failed lease must not leak the slot; handle_task owns checkin after this.
             pool.task_pool.checkin(member, reusable=False)
+            admission_controller.release(task_id)
             raise
         handle_task(
             task_id=task_id,
@@ -268,9 +326,7 @@ def start_process(
     kwargs["queue"] = mp_context.Queue(maxsize=1)
 
     p: Process = mp_context.Process(target=process_task, kwargs=kwargs)
-    p.start()
-
-    process_manager.add_process(task_id, p)
+    _start_admitted(task_id, p)
     handle_task(
         task_id=task_id, p=p, progress=kwargs["progress"], error_message=kwargs["error_message"], q=kwargs["queue"]
     )
@@ -296,10 +352,13 @@ def start_generic_process(
         kwargs (dict, optional): Additional arguments for the function. Defaults to None.
 
     Notes:
+        - Waits for admission control first; a task cancelled while queued never starts
         - Creates shared memory objects for progress tracking and error handling
         - Initializes and starts a new process for the generic function
         - Delegates to handle_task for process monitoring
     """
+    if not await_admission(task_id, "generic_task", flowfile_flow_id, flowfile_node_id):
+        return
     kwargs = {} if kwargs is None else kwargs
     kwargs["func"] = func_ref
     kwargs["progress"] = mp_context.Value("i", 0)
@@ -311,9 +370,7 @@ def start_generic_process(
 
     process_task = funcs.generic_task
     p: Process = mp_context.Process(target=process_task, kwargs=kwargs)
-    p.start()
-
-    process_manager.add_process(task_id, p)
+    _start_admitted(task_id, p)
     handle_task(
         task_id=task_id, p=p, progress=kwargs["progress"], error_message=kwargs["error_message"], q=kwargs["queue"]
     )
@@ -398,6 +455,46 @@ def start_apply_model_process(
     handle_task(task_id=task_id, p=p, progress=progress, error_message=error_message, q=q)
 
 
+def start_graph_solver_process(
+    polars_serializable_object: bytes,
+    task_id: str,
+    file_ref: str,
+    col_from: str,
+    col_to: str,
+    output_column_name: str,
+    state_name: str | None,
+    flowfile_flow_id: int,
+    flowfile_node_id: flowfile_node_id_type,
+) -> None:
+    """Spawn the partitioned graph solver subprocess.
+
+    Writes the labelled rows to *file_ref* (IPC); ``handle_task`` surfaces the
+    serialised LazyFrame via the queue.
+    """
+    progress = mp_context.Value("i", 0)
+    error_message = mp_context.Array("c", 1024)
+    q = mp_context.Queue(maxsize=1)
+
+    kwargs = {
+        "polars_serializable_object": polars_serializable_object,
+        "progress": progress,
+        "error_message": error_message,
+        "queue": q,
+        "file_path": file_ref,
+        "col_from": col_from,
+        "col_to": col_to,
+        "output_column_name": output_column_name,
+        "state_name": state_name,
+        "flowfile_flow_id": flowfile_flow_id,
+        "flowfile_node_id": flowfile_node_id,
+    }
+
+    p: Process = mp_context.Process(target=funcs.graph_solver_task, kwargs=kwargs)
+    p.start()
+    process_manager.add_process(task_id, p)
+    handle_task(task_id=task_id, p=p, progress=progress, error_message=error_message, q=q)
+
+
 def start_fuzzy_process(
     left_serializable_object: bytes,
     right_serializable_object: bytes,
@@ -406,6 +503,7 @@ def start_fuzzy_process(
     task_id: str,
     flowfile_flow_id: int,
     flowfile_node_id: flowfile_node_id_type,
+    blocking: models.FuzzyBlocking | None = None,
 ) -> None:
     """
     Starts a new process for performing fuzzy joining operations on two datasets.
@@ -418,7 +516,9 @@ def start_fuzzy_process(
         task_id (str): Unique identifier for the task
         flowfile_flow_id: id of the flow that started the process
         flowfile_node_id: id of the node that started the process
+        blocking: candidate blocking settings; None compares every pair
     Notes:
+        - Waits for admission control first; a task cancelled while queued never starts
         - Creates shared memory objects for progress tracking and error handling
         - Initializes and starts a new process for fuzzy joining operation
         - Delegates to handle_task for process monitoring
@@ -437,6 +537,7 @@ def start_fuzzy_process(
         Queue,
         int,
         flowfile_node_id_type,
+        models.FuzzyBlocking | None,
     ] = (
         left_serializable_object,
         right_serializable_object,
@@ -447,12 +548,19 @@ def start_fuzzy_process(
         q,
         flowfile_flow_id,
         flowfile_node_id,
+        blocking,
     )
 
+    if not await_admission(
+        task_id,
+        "fuzzy_join_task",
+        flowfile_flow_id,
+        flowfile_node_id,
+        len(left_serializable_object) + len(right_serializable_object),
+    ):
+        return
     p: Process = mp_context.Process(target=funcs.fuzzy_join_task, args=args)
-    p.start()
-
-    process_manager.add_process(task_id, p)
+    _start_admitted(task_id, p)
     handle_task(task_id=task_id, p=p, progress=progress, error_message=error_message, q=q)
 
 
@@ -26,13 +26,16 @@ from typing import Any
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
-from flowfile_worker import CACHE_DIR, funcs, models, mp_context, pool, status_dict, status_dict_lock
+from flowfile_worker import CACHE_DIR, funcs, models, mp_context, pool, status_dict, status_dict_lock, task_events
+from flowfile_worker.admission import admission_controller, sample_rss
 from flowfile_worker.configs import logger
 from flowfile_worker.pool import PoolMember
+from flowfile_worker.result_cache import result_cache
 from flowfile_worker.spawner import (
     _TASK_TIMEOUT,
     drain_member_envelope,
     drain_result_queue,
+    lease_member,
     process_manager,
     unpack_result,
 )
@@ -71,6 +74,7 @@ class _TaskContext:
     extra_kwargs: dict
     file_path: str
     result_type: str
+    estimated_input_bytes: int | None = None
 
 
 def _parse_metadata(metadata: dict) -> _TaskContext:
@@ -80,6 +84,7 @@ def _parse_metadata(metadata: dict) -> _TaskContext:
     flow_id = int(metadata.get("flow_id", 1))
     node_id = metadata.get("node_id", -1)
     extra_kwargs = metadata.get("kwargs", {})
+    estimated_input_bytes = metadata.get("estimated_input_bytes")
 
     try:
         node_id = int(node_id)
@@ -99,6 +104,7 @@ def _parse_metadata(metadata: dict) -> _TaskContext:
         extra_kwargs=extra_kwargs,
         file_path=file_path,
         result_type=result_type,
+        estimated_input_bytes=int(estimated_input_bytes) if estimated_input_bytes else None,
     )
 
 
@@ -112,6 +118,34 @@ def _register_status(ctx: _TaskContext) -> None:
     )
 
 
+# Admission
+
+
+async def _await_admission(websocket: WebSocket, ctx: _TaskContext, payload_bytes: int) -> bool:
+    """Wait for admission control, heartbeating the client so its liveness timeout never fires.
+
+    Returns False when the task was cancelled while queued (the client is told) or the
+    client went away before it was admitted.
+    """
+    if not admission_controller.enabled:
+        return True
+    estimate_mb = admission_controller.estimate_mb(
+        ctx.operation, ctx.flow_id, ctx.node_id, payload_bytes, ctx.estimated_input_bytes
+    )
+    ticket = admission_controller.enqueue(ctx.task_id, ctx.operation, ctx.flow_id, ctx.node_id, estimate_mb)
+    while not await asyncio.to_thread(admission_controller.wait, ticket, _HEARTBEAT_INTERVAL / 2):
+        if ticket.withdrawn:
+            await websocket.send_json({"type": "error", "error_message": "Task was cancelled while queued"})
+            return False
+        try:
+            await websocket.send_json({"type": "progress", "progress": 0})
+        except Exception:
+            # Admitted in the meantime when the withdraw misses: the next wait returns at once.
+            if admission_controller.withdraw(ctx.task_id):
+                return False
+    return True
+
+
 # Subprocess management
 
 
@@ -134,7 +168,7 @@ def _spawn_subprocess(ctx: _TaskContext, polars_bytes: bytes) -> tuple[Process,
     kwargs["flowfile_flow_id"] = ctx.flow_id
     kwargs["flowfile_node_id"] = ctx.node_id
 
-    member = pool.task_pool.acquire(ctx.operation)
+    member = lease_member(ctx.operation, kwargs)
     if member is not None:
         try:
             member.submit(ctx.operation, kwargs)
@@ -169,6 +203,7 @@ def _set_error_status(task_id: str, msg: str) -> None:
     with status_dict_lock:
         status_dict[task_id].status = "Error"
         status_dict[task_id].error_message = msg
+    task_events.notify(task_id)
 
 
 # Progress monitoring
@@ -185,6 +220,7 @@ async def _monitor_progress(websocket: WebSocket, p: Process, progress, error_me
     delay = _MONITOR_INITIAL_DELAY
     deadline = (monotonic() + _TASK_TIMEOUT) if _TASK_TIMEOUT else None
     while p.is_alive():
+        sample_rss(task_id, p.pid)
         with progress.get_lock():
             current = progress.value
 
@@ -236,6 +272,10 @@ def _update_completed_status(task_id: str, result_data: Any, number_of_records:
                 status_dict[task_id].results = b64encode(result_data).decode("ascii")
             else:
                 status_dict[task_id].results = result_data
+        status = status_dict[task_id]
+    if status.result_type == "polars":
+        result_cache.register(task_id, status.file_ref, status.number_of_records)
+    task_events.notify(task_id)
 
 
 async def _send_completion(
@@ -285,6 +325,7 @@ async def _send_final_error(websocket: WebSocket, task_id: str, progress, error_
     else:
         with status_dict_lock:
             status_dict[task_id].status = "Unknown Error"
+        task_events.notify(task_id)
         await websocket.send_json(
             {
                 "type": "error",
@@ -336,7 +377,7 @@ async def ws_submit(websocket: WebSocket):
     """WebSocket endpoint for streaming task submission and result retrieval.
 
     Protocol (Core -> Worker):
-        1. JSON message: task metadata (task_id, operation, flow_id, node_id, kwargs)
+        1. JSON message: task metadata (task_id, operation, flow_id, node_id, kwargs, estimated_input_bytes)
         2. Binary message: serialized Polars LazyFrame bytes
 
     Protocol (Worker -> Core):
@@ -354,6 +395,7 @@ async def ws_submit(websocket: WebSocket):
     queue = None
     member = None
     envelope_received = False
+    handed_off = False
 
     try:
         metadata = await websocket.receive_json()
@@ -363,6 +405,8 @@ async def ws_submit(websocket: WebSocket):
 
         polars_bytes = await websocket.receive_bytes()
 
+        if not await _await_admission(websocket, ctx, len(polars_bytes)):
+            return
         p, progress, error_message, queue, member = _spawn_subprocess(ctx, polars_bytes)
 
         had_error = await _monitor_progress(websocket, p, progress, error_message, task_id)
@@ -388,6 +432,7 @@ async def ws_submit(websocket: WebSocket):
                 # The socket died mid-task (progress send failed): let the task finish
                 # off-socket, mirroring the spawn path's join-to-completion semantics.
                 _handoff_to_background(task_id, p, progress, error_message, queue, member)
+                handed_off = True
                 p = None
                 progress = None
                 error_message = None
@@ -420,6 +465,7 @@ async def ws_submit(websocket: WebSocket):
         if p is not None and p.is_alive() and queue is not None and not envelope_received:
             _handoff_to_background(task_id, p, progress, error_message, queue, member)
             # Prevent finally block from cleaning up - handle_task owns these now
+            handed_off = True
             p = None
             progress = None
             error_message = None
@@ -436,5 +482,7 @@ async def ws_submit(websocket: WebSocket):
             await asyncio.to_thread(pool.task_pool.checkin, member, envelope_received)
         elif p is not None:
             await asyncio.to_thread(_cleanup_process, task_id, p)
+        if task_id is not None and not handed_off:
+            admission_controller.release(task_id)
         del p, progress, error_message
         gc.collect(0)
@@ -0,0 +1,70 @@
+"""Wake-up hub for the multiplexed task-event channel (``/ws/events``).
+
+Status changes happen on monitor threads (``spawner.handle_task``), in the
+``/ws/submit`` coroutines and in the cancel route. Each of those calls
+``notify`` after updating ``status_dict``; every open event channel is woken on its
+own event loop and pushes whatever changed for the tasks it watches. Channels also
+sweep on a short interval, so a transition that was never notified (e.g. a bare
+progress tick) is still delivered, just not instantly.
+
+Kept free of models/polars: ``spawner`` imports it.
+"""
+
+import asyncio
+import threading
+
+
+class _Subscriber:
+    """One event channel, woken from any thread."""
+
+    __slots__ = ("loop", "event")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.event = asyncio.Event()
+
+    def wake(self) -> None:
+        try:
+            self.loop.call_soon_threadsafe(self.event.set)
+        except RuntimeError:
+            # The channel's loop already closed; its unregister is on the way.
+            pass
+
+    async def wait(self, timeout: float) -> None:
+        try:
+            await asyncio.wait_for(self.event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self.event.clear()
+
+
+class TaskEventHub:
+    """Registry of open event channels."""
+
+    def __init__(self):
+        self._subscribers: set[_Subscriber] = set()
+        self._lock = threading.Lock()
+
+    def register(self, loop: asyncio.AbstractEventLoop) -> _Subscriber:
+        subscriber = _Subscriber(loop)
+        with self._lock:
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unregister(self, subscriber: _Subscriber) -> None:
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def notify(self, task_id: str | None = None) -> None:
+        """Wake every channel; each one filters on the tasks it watches."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            subscriber.wake()
+
+
+hub = TaskEventHub()
+
+
+def notify(task_id: str | None = None) -> None:
+    hub.notify(task_id)
@@ -1,8 +1,16 @@
+import os
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
+from typing import Literal
 
 import polars as pl
 from polars.exceptions import PanicException
 
+# How often the memory ceiling samples the task process' RSS.
+_MEMORY_CHECK_INTERVAL = 0.2
+
 
 def collect_lazy_frame(lf: pl.LazyFrame) -> pl.DataFrame:
     try:
@@ -24,3 +32,85 @@ def collect_lazy_frame_and_get_streaming_info(lf: pl.LazyFrame) -> CollectStream
         return CollectStreamingInfo(df, True)
     except PanicException:
         return CollectStreamingInfo(lf.collect(), False)
+
+
+@dataclass
+class SinkInfo:
+    __slots__ = "n_records", "streamed"
+    n_records: int
+    streamed: bool
+
+
+def sink_lazy_frame(
+    lf: pl.LazyFrame,
+    file_path: str,
+    file_format: Literal["ipc", "parquet"] = "ipc",
+    compression: str | None = None,
+) -> SinkInfo:
+    """Write *lf* to *file_path* with the streaming engine, so the result is never resident in full.
+
+    Falls back to collect-then-write only when the streaming engine cannot sink the plan
+    (it panics, as in ``collect_lazy_frame``); any other error is the plan's own and is raised.
+    The row count is read from the written file's metadata (IPC batch headers / Parquet footer).
+    """
+    if file_format == "ipc":
+        # write_ipc spells "no compression" as "uncompressed"; the sink takes None.
+        sink_compression = None if compression in (None, "uncompressed") else compression
+        scan = pl.scan_ipc
+    else:
+        sink_compression = compression or "zstd"
+        scan = pl.scan_parquet
+    try:
+        getattr(lf, f"sink_{file_format}")(file_path, compression=sink_compression)
+    except BaseException as e:  # PanicException derives from BaseException
+        # A partial file from the failed sink must not be mistaken for the result.
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        if not isinstance(e, PanicException):
+            raise
+        df = lf.collect(engine="in-memory")
+        getattr(df, f"write_{file_format}")(file_path, compression=sink_compression or "uncompressed")
+        return SinkInfo(df.height, False)
+    return SinkInfo(scan(file_path).select(pl.len()).collect().item(), True)
+
+
+def get_default_memory_limit_mb() -> float | None:
+    """Per-task memory ceiling for nodes without their own (``FLOWFILE_WORKER_TASK_MEMORY_LIMIT_MB``, 0 = off)."""
+    try:
+        limit = float(os.environ.get("FLOWFILE_WORKER_TASK_MEMORY_LIMIT_MB", "0"))
+    except ValueError:
+        return None
+    return limit if limit > 0 else None
+
+
+@contextmanager
+def memory_ceiling(limit_mb: float | None, on_exceeded: Callable[[float], None]) -> Iterator[None]:
+    """Sample this process' RSS while the block runs and call *on_exceeded* once it passes *limit_mb*.
+
+    *on_exceeded* runs on a watchdog thread with the RSS in MB; a native collect cannot be
+    interrupted from Python, so it is expected to end the process. No-op without a limit
+    or without psutil.
+    """
+    if not limit_mb:
+        yield
+        return
+    try:
+        import psutil
+    except ImportError:
+        yield
+        return
+    process = psutil.Process()
+    done = threading.Event()
+
+    def watch() -> None:
+        while not done.wait(_MEMORY_CHECK_INTERVAL):
+            rss_mb = process.memory_info().rss / 1e6
+            if rss_mb > limit_mb:
+                on_exceeded(rss_mb)
+                return
+
+    threading.Thread(target=watch, daemon=True, name="task-memory-ceiling").start()
+    try:
+        yield
+    finally:
+        done.set()
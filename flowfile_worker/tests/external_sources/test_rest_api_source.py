@@ -18,7 +18,7 @@ import pytest
 from flowfile_worker.external_sources.rest_api_source.main import read_rest_api
 from flowfile_worker.external_sources.rest_api_source.models import RestApiReadSettings as WorkerRestApiReadSettings
 from flowfile_worker.secrets import encrypt_secret
-from shared.rest_api.fetch import _parse_retry_after, fetch_rest_api
+from shared.rest_api.fetch import _parse_retry_after, fetch_rest_api, fetch_rest_api_to_ipc
 from shared.rest_api.models import (
     AuthConfig,
     PaginationConfig,
@@ -449,3 +449,75 @@ def test_scalar_list_wrapped_as_value_column():
     df = _run(handler, RestApiReadSettings(url="https://x/api", record_path="items"))
     assert df.columns == ["value"]
     assert df["value"].to_list() == [1, 2, 3]
+
+
+# --- concurrent pagination + IPC streaming ------------------------------------
+
+
+def test_concurrent_offset_pagination_keeps_page_order():
+    def handler(req):
+        off = int(req.url.params["offset"])
+        if off >= 25:
+            return httpx.Response(200, json=[{"id": i} for i in range(off, 27)])  # short page -> stop
+        return httpx.Response(200, json=[{"id": i} for i in range(off, off + 5)])
+
+    settings = RestApiReadSettings(
+        url="https://x/api",
+        pagination=PaginationConfig(pagination_type="offset", page_size=5, max_concurrency=4),
+    )
+    df = _run(handler, settings)
+    assert df["id"].to_list() == list(range(27))
+
+
+def test_concurrent_page_pagination_respects_max_records():
+    def handler(req):
+        page = int(req.url.params["page"])
+        return httpx.Response(200, json=[{"page": page, "i": i} for i in range(3)])
+
+    settings = RestApiReadSettings(
+        url="https://x/api",
+        pagination=PaginationConfig(pagination_type="page", max_concurrency=3, max_records=7),
+    )
+    df = _run(handler, settings)
+    assert df["page"].to_list() == [1, 1, 1, 2, 2, 2, 3]
+
+
+def test_429_backs_off_every_concurrent_request(monkeypatch):
+    slept = []
+    monkeypatch.setattr("shared.rest_api.fetch.time.sleep", slept.append)
+    calls = {"n": 0}
+
+    def handler(req):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            return httpx.Response(429, headers={"Retry-After": "7"}, json={})
+        return httpx.Response(200, json=[] if req.url.params["page"] == "3" else [{"id": 1}])
+
+    settings = RestApiReadSettings(
+        url="https://x/api", pagination=PaginationConfig(pagination_type="page", max_concurrency=2)
+    )
+    df = _run(handler, settings)
+    assert df.height == 2
+    assert slept and max(slept) > 6
+
+
+def test_fetch_to_ipc_streams_batches_with_drifting_schema(tmp_path, monkeypatch):
+    monkeypatch.setattr("shared.rest_api.fetch.RECORD_BATCH_SIZE", 2)
+
+    def handler(req):
+        page = int(req.url.params["page"])
+        if page == 1:
+            return httpx.Response(200, json=[{"id": 1}, {"id": 2}])
+        if page == 2:
+            return httpx.Response(200, json=[{"id": 3.5, "extra": "x"}])
+        return httpx.Response(200, json=[])
+
+    settings = RestApiReadSettings(url="https://x/api", pagination=PaginationConfig(pagination_type="page"))
+    path = tmp_path / "out.arrow"
+    with mock_transport(handler):
+        n = fetch_rest_api_to_ipc(settings, str(path))
+    df = pl.read_ipc(path)
+    assert n == 3
+    assert df.schema["id"] == pl.Float64
+    assert df["extra"].to_list() == [None, None, "x"]
+    assert [p.name for p in tmp_path.iterdir()] == ["out.arrow"]
@@ -0,0 +1,102 @@
+"""Tests for memory-aware admission control (flowfile_worker/admission.py)."""
+
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from flowfile_worker import PROCESS_MEMORY_USAGE, admission, main, routes
+from flowfile_worker.admission import AdmissionController
+
+client = TestClient(main.app)
+
+pytestmark = pytest.mark.worker
+
+
+@pytest.fixture(autouse=True)
+def plenty_of_host_memory(monkeypatch):
+    monkeypatch.setattr(admission, "_host_memory_mb", lambda: (64_000.0, 32_000.0))
+
+
+def _controller(budget_mb: float = 1000, max_concurrent: int = 0) -> AdmissionController:
+    return AdmissionController(enabled=True, budget_mb=budget_mb, headroom_mb=512, max_concurrent=max_concurrent)
+
+
+def _admit_in_thread(controller: AdmissionController, task_id: str, estimate_mb: float):
+    outcome = []
+    thread = threading.Thread(
+        target=lambda: outcome.append(controller.admit(task_id, "store", 1, task_id, estimate_mb)), daemon=True
+    )
+    thread.start()
+    return thread, outcome
+
+
+def test_tasks_over_budget_wait_for_a_release():
+    controller = _controller()
+    assert controller.admit("adm-a", "store", 1, 1, 700)
+    thread, outcome = _admit_in_thread(controller, "adm-b", 700)
+    thread.join(0.3)
+    assert outcome == []
+    assert controller.describe()["queue_depth"] == 1
+
+    controller.release("adm-a")
+    thread.join(5)
+    assert outcome == [True]
+    assert controller.describe()["reserved_mb"] == 700
+
+
+def test_a_lone_task_is_admitted_even_over_budget():
+    assert _controller(budget_mb=100).admit("adm-big", "store", 1, 1, 10_000)
+
+
+def test_queue_is_first_in_first_out():
+    controller = _controller(max_concurrent=1)
+    assert controller.admit("adm-running", "store", 1, 1, 64)
+    big, big_outcome = _admit_in_thread(controller, "adm-big", 900)
+    big.join(0.2)
+    small, small_outcome = _admit_in_thread(controller, "adm-small", 64)
+    small.join(0.2)
+
+    controller.release("adm-running")
+    big.join(5)
+    small.join(0.3)
+    assert big_outcome == [True]
+    assert small_outcome == []
+    controller.release("adm-big")
+    small.join(5)
+    assert small_outcome == [True]
+
+
+def test_withdrawn_tasks_never_start():
+    controller = _controller(max_concurrent=1)
+    assert controller.admit("adm-running", "store", 1, 1, 64)
+    thread, outcome = _admit_in_thread(controller, "adm-queued", 64)
+    thread.join(0.2)
+    assert controller.withdraw("adm-queued")
+    thread.join(5)
+    assert outcome == [False]
+    assert not controller.withdraw("adm-running")
+
+
+def test_estimate_learns_from_the_previous_peak(monkeypatch):
+    controller = _controller()
+    assert controller.estimate_mb("store", 1, 7, payload_bytes=1_000_000) == 64
+    assert controller.estimate_mb("store", 1, 7, input_bytes=100_000_000) == 400
+    monkeypatch.setitem(PROCESS_MEMORY_USAGE, "adm-peak", 850.0)
+    assert controller.admit("adm-peak", "store", 1, 7, 64)
+    controller.release("adm-peak")
+    assert controller.estimate_mb("store", 1, 7) == 850
+
+
+def test_cancel_withdraws_a_queued_task(monkeypatch):
+    controller = _controller(max_concurrent=1)
+    monkeypatch.setattr(routes, "admission_controller", controller)
+    assert controller.admit("adm-running", "store", 1, 1, 64)
+    thread, outcome = _admit_in_thread(controller, "adm-cancel", 64)
+    thread.join(0.2)
+
+    assert client.get("/admission").status_code == 200
+    assert client.post("/cancel_task/adm-cancel").status_code == 200
+    thread.join(5)
+    assert outcome == [False]
+    assert controller.describe()["withdrawn_total"] == 1
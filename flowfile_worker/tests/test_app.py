@@ -147,6 +147,34 @@ def test_status_404s_when_the_result_file_is_gone(create_grouper_data):
     assert client.get(f'/status/{task_id}').status_code == 404
 
 
+def test_status_batch_and_clear_tasks(create_grouper_data):
+    df = create_grouper_data
+    headers = {
+        "Content-Type": "application/octet-stream",
+        "X-Operation-Type": "store",
+        "X-Flow-Id": "1",
+        "X-Node-Id": "-1",
+    }
+    v = client.post('/submit_query/', content=df.serialize(), headers=headers)
+    assert v.status_code == 200, v.text
+    task_id = models.Status.model_validate(v.json()).background_task_id
+
+    for _ in range(100):
+        r = client.post('/status/batch', json={"task_ids": [task_id, "batch-missing"]})
+        assert r.status_code == 200, r.text
+        statuses = models.StatusBatchResponse.model_validate(r.json()).statuses
+        if statuses[task_id].status == 'Completed':
+            break
+        time.sleep(0.1)
+    assert statuses[task_id].status == 'Completed'
+    assert statuses["batch-missing"] is None
+
+    r = client.post('/clear_tasks', json={"task_ids": [task_id, "batch-missing"]})
+    assert r.status_code == 200, r.text
+    assert r.json() == {"cleared": [task_id]}
+    assert client.get(f'/status/{task_id}').status_code == 404
+
+
 def test_add_fuzzy_join(create_fuzzy_data):
     load = create_fuzzy_data
     # Use model_dump_json() - Pydantic handles single base64 encoding for bytes in JSON
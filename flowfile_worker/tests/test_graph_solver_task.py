@@ -0,0 +1,75 @@
+"""Tests for the worker-side partitioned graph solver task.
+
+Exercises ``graph_solver_task`` directly (no HTTP, no subprocess), checking the
+IPC file and queue contract the spawner relies on.
+"""
+
+from io import BytesIO
+from multiprocessing import Queue
+
+import polars as pl
+import pytest
+from pydantic import ValidationError
+
+from flowfile_worker import mp_context
+from flowfile_worker.funcs import graph_solver_task
+from flowfile_worker.models import GraphSolverInput, PolarsOperation
+
+
+def _shared_objects():
+    return mp_context.Value("i", 0), mp_context.Array("c", 1024), Queue(maxsize=1)
+
+
+def test_graph_solver_task_writes_labels(tmp_path):
+    edges = pl.LazyFrame({"from": ["a", "b", "g", None], "to": ["b", "c", "d", "x"]})
+    progress, error_message, queue = _shared_objects()
+    out_ipc = tmp_path / "labelled.arrow"
+    graph_solver_task(
+        polars_serializable_object=edges.serialize(),
+        progress=progress,
+        error_message=error_message,
+        queue=queue,
+        file_path=str(out_ipc),
+        col_from="from",
+        col_to="to",
+        output_column_name="group",
+        flowfile_flow_id=1,
+        flowfile_node_id=2,
+    )
+    assert progress.value == 100, error_message.value.decode().rstrip("\x00")
+
+    result = pl.LazyFrame.deserialize(BytesIO(queue.get(timeout=5))).collect()
+    assert result.columns == ["from", "to", "group"]
+    group = result["group"].to_list()
+    assert group[0] == group[1]
+    assert len({group[0], group[2], group[3]}) == 3
+    assert pl.read_ipc(out_ipc).height == 4
+
+
+def test_graph_solver_task_marks_error_on_missing_column(tmp_path):
+    progress, error_message, queue = _shared_objects()
+    graph_solver_task(
+        polars_serializable_object=pl.LazyFrame({"from": ["a"]}).serialize(),
+        progress=progress,
+        error_message=error_message,
+        queue=queue,
+        file_path=str(tmp_path / "labelled.arrow"),
+        col_from="from",
+        col_to="to",
+        output_column_name="group",
+    )
+    assert progress.value == -1
+    assert error_message.value
+    assert queue.empty()
+
+
+@pytest.mark.parametrize("state_name", ["../escape", "nested/name", "/abs", ""])
+def test_graph_solver_input_rejects_state_names_outside_the_state_dir(state_name):
+    with pytest.raises(ValidationError):
+        GraphSolverInput(
+            df_operation=PolarsOperation(operation=pl.LazyFrame({"from": ["a"]}).serialize()),
+            col_from="from",
+            col_to="to",
+            output_column_name="group",
+            state_name=state_name,
+        )
@@ -19,7 +19,7 @@ from fastapi.testclient import TestClient
 
 from flowfile_worker import main, models, pool, status_dict, status_dict_lock
 from flowfile_worker.pool import POOLABLE_OPERATIONS, TaskPool
-from flowfile_worker.spawner import process_manager, start_process
+from flowfile_worker.spawner import lease_member, process_manager, start_process
 
 client = TestClient(main.app)
 
@@ -282,6 +282,14 @@ class TestFallbacks:
         assert warm_pool.acquire("execute_custom_node") is None
         assert warm_pool.acquire("generic_task") is None
 
+    def test_store_under_a_memory_ceiling_takes_spawn_path(self, warm_pool, monkeypatch, tmp_path):
+        assert lease_member("store", {"memory_limit_mb": 512}) is None
+        monkeypatch.setenv("FLOWFILE_WORKER_TASK_MEMORY_LIMIT_MB", "8192")
+        assert lease_member("store", {}) is None
+        status = _run_task("pool-ceiling-1", "store", pl.LazyFrame({"a": [7]}).serialize(), str(tmp_path / "c.arrow"))
+        assert status.status == "Completed", status.error_message
+        assert warm_pool.stats()["total"] == 0
+
     def test_saturated_pool_returns_none(self, warm_pool):
         member = warm_pool.acquire("store")
         assert member is not None
@@ -0,0 +1,164 @@
+"""Tests for the size-bounded, restart-safe worker result cache (flowfile_worker/result_cache.py)."""
+
+import io
+from base64 import b64decode
+
+import polars as pl
+import pytest
+from fastapi.testclient import TestClient
+
+from flowfile_worker import main, models, routes, status_dict, status_dict_lock
+from flowfile_worker.result_cache import ResultCache, ipc_compression
+
+client = TestClient(main.app)
+
+pytestmark = pytest.mark.worker
+
+
+def _write_result(cache_dir, flow_id: int, task_id: str, n_rows: int = 100) -> str:
+    flow_dir = cache_dir / str(flow_id)
+    flow_dir.mkdir(parents=True, exist_ok=True)
+    path = flow_dir / f"{task_id}.arrow"
+    pl.DataFrame({"a": list(range(n_rows))}).write_ipc(path)
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def clean_status_dict():
+    yield
+    with status_dict_lock:
+        for task_id in [t for t in status_dict if t.startswith("rc-")]:
+            status_dict.pop(task_id, None)
+
+
+def test_register_ignores_files_outside_cache_dir(tmp_path):
+    cache = ResultCache(tmp_path / "cache")
+    outside = tmp_path / "out.arrow"
+    pl.DataFrame({"a": [1]}).write_ipc(outside)
+    assert cache.register("rc-out", str(outside)) == []
+    assert cache.get("rc-out") is None
+
+
+def test_total_budget_evicts_least_recently_used(tmp_path):
+    cache_dir = tmp_path / "cache"
+    first = _write_result(cache_dir, 1, "rc-1")
+    size = (cache_dir / "1" / "rc-1.arrow").stat().st_size
+    cache = ResultCache(cache_dir, max_bytes=size * 2)
+
+    cache.register("rc-1", first)
+    cache.register("rc-2", _write_result(cache_dir, 1, "rc-2"))
+    cache.touch("rc-1")
+    evicted = cache.register("rc-3", _write_result(cache_dir, 2, "rc-3"))
+
+    assert [e.task_id for e in evicted] == ["rc-2"]
+    assert not (cache_dir / "1" / "rc-2.arrow").exists()
+    assert cache.get("rc-1") is not None and cache.get("rc-3") is not None
+
+
+def test_flow_quota_only_evicts_within_the_flow(tmp_path):
+    cache_dir = tmp_path / "cache"
+    other = _write_result(cache_dir, 2, "rc-other")
+    size = (cache_dir / "2" / "rc-other.arrow").stat().st_size
+    cache = ResultCache(cache_dir, flow_max_bytes=size)
+
+    cache.register("rc-other", other)
+    cache.register("rc-a", _write_result(cache_dir, 1, "rc-a"))
+    evicted = cache.register("rc-b", _write_result(cache_dir, 1, "rc-b"))
+
+    assert [e.task_id for e in evicted] == ["rc-a"]
+    assert cache.get("rc-other") is not None
+
+
+def test_running_tasks_are_never_evicted(tmp_path):
+    cache_dir = tmp_path / "cache"
+    running = _write_result(cache_dir, 1, "rc-running")
+    size = (cache_dir / "1" / "rc-running.arrow").stat().st_size
+    cache = ResultCache(cache_dir, max_bytes=size)
+    cache.register("rc-running", running)
+    with status_dict_lock:
+        status_dict["rc-running"] = models.Status(background_task_id="rc-running", status="Processing", file_ref=running)
+
+    assert cache.register("rc-new", _write_result(cache_dir, 1, "rc-new")) == []
+
+
+def test_held_results_are_never_evicted(tmp_path):
+    cache_dir = tmp_path / "cache"
+    held = _write_result(cache_dir, 1, "rc-held")
+    size = (cache_dir / "1" / "rc-held.arrow").stat().st_size
+    cache = ResultCache(cache_dir, max_bytes=size)
+    cache.register("rc-held", held)
+    cache.acquire("rc-held", "flow-a")
+
+    assert cache.register("rc-new", _write_result(cache_dir, 1, "rc-new")) == []
+    assert cache.release("flow-a") == ["rc-held"]
+    assert [e.task_id for e in cache.register("rc-newer", _write_result(cache_dir, 1, "rc-newer"))] == [
+        "rc-held",
+        "rc-new",
+    ]
+
+
+def test_clear_keeps_results_other_flows_hold(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    cache = ResultCache(cache_dir)
+    cache.register("rc-shared", _write_result(cache_dir, 1, "rc-shared"))
+    monkeypatch.setattr(routes, "result_cache", cache)
+
+    hold = {"holder": "flow-a", "task_ids": ["rc-shared", "rc-unknown"]}
+    assert client.post("/results/acquire", json=hold).json() == {"task_ids": ["rc-shared"]}
+    assert client.post("/results/acquire", json={**hold, "holder": "flow-b"}).json() == {"task_ids": ["rc-shared"]}
+
+    # flow-a's clear only drops its own hold while flow-b still reads the result.
+    assert client.delete("/clear_task/rc-shared", params={"holder": "flow-a"}).status_code == 404
+    assert (cache_dir / "1" / "rc-shared.arrow").exists()
+    assert client.post("/results/release", json={"holder": "flow-b"}).json() == {"task_ids": ["rc-shared"]}
+    assert client.post("/clear_tasks", json={"task_ids": ["rc-shared"]}).json() == {"cleared": ["rc-shared"]}
+    assert not (cache_dir / "1" / "rc-shared.arrow").exists()
+
+
+def test_index_survives_restart_and_drops_missing_files(tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache = ResultCache(cache_dir, persist=True)
+    cache.register("rc-keep", _write_result(cache_dir, 1, "rc-keep"), number_of_records=100)
+    gone = _write_result(cache_dir, 1, "rc-gone")
+    cache.register("rc-gone", gone)
+    (cache_dir / "1" / "rc-gone.arrow").unlink()
+
+    reopened = ResultCache(cache_dir, persist=True)
+    assert reopened.load() == 1
+    assert reopened.get("rc-keep").number_of_records == 100
+
+
+def test_status_endpoint_restores_cached_result_after_restart(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    ResultCache(cache_dir, persist=True).register("rc-restored", _write_result(cache_dir, 1, "rc-restored", 7), 7)
+    restarted = ResultCache(cache_dir, persist=True)
+    restarted.load()
+    monkeypatch.setattr(routes, "result_cache", restarted)
+
+    response = client.get("/status/rc-restored")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "Completed"
+    assert body["number_of_records"] == 7
+    lf = pl.LazyFrame.deserialize(io.BytesIO(b64decode(body["results"])))
+    assert lf.collect().height == 7
+
+
+def test_clear_task_removes_index_entry(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    cache = ResultCache(cache_dir)
+    path = _write_result(cache_dir, 1, "rc-clear")
+    cache.register("rc-clear", path)
+    monkeypatch.setattr(routes, "result_cache", cache)
+
+    assert client.delete("/clear_task/rc-clear").status_code == 200
+    assert cache.get("rc-clear") is None
+    assert not (cache_dir / "1" / "rc-clear.arrow").exists()
+
+
+def test_ipc_compression_env(monkeypatch):
+    monkeypatch.setenv("FLOWFILE_WORKER_CACHE_COMPRESSION", "ZSTD")
+    assert ipc_compression() == "zstd"
+    monkeypatch.setenv("FLOWFILE_WORKER_CACHE_COMPRESSION", "brotli")
+    assert ipc_compression() == "uncompressed"
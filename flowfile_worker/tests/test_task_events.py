@@ -0,0 +1,72 @@
+"""Tests for the multiplexed task-event channel (/ws/events)."""
+
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from flowfile_worker import main, models, status_dict, status_dict_lock, task_events
+
+client = TestClient(main.app)
+
+pytestmark = pytest.mark.worker
+
+
+@pytest.fixture(autouse=True)
+def clean_status_dict():
+    yield
+    with status_dict_lock:
+        for task_id in [t for t in status_dict if t.startswith("ev-")]:
+            status_dict.pop(task_id, None)
+
+
+def _set_status(task_id: str, **fields) -> None:
+    with status_dict_lock:
+        status_dict[task_id] = models.Status(background_task_id=task_id, **fields)
+    task_events.notify(task_id)
+
+
+def test_unknown_task_is_reported_not_found():
+    with client.websocket_connect("/ws/events") as ws:
+        ws.send_json({"type": "subscribe", "task_id": "ev-missing"})
+        assert ws.receive_json() == {"type": "not_found", "task_id": "ev-missing"}
+
+
+def test_progress_then_final_status_is_pushed():
+    _set_status("ev-run", status="Processing", file_ref="", progress=10)
+    with client.websocket_connect("/ws/events") as ws:
+        ws.send_json({"type": "subscribe", "task_id": "ev-run"})
+        first = ws.receive_json()
+        assert first == {"type": "progress", "task_id": "ev-run", "status": "Processing", "progress": 10}
+
+        fail = {"status": "Error", "file_ref": "", "progress": -1, "error_message": "boom"}
+        threading.Timer(0.05, _set_status, args=("ev-run",), kwargs=fail).start()
+        final = ws.receive_json()
+
+    assert final["type"] == "status"
+    assert final["status"]["status"] == "Error"
+    assert final["status"]["error_message"] == "boom"
+
+
+def test_one_channel_serves_many_tasks():
+    _set_status("ev-a", status="Error", file_ref="", error_message="a")
+    _set_status("ev-b", status="Unknown Error", file_ref="")
+    with client.websocket_connect("/ws/events") as ws:
+        ws.send_json({"type": "subscribe", "task_id": "ev-a"})
+        ws.send_json({"type": "subscribe", "task_id": "ev-b"})
+        events = {e["task_id"]: e for e in (ws.receive_json(), ws.receive_json())}
+
+    assert events["ev-a"]["status"]["status"] == "Error"
+    assert events["ev-b"]["status"]["status"] == "Unknown Error"
+
+
+def test_hub_forgets_closed_channels():
+    with client.websocket_connect("/ws/events") as ws:
+        ws.send_json({"type": "subscribe", "task_id": "ev-missing"})
+        ws.receive_json()
+    # The endpoint unregisters on disconnect; give the server loop a moment.
+    for _ in range(50):
+        if not task_events.hub._subscribers:
+            break
+        threading.Event().wait(0.02)
+    assert not task_events.hub._subscribers
@@ -1,9 +1,18 @@
 """Tests for worker utils module."""
 
+import threading
+
 import polars as pl
+import pytest
 from polars.exceptions import PanicException
 
-from flowfile_worker.utils import CollectStreamingInfo, collect_lazy_frame, collect_lazy_frame_and_get_streaming_info
+from flowfile_worker.utils import (
+    CollectStreamingInfo,
+    collect_lazy_frame,
+    collect_lazy_frame_and_get_streaming_info,
+    memory_ceiling,
+    sink_lazy_frame,
+)
 
 
 class TestCollectLazyFrame:
@@ -50,3 +59,71 @@ class TestCollectLazyFrameAndGetStreamingInfo:
         lf = pl.DataFrame({"x": [10, 20, 30]}).lazy().filter(pl.col("x") >= 20)
         result = collect_lazy_frame_and_get_streaming_info(lf)
         assert len(result.df) == 2
+
+
+class TestSinkLazyFrame:
+    """Test sink_lazy_frame function."""
+
+    def test_streams_ipc_and_counts_rows(self, tmp_path):
+        lf = pl.LazyFrame({"a": list(range(10))}).filter(pl.col("a") % 2 == 0)
+        file_path = str(tmp_path / "out.arrow")
+        info = sink_lazy_frame(lf, file_path, "ipc", "uncompressed")
+        assert info.streamed is True
+        assert info.n_records == 5
+        assert pl.read_ipc(file_path).equals(lf.collect())
+
+    def test_streams_parquet(self, tmp_path):
+        file_path = str(tmp_path / "out.parquet")
+        info = sink_lazy_frame(pl.LazyFrame({"a": [1, 2, 3]}), file_path, "parquet")
+        assert info.n_records == 3
+        assert pl.read_parquet(file_path)["a"].to_list() == [1, 2, 3]
+
+    def test_other_sink_errors_are_raised(self, tmp_path, monkeypatch):
+        file_path = tmp_path / "out.arrow"
+
+        def failing_sink(self, path, **kwargs):
+            with open(path, "wb") as f:
+                f.write(b"partial")
+            raise pl.exceptions.ComputeError("bad cast")
+
+        monkeypatch.setattr(pl.LazyFrame, "sink_ipc", failing_sink)
+        monkeypatch.setattr(pl.LazyFrame, "collect", lambda *args, **kwargs: pytest.fail("fell back to collect"))
+        with pytest.raises(pl.exceptions.ComputeError, match="bad cast"):
+            sink_lazy_frame(pl.LazyFrame({"a": [1, 2]}), str(file_path), "ipc", "lz4")
+        assert not file_path.exists()
+
+    def test_falls_back_to_collect_when_the_sink_panics(self, tmp_path, monkeypatch):
+        file_path = tmp_path / "out.parquet"
+
+        def panicking_sink(self, path, **kwargs):
+            with open(path, "wb") as f:
+                f.write(b"partial")
+            raise PanicException("not implemented for the streaming engine")
+
+        monkeypatch.setattr(pl.LazyFrame, "sink_parquet", panicking_sink)
+        info = sink_lazy_frame(pl.LazyFrame({"a": [1, 2, 3]}), str(file_path), "parquet")
+        assert info.streamed is False
+        assert info.n_records == 3
+        assert pl.read_parquet(file_path)["a"].to_list() == [1, 2, 3]
+
+
+class TestMemoryCeiling:
+    """Test memory_ceiling context manager."""
+
+    def test_calls_back_once_over_the_limit(self):
+        exceeded = threading.Event()
+        readings = []
+
+        def on_exceeded(rss_mb):
+            readings.append(rss_mb)
+            exceeded.set()
+
+        with memory_ceiling(1, on_exceeded):
+            assert exceeded.wait(5)
+        assert len(readings) == 1 and readings[0] > 1
+
+    def test_no_limit_is_a_no_op(self):
+        readings = []
+        with memory_ceiling(None, readings.append):
+            pass
+        assert readings == []
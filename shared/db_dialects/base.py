@@ -2,7 +2,8 @@
 
 A ``DbDialect`` bundles everything Flowfile needs to know about one database
 vocabulary entry: catalog metadata (name, file_based, default port), URI
-building, the read/write strategy, and optional fast-schema hooks. The base
+building, the read/write strategy (including the bulk-load path for one
+chunk of a write), and optional fast-schema hooks. The base
 class *is* the generic dialect — its method bodies are the historical
 postgres-shaped code paths, so registering a dialect with no overrides changes
 nothing about behavior.
@@ -24,6 +25,7 @@ from typing import TYPE_CHECKING, ClassVar
 
 if TYPE_CHECKING:
     import polars as pl
+    import sqlalchemy as sa
 
 logger = logging.getLogger(__name__)
 
@@ -126,7 +128,35 @@ class DbDialect:
     def write(self, df: pl.DataFrame, *, uri: str, table_name: str, if_exists: str = "append") -> None:
         from shared.db_writer import _write_df_via_sqlalchemy_core
 
-        _write_df_via_sqlalchemy_core(df, uri, table_name, if_exists)
+        _write_df_via_sqlalchemy_core(
+            df, uri, table_name, if_exists, load_chunk=self.load_chunk, connect_args=self.write_connect_args()
+        )
+
+    def merge(self, df: pl.DataFrame, *, uri: str, table_name: str, merge_mode: str, merge_keys: list[str]) -> None:
+        """Upsert/update/delete *df* on *merge_keys* through a staging table; creates a missing target."""
+        from shared.db_writer import _merge_df_via_sqlalchemy_core
+
+        merged = _merge_df_via_sqlalchemy_core(
+            df,
+            uri,
+            table_name,
+            merge_mode,
+            merge_keys,
+            load_chunk=self.load_chunk,
+            connect_args=self.write_connect_args(),
+        )
+        if not merged:
+            self.write(df if merge_mode == "upsert" else df.clear(), uri=uri, table_name=table_name)
+
+    def write_connect_args(self) -> dict:
+        """Extra DBAPI connect arguments for the write engine (e.g. to enable a bulk-load path)."""
+        return {}
+
+    def load_chunk(self, conn: sa.Connection, sql_table: sa.Table, df: pl.DataFrame) -> None:
+        """Load one chunk of rows into the created table; runs inside the chunk's transaction."""
+        from shared.db_writer import insert_rows
+
+        insert_rows(conn, sql_table, df)
 
     def limit_query(self, select_sql: str, n: int) -> str:
         """Wrap a SELECT statement so it returns at most ``n`` rows."""
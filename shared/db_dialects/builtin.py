@@ -2,12 +2,24 @@
 
 from __future__ import annotations
 
+import logging
+import os
 from typing import TYPE_CHECKING
 
 from shared.db_dialects.base import DbDialect
 
 if TYPE_CHECKING:
     import polars as pl
+    import sqlalchemy as sa
+
+logger = logging.getLogger(__name__)
+
+# LOAD DATA LOCAL lets the server ask the client for any file it can read, so it is opt-in;
+# MySQL writes use multi-row inserts otherwise.
+MYSQL_LOCAL_INFILE: bool = os.environ.get("FLOWFILE_MYSQL_LOCAL_INFILE", "0") == "1"
+
+# MySQL errors for a refused LOAD DATA LOCAL: local_infile off on the server, or on the client.
+_LOCAL_INFILE_REFUSED = {1148, 2068, 3948}
 
 
 class PostgresDialect(DbDialect):
@@ -17,6 +29,11 @@ class PostgresDialect(DbDialect):
     supports_ssl = True
     sqlglot_name = "postgres"
 
+    def load_chunk(self, conn: sa.Connection, sql_table: sa.Table, df: pl.DataFrame) -> None:
+        from shared.db_writer import copy_rows_postgres
+
+        copy_rows_postgres(conn, sql_table, df)
+
 
 class MySQLDialect(DbDialect):
     name = "mysql"
@@ -25,6 +42,31 @@ class MySQLDialect(DbDialect):
     sqlalchemy_driver = "mysql+pymysql"
     sqlglot_name = "mysql"
 
+    def write_connect_args(self) -> dict:
+        return {"local_infile": True} if MYSQL_LOCAL_INFILE else {}
+
+    def load_chunk(self, conn: sa.Connection, sql_table: sa.Table, df: pl.DataFrame) -> None:
+        """Multi-row inserts; ``LOAD DATA LOCAL INFILE`` when ``FLOWFILE_MYSQL_LOCAL_INFILE`` is on.
+
+        The bulk load falls back to inserts when the server refuses it, and is never used for
+        binary columns.
+        """
+        import polars as pl
+
+        from shared.db_writer import insert_rows, load_data_local_mysql
+
+        if not MYSQL_LOCAL_INFILE or any(dtype == pl.Binary for dtype in df.dtypes):
+            insert_rows(conn, sql_table, df)
+            return
+        try:
+            load_data_local_mysql(conn, sql_table, df)
+        except Exception as exc:
+            code = exc.args[0] if exc.args else None
+            if code not in _LOCAL_INFILE_REFUSED:
+                raise
+            logger.info("LOAD DATA LOCAL refused by the server (%s); writing with inserts", exc)
+            insert_rows(conn, sql_table, df)
+
 
 class SQLiteDialect(DbDialect):
     name = "sqlite"
@@ -153,6 +153,47 @@ class DuckDBDialect(DbDialect):
         finally:
             con.close()
 
+    def merge(self, df: pl.DataFrame, *, uri: str, table_name: str, merge_mode: str, merge_keys: list[str]) -> None:
+        # The registered frame is the staging table: DuckDB scans it in place.
+        schema, _, table = table_name.rpartition(".")
+        schema = schema or None
+        qualified = f"{_quote_ident(schema)}.{_quote_ident(table)}" if schema else _quote_ident(table)
+
+        con = self._connect(uri, read_only=False)
+        exists = False
+        try:
+            exists = self._table_exists(con, schema, table)
+        finally:
+            if not exists:
+                con.close()
+        if not exists:
+            self.write(df if merge_mode == "upsert" else df.clear(), uri=uri, table_name=table_name)
+            return
+        try:
+            con.register("_ff_df", df)
+            matches = " AND ".join(f"t.{_quote_ident(k)} = s.{_quote_ident(k)}" for k in merge_keys)
+            updates = ", ".join(f"{_quote_ident(c)} = s.{_quote_ident(c)}" for c in df.columns if c not in merge_keys)
+            columns = ", ".join(_quote_ident(c) for c in df.columns)
+            con.execute("BEGIN TRANSACTION")
+            try:
+                if merge_mode == "delete":
+                    con.execute(
+                        f"DELETE FROM {qualified} AS t WHERE EXISTS (SELECT 1 FROM _ff_df AS s WHERE {matches})"
+                    )
+                elif updates:
+                    con.execute(f"UPDATE {qualified} AS t SET {updates} FROM _ff_df AS s WHERE {matches}")
+                if merge_mode == "upsert":
+                    con.execute(
+                        f"INSERT INTO {qualified} ({columns}) SELECT {columns} FROM _ff_df AS s "
+                        f"WHERE NOT EXISTS (SELECT 1 FROM {qualified} AS t WHERE {matches})"
+                    )
+                con.execute("COMMIT")
+            except Exception:
+                con.execute("ROLLBACK")
+                raise
+        finally:
+            con.close()
+
     @staticmethod
     def _table_exists(con, schema: str | None, table: str) -> bool:
         row = con.execute(
@@ -6,7 +6,8 @@ attempt-per-read model (reproduced with connectorx 0.4.5: first threaded read
 succeeds, the second SIGSEGVs the process). Reads therefore go through the
 SQLAlchemy/pymssql leg only (``shared.db_reader.read_sql_sqlalchemy``), which
 keeps the abandonable-thread/cancel semantics. Writes inherit the base
-SQLAlchemy Core insert path.
+SQLAlchemy Core path, loading each chunk as multi-row ``INSERT ... VALUES``
+statements: pymssql's executemany is one round trip per row.
 
 Fast schema comes from ``sp_describe_first_result_set`` — SQL Server plans the
 query without executing it and reports every result column's T-SQL type — and a
@@ -35,6 +36,7 @@ from shared.db_dialects.base import DbDialect
 
 if TYPE_CHECKING:
     import polars as pl
+    import sqlalchemy as sa
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +47,9 @@ _TYPE_ARGS = re.compile(r"^([a-z0-9_ ]+?)\s*(?:\((.*)\))?$")
 # projected to NVARCHAR in the read path so frames stay Object-free.
 _STRINGIFY_TYPES = {"uniqueidentifier", "datetimeoffset", "hierarchyid", "sql_variant"}
 
+# SQL Server allows 2100 parameters per statement.
+_MAX_INSERT_PARAMS = 2000
+
 
 def _quote_ident(name: str) -> str:
     return "[" + name.replace("]", "]]") + "]"
@@ -73,6 +78,11 @@ class MSSQLDialect(DbDialect):
             return False
         return True
 
+    def load_chunk(self, conn: sa.Connection, sql_table: sa.Table, df: pl.DataFrame) -> None:
+        from shared.db_writer import insert_values_batches
+
+        insert_values_batches(conn, sql_table, df, max_params=_MAX_INSERT_PARAMS)
+
     def limit_query(self, select_sql: str, n: int) -> str:
         match = _SELECT_HEAD.match(select_sql)
         if match:
@@ -6,6 +6,11 @@ hang at the protocol level instead of erroring. SQLAlchemy reads (simple query
 protocol) are reliable on those endpoints. ``read_sql_with_fallback`` hedges: it
 starts connectorx, and if that neither finishes nor fails within ``hedge_delay``
 seconds it races a SQLAlchemy read in parallel, returning the first success.
+
+``read_sql_partitioned`` splits one large read into range queries on a column
+(``DbReadPartitioning``), reads them concurrently through the dialect's read
+strategy and yields each partition as it arrives; ``write_partitions_ipc``
+streams those into one Arrow IPC file, so the whole table is never in memory.
 """
 
 from __future__ import annotations
@@ -13,12 +18,19 @@ from __future__ import annotations
 import hashlib
 import logging
 import os
+import re
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import date, datetime
+from decimal import Decimal
+from itertools import islice
 from urllib.parse import urlsplit, urlunsplit
 
 import polars as pl
+import pyarrow as pa
+from pydantic import BaseModel, Field, field_validator
 
 from shared.sql_utils import get_sqlalchemy_uri
 
@@ -188,3 +200,179 @@ def read_sql_with_fallback(
             waiters[0].wait(_POLL_INTERVAL_SECONDS)
         else:
             time.sleep(_POLL_INTERVAL_SECONDS)
+
+
+PartitionBound = int | float | datetime | date
+
+
+class DbReadPartitioning(BaseModel):
+    """Split a database read into concurrent range queries on one column.
+
+    ``num_partitions`` ranges are cut evenly between ``lower_bound`` and ``upper_bound``
+    (the column's MIN/MAX when not given). The bounds only place the cuts: the first
+    range also takes NULLs and anything below it and the last everything above, so no
+    row is dropped. At most ``max_concurrency`` partitions are read at once.
+    """
+
+    column: str
+    num_partitions: int = Field(default=4, ge=1)
+    lower_bound: PartitionBound | None = None
+    upper_bound: PartitionBound | None = None
+    max_concurrency: int = Field(default=4, ge=1)
+
+    @field_validator("column")
+    @classmethod
+    def validate_column(cls, v: str) -> str:
+        if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", v):
+            raise ValueError(f"Invalid partition column: '{v}'. Only letters, numbers, and underscores are allowed.")
+        return v
+
+
+def _sql_literal(value: PartitionBound) -> str:
+    if isinstance(value, bool):
+        raise ValueError("Cannot partition a read on a boolean column")
+    if isinstance(value, int | float):
+        return repr(value)
+    if isinstance(value, datetime):
+        return f"'{value.isoformat(sep=' ')}'"
+    if isinstance(value, date):
+        return f"'{value.isoformat()}'"
+    raise ValueError(f"Cannot partition a read on values of type {type(value).__name__}; use a numeric or date column")
+
+
+def _bound_kind(value: PartitionBound) -> str | None:
+    """The kind of partition bound *value* is, or None when a read cannot be cut on it."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int | float | Decimal):
+        return "number"
+    if isinstance(value, datetime):
+        return "datetime"
+    if isinstance(value, date):
+        return "date"
+    return None
+
+
+def _cut_points(lower: PartitionBound, upper: PartitionBound, n: int) -> list[PartitionBound]:
+    """The ``n - 1`` evenly spaced cuts between the bounds, without duplicates."""
+    if isinstance(lower, Decimal) or isinstance(upper, Decimal):
+        lower, upper = float(lower), float(upper)
+    if upper <= lower:
+        return []
+    span = upper - lower
+    # Integers and dates cut on whole units, so no cut lands between two possible values.
+    whole_units = not isinstance(lower, float | datetime) and not isinstance(upper, float | datetime)
+    cuts = [lower + (span * i // n if whole_units else span * i / n) for i in range(1, n)]
+    return sorted({c for c in cuts if lower < c <= upper})
+
+
+def partition_queries(
+    query: str, partitioning: DbReadPartitioning, lower: PartitionBound, upper: PartitionBound
+) -> list[str]:
+    """Range sub-queries of *query* on the partition column that together return every row."""
+    kind = _bound_kind(lower)
+    if kind is None or kind != _bound_kind(upper):
+        raise ValueError(
+            f"Cannot partition a read on column '{partitioning.column}' with "
+            f"{type(lower).__name__} and {type(upper).__name__} bounds; "
+            "use a numeric, date or datetime column"
+        )
+    cuts = [_sql_literal(c) for c in _cut_points(lower, upper, partitioning.num_partitions)]
+    if not cuts:
+        return [query]
+    col = partitioning.column
+    conditions = [f"{col} < {cuts[0]} OR {col} IS NULL"]
+    conditions += [f"{col} >= {lo} AND {col} < {hi}" for lo, hi in zip(cuts, cuts[1:], strict=False)]
+    conditions.append(f"{col} >= {cuts[-1]}")
+    # No AS before the alias: Oracle rejects it, every other dialect accepts both forms.
+    return [f"SELECT * FROM ({query}) __ff_part WHERE {condition}" for condition in conditions]
+
+
+def read_sql_partitioned(
+    query: str,
+    uri: str,
+    logger: logging.Logger,
+    partitioning: DbReadPartitioning,
+    *,
+    database_type: str | None = None,
+    cancel_check: Callable[[], bool] | None = None,
+) -> Iterator[pl.DataFrame]:
+    """Read *query* as concurrent range partitions, yielding each one as it arrives.
+
+    Every partition goes through the dialect's own read strategy (``shared.db_dialects.read_sql``),
+    so each one keeps the connectorx/SQLAlchemy hedging and cancel semantics of a single read.
+    """
+    from shared.db_dialects import read_sql
+
+    def read(q: str) -> pl.DataFrame:
+        return read_sql(q, uri, logger, database_type=database_type, cancel_check=cancel_check)
+
+    lower, upper = partitioning.lower_bound, partitioning.upper_bound
+    if lower is None or upper is None:
+        col = partitioning.column
+        min_value, max_value = read(f"SELECT MIN({col}) AS lo, MAX({col}) AS hi FROM ({query}) __ff_bounds").row(0)
+        lower = min_value if lower is None else lower
+        upper = max_value if upper is None else upper
+    queries = [query] if lower is None or upper is None else partition_queries(query, partitioning, lower, upper)
+    logger.info(
+        "Reading %d partitions on %s, %d at a time",
+        len(queries),
+        partitioning.column,
+        min(partitioning.max_concurrency, len(queries)),
+    )
+
+    max_workers = min(partitioning.max_concurrency, len(queries))
+    pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="db-read-partition")
+    pending = iter(queries)
+    # A bounded window of in-flight reads: a partition is dropped from it once yielded, so
+    # only the partitions being read or not yet consumed are held in memory.
+    in_flight = {pool.submit(read, q) for q in islice(pending, max_workers)}
+    try:
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            while done:
+                in_flight.update(pool.submit(read, q) for q in islice(pending, 1))
+                # No local keeps the future (and its DataFrame) once the caller has it.
+                yield done.pop().result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def write_partitions_ipc(partitions: Iterable[pl.DataFrame], path: str) -> int:
+    """Stream *partitions* into one Arrow IPC file and return its row count.
+
+    The first partition fixes the file's schema and later ones are cast to it. Partitions
+    with an all-null (``pl.Null``) column are held back and written last, so a sparse
+    partition does not decide that column's type.
+    """
+    sink: pa.OSFile | None = None
+    writer: pa.ipc.RecordBatchFileWriter | None = None
+    schema: pl.Schema | None = None
+    held_back: list[pl.DataFrame] = []
+    rows = 0
+
+    def write(df: pl.DataFrame) -> None:
+        nonlocal sink, writer, schema
+        if writer is None:
+            schema = df.schema
+            sink = pa.OSFile(path, "wb")
+            writer = pa.ipc.new_file(sink, df.to_arrow().schema)
+        else:
+            df = df.select(pl.col(name).cast(dtype) for name, dtype in schema.items())
+        writer.write_table(df.to_arrow())
+
+    try:
+        for df in partitions:
+            rows += df.height
+            if pl.Null in df.dtypes:
+                held_back.append(df)
+            else:
+                write(df)
+        for df in held_back:
+            write(df)
+    finally:
+        if writer is not None:
+            writer.close()
+        if sink is not None:
+            sink.close()
+    return rows
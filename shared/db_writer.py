@@ -1,18 +1,38 @@
 """Pandas-free Polars-DataFrame -> SQL writer, shared by the worker and core.
 
-SQLite uses stdlib ``sqlite3``; other backends use SQLAlchemy Core.
+SQLite uses stdlib ``sqlite3``; other backends use SQLAlchemy Core. Rows are loaded
+in chunks of ``WRITE_CHUNK_ROWS``, one transaction per chunk, through the dialect's
+bulk path: ``COPY FROM STDIN`` for PostgreSQL, ``LOAD DATA LOCAL`` for MySQL and
+multi-row ``VALUES`` batches for SQL Server. Other dialects use an executemany insert.
+
+The merge modes (``upsert``, ``update``, ``delete``) bulk-load into a staging table
+next to the target and apply it with set-based statements in one transaction, with
+the key semantics of ``shared.delta_utils.merge_into_delta``.
 """
 
 from __future__ import annotations
 
+import io
 import json
+import os
 import sqlite3
-from collections.abc import Iterator
+import tempfile
+import uuid
+from collections.abc import Callable
+from typing import TYPE_CHECKING
 
 import polars as pl
 
 from shared.sql_utils import get_sqlalchemy_uri
 
+if TYPE_CHECKING:
+    import sqlalchemy as sa
+
+WRITE_CHUNK_ROWS: int = int(os.environ.get("FLOWFILE_DB_WRITE_CHUNK_ROWS", "100000"))
+MERGE_MODES = ("upsert", "update", "delete")
+
+ChunkLoader = Callable[["sa.Connection", "sa.Table", pl.DataFrame], None]
+
 
 def _quote_ident(name: str) -> str:
     return '"' + name.replace('"', '""') + '"'
@@ -58,16 +78,22 @@ def _sqlite_table_exists(conn: sqlite3.Connection, schema: str | None, table: st
     return cur.fetchone() is not None
 
 
-def _iter_sqlite_rows(df: pl.DataFrame, nested_idx: list[int]) -> Iterator[tuple]:
-    if not nested_idx:
-        yield from df.iter_rows()
-        return
-    nested = set(nested_idx)
-    for row in df.iter_rows():
-        yield tuple(
-            json.dumps(value, default=str) if i in nested and value is not None else value
-            for i, value in enumerate(row)
-        )
+def _json_text(series: pl.Series) -> pl.Series:
+    # ``to_list`` turns lists and structs into plain Python values; ``map_elements``
+    # would hand list elements over as Series.
+    values = [None if value is None else json.dumps(value, default=str) for value in series.to_list()]
+    return pl.Series(series.name, values, dtype=pl.String)
+
+
+def _encode_text_columns(df: pl.DataFrame) -> pl.DataFrame:
+    """Nested values as JSON text and durations as text: the form every backend stores them in."""
+    encoded = []
+    for name, dtype in df.schema.items():
+        if dtype.is_nested():
+            encoded.append(_json_text(df[name]))
+        elif isinstance(dtype, pl.Duration):
+            encoded.append(pl.col(name).cast(pl.String))
+    return df.with_columns(encoded) if encoded else df
 
 
 def _write_df_to_sqlite(df: pl.DataFrame, uri: str, table_name: str, if_exists: str) -> None:
@@ -75,8 +101,7 @@ def _write_df_to_sqlite(df: pl.DataFrame, uri: str, table_name: str, if_exists:
     schema, table = _split_identifier(table_name)
     qualified = f"{_quote_ident(schema)}.{_quote_ident(table)}" if schema else _quote_ident(table)
 
-    df = _coerce_for_sqlite(df)
-    nested_idx = [i for i, dtype in enumerate(df.dtypes) if dtype.is_nested()]
+    df = _encode_text_columns(_coerce_for_sqlite(df))
     column_defs = ", ".join(f"{_quote_ident(name)} {_sqlite_affinity(dtype)}" for name, dtype in df.schema.items())
     column_list = ", ".join(_quote_ident(name) for name in df.columns)
     placeholders = ", ".join(["?"] * df.width)
@@ -85,14 +110,20 @@ def _write_df_to_sqlite(df: pl.DataFrame, uri: str, table_name: str, if_exists:
     try:
         if if_exists == "fail" and _sqlite_table_exists(conn, schema, table):
             raise ValueError(f"Table '{table_name}' already exists")
-        if if_exists == "replace":
+        replace = if_exists == "replace"
+        if replace:
+            # SQLite DDL is transactional: drop, create and load as one, so a failed chunk keeps the old table.
+            conn.execute("BEGIN")
             conn.execute(f"DROP TABLE IF EXISTS {qualified}")
         create = "CREATE TABLE IF NOT EXISTS" if if_exists == "append" else "CREATE TABLE"
         conn.execute(f"{create} {qualified} ({column_defs})")
-        conn.executemany(
-            f"INSERT INTO {qualified} ({column_list}) VALUES ({placeholders})",
-            _iter_sqlite_rows(df, nested_idx),
-        )
+        if not replace:
+            conn.commit()
+        insert = f"INSERT INTO {qualified} ({column_list}) VALUES ({placeholders})"
+        for chunk in df.iter_slices(WRITE_CHUNK_ROWS):
+            conn.executemany(insert, chunk.iter_rows())
+            if not replace:
+                conn.commit()
         conn.commit()
     finally:
         conn.close()
@@ -118,42 +149,222 @@ def _sqlalchemy_column_type(sa, dtype: pl.DataType):
     return sa.Text()
 
 
-def _text_encoders(df: pl.DataFrame) -> dict:
-    encoders = {}
-    for name, dtype in df.schema.items():
-        if dtype.is_nested():
-            encoders[name] = lambda value: json.dumps(value, default=str)
-        elif isinstance(dtype, pl.Duration):
-            encoders[name] = str
-    return encoders
+def insert_rows(conn: sa.Connection, sql_table: sa.Table, df: pl.DataFrame) -> None:
+    """The portable chunk loader: one executemany insert."""
+    if df.height:
+        conn.execute(sql_table.insert(), df.to_dicts())
+
+
+def insert_values_batches(conn: sa.Connection, sql_table: sa.Table, df: pl.DataFrame, max_params: int) -> None:
+    """Load as multi-row ``INSERT ... VALUES`` statements of at most *max_params* bound values.
 
+    For drivers whose executemany is one round trip per row.
+    """
+    rows_per_statement = max(1, min(1000, max_params // max(df.width, 1)))
+    for batch in df.iter_slices(rows_per_statement):
+        conn.execute(sql_table.insert().values(batch.to_dicts()))
+
+
+def to_csv_bytes(df: pl.DataFrame, null_value: str, **kwargs) -> bytes:
+    """*df* as header-less CSV where only nulls are unquoted non-numbers, so they cannot be confused."""
+    buffer = io.BytesIO()
+    df.write_csv(buffer, include_header=False, null_value=null_value, quote_style="non_numeric", **kwargs)
+    return buffer.getvalue()
+
+
+def copy_rows_postgres(conn: sa.Connection, sql_table: sa.Table, df: pl.DataFrame) -> None:
+    """Stream *df* into the table with ``COPY ... FROM STDIN`` (CSV)."""
+    if not df.height:
+        return
+    preparer = conn.dialect.identifier_preparer
+    columns = ", ".join(preparer.quote(name) for name in df.columns)
+    statement = f"COPY {preparer.format_table(sql_table)} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+    # bytea takes hex text input.
+    df = df.with_columns(
+        pl.concat_str(pl.lit("\\x"), pl.col(name).bin.encode("hex"))
+        for name, dtype in df.schema.items()
+        if dtype == pl.Binary
+    )
+    data = to_csv_bytes(df, null_value="\\N", time_format="%H:%M:%S%.6f")
+    cursor = conn.connection.cursor()
+    try:
+        if hasattr(cursor, "copy_expert"):  # psycopg2
+            cursor.copy_expert(statement, io.BytesIO(data))
+        else:  # psycopg 3
+            with cursor.copy(statement) as copy:
+                copy.write(data)
+    finally:
+        cursor.close()
+
+
+def load_data_local_mysql(conn: sa.Connection, sql_table: sa.Table, df: pl.DataFrame) -> None:
+    """Load *df* with ``LOAD DATA LOCAL INFILE`` from a temporary CSV file.
+
+    Needs ``local_infile`` enabled on both the client connection and the server.
+    """
+    if not df.height:
+        return
+    preparer = conn.dialect.identifier_preparer
+    columns = ", ".join(preparer.quote(name) for name in df.columns)
+    # MySQL stores booleans as TINYINT and reads quoted "true" as 0.
+    df = df.with_columns(pl.col(pl.Boolean).cast(pl.Int8))
+    fd, path = tempfile.mkstemp(suffix=".csv")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(
+                to_csv_bytes(df, null_value="NULL", datetime_format="%Y-%m-%d %H:%M:%S%.6f", time_format="%H:%M:%S%.6f")
+            )
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute(
+                f"LOAD DATA LOCAL INFILE %s INTO TABLE {preparer.format_table(sql_table)} "
+                "CHARACTER SET utf8mb4 FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '' "
+                f"LINES TERMINATED BY '\\n' ({columns})",
+                (path,),
+            )
+        finally:
+            cursor.close()
+    finally:
+        os.remove(path)
+
+
+def _write_df_via_sqlalchemy_core(
+    df: pl.DataFrame,
+    uri: str,
+    table_name: str,
+    if_exists: str,
+    load_chunk: ChunkLoader = insert_rows,
+    connect_args: dict | None = None,
+    chunk_rows: int | None = None,
+) -> None:
+    """Create the table, then load *df* with *load_chunk*, one transaction per chunk.
 
-def _write_df_via_sqlalchemy_core(df: pl.DataFrame, uri: str, table_name: str, if_exists: str) -> None:
+    A failed chunk rolls back alone; the chunks before it stay committed. ``replace`` loads
+    into a staging table and swaps it in only once every chunk is in, so a failed load
+    leaves the old table as it was.
+    """
     import sqlalchemy as sa
 
     schema, table = _split_identifier(table_name)
-    engine = sa.create_engine(get_sqlalchemy_uri(uri))
+    engine = sa.create_engine(get_sqlalchemy_uri(uri), connect_args=connect_args or {})
     try:
         columns = [sa.Column(name, _sqlalchemy_column_type(sa, dtype)) for name, dtype in df.schema.items()]
-        sql_table = sa.Table(table, sa.MetaData(), *columns, schema=schema)
         exists = sa.inspect(engine).has_table(table, schema=schema)
         if if_exists == "fail" and exists:
             raise ValueError(f"Table '{table_name}' already exists")
-        encoders = _text_encoders(df)
+        if if_exists == "replace":
+            stage = sa.Table(f"_ff_stage_{uuid.uuid4().hex[:12]}", sa.MetaData(), *columns, schema=schema)
+            with engine.begin() as conn:
+                stage.create(conn)
+            try:
+                _load_chunks(engine, stage, df, load_chunk, chunk_rows)
+                with engine.begin() as conn:
+                    if exists:
+                        sa.Table(table, sa.MetaData(), schema=schema).drop(conn)
+                    _rename_table(conn, stage, table)
+            except BaseException:
+                with engine.begin() as conn:
+                    stage.drop(conn, checkfirst=True)
+                raise
+            return
+        sql_table = sa.Table(table, sa.MetaData(), *columns, schema=schema)
         with engine.begin() as conn:
-            if if_exists == "replace" and exists:
-                sql_table.drop(conn)
             sql_table.create(conn, checkfirst=(if_exists == "append"))
-            for batch in df.iter_slices(50_000):
-                rows = batch.to_dicts()
-                for row in rows:
-                    for name, encode in encoders.items():
-                        if row[name] is not None:
-                            row[name] = encode(row[name])
-                if rows:
-                    conn.execute(sql_table.insert(), rows)
+        _load_chunks(engine, sql_table, df, load_chunk, chunk_rows)
+    finally:
+        engine.dispose()
+
+
+def _rename_table(conn: sa.Connection, sql_table: sa.Table, new_name: str) -> None:
+    """Rename *sql_table* to *new_name*, keeping its schema."""
+    import sqlalchemy as sa
+
+    preparer = conn.dialect.identifier_preparer
+    if conn.dialect.name == "mssql":
+        old_name = f"{sql_table.schema}.{sql_table.name}" if sql_table.schema else sql_table.name
+        conn.execute(sa.text("EXEC sp_rename :old_name, :new_name"), {"old_name": old_name, "new_name": new_name})
+        return
+    conn.execute(sa.text(f"ALTER TABLE {preparer.format_table(sql_table)} RENAME TO {preparer.quote(new_name)}"))
+
+
+def _load_chunks(engine: sa.Engine, sql_table: sa.Table, df: pl.DataFrame, load_chunk: ChunkLoader, chunk_rows) -> None:
+    for chunk in _encode_text_columns(df).iter_slices(chunk_rows or WRITE_CHUNK_ROWS):
+        with engine.begin() as conn:
+            load_chunk(conn, sql_table, chunk)
+
+
+def validate_merge(df: pl.DataFrame, merge_mode: str, merge_keys: list[str] | None) -> None:
+    """Reject merges without usable keys, and upserts/updates with duplicate source keys."""
+    if merge_mode not in MERGE_MODES:
+        raise ValueError(f"Unknown merge mode: {merge_mode}")
+    if not merge_keys:
+        raise ValueError(f"merge_keys is required when writing with mode '{merge_mode}'")
+    missing = [k for k in merge_keys if k not in df.columns]
+    if missing:
+        raise ValueError(f"merge_keys not found in the data: {missing}")
+    if merge_mode != "delete" and df.select(pl.struct(merge_keys).is_duplicated().any()).item():
+        raise ValueError(f"Rows to {merge_mode} contain duplicate keys on {merge_keys}")
+
+
+def _merge_statements(target: sa.Table, stage: sa.Table, merge_mode: str, merge_keys: list[str]) -> list:
+    import sqlalchemy as sa
+
+    matches = sa.and_(*(target.c[k] == stage.c[k] for k in merge_keys))
+    if merge_mode == "delete":
+        return [sa.delete(target).where(sa.exists().where(matches))]
+    statements = []
+    values = {name: stage.c[name] for name in stage.c.keys() if name not in merge_keys}
+    if values:
+        # Renders as UPDATE ... FROM, or a multi-table UPDATE on MySQL.
+        statements.append(sa.update(target).values(values).where(matches))
+    if merge_mode == "upsert":
+        columns = list(stage.c.keys())
+        new_rows = sa.select(*stage.c).where(~sa.exists().where(matches))
+        statements.append(sa.insert(target).from_select(columns, new_rows))
+    return statements
+
+
+def _merge_df_via_sqlalchemy_core(
+    df: pl.DataFrame,
+    uri: str,
+    table_name: str,
+    merge_mode: str,
+    merge_keys: list[str],
+    load_chunk: ChunkLoader = insert_rows,
+    connect_args: dict | None = None,
+    chunk_rows: int | None = None,
+) -> bool:
+    """Merge *df* into the existing table on *merge_keys*; ``False`` when the table does not exist.
+
+    The rows are bulk-loaded with *load_chunk* into a staging table in the target's schema,
+    then applied in one transaction; the staging table is always dropped afterwards.
+    """
+    import sqlalchemy as sa
+
+    schema, table = _split_identifier(table_name)
+    engine = sa.create_engine(get_sqlalchemy_uri(uri), connect_args=connect_args or {})
+    try:
+        if not sa.inspect(engine).has_table(table, schema=schema):
+            return False
+        target = sa.Table(table, sa.MetaData(), autoload_with=engine, schema=schema)
+        missing = [name for name in df.columns if name not in target.c]
+        if missing:
+            raise ValueError(f"Columns not in table '{table_name}': {missing}")
+        columns = [sa.Column(name, _sqlalchemy_column_type(sa, dtype)) for name, dtype in df.schema.items()]
+        stage = sa.Table(f"_ff_stage_{uuid.uuid4().hex[:12]}", sa.MetaData(), *columns, schema=schema)
+        with engine.begin() as conn:
+            stage.create(conn)
+        try:
+            _load_chunks(engine, stage, df, load_chunk, chunk_rows)
+            with engine.begin() as conn:
+                for statement in _merge_statements(target, stage, merge_mode, merge_keys):
+                    conn.execute(statement)
+        finally:
+            with engine.begin() as conn:
+                stage.drop(conn, checkfirst=True)
     finally:
         engine.dispose()
+    return True
 
 
 def write_dataframe_to_database(
@@ -163,10 +374,21 @@ def write_dataframe_to_database(
     uri: str,
     table_name: str,
     if_exists: str = "append",
+    merge_keys: list[str] | None = None,
 ) -> None:
     """Write ``df`` to ``table_name``. ``uri`` is a base URI (``sqlite:///<path>`` or
-    a base scheme; the SQLAlchemy driver suffix is applied internally)."""
+    a base scheme; the SQLAlchemy driver suffix is applied internally).
+
+    ``if_exists`` is ``append``/``replace``/``fail``, or one of the merge modes on
+    ``merge_keys``: ``upsert`` (update matching rows, insert the rest), ``update``
+    (matching rows only) or ``delete`` (remove matching rows). A merge into a missing
+    table creates it, holding the rows only for ``upsert``."""
     from shared.db_dialects import get_dialect_or_generic
 
     if_exists = if_exists or "append"
-    get_dialect_or_generic(database_type).write(df, uri=uri, table_name=table_name, if_exists=if_exists)
+    dialect = get_dialect_or_generic(database_type)
+    if if_exists in MERGE_MODES:
+        validate_merge(df, if_exists, merge_keys)
+        dialect.merge(df, uri=uri, table_name=table_name, merge_mode=if_exists, merge_keys=merge_keys)
+    else:
+        dialect.write(df, uri=uri, table_name=table_name, if_exists=if_exists)
@@ -8,7 +8,10 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import os
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -16,6 +19,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     import polars as pl
+    from deltalake import DeltaTable
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +60,192 @@ def format_delta_timestamp(ts: object) -> str | None:
     return str(ts)
 
 
+# Delta snapshot cache
+
+# Upper bound on cached table handles (0 disables the cache) and how long a
+# handle is trusted before it is reopened from scratch.
+DELTA_CACHE_MAX_TABLES: int = int(os.environ.get("FLOWFILE_DELTA_CACHE_SIZE", "64"))
+DELTA_CACHE_TTL_SECONDS: float = float(os.environ.get("FLOWFILE_DELTA_CACHE_TTL_SECONDS", "600"))
+
+
+def _table_uri(path: str | Path) -> str:
+    """Normalise *path* so the same table always maps to the same cache key."""
+    value = str(path)
+    if "://" in value:
+        return value.rstrip("/")
+    return os.path.abspath(value)
+
+
+def _open_delta(
+    path: str | Path, version: int | None, storage_options: dict[str, str] | None, without_files: bool
+) -> DeltaTable:
+    from deltalake import DeltaTable
+
+    return DeltaTable(str(path), version=version, storage_options=storage_options, without_files=without_files)
+
+
+def _commit_stamp(uri: str, version: int) -> tuple[int, int] | None:
+    """Identity of a local table's commit file for *version*; ``None`` for object storage or a missing file."""
+    if "://" in uri:
+        return None
+    try:
+        stat = os.stat(os.path.join(uri, "_delta_log", f"{version:020d}.json"))
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns
+
+
+@dataclass
+class _CachedDeltaTable:
+    table: DeltaTable
+    opened_at: float
+    stamp: tuple[int, int] | None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class DeltaTableCache:
+    """Open ``DeltaTable`` handles keyed by table URI, storage options and version.
+
+    Opening a table lists its ``_delta_log`` and replays it from the last
+    checkpoint; on object storage that dominates every metadata read, so repeated
+    opens of the same table share one handle:
+
+    - A pinned *version* is an immutable snapshot and is reused as is.
+    - The latest snapshot (``version=None``) is brought up to date on every lookup
+      with ``update_incremental``, which reads only the commits after the cached
+      version. A version probe therefore stays exact and costs one log listing.
+    - A metadata-only lookup (``without_files=True``) is served by a cached handle
+      with files when there is one.
+    - An incremental update cannot notice a table that was deleted or re-created
+      at the same location. Local handles check that their commit file is still
+      the one they read (one ``stat``); object-storage handles are reopened after
+      ``ttl_seconds``, and :meth:`invalidate` drops a table's handles right away.
+
+    Handles are shared between threads, so callers must only read from them;
+    writers open their own. A latest-snapshot handle advances in place, so pin a
+    version when several calls must see the same snapshot.
+    """
+
+    def __init__(self, max_tables: int = DELTA_CACHE_MAX_TABLES, ttl_seconds: float = DELTA_CACHE_TTL_SECONDS):
+        self.max_tables = max_tables
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple, _CachedDeltaTable] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        path: str | Path,
+        *,
+        version: int | None = None,
+        storage_options: dict[str, str] | None = None,
+        without_files: bool = False,
+    ) -> DeltaTable:
+        if self.max_tables <= 0:
+            return _open_delta(path, version, storage_options, without_files)
+
+        uri = _table_uri(path)
+        options = tuple(sorted((storage_options or {}).items()))
+        keys = [(uri, options, version, False)]
+        if without_files:
+            keys.append((uri, options, version, True))
+
+        now = time.monotonic()
+        entry: _CachedDeltaTable | None = None
+        with self._lock:
+            for key in keys:
+                candidate = self._entries.get(key)
+                if candidate is None:
+                    continue
+                if now - candidate.opened_at > self.ttl_seconds:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                entry = candidate
+                break
+
+        if entry is not None:
+            with entry.lock:
+                table = entry.table
+                if entry.stamp is not None and _commit_stamp(uri, table.version()) != entry.stamp:
+                    entry = None
+                elif version is None:
+                    try:
+                        table.update_incremental()
+                        entry.stamp = _commit_stamp(uri, table.version())
+                    except Exception:
+                        logger.debug("Incremental log update of %s failed, reopening", uri, exc_info=True)
+                        entry = None
+            if entry is not None:
+                return table
+            self.invalidate(path)
+
+        table = _open_delta(path, version, storage_options, without_files)
+        with self._lock:
+            self._entries[keys[-1]] = _CachedDeltaTable(
+                table=table, opened_at=now, stamp=_commit_stamp(uri, table.version())
+            )
+            self._entries.move_to_end(keys[-1])
+            while len(self._entries) > self.max_tables:
+                self._entries.popitem(last=False)
+        return table
+
+    def invalidate(self, path: str | Path | None = None) -> None:
+        """Drop the cached handles of the table at *path* (every table when ``None``)."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+            uri = _table_uri(path)
+            for key in [key for key in self._entries if key[0] == uri]:
+                del self._entries[key]
+
+
+_delta_tables = DeltaTableCache()
+
+
+def open_delta_table(
+    path: str | Path,
+    *,
+    version: int | None = None,
+    storage_options: dict[str, str] | None = None,
+    without_files: bool = False,
+) -> DeltaTable:
+    """A shared, read-only ``DeltaTable`` for *path* from the process-wide cache.
+
+    See :class:`DeltaTableCache`. Raises like ``DeltaTable`` when the table (or
+    the requested *version*) cannot be loaded.
+    """
+    return _delta_tables.get(path, version=version, storage_options=storage_options, without_files=without_files)
+
+
+def get_delta_version(path: str | Path, storage_options: dict[str, str] | None = None) -> int:
+    """Current version of the Delta table at *path*, metadata-only and from the cached log."""
+    return open_delta_table(path, storage_options=storage_options, without_files=True).version()
+
+
+def invalidate_delta_table(path: str | Path | None = None) -> None:
+    """Forget the cached handles of *path* after deleting or re-creating the table there."""
+    _delta_tables.invalidate(path)
+
+
+def scan_delta_table(
+    path: str | Path,
+    *,
+    version: int | None = None,
+    storage_options: dict[str, str] | None = None,
+) -> pl.LazyFrame:
+    """``pl.scan_delta`` of *path*, reusing the cached log for local tables.
+
+    Object-storage tables are still scanned by URI: polars opens their log itself
+    so it can hand the same *storage_options* to the data file reads.
+    """
+    import polars as pl_
+
+    if storage_options is not None:
+        return pl_.scan_delta(str(path), version=version, storage_options=storage_options)
+    return pl_.scan_delta(open_delta_table(path, version=version))
+
+
 # Delta table size
 
 
@@ -68,10 +258,8 @@ def get_delta_size_bytes(path: str | Path, storage_options: dict[str, str] | Non
     Falls back to filesystem scanning if the delta log can't be read (local only; an
     unreadable object-storage log yields ``0``).
     """
-    from deltalake import DeltaTable
-
     try:
-        dt = DeltaTable(str(path), storage_options=storage_options)
+        dt = open_delta_table(path, storage_options=storage_options)
         add_actions = dt.get_add_actions(flatten=True)
         size_col = add_actions.column("size_bytes")
         return sum(v for v in size_col.to_pylist() if v is not None)
@@ -232,6 +420,9 @@ def write_delta(
         df.sink_delta(output_path, **write_kwargs)
     else:
         df.write_delta(output_path, **write_kwargs)
+    if mode == "error":
+        # A new table: handles cached for an earlier table at this location are stale.
+        invalidate_delta_table(output_path)
     return True
 
 
@@ -287,6 +478,7 @@ def merge_into_delta(
             df.clear().write_delta(output_path, mode="error", delta_write_options=create_opts, **create_kwargs)
         else:
             df.write_delta(output_path, mode="error", delta_write_options=create_opts, **create_kwargs)
+        invalidate_delta_table(output_path)
     else:
         if partition_by:
             logger.warning("Ignoring partition_by on merge into existing table: Delta partitioning is immutable")
@@ -450,7 +642,6 @@ def apply_delta_edits(
     refreshed table metadata (``schema``, ``row_count``, ``column_count``, ``size_bytes``).
     """
     import polars as pl_
-    from deltalake import DeltaTable
 
     dt = _open_delta_or_none(table_path, storage_options)
     if dt is None:
@@ -513,7 +704,7 @@ def apply_delta_edits(
 
     # Re-read before the first commit: the scans above leave a window a concurrent editor can commit in.
     if expected_version is not None:
-        latest = DeltaTable(table_path, without_files=True, storage_options=storage_options).version()
+        latest = get_delta_version(table_path, storage_options=storage_options)
         if latest != current_version:
             raise DeltaEditStaleError(expected=expected_version, current=latest)
 
@@ -552,13 +743,13 @@ def apply_delta_edits(
         )
         rows_deleted = deletes.height
 
-    refreshed = pl_.scan_delta(table_path, storage_options=storage_options)
+    refreshed = scan_delta_table(table_path, storage_options=storage_options)
     schema = dict(refreshed.collect_schema())
     row_count = int(refreshed.select(pl_.len()).collect().item())
     return {
         "rows_upserted": rows_upserted,
         "rows_deleted": rows_deleted,
-        "new_version": DeltaTable(table_path, without_files=True, storage_options=storage_options).version(),
+        "new_version": get_delta_version(table_path, storage_options=storage_options),
         "schema": [{"name": name, "dtype": str(dtype)} for name, dtype in schema.items()],
         "row_count": row_count,
         "column_count": len(schema),
@@ -579,7 +770,6 @@ def add_delta_row_id_column(
     where it runs (worker child in offload mode, in-process otherwise).
     """
     import polars as pl_
-    from deltalake import DeltaTable
 
     dt = _open_delta_or_none(table_path, storage_options)
     if dt is None:
@@ -596,14 +786,14 @@ def add_delta_row_id_column(
     df = df.with_row_index(column_name, offset=1).with_columns(pl_.col(column_name).cast(pl_.Int64))
     # Re-check right before the overwrite: a commit that landed while we collected
     # would otherwise be silently erased by the full rewrite.
-    latest = DeltaTable(table_path, without_files=True, storage_options=storage_options).version()
+    latest = get_delta_version(table_path, storage_options=storage_options)
     if latest != current_version:
         raise DeltaEditStaleError(expected=current_version, current=latest)
     write_delta(df, table_path, mode="overwrite", storage_options=storage_options)
 
     schema = df.schema
     return {
-        "new_version": DeltaTable(table_path, without_files=True, storage_options=storage_options).version(),
+        "new_version": get_delta_version(table_path, storage_options=storage_options),
         "schema": [{"name": name, "dtype": str(dtype)} for name, dtype in schema.items()],
         "row_count": df.height,
         "column_count": len(schema),
@@ -1251,10 +1441,10 @@ def _scd2_once(
 
 def get_delta_partition_columns(path: str | Path, storage_options: dict[str, str] | None = None) -> list[str]:
     """Return the partition columns of a Delta table, or ``[]`` if unpartitioned/unreadable."""
-    from deltalake import DeltaTable
-
     try:
-        return list(DeltaTable(str(path), storage_options=storage_options).metadata().partition_columns)
+        return list(
+            open_delta_table(path, storage_options=storage_options, without_files=True).metadata().partition_columns
+        )
     except Exception:
         logger.warning("Failed to read partition columns from %s", path, exc_info=True)
         return []
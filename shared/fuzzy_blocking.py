@@ -0,0 +1,306 @@
+"""Candidate blocking for fuzzy joins, shared by the worker and core.
+
+Without blocking, ``fuzzy_match_dfs`` scores every left value against every right value.
+With blocking, each row is first assigned one or more block keys, then:
+
+1. Left rows are sorted (exact keys, then the normalised match text) and cut into
+   chunks of ``chunk_size`` rows.
+2. Each chunk is scored against the union of the right rows that share a block with
+   any row in the chunk. This is a normal ``fuzzy_match_dfs`` call, so scoring,
+   thresholds and output columns do not change.
+3. Chunks run on a thread pool. Polars releases the GIL, so the chunks use all cores.
+
+Block keys:
+
+- ``exact_keys``: equal values are required; the matches are also filtered on them.
+- ``method="lsh"``: MinHash over character q-grams of the first fuzzy mapping, in
+  ``num_bands`` bands of ``rows_per_band`` hashes. Buckets with more than
+  ``max_bucket_size`` right rows (very common q-gram sets) are skipped.
+- ``method="sorted_neighbourhood"``: both sides are sorted on the match text. Each row
+  lands in two overlapping windows of ``window_size`` rows.
+
+LSH and sorted neighbourhood only choose which pairs get scored. A pair they miss is
+lost, but every returned pair still met the mapping thresholds.
+
+The right side's LSH blocks are kept in ``FUZZY_INDEX_DIR``. They are keyed on the
+blocking settings and a fingerprint of the right blocking columns, so a run whose right
+input did not change reuses them instead of hashing again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+import polars as pl
+from pydantic import BaseModel
+
+from shared.storage_config import storage
+
+if TYPE_CHECKING:
+    from pl_fuzzy_frame_match.models import FuzzyMapping
+
+FUZZY_INDEX_DIR = storage.cache_directory / "fuzzy_index"
+_MAX_INDEX_FILES = 64
+
+LEFT_KEY_PREFIX = "__ff_block_left_"
+RIGHT_KEY_PREFIX = "__ff_block_right_"
+_ID = "__ff_row_id"
+_BLOCK = "__ff_block"
+_CHUNK = "__ff_chunk"
+_TEXT = "__ff_text"
+_EXACT = "__ff_exact"
+_POS = "__ff_pos"
+_SIDE = "__ff_side"
+
+_log = logging.getLogger(__name__)
+# fuzzy_match_dfs logs every step; one chunk of thousands would flood the node log.
+_chunk_logger = logging.getLogger("shared.fuzzy_blocking.chunk")
+_chunk_logger.setLevel(logging.WARNING)
+
+
+class BlockingKey(BaseModel):
+    """A pair of columns whose values must be equal for two rows to be compared."""
+
+    left_col: str
+    right_col: str
+
+
+class FuzzyBlocking(BaseModel):
+    """Candidate generation settings for a fuzzy join; the default compares every pair."""
+
+    method: Literal["none", "lsh", "sorted_neighbourhood"] = "none"
+    exact_keys: list[BlockingKey] = []
+    qgram_size: int = 3
+    num_bands: int = 20
+    rows_per_band: int = 3
+    max_bucket_size: int = 2000
+    window_size: int = 100
+    chunk_size: int = 2000
+    max_workers: int | None = None
+    persist_index: bool = True
+
+    @property
+    def enabled(self) -> bool:
+        return self.method != "none" or bool(self.exact_keys)
+
+    def index_digest(self) -> str:
+        """Digest of the settings the right-side index depends on."""
+        settings = self.model_dump_json(include={"method", "exact_keys", "qgram_size", "num_bands", "rows_per_band"})
+        return hashlib.sha256(settings.encode()).hexdigest()[:16]
+
+
+def block_key_selects(blocking: FuzzyBlocking | None) -> tuple[list[pl.Expr], list[pl.Expr]]:
+    """Expressions that carry the exact blocking keys through column selection and renaming."""
+    if blocking is None:
+        return [], []
+    return (
+        [pl.col(k.left_col).alias(f"{LEFT_KEY_PREFIX}{i}") for i, k in enumerate(blocking.exact_keys)],
+        [pl.col(k.right_col).alias(f"{RIGHT_KEY_PREFIX}{i}") for i, k in enumerate(blocking.exact_keys)],
+    )
+
+
+def _key_columns(df: pl.DataFrame, prefix: str) -> list[str]:
+    return [c for c in df.columns if c.startswith(prefix)]
+
+
+def _normalised_text(col: str) -> pl.Expr:
+    return pl.col(col).cast(pl.String).str.to_lowercase().str.strip_chars()
+
+
+def _blocking_frame(df: pl.DataFrame, text_col: str, key_cols: list[str]) -> pl.DataFrame:
+    """(id, exact-key hash, normalised text) per row; rows with a null key or text are dropped."""
+    exact = pl.struct(key_cols).hash() if key_cols else pl.lit(0, dtype=pl.UInt64)
+    return (
+        df.select(pl.col(_ID), exact.alias(_EXACT), _normalised_text(text_col).alias(_TEXT), *key_cols)
+        .drop_nulls()
+        .filter(pl.col(_TEXT).str.len_chars() > 0)
+        .drop(key_cols)
+    )
+
+
+def _lsh_blocks(frame: pl.DataFrame, blocking: FuzzyBlocking) -> pl.DataFrame:
+    q = blocking.qgram_size
+    n_grams = pl.max_horizontal(pl.col(_TEXT).str.len_chars().cast(pl.Int64) - q + 1, pl.lit(1))
+    grams = (
+        frame.lazy()
+        .with_columns(pl.int_ranges(0, n_grams).alias(_POS))
+        .explode(_POS)
+        .select(pl.col(_ID), pl.col(_EXACT), pl.col(_TEXT).str.slice(pl.col(_POS), q))
+    )
+    n_hashes = blocking.num_bands * blocking.rows_per_band
+    signatures = grams.group_by(_ID, _EXACT).agg(
+        [pl.col(_TEXT).hash(seed=i).min().alias(f"{_POS}{i}") for i in range(n_hashes)]
+    )
+    r = blocking.rows_per_band
+    bands = [
+        pl.struct(_EXACT, *(f"{_POS}{b * r + j}" for j in range(r))).hash(seed=b).alias(f"{_BLOCK}{b}")
+        for b in range(blocking.num_bands)
+    ]
+    return (
+        signatures.select(_ID, *bands)
+        .unpivot(index=_ID, value_name=_BLOCK)
+        .select(_ID, _BLOCK)
+        .collect(engine="streaming")
+    )
+
+
+def _exact_blocks(frame: pl.DataFrame) -> pl.DataFrame:
+    return frame.select(_ID, pl.col(_EXACT).alias(_BLOCK))
+
+
+def _sorted_neighbourhood_blocks(
+    left: pl.DataFrame, right: pl.DataFrame, window_size: int
+) -> tuple[pl.DataFrame, pl.DataFrame]:
+    half = max(window_size // 2, 1)
+    ordered = (
+        pl.concat([left.with_columns(pl.lit(0).alias(_SIDE)), right.with_columns(pl.lit(1).alias(_SIDE))])
+        .sort(_EXACT, _TEXT)
+        .with_row_index(_POS)
+        .with_columns((pl.col(_POS) // half).cast(pl.UInt64).alias(_BLOCK))
+    )
+    # Window k covers positions [k * half, k * half + window): each row is in windows k and k - 1.
+    both = pl.concat([ordered, ordered.filter(pl.col(_BLOCK) > 0).with_columns(pl.col(_BLOCK) - 1)])
+    return (
+        both.filter(pl.col(_SIDE) == 0).select(_ID, _BLOCK),
+        both.filter(pl.col(_SIDE) == 1).select(_ID, _BLOCK),
+    )
+
+
+def _fingerprint(frame: pl.DataFrame) -> str:
+    """Fingerprint of the right side's blocking columns; row ids make it order-sensitive."""
+    digest = frame.hash_rows(seed=7).sum()
+    return f"{frame.height}-{digest}"
+
+
+def _right_blocks(right: pl.DataFrame, blocking: FuzzyBlocking, index_dir: Path | None) -> pl.DataFrame:
+    """Right-side LSH blocks, served from the persisted index when the right input did not change."""
+    index_path = None
+    if index_dir is not None and blocking.persist_index:
+        index_path = index_dir / f"{blocking.index_digest()}_{_fingerprint(right)}.arrow"
+        if index_path.exists():
+            try:
+                blocks = pl.read_ipc(index_path, memory_map=False)
+                index_path.touch()
+                return blocks
+            except Exception as e:
+                _log.warning(f"Ignoring unreadable fuzzy index {index_path}: {e}")
+    blocks = _lsh_blocks(right, blocking)
+    if index_path is not None:
+        _write_index(blocks, index_path)
+    return blocks
+
+
+def _write_index(blocks: pl.DataFrame, index_path: Path) -> None:
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = index_path.with_suffix(f".{os.getpid()}.tmp")
+        blocks.write_ipc(tmp_path)
+        os.replace(tmp_path, index_path)
+        stale = sorted(index_path.parent.glob("*.arrow"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for path in stale[_MAX_INDEX_FILES:]:
+            path.unlink(missing_ok=True)
+    except OSError as e:
+        _log.warning(f"Could not persist fuzzy index {index_path}: {e}")
+
+
+def plan_chunks(
+    left: pl.DataFrame,
+    right: pl.DataFrame,
+    left_text_col: str,
+    right_text_col: str,
+    blocking: FuzzyBlocking,
+    index_dir: Path | None = None,
+) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Assign left rows to chunks and list each chunk's candidate right rows.
+
+    *left* and *right* carry a ``__ff_row_id`` column. Returns ``(left_chunks, right_chunks)``:
+    ``(row id, chunk)`` pairs for each side. Left rows without any candidate are left out.
+    """
+    left_frame = _blocking_frame(left, left_text_col, _key_columns(left, LEFT_KEY_PREFIX))
+    right_frame = _blocking_frame(right, right_text_col, _key_columns(right, RIGHT_KEY_PREFIX))
+    if blocking.method == "sorted_neighbourhood":
+        left_blocks, right_blocks = _sorted_neighbourhood_blocks(left_frame, right_frame, blocking.window_size)
+    elif blocking.method == "lsh":
+        left_blocks, right_blocks = _lsh_blocks(left_frame, blocking), _right_blocks(right_frame, blocking, index_dir)
+        bucket_sizes = right_blocks.group_by(_BLOCK).len()
+        oversized = bucket_sizes.filter(pl.col("len") > blocking.max_bucket_size)
+        if oversized.height:
+            _log.info(f"Skipping {oversized.height} LSH buckets over {blocking.max_bucket_size}")
+            right_blocks = right_blocks.join(oversized.select(_BLOCK), on=_BLOCK, how="anti")
+    else:
+        left_blocks, right_blocks = _exact_blocks(left_frame), _exact_blocks(right_frame)
+
+    left_blocks = left_blocks.join(right_blocks.select(_BLOCK).unique(), on=_BLOCK, how="semi")
+    left_chunks = (
+        left_frame.join(left_blocks.select(_ID).unique(), on=_ID, how="semi")
+        .sort(_EXACT, _TEXT)
+        .with_row_index(_POS)
+        .select(_ID, (pl.col(_POS) // blocking.chunk_size).alias(_CHUNK))
+    )
+    right_chunks = (
+        left_blocks.join(left_chunks, on=_ID)
+        .select(_CHUNK, _BLOCK)
+        .unique()
+        .join(right_blocks, on=_BLOCK)
+        .select(_ID, _CHUNK)
+        .unique()
+    )
+    return left_chunks, right_chunks
+
+
+def _filter_exact_keys(matches: pl.DataFrame, n_keys: int) -> pl.DataFrame:
+    if n_keys:
+        matches = matches.filter(
+            *(pl.col(f"{LEFT_KEY_PREFIX}{i}") == pl.col(f"{RIGHT_KEY_PREFIX}{i}") for i in range(n_keys))
+        )
+    return matches.drop(pl.selectors.starts_with(LEFT_KEY_PREFIX, RIGHT_KEY_PREFIX))
+
+
+def blocked_fuzzy_match(
+    left_df: pl.LazyFrame | pl.DataFrame,
+    right_df: pl.LazyFrame | pl.DataFrame,
+    fuzzy_maps: Sequence[FuzzyMapping],
+    blocking: FuzzyBlocking,
+    logger: logging.Logger,
+    index_dir: Path | None = FUZZY_INDEX_DIR,
+) -> pl.DataFrame:
+    """``fuzzy_match_dfs`` that only scores the candidate pairs *blocking* produces.
+
+    The frames carry the exact blocking keys selected with ``block_key_selects``. Those
+    columns are used for blocking and filtering and are not part of the result.
+    """
+    from pl_fuzzy_frame_match import fuzzy_match_dfs
+
+    left = left_df.lazy().collect().with_row_index(_ID)
+    right = right_df.lazy().collect().with_row_index(_ID)
+    first_map = fuzzy_maps[0]
+    left_chunks, right_chunks = plan_chunks(
+        left, right, first_map.left_col, first_map.right_col, blocking, index_dir=index_dir
+    )
+    left_parts = left.join(left_chunks, on=_ID).drop(_ID).partition_by(_CHUNK, as_dict=True, include_key=False)
+    right_parts = right.join(right_chunks, on=_ID).drop(_ID).partition_by(_CHUNK, as_dict=True, include_key=False)
+    chunks = [(part, right_parts[key]) for key, part in left_parts.items() if key in right_parts]
+    candidate_pairs = sum(lp.height * rp.height for lp, rp in chunks)
+    logger.info(
+        f"Fuzzy blocking ({blocking.method}): {candidate_pairs:,} comparisons in {len(chunks)} chunks "
+        f"instead of {left.height * right.height:,}"
+    )
+    n_keys = len(blocking.exact_keys)
+
+    def match_chunk(chunk: tuple[pl.DataFrame, pl.DataFrame]) -> pl.DataFrame:
+        chunk_left, chunk_right = chunk
+        matches = fuzzy_match_dfs(chunk_left.lazy(), chunk_right.lazy(), fuzzy_maps=fuzzy_maps, logger=_chunk_logger)
+        return _filter_exact_keys(matches, n_keys)
+
+    if not chunks:
+        # Score one throw-away pair so an empty result still has the matcher's schema.
+        return match_chunk((left.drop(_ID).head(1), right.drop(_ID).head(1))).clear()
+    with ThreadPoolExecutor(max_workers=blocking.max_workers or os.cpu_count()) as executor:
+        results = list(executor.map(match_chunk, chunks))
+    return pl.concat(results, how="diagonal_relaxed")
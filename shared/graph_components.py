@@ -0,0 +1,224 @@
+"""Partitioned connected components for the graph solver node.
+
+``polars_grouper.graph_solver`` labels the components of a whole edge list in one
+in-memory call. The partitioned mode here scales past that:
+
+1. Every node gets a dense id. The edges are encoded to ids and spilled to a Parquet
+   file in the cache directory, so the edge list itself never has to fit in memory.
+2. The spilled edges are read back in chunks. Each chunk is sorted, compacted and
+   reduced to its spanning forest (one ``node -> root`` edge per non-root node) by a
+   vectorised union-find: every root is hooked onto the smallest root it touches, then
+   paths are compressed by pointer jumping until each node points at its root. Chunks
+   run on a thread pool.
+3. The chunk forests are merged with the same union-find. They are folded whenever they
+   outgrow the node count, so the merge holds at most about two edges per node.
+
+With a state table, labels persist between runs. Edges whose endpoints already share a
+component are dropped before step 2, and the previous components join the merge as their
+forest, so a run only does work for new edges. Components keep their previous label (the
+smallest, when components merge); new components get new labels. The state only grows:
+removing edges never splits a persisted component.
+"""
+
+from __future__ import annotations
+
+import os
+import uuid
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+import polars as pl
+import pyarrow.parquet as pq
+
+from shared.storage_config import storage
+
+GRAPH_STATE_DIR = storage.cache_directory / "graph_components"
+DEFAULT_CHUNK_SIZE = 5_000_000
+LABEL_DTYPE = pl.UInt32
+
+
+def _compress(parent: pl.Series) -> pl.Series:
+    """Pointer jumping: repeat ``parent = parent[parent]`` until every node points at its root."""
+    while True:
+        grandparent = parent.gather(parent)
+        if grandparent.equals(parent):
+            return parent
+        parent = grandparent
+
+
+def _roots(n: int, src: pl.Series, dst: pl.Series) -> pl.Series:
+    """Root of each node ``0..n-1``: the smallest node id in its component."""
+    parent = pl.int_range(n, dtype=pl.UInt64, eager=True)
+    edges = pl.DataFrame({"src": src, "dst": dst}).cast(pl.UInt64)
+    while True:
+        edges = (
+            edges.select(lo=pl.min_horizontal("src", "dst"), hi=pl.max_horizontal("src", "dst"))
+            .filter(pl.col("lo") != pl.col("hi"))
+            .unique()
+        )
+        if edges.is_empty():
+            return parent
+        # Every `hi` is a root here, and only ever moves to a smaller id, so no cycles form.
+        hooks = edges.group_by("hi").agg(pl.col("lo").min())
+        parent = _compress(parent.scatter(hooks["hi"], hooks["lo"]))
+        edges = pl.DataFrame({"src": parent.gather(edges["lo"]), "dst": parent.gather(edges["hi"])})
+
+
+def _forest(n: int, src: pl.Series, dst: pl.Series) -> pl.DataFrame:
+    """The spanning forest of the edges over ``0..n-1``, as ``node -> root`` edges."""
+    return pl.DataFrame({"src": pl.int_range(n, dtype=pl.UInt64, eager=True), "dst": _roots(n, src, dst)}).filter(
+        pl.col("src") != pl.col("dst")
+    )
+
+
+def _chunk_forest(edges: pl.DataFrame) -> pl.DataFrame:
+    """Reduce one chunk of edges to its spanning forest, in global ids."""
+    nodes = pl.concat([edges["src"], edges["dst"]]).unique().sort()
+    forest = _forest(nodes.len(), nodes.search_sorted(edges["src"]), nodes.search_sorted(edges["dst"]))
+    return pl.DataFrame({"src": nodes.gather(forest["src"]), "dst": nodes.gather(forest["dst"])})
+
+
+def _read_chunks(path: Path, chunk_size: int) -> Iterator[pl.DataFrame]:
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+        yield pl.from_arrow(batch)
+
+
+def _merge_chunks(chunks: Iterator[pl.DataFrame], n: int, seed: pl.DataFrame, max_workers: int | None) -> pl.Series:
+    """Solve the chunks on a thread pool and merge their forests into the root of every node."""
+    parts, part_rows = [seed], seed.height
+
+    def add(part: pl.DataFrame) -> None:
+        nonlocal parts, part_rows
+        parts.append(part)
+        part_rows += part.height
+        if part_rows > n:
+            merged = pl.concat(parts)
+            parts = [_forest(n, merged["src"], merged["dst"])]
+            part_rows = parts[0].height
+
+    workers = max_workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        in_flight: deque[Future] = deque()
+        for chunk in chunks:
+            in_flight.append(pool.submit(_chunk_forest, chunk))
+            # Bound the chunks held in memory at once.
+            while len(in_flight) >= 2 * workers or (in_flight and in_flight[0].done()):
+                add(in_flight.popleft().result())
+        while in_flight:
+            add(in_flight.popleft().result())
+    merged = pl.concat(parts)
+    return _roots(n, merged["src"], merged["dst"])
+
+
+def _node_dtype(lf: pl.LazyFrame, col_from: str, col_to: str) -> pl.DataType:
+    schema = lf.collect_schema()
+    return schema[col_from] if schema[col_from] == schema[col_to] else pl.String
+
+
+def _read_state(state_path: Path | None, node_dtype: pl.DataType) -> pl.DataFrame | None:
+    if state_path is None or not state_path.exists():
+        return None
+    return pl.read_parquet(state_path).with_columns(pl.col("node").cast(node_dtype))
+
+
+def _write_state(state_path: Path, labels: pl.DataFrame) -> None:
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = state_path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+    labels.write_parquet(tmp_path)
+    os.replace(tmp_path, state_path)
+
+
+def _state_forest(previous: pl.DataFrame) -> pl.DataFrame:
+    """Persisted components as forest edges; their nodes hold the first ids."""
+    with_ids = previous.with_row_index("src").with_columns(pl.col("src").cast(pl.UInt64))
+    return (
+        with_ids.join(with_ids.group_by("label").agg(pl.col("src").min().alias("dst")), on="label")
+        .select("src", "dst")
+        .filter(pl.col("src") != pl.col("dst"))
+    )
+
+
+def _label_components(nodes: pl.DataFrame, previous: pl.DataFrame | None) -> pl.DataFrame:
+    """Turn ``node, root`` into ``node, label``, keeping persisted labels where there are any."""
+    if previous is None:
+        return nodes.select("node", label=pl.col("root").rank("dense").cast(LABEL_DTYPE))
+    nodes = nodes.join(previous, on="node", how="left")
+    components = nodes.group_by("root").agg(pl.col("label").min())
+    next_label = previous["label"].max() or 0
+    new_components = components.filter(pl.col("label").is_null()).with_columns(
+        label=(pl.col("root").rank("dense") + next_label).cast(LABEL_DTYPE)
+    )
+    components = pl.concat([components.filter(pl.col("label").is_not_null()), new_components], how="vertical_relaxed")
+    return nodes.drop("label").join(components, on="root").select("node", pl.col("label").cast(LABEL_DTYPE))
+
+
+def connected_components(
+    lf: pl.LazyFrame,
+    col_from: str,
+    col_to: str,
+    state_path: Path | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: int | None = None,
+    spill_dir: Path = GRAPH_STATE_DIR,
+) -> pl.DataFrame:
+    """Label the components of the graph given by the *col_from* -> *col_to* edges of *lf*.
+
+    Returns one row per node with its component ``label``; a node only ever paired with a
+    null is a component of its own. With *state_path*, labels continue from that table and
+    the table is updated with the result.
+    """
+    node_dtype = _node_dtype(lf, col_from, col_to)
+    edges = lf.select(src=pl.col(col_from).cast(node_dtype), dst=pl.col(col_to).cast(node_dtype))
+    nodes = pl.concat([edges.select(node="src"), edges.select(node="dst")]).drop_nulls().unique()
+
+    previous = _read_state(state_path, node_dtype)
+    seed = pl.DataFrame(schema={"src": pl.UInt64, "dst": pl.UInt64})
+    if previous is not None:
+        labels = previous.lazy()
+        # Edges inside one persisted component add nothing; skip them before the spill.
+        edges = (
+            edges.join(labels, left_on="src", right_on="node", how="left")
+            .join(labels, left_on="dst", right_on="node", how="left", suffix="_dst")
+            .filter(
+                pl.col("label").is_null() | pl.col("label_dst").is_null() | (pl.col("label") != pl.col("label_dst"))
+            )
+            .select("src", "dst")
+        )
+        nodes = pl.concat([previous.lazy().select("node"), nodes]).unique(keep="first", maintain_order=True)
+        seed = _state_forest(previous)
+
+    node_ids = nodes.with_row_index("id").with_columns(pl.col("id").cast(pl.UInt64)).collect(engine="streaming")
+    spill_dir.mkdir(parents=True, exist_ok=True)
+    spill_path = spill_dir / f"edges_{uuid.uuid4().hex}.parquet"
+    try:
+        ids = node_ids.lazy()
+        encoded = edges.join(ids, left_on="src", right_on="node").join(
+            ids, left_on="dst", right_on="node", suffix="_dst"
+        )
+        encoded.select(src="id", dst="id_dst").filter(pl.col("src") != pl.col("dst")).sink_parquet(spill_path)
+        roots = _merge_chunks(_read_chunks(spill_path, chunk_size), node_ids.height, seed, max_workers)
+    finally:
+        spill_path.unlink(missing_ok=True)
+
+    result = _label_components(node_ids.select("node", root=roots), previous)
+    if state_path is not None:
+        _write_state(state_path, result)
+    return result
+
+
+def label_rows(
+    lf: pl.LazyFrame, col_from: str, col_to: str, labels: pl.DataFrame, output_column_name: str
+) -> pl.LazyFrame:
+    """Add each row's component label from *labels* (taken from *col_to* when *col_from* is null)."""
+    node_dtype = labels.schema["node"]
+
+    def lookup(col: str) -> pl.Expr:
+        return (
+            pl.col(col)
+            .cast(node_dtype)
+            .replace_strict(labels["node"], labels["label"], default=None, return_dtype=LABEL_DTYPE)
+        )
+
+    return lf.with_columns(pl.coalesce(lookup(col_from), lookup(col_to)).alias(output_column_name))
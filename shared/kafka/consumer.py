@@ -5,29 +5,45 @@ plus new offsets. Uses Kafka consumer group offset management — the broker
 tracks committed offsets internally via the ``__consumer_offsets`` topic.
 
 Callable from any context (worker subprocess, core CLI mode, tests).
+
+Messages are decoded per batch, not per message: the consume loop only collects
+the raw values and metadata, and each flush hands the values to the
+deserializer's ``deserialize_batch`` (one NDJSON parse for JSON) and attaches
+key/partition/offset/timestamp as columns.
+
+Topics with several partitions are read by up to ``max_consumers`` consumers at
+once, each manually assigned a group of partitions and running on its own
+thread (librdkafka fetches and Polars decodes outside the GIL). The consumers
+spill into one shared IPC file; only a consumer whose inferred value schema
+differs gets a shard of its own, combined with the shared file at the end. Their
+high watermarks are merged into one ``{partition: next_offset}`` map, so offsets
+are committed exactly as with a single consumer.
 """
 
 from __future__ import annotations
 
 import logging
+import os
+import threading
 import time
 from collections.abc import Callable
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 from typing import NamedTuple
 
 import polars as pl
 import pyarrow as pa
 import pyarrow.ipc
-from confluent_kafka import Consumer, KafkaError
+from confluent_kafka import Consumer, KafkaError, KafkaException, TopicPartition
 from confluent_kafka.admin import AdminClient
 
-from shared.kafka.deserializers import get_deserializer
+from shared.kafka.deserializers import KafkaDeserializer, get_deserializer
 from shared.kafka.models import KafkaReadResult, KafkaReadSettings
 
 logger = logging.getLogger(__name__)
 
 _CONSUME_BATCH_SIZE = 500
 _FLUSH_SIZE = 100_000
+_METADATA_TIMEOUT_SECONDS = 10.0
 
 _EMPTY_SCHEMA: dict[str, pl.DataType] = {
     "_kafka_key": pl.String,
@@ -37,10 +53,74 @@ _EMPTY_SCHEMA: dict[str, pl.DataType] = {
 }
 
 
+class _PendingMessages:
+    """Raw values and metadata of consumed messages, decoded together on flush."""
+
+    def __init__(self) -> None:
+        self.values: list[bytes] = []
+        self.keys: list[str | None] = []
+        self.partitions: list[int] = []
+        self.offsets: list[int] = []
+        self.timestamps: list[int | None] = []
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def append(self, msg) -> None:
+        key = msg.key()
+        ts_type, ts_value = msg.timestamp()
+        self.values.append(msg.value())
+        self.keys.append(key.decode("utf-8", errors="replace") if key else None)
+        self.partitions.append(msg.partition())
+        self.offsets.append(msg.offset())
+        self.timestamps.append(None if ts_type == 0 else ts_value)  # 0 = TIMESTAMP_NOT_AVAILABLE
+
+    def to_frame(self, deserializer: KafkaDeserializer) -> pl.DataFrame:
+        """Decode the values in one batch and attach the metadata columns; undecodable messages are dropped."""
+        data, kept = deserializer.deserialize_batch(self.values)
+        metadata = pl.DataFrame(
+            {
+                "_kafka_key": pl.Series(self.keys, dtype=pl.String),
+                "_kafka_partition": pl.Series(self.partitions, dtype=pl.Int64),
+                "_kafka_offset": pl.Series(self.offsets, dtype=pl.Int64),
+                "_kafka_timestamp": pl.from_epoch(pl.Series(self.timestamps, dtype=pl.Int64), time_unit="ms"),
+            }
+        ).with_columns(pl.col("_kafka_timestamp").cast(pl.Datetime("us")))
+        if len(kept) != len(self.values):
+            metadata = metadata[kept]
+        data = data.drop(metadata.columns, strict=False)
+        # Messages that are all empty objects decode to a frame without columns (or rows).
+        return data.hstack(metadata) if data.width else metadata
+
+    def clear(self) -> None:
+        for values in (self.values, self.keys, self.partitions, self.offsets, self.timestamps):
+            values.clear()
+
+
+class _MessageBudget:
+    """Messages left to consume, shared by all consumers of one read."""
+
+    def __init__(self, total: int) -> None:
+        self._left = total
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> int:
+        return max(self._left, 0)
+
+    def take(self) -> bool:
+        """Claim one message; ``False`` once ``max_messages`` have been claimed."""
+        with self._lock:
+            if self._left <= 0:
+                return False
+            self._left -= 1
+            return True
+
+
 class _ConsumeResult(NamedTuple):
     """Result of the internal consume loop."""
 
-    remaining_rows: list[dict]
+    remaining: _PendingMessages
     high_watermarks: dict[int, int]  # {partition: next_offset}
     messages_consumed: int
 
@@ -65,26 +145,45 @@ def read_kafka_source(
             of ``_FLUSH_SIZE`` rows and a ``pl.LazyFrame`` is returned.
             When ``None`` an in-memory ``pl.DataFrame`` is returned.
 
+    A topic with more than one partition is read by up to
+    ``settings.max_consumers`` consumers in parallel; see the module docstring.
+
     Returns:
         ``(data, KafkaReadResult)``
     """
-    consumer = Consumer(settings.to_consumer_config(decrypt_fn=decrypt_fn))
+    config = settings.to_consumer_config(decrypt_fn=decrypt_fn)
+    consumer = Consumer(config)
     try:
-        writer = _IpcWriter(spill_path) if spill_path else None
-        consumed = _consume_messages(consumer, settings, writer)
-        result_data = _build_result(consumed.remaining_rows, writer)
+        groups = _partition_groups(_topic_partitions(consumer, settings.topic), settings.max_consumers)
+        if len(groups) > 1:
+            result_data, high_watermarks, messages_consumed = _read_partition_groups(
+                config, settings, groups, spill_path
+            )
+            if commit and messages_consumed > 0:
+                # This consumer never joined the group, so it can commit the merged offsets as-is.
+                consumer.commit(
+                    offsets=[TopicPartition(settings.topic, p, o) for p, o in high_watermarks.items()],
+                    asynchronous=False,
+                )
+        else:
+            writer = _IpcWriter(spill_path) if spill_path else None
+            deserializer = get_deserializer(settings.value_format)
+            consumed = _consume_messages(consumer, settings, writer, deserializer)
+            result_data, remaining_rows = _build_result(consumed.remaining, writer, deserializer)
+            high_watermarks = consumed.high_watermarks
+            messages_consumed = consumed.messages_consumed + remaining_rows
 
-        if commit and consumed.messages_consumed > 0:
-            consumer.commit(asynchronous=False)
+            if commit and messages_consumed > 0:
+                consumer.commit(asynchronous=False)
 
         result = KafkaReadResult(
-            new_offsets=consumed.high_watermarks,
-            messages_consumed=consumed.messages_consumed,
-            partitions_read=len(consumed.high_watermarks),
+            new_offsets=high_watermarks,
+            messages_consumed=messages_consumed,
+            partitions_read=len(high_watermarks),
         )
         logger.info(
-            "Consumed %d messages from topic %r (group=%s)",
-            consumed.messages_consumed, settings.topic, settings.group_id,
+            "Consumed %d messages from topic %r (group=%s, consumers=%d)",
+            messages_consumed, settings.topic, settings.group_id, max(len(groups), 1),
         )
         return result_data, result
     finally:
@@ -104,6 +203,7 @@ def infer_topic_schema(
         "group_id": f"{settings.group_id}__schema_probe",
         "start_offset": "earliest",
         "max_messages": sample_size,
+        "max_consumers": 1,
         "poll_timeout_seconds": 10.0,
     })
     df_or_lf, _ = read_kafka_source(probe_settings, commit=False, decrypt_fn=decrypt_fn)
@@ -111,42 +211,125 @@ def infer_topic_schema(
     return list(schema.items())
 
 
+# Internal: partition groups
+
+
+def _topic_partitions(consumer: Consumer, topic: str) -> list[int]:
+    """Partition ids of *topic*, or ``[]`` when the metadata is unavailable."""
+    try:
+        metadata = consumer.list_topics(topic, timeout=_METADATA_TIMEOUT_SECONDS).topics.get(topic)
+    except KafkaException as e:
+        logger.warning("Could not list partitions of topic %r: %s", topic, e)
+        return []
+    if metadata is None or metadata.error is not None:
+        return []
+    return sorted(metadata.partitions)
+
+
+def _partition_groups(partitions: list[int], max_consumers: int) -> list[list[int]]:
+    """Deal *partitions* round-robin into at most *max_consumers* groups."""
+    n_groups = min(max_consumers, len(partitions))
+    return [partitions[i::n_groups] for i in range(n_groups)]
+
+
+def _read_partition_groups(
+    config: dict,
+    settings: KafkaReadSettings,
+    groups: list[list[int]],
+    spill_path: str | None,
+) -> tuple[pl.DataFrame | pl.LazyFrame, dict[int, int], int]:
+    """Read each partition group with its own consumer on a thread pool.
+
+    With *spill_path*, the consumers write into it directly (see ``_SharedSpill``).
+    Returns the combined data, the merged high watermarks and the number of rows read.
+    """
+    budget = _MessageBudget(settings.max_messages)
+    spill = _SharedSpill(spill_path) if spill_path else None
+
+    def read_group(index: int, partitions: list[int]) -> tuple[pl.DataFrame | None, dict[int, int], int]:
+        consumer = Consumer(config)
+        try:
+            writer = spill.route(index) if spill else None
+            deserializer = get_deserializer(settings.value_format)
+            consumed = _consume_messages(consumer, settings, writer, deserializer, partitions=partitions, budget=budget)
+            remaining = consumed.remaining
+            frame = remaining.to_frame(deserializer) if len(remaining) else pl.DataFrame(schema=_EMPTY_SCHEMA)
+            rows = consumed.messages_consumed + frame.height
+            if writer is None:
+                return frame, consumed.high_watermarks, rows
+            if frame.height:
+                writer.write_batch(frame)
+            return None, consumed.high_watermarks, rows
+        finally:
+            consumer.close()
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(groups), thread_name_prefix="kafka-consumer") as pool:
+            results = list(pool.map(read_group, range(len(groups)), groups))
+    except BaseException:
+        if spill is not None:
+            spill.close()
+            spill.remove_shards()
+        raise
+    high_watermarks = {p: o for _, group_watermarks, _ in results for p, o in group_watermarks.items()}
+    rows = sum(group_rows for _, _, group_rows in results)
+    if spill is not None:
+        return spill.finish(), high_watermarks, rows
+    # Each group infers its own value schema; the frames are aligned by column name.
+    return pl.concat([data for data, _, _ in results], how="diagonal_relaxed"), high_watermarks, rows
+
+
 # Internal: consume loop
 
 
 def _consume_messages(
     consumer: Consumer,
     settings: KafkaReadSettings,
-    writer: _IpcWriter | None = None,
+    writer: _IpcWriter | None,
+    deserializer: KafkaDeserializer,
+    *,
+    partitions: list[int] | None = None,
+    budget: _MessageBudget | None = None,
 ) -> _ConsumeResult:
     """Run the consume loop.
 
-    When *writer* is provided, rows are flushed to IPC every ``_FLUSH_SIZE``
-    rows during consumption, keeping memory bounded.
-    """
-    deserializer = get_deserializer(settings.value_format)
+    When *writer* is provided, messages are decoded and flushed to IPC every
+    ``_FLUSH_SIZE`` messages during consumption, keeping memory bounded. The
+    returned ``messages_consumed`` counts the rows flushed so far; messages
+    still pending are decoded by ``_build_result``.
 
+    With *partitions*, the consumer is assigned those partitions (resuming from
+    the group's committed offsets) instead of subscribing to the topic. A
+    shared *budget* caps the messages read by all consumers of one read.
+    """
     assigned: set[int] = set()
-    consumer.subscribe(
-        [settings.topic],
-        on_assign=lambda _c, parts: assigned.update(tp.partition for tp in parts),
-    )
+    if partitions is None:
+        consumer.subscribe(
+            [settings.topic],
+            on_assign=lambda _c, parts: assigned.update(tp.partition for tp in parts),
+        )
+    else:
+        consumer.assign([TopicPartition(settings.topic, p) for p in partitions])
+        assigned.update(partitions)
+    if budget is None:
+        budget = _MessageBudget(settings.max_messages)
 
-    rows: list[dict] = []
+    pending = _PendingMessages()
     high_watermarks: dict[int, int] = {}
     eof_partitions: set[int] = set()
     count = 0
+    flushed_rows = 0
     empty_polls = 0
     first_poll = True
     deadline = time.monotonic() + settings.poll_timeout_seconds
 
-    while count < settings.max_messages and time.monotonic() < deadline:
+    while budget.remaining > 0 and time.monotonic() < deadline:
         remaining = max(0.1, deadline - time.monotonic())
         timeout = min(remaining, 10.0) if first_poll else min(remaining, 1.0)
         first_poll = False
 
         batch = consumer.consume(
-            num_messages=min(_CONSUME_BATCH_SIZE, settings.max_messages - count),
+            num_messages=max(1, min(_CONSUME_BATCH_SIZE, budget.remaining)),
             timeout=timeout,
         )
 
@@ -169,34 +352,31 @@ def _consume_messages(
                 logger.error("Kafka consumer error: %s", msg.error())
                 continue
 
-            record = deserializer.deserialize(msg.value())
-            if record is None:
-                high_watermarks[msg.partition()] = msg.offset() + 1
-                continue
-
-            record["_kafka_key"] = msg.key().decode("utf-8", errors="replace") if msg.key() else None
-            record["_kafka_partition"] = msg.partition()
-            record["_kafka_offset"] = msg.offset()
-            record["_kafka_timestamp"] = _extract_timestamp(msg)
-
-            rows.append(record)
+            if msg.value() and not budget.take():
+                break
             high_watermarks[msg.partition()] = msg.offset() + 1
+            if not msg.value():
+                continue
+            pending.append(msg)
             count += 1
 
-            if writer and len(rows) >= _FLUSH_SIZE:
-                writer.write_batch(_coerce_metadata_types(pl.DataFrame(rows)))
-                rows.clear()
+            if writer and len(pending) >= _FLUSH_SIZE:
+                frame = pending.to_frame(deserializer)
+                if frame.height:
+                    writer.write_batch(frame)
+                flushed_rows += frame.height
+                pending.clear()
 
-            if count >= settings.max_messages:
+            if budget.remaining == 0:
                 break
         else:
             continue
         break
 
     return _ConsumeResult(
-        remaining_rows=rows,
+        remaining=pending,
         high_watermarks=high_watermarks,
-        messages_consumed=count,
+        messages_consumed=flushed_rows,
     )
 
 
@@ -226,51 +406,112 @@ class _IpcWriter:
         return self._writer is not None
 
 
-# Internal: build result from rows
+class _SharedSpill:
+    """Parallel consumers spilling into one IPC file, so the result is never rewritten.
+
+    A consumer's batches go to the shared file when its first batch has the file's
+    schema; otherwise (its value schema was inferred differently) to a shard of its
+    own. Shards are merged into the shared file by ``finish``, the only case that
+    rewrites it. As with a single consumer, one consumer's batches share a schema.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._shared = _IpcWriter(path)
+        self._schema: pl.Schema | None = None
+        self._routes: dict[int, _IpcWriter] = {}
+        self._lock = threading.Lock()
+
+    def route(self, index: int) -> _SpillRoute:
+        return _SpillRoute(self, index)
+
+    def write_batch(self, index: int, df: pl.DataFrame) -> None:
+        with self._lock:
+            writer = self._routes.get(index)
+            if writer is None:
+                if self._schema is None:
+                    self._schema = df.schema
+                writer = self._shared if df.schema == self._schema else _IpcWriter(f"{self.path}.{index:03d}.shard")
+                self._routes[index] = writer
+            if writer is self._shared:
+                writer.write_batch(df)
+                return
+        writer.write_batch(df)
+
+    @property
+    def _shards(self) -> list[_IpcWriter]:
+        return [writer for writer in self._routes.values() if writer is not self._shared]
+
+    def close(self) -> None:
+        for writer in [self._shared, *self._shards]:
+            writer.close()
+
+    def remove_shards(self) -> None:
+        for path in [writer.path for writer in self._shards] + [f"{self.path}.merge"]:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def finish(self) -> pl.LazyFrame:
+        """Close the writers and return the combined result, merging any shards into the shared file."""
+        self.close()
+        shards = [writer.path for writer in self._shards if writer.has_written]
+        if not shards:
+            if not self._shared.has_written:
+                pl.DataFrame(schema=_EMPTY_SCHEMA).write_ipc(self.path)
+            return pl.scan_ipc(self.path)
+        parts = [pl.scan_ipc(self.path)] if self._shared.has_written else []
+        try:
+            merged = pl.concat(parts + [pl.scan_ipc(shard) for shard in shards], how="diagonal_relaxed")
+            merged.sink_ipc(f"{self.path}.merge")
+            os.replace(f"{self.path}.merge", self.path)
+        finally:
+            self.remove_shards()
+        return pl.scan_ipc(self.path)
+
+
+class _SpillRoute(NamedTuple):
+    """One consumer's writer into a ``_SharedSpill``."""
+
+    spill: _SharedSpill
+    index: int
+
+    def write_batch(self, df: pl.DataFrame) -> None:
+        self.spill.write_batch(self.index, df)
 
 
-def _coerce_metadata_types(df: pl.DataFrame) -> pl.DataFrame:
-    """Cast Kafka metadata columns to their canonical types."""
-    if "_kafka_key" in df.columns and df["_kafka_key"].dtype == pl.Null:
-        df = df.with_columns(pl.col("_kafka_key").cast(pl.String))
-    if "_kafka_timestamp" in df.columns:
-        df = df.with_columns(pl.col("_kafka_timestamp").cast(pl.Datetime("us")))
-    return df
+# Internal: build result from pending messages
 
 
 def _build_result(
-    rows: list[dict],
+    pending: _PendingMessages,
     writer: _IpcWriter | None,
-) -> pl.DataFrame | pl.LazyFrame:
-    """Finalize the result from any remaining (unflushed) rows.
+    deserializer: KafkaDeserializer,
+) -> tuple[pl.DataFrame | pl.LazyFrame, int]:
+    """Finalize the result from the pending (unflushed) messages.
 
-    Rows may already have been partially flushed to *writer* during
-    consumption.  This handles the remainder and closes the writer.
+    Messages may already have been partially flushed to *writer* during
+    consumption.  This decodes the remainder, closes the writer and returns
+    the result with the number of rows the remainder added.
     """
+    frame = pending.to_frame(deserializer) if len(pending) else None
+    rows = frame.height if frame is not None else 0
+
     if writer is not None:
         if rows:
-            writer.write_batch(_coerce_metadata_types(pl.DataFrame(rows)))
+            writer.write_batch(frame)
 
         if writer.has_written:
             writer.close()
-            return pl.scan_ipc(writer.path)
+            return pl.scan_ipc(writer.path), rows
 
         # No rows at all — write empty schema
         pl.DataFrame(schema=_EMPTY_SCHEMA).write_ipc(writer.path)
-        return pl.scan_ipc(writer.path)
+        return pl.scan_ipc(writer.path), rows
 
     # In-memory path
     if rows:
-        return _coerce_metadata_types(pl.DataFrame(rows))
-    return pl.DataFrame(schema=_EMPTY_SCHEMA)
-
-
-def _extract_timestamp(msg) -> datetime | None:
-    """Extract message timestamp as a datetime."""
-    ts_type, ts_value = msg.timestamp()
-    if ts_type == 0:  # TIMESTAMP_NOT_AVAILABLE
-        return None
-    return datetime.fromtimestamp(ts_value / 1000.0, tz=timezone.utc)
+        return frame, rows
+    return pl.DataFrame(schema=_EMPTY_SCHEMA), rows
 
 
 def commit_offsets(
@@ -1,15 +1,21 @@
 """Kafka message deserializers.
 
 Provides a clean interface for adding new formats (Avro, Protobuf)
-without modifying the consumer logic.
+without modifying the consumer logic. The consumer decodes whole batches
+through ``deserialize_batch``; a format with a columnar decoder (e.g. a
+schema-registry Avro reader producing Arrow) overrides it, and any other
+format gets the row-wise default built on ``deserialize``.
 """
 
 from __future__ import annotations
 
+import io
 import json
 import logging
 from abc import ABC, abstractmethod
 
+import polars as pl
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,9 +29,44 @@ class KafkaDeserializer(ABC):
         Returns None if the message cannot be deserialized.
         """
 
+    def deserialize_batch(self, values: list[bytes]) -> tuple[pl.DataFrame, list[int]]:
+        """Deserialize a batch of message values into one frame.
+
+        Returns the frame and the indices of the values it holds a row for, in
+        order; values that cannot be deserialized are dropped.
+        """
+        records: list[dict] = []
+        kept: list[int] = []
+        for i, value in enumerate(values):
+            record = self.deserialize(value)
+            if record is not None:
+                records.append(record)
+                kept.append(i)
+        return pl.DataFrame(records), kept
+
 
 class JsonDeserializer(KafkaDeserializer):
-    """Deserializes JSON-encoded Kafka messages."""
+    """Deserializes JSON-encoded Kafka messages.
+
+    Batches are parsed as one NDJSON buffer by Polars' native reader. A batch that
+    does not parse that way (invalid JSON, non-object values) falls back to the
+    row-wise path, which skips or wraps the offending messages.
+    """
+
+    def deserialize_batch(self, values: list[bytes]) -> tuple[pl.DataFrame, list[int]]:
+        if not values:
+            return pl.DataFrame(), []
+        # Raw newlines in JSON can only be whitespace, so flattening them keeps one value per line.
+        buffer = b"\n".join(
+            v.replace(b"\n", b" ").replace(b"\r", b" ") if b"\n" in v or b"\r" in v else v for v in values
+        )
+        try:
+            df = pl.read_ndjson(io.BytesIO(buffer), infer_schema_length=None)
+        except Exception:  # noqa: BLE001 - any parse failure means a dirty batch
+            df = None
+        if df is not None and df.height == len(values):
+            return df, list(range(len(values)))
+        return super().deserialize_batch(values)
 
     def deserialize(self, value: bytes | None) -> dict | None:
         if value is None:
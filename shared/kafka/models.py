@@ -5,7 +5,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import TYPE_CHECKING
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 if TYPE_CHECKING:
     pass
@@ -37,6 +37,8 @@ class KafkaReadSettings(BaseModel):
     start_offset: str = "latest"  # "earliest" or "latest" — used on first-ever consume
     max_messages: int = 100_000
     poll_timeout_seconds: float = 30.0
+    # Partitions are split into up to this many groups, each read by its own consumer.
+    max_consumers: int = Field(default=4, ge=1)
 
     # Security / auth (optional) — values are encrypted, not plaintext
     security_protocol: str = "PLAINTEXT"
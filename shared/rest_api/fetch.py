@@ -7,13 +7,28 @@ dependency on either side's secret manager — the caller decrypts and passes th
 plaintext.
 
 JSON is the only supported response format; the located record array is
-flattened with ``pl.json_normalize``.
+flattened with ``pl.json_normalize`` in batches of ``RECORD_BATCH_SIZE`` records.
+
+Offset and page-number pagination can fetch ``max_concurrency`` pages at once:
+pages are requested ahead on a thread pool and consumed in page order, so the
+stop conditions (an empty or short page, the record cap) behave exactly as in a
+sequential walk. A 429 holds every request until its ``Retry-After`` has passed.
+Cursor pagination stays sequential: each page names the next.
 """
 
 from __future__ import annotations
 
+import contextlib
+import os
+import shutil
+import tempfile
+import threading
 import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from email.utils import parsedate_to_datetime
+from pathlib import Path
 from typing import Any
 
 import httpx
@@ -32,6 +47,12 @@ from shared.rest_api.models import (
 _BACKOFF_BASE_SECONDS = 0.5
 _BACKOFF_CAP_SECONDS = 30.0
 
+# Records per json_normalize call, and per spilled batch when writing to IPC.
+RECORD_BATCH_SIZE = 50_000
+
+# Pagination whose page requests are known up front, so they can be issued concurrently.
+_CONCURRENT_PAGINATION = (PaginationType.OFFSET, PaginationType.PAGE)
+
 
 def _backoff_delay(attempt: int) -> float:
     """Exponential backoff capped at ``_BACKOFF_CAP_SECONDS``."""
@@ -85,6 +106,31 @@ def _to_records(extracted: Any) -> list[dict]:
     return [{"value": extracted}]
 
 
+class _RequestPacer:
+    """Shared start times for concurrent requests.
+
+    Starts are spaced at least ``min_interval`` apart, and a 429 pushes the next
+    start of every request past its ``Retry-After``.
+    """
+
+    def __init__(self, min_interval: float = 0.0):
+        self._min_interval = min_interval
+        self._next_start = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._min_interval
+        if start > now:
+            time.sleep(start - now)
+
+    def back_off(self, seconds: float) -> None:
+        with self._lock:
+            self._next_start = max(self._next_start, time.monotonic() + seconds)
+
+
 def _request_with_retries(
     client: httpx.Client,
     *,
@@ -94,15 +140,19 @@ def _request_with_retries(
     params: dict[str, str],
     json_body: Any | None,
     max_retries: int,
+    pacer: _RequestPacer | None = None,
 ) -> httpx.Response:
     """Issue one request, retrying transient failures with backoff.
 
     Retries network errors and 5xx responses with exponential backoff, and 429
     responses honoring ``Retry-After`` when present. 4xx (other than 429) are
-    raised immediately — they are not transient.
+    raised immediately — they are not transient. With a *pacer*, the 429 wait
+    applies to every request sharing it.
     """
     last_exc: Exception | None = None
     for attempt in range(max_retries + 1):
+        if pacer is not None:
+            pacer.wait()
         try:
             response = client.request(
                 method,
@@ -122,7 +172,11 @@ def _request_with_retries(
             if attempt >= max_retries:
                 response.raise_for_status()
             retry_after = _parse_retry_after(response.headers.get("Retry-After"))
-            time.sleep(retry_after if retry_after is not None else _backoff_delay(attempt))
+            delay = retry_after if retry_after is not None else _backoff_delay(attempt)
+            if pacer is not None:
+                pacer.back_off(delay)
+            else:
+                time.sleep(delay)
             continue
         if response.status_code >= 500:
             if attempt >= max_retries:
@@ -149,14 +203,98 @@ def _read_next_cursor(body: Any, response: httpx.Response, pagination) -> str |
     return str(value)
 
 
-def fetch_rest_api(settings: RestApiReadSettings, *, secret: str | None = None) -> pl.DataFrame:
-    """Fetch all (or a capped sample of) records from a REST API as a typed frame.
+def _page_params(base_params: dict[str, str], pagination, page_index: int, cursor: str | None) -> dict[str, str]:
+    params = dict(base_params)
+    ptype = pagination.pagination_type
+    if ptype == PaginationType.OFFSET:
+        params[pagination.offset_param] = str(page_index * pagination.page_size)
+        params[pagination.limit_param] = str(pagination.page_size)
+    elif ptype == PaginationType.PAGE:
+        params[pagination.page_param] = str(pagination.start_page + page_index)
+    elif ptype == PaginationType.CURSOR and cursor:
+        params[pagination.cursor_param] = cursor
+    return params
+
+
+def _is_last_page(page_records: list[dict], pagination) -> bool:
+    """Whether an offset/page-number page ends the walk: an empty page, or a short offset page."""
+    if not page_records:
+        return True
+    return pagination.pagination_type == PaginationType.OFFSET and len(page_records) < pagination.page_size
+
+
+def _iter_pages_sequential(
+    fetch_page: Callable[[dict[str, str]], tuple[Any, httpx.Response]],
+    settings: RestApiReadSettings,
+    base_params: dict[str, str],
+    max_pages: int,
+) -> Iterator[list[dict]]:
+    pagination = settings.pagination
+    ptype = pagination.pagination_type
+    cursor = pagination.initial_cursor
+    for page_index in range(max_pages):
+        body, response = fetch_page(_page_params(base_params, pagination, page_index, cursor))
+        page_records = _to_records(_extract_by_path(body, settings.record_path))
+        yield page_records
+
+        if ptype == PaginationType.NONE:
+            return
+        if ptype == PaginationType.CURSOR:
+            cursor = _read_next_cursor(body, response, pagination)
+            if not cursor:
+                return
+        elif _is_last_page(page_records, pagination):
+            return
+
+        if pagination.page_delay_seconds > 0:
+            time.sleep(pagination.page_delay_seconds)
+
+
+def _iter_pages_concurrent(
+    fetch_page: Callable[[dict[str, str]], tuple[Any, httpx.Response]],
+    settings: RestApiReadSettings,
+    base_params: dict[str, str],
+    max_pages: int,
+) -> Iterator[list[dict]]:
+    """Request up to ``max_concurrency`` offset/page-number pages ahead; yield them in page order."""
+    pagination = settings.pagination
 
-    ``secret`` is the plaintext credential matching ``settings.auth.auth_type``
-    (the API key, bearer token, or basic password); the caller decrypts it.
+    def page(page_index: int) -> list[dict]:
+        body, _ = fetch_page(_page_params(base_params, pagination, page_index, None))
+        return _to_records(_extract_by_path(body, settings.record_path))
+
+    pool = ThreadPoolExecutor(max_workers=pagination.max_concurrency, thread_name_prefix="rest-api-page")
+    in_flight: deque[Future] = deque()
+    next_index = 0
+    try:
+        while True:
+            while next_index < max_pages and len(in_flight) < pagination.max_concurrency:
+                in_flight.append(pool.submit(page, next_index))
+                next_index += 1
+            if not in_flight:
+                return
+            page_records = in_flight.popleft().result()
+            yield page_records
+            if _is_last_page(page_records, pagination):
+                return
+    finally:
+        # Pages requested past the end are dropped; don't wait for their responses.
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_rest_api_batches(
+    settings: RestApiReadSettings, *, secret: str | None = None, batch_records: int | None = None
+) -> Iterator[pl.DataFrame]:
+    """Fetch the records of a REST API, in page order, as frames of up to *batch_records* records.
+
+    *batch_records* defaults to ``RECORD_BATCH_SIZE``. ``secret`` is the plaintext
+    credential matching ``settings.auth.auth_type`` (the API key, bearer token, or
+    basic password); the caller decrypts it. Each batch is flattened on its own, so
+    batches can differ in columns and types.
     """
     pagination = settings.pagination
     is_sample = settings.sample_size is not None
+    batch_records = batch_records or RECORD_BATCH_SIZE
 
     # A sample fetch is a single page, capped to ``sample_size`` records.
     max_pages = 1 if is_sample else max(1, pagination.max_pages)
@@ -179,25 +317,19 @@ def fetch_rest_api(settings: RestApiReadSettings, *, secret: str | None = None)
 
     method = settings.method.value
     json_body = settings.json_body if method == "POST" else None
-    ptype = pagination.pagination_type
-
-    all_records: list[dict] = []
-    cursor = pagination.initial_cursor
-    offset = 0
-    page_number = pagination.start_page
-    page_index = 0
-
-    with httpx.Client(timeout=settings.timeout_seconds, auth=httpx_auth, follow_redirects=True) as client:
-        while page_index < max_pages:
-            params = dict(base_params)
-            if ptype == PaginationType.OFFSET:
-                params[pagination.offset_param] = str(offset)
-                params[pagination.limit_param] = str(pagination.page_size)
-            elif ptype == PaginationType.PAGE:
-                params[pagination.page_param] = str(page_number)
-            elif ptype == PaginationType.CURSOR and cursor:
-                params[pagination.cursor_param] = cursor
-
+    concurrent = (
+        max_pages > 1 and pagination.max_concurrency > 1 and pagination.pagination_type in _CONCURRENT_PAGINATION
+    )
+    pacer = _RequestPacer(pagination.page_delay_seconds) if concurrent else None
+
+    with httpx.Client(
+        timeout=settings.timeout_seconds,
+        auth=httpx_auth,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=max(pagination.max_concurrency, 10)),
+    ) as client:
+
+        def fetch_page(params: dict[str, str]) -> tuple[Any, httpx.Response]:
             response = _request_with_retries(
                 client,
                 method=method,
@@ -206,41 +338,60 @@ def fetch_rest_api(settings: RestApiReadSettings, *, secret: str | None = None)
                 params=params,
                 json_body=json_body,
                 max_retries=settings.max_retries,
+                pacer=pacer,
             )
-
             try:
-                body = response.json()
+                return response.json(), response
             except Exception as exc:  # noqa: BLE001 - surface any decode failure uniformly
                 raise RuntimeError(f"REST API response was not valid JSON: {exc}") from exc
 
-            page_records = _to_records(_extract_by_path(body, settings.record_path))
-            all_records.extend(page_records)
-            page_index += 1
-
-            if max_records is not None and len(all_records) >= max_records:
-                all_records = all_records[:max_records]
-                break
-
-            if ptype == PaginationType.NONE:
-                break
-            if ptype == PaginationType.OFFSET:
-                if not page_records or len(page_records) < pagination.page_size:
-                    break
-                offset += pagination.page_size
-            elif ptype == PaginationType.PAGE:
-                if not page_records:
-                    break
-                page_number += 1
-            elif ptype == PaginationType.CURSOR:
-                next_cursor = _read_next_cursor(body, response, pagination)
-                if not next_cursor:
+        iter_pages = _iter_pages_concurrent if concurrent else _iter_pages_sequential
+        pending: list[dict] = []
+        n_records = 0
+        with contextlib.closing(iter_pages(fetch_page, settings, base_params, max_pages)) as pages:
+            for page_records in pages:
+                if max_records is not None:
+                    page_records = page_records[: max_records - n_records]
+                pending.extend(page_records)
+                n_records += len(page_records)
+                if len(pending) >= batch_records:
+                    yield pl.json_normalize(pending, infer_schema_length=None)
+                    pending = []
+                if max_records is not None and n_records >= max_records:
                     break
-                cursor = next_cursor
+        if pending:
+            yield pl.json_normalize(pending, infer_schema_length=None)
 
-            if pagination.page_delay_seconds > 0:
-                time.sleep(pagination.page_delay_seconds)
 
-    if not all_records:
+def fetch_rest_api(settings: RestApiReadSettings, *, secret: str | None = None) -> pl.DataFrame:
+    """Fetch all (or a capped sample of) records from a REST API as a typed frame.
+
+    ``secret`` is the plaintext credential matching ``settings.auth.auth_type``
+    (the API key, bearer token, or basic password); the caller decrypts it.
+    """
+    batches = list(iter_rest_api_batches(settings, secret=secret))
+    if not batches:
         return pl.DataFrame()
+    return pl.concat(batches, how="diagonal_relaxed")
+
+
+def fetch_rest_api_to_ipc(settings: RestApiReadSettings, path: str, *, secret: str | None = None) -> int:
+    """Fetch a REST API into the Arrow IPC file at *path* and return its row count.
 
-    return pl.json_normalize(all_records, infer_schema_length=None)
+    Each batch is spilled to its own IPC file as it arrives, and the spilled batches are
+    streamed into *path* at the end, so memory holds one batch rather than every record.
+    """
+    spill_dir = Path(tempfile.mkdtemp(prefix="rest_api_", dir=os.path.dirname(path) or None))
+    try:
+        parts = []
+        for i, batch in enumerate(iter_rest_api_batches(settings, secret=secret)):
+            part = spill_dir / f"{i:06d}.arrow"
+            batch.write_ipc(part)
+            parts.append(part)
+        if not parts:
+            pl.DataFrame().write_ipc(path)
+            return 0
+        pl.concat([pl.scan_ipc(part) for part in parts], how="diagonal_relaxed").sink_ipc(path)
+        return pl.scan_ipc(path).select(pl.len()).collect().item()
+    finally:
+        shutil.rmtree(spill_dir, ignore_errors=True)
@@ -101,6 +101,10 @@ class PaginationConfig(BaseModel):
     max_records: int | None = None
     page_delay_seconds: float = 0.0
 
+    # Pages fetched at once for offset / page pagination; cursor pages are always sequential.
+    # With concurrency, ``page_delay_seconds`` is the minimum spacing between request starts.
+    max_concurrency: int = Field(default=1, ge=1)
+
 
 class RestApiReadSettings(BaseModel):
     """Payload for ``POST /store_rest_api_read_result``."""
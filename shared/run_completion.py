@@ -17,6 +17,7 @@ from sqlalchemy.orm import Session
 
 from shared.models import FlowRun
 from shared.storage_config import get_database_url
+from shared.subprocess_utils import cancel_runner_run, runner_run_state
 
 logger = logging.getLogger("flowfile.run_completion")
 
@@ -127,6 +128,15 @@ def _terminate_pid(pid: int) -> str:
         return f"pid {pid} could not be signalled"
 
 
+def _stop_run(run_id: int, pid: int, runner_state: str | None) -> str:
+    """Stop a live run: through the flow runner for one of its members, else by PID."""
+    if runner_state is None:
+        return _terminate_pid(pid)
+    if cancel_runner_run(run_id):
+        return f"cancelled on flow runner member pid {pid}"
+    return f"no longer running on flow runner member pid {pid}"
+
+
 def reap_orphaned_runs(max_age_seconds: int | None = None) -> int:
     """Close run rows whose subprocess died without recording completion.
 
@@ -156,7 +166,12 @@ def reap_orphaned_runs(max_age_seconds: int | None = None) -> int:
         for run in runs:
             age = (now_naive - run.started_at.replace(tzinfo=None)).total_seconds() if run.started_at else None
 
-            pid_alive = run.pid is not None and _pid_is_alive(run.pid)
+            # A warm runner member outlives its runs, so the runner says whether this one is still going.
+            runner_state = runner_run_state(run.id, run.pid) if run.pid is not None else None
+            if runner_state is not None:
+                pid_alive = runner_state == "running"
+            else:
+                pid_alive = run.pid is not None and _pid_is_alive(run.pid)
 
             reason: str | None = None
             if run.pid is None:
@@ -170,7 +185,7 @@ def reap_orphaned_runs(max_age_seconds: int | None = None) -> int:
                 if pid_alive:
                     # Closing the row releases the double-launch guard, so the process
                     # must not outlive it — otherwise the next tick spawns a duplicate.
-                    reason = f"{reason}; {_terminate_pid(run.pid)}"
+                    reason = f"{reason}; {_stop_run(run.id, run.pid, runner_state)}"
 
             if reason is None:
                 continue
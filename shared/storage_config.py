@@ -28,6 +28,11 @@ def _is_docker_mode() -> bool:
     return os.environ.get("FLOWFILE_MODE") == "docker"
 
 
+def worker_cache_persisted() -> bool:
+    """Check if the worker result cache should survive restarts (FLOWFILE_WORKER_CACHE_PERSIST)."""
+    return os.environ.get("FLOWFILE_WORKER_CACHE_PERSIST", "0").lower() in ("1", "true", "yes")
+
+
 class FlowfileStorage:
     """Centralized storage manager for Flowfile applications."""
 
@@ -377,9 +382,14 @@ class FlowfileStorage:
                 continue
 
     def cleanup_directories(self) -> None:
-        """Clean up temporary files older than specified hours."""
+        """Clean up temporary files older than specified hours.
+
+        The worker result cache is left alone when it is persisted across restarts
+        (``FLOWFILE_WORKER_CACHE_PERSIST``); the worker then bounds it by its own budget.
+        """
         self.cleanup_directory("temp_directory", storage_duration_hours=24)
-        self.cleanup_directory("cache_directory", storage_duration_hours=1)
+        if not worker_cache_persisted():
+            self.cleanup_directory("cache_directory", storage_duration_hours=1)
         # logs_directory is deliberately absent: run/flow log retention is owned by
         # shared.run_logs.cleanup_old_logs (FLOWFILE_RUN_LOG_RETENTION_DAYS).
         self.cleanup_directory("system_logs_directory", storage_duration_hours=168)
@@ -3,30 +3,129 @@
 This module is intentionally free of ``flowfile_core`` imports so that
 both the core service and the lightweight scheduler can use it without
 pulling in the full application stack.
+
+When a warm flow runner (``flowfile run runner``) is up, runs are handed to
+one of its pre-imported members over a local socket instead; the runner
+advertises its address in ``runner_address_path()``. Without a runner, or
+when every member is busy, a fresh ``flowfile run flow`` process is spawned.
+A member serves many runs under one PID, so the liveness and cancel checks
+for a run recorded with a member PID go through the runner
+(``runner_run_state`` / ``cancel_runner_run``).
 """
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 import subprocess
 import sys
+from pathlib import Path
 
 from shared.run_logs import run_log_path
+from shared.storage_config import storage
 
 logger = logging.getLogger("flowfile.subprocess")
 
+_RUNNER_REPLY_TIMEOUT_SECONDS = 5.0
+
+
+def runner_address_path() -> Path:
+    """File in which a running flow runner publishes its socket address and auth key."""
+    return storage.base_directory / "flow_runner.json"
+
+
+def _runner_client():
+    """A connection to the running flow runner, or ``None`` when there is none."""
+    from multiprocessing.connection import Client
+
+    try:
+        info = json.loads(runner_address_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    try:
+        return Client(info["address"], authkey=bytes.fromhex(info["authkey"]))
+    except Exception as e:
+        # A stale address file from a runner that is gone is the common case here.
+        logger.debug("Flow runner unavailable at %s: %s", info.get("address"), e)
+        return None
+
+
+def _ask_runner(request: dict):
+    """Send *request* to the flow runner and return its reply, or ``None`` when it cannot answer."""
+    conn = _runner_client()
+    if conn is None:
+        return None
+    try:
+        with conn:
+            conn.send(request)
+            if not conn.poll(_RUNNER_REPLY_TIMEOUT_SECONDS):
+                logger.warning("Flow runner did not answer a %s request", request.get("op"))
+                return None
+            return conn.recv()
+    except Exception as e:
+        logger.debug("Flow runner request failed: %s", e)
+        return None
+
+
+def submit_flow_to_runner(flow_path: str, run_id: int) -> int | None:
+    """Hand a run to the warm flow runner.
+
+    Returns the PID of the member executing the run, or ``None`` when no
+    runner is reachable or all of its members are busy. The runner offers a
+    member first and starts the run only on this side's ``"start"``; on
+    ``None`` the run was not started and the caller may spawn it itself.
+    """
+    conn = _runner_client()
+    if conn is None:
+        return None
+    try:
+        with conn:
+            conn.send({"op": "submit", "flow_path": flow_path, "run_id": run_id})
+            if not conn.poll(_RUNNER_REPLY_TIMEOUT_SECONDS):
+                # Closing without "start" makes the runner take its offer back.
+                logger.warning("Flow runner did not answer for run %s", run_id)
+                return None
+            pid = conn.recv()
+            if pid is None:
+                return None
+            conn.send("start")
+    except Exception as e:
+        logger.debug("Flow runner did not take run %s: %s", run_id, e)
+        return None
+    logger.info("Run %s handed to flow runner member (pid=%s)", run_id, pid)
+    return pid
+
+
+def runner_run_state(run_id: int, pid: int | None) -> str | None:
+    """The flow runner's view of *run_id* recorded with *pid*.
+
+    ``"running"`` while one of its members runs it, ``"finished"`` when *pid* is
+    a member that is not running it (any more), and ``None`` when *pid* is not a
+    runner member or no runner answers: then *pid* is an ordinary process.
+    """
+    return _ask_runner({"op": "status", "run_id": run_id, "pid": pid})
+
+
+def cancel_runner_run(run_id: int) -> bool:
+    """Ask the flow runner to stop *run_id*. ``False`` when no member is running it."""
+    return bool(_ask_runner({"op": "cancel", "run_id": run_id}))
+
 
 def spawn_flow_subprocess(flow_path: str, run_id: int) -> int | None:
     """Fire-and-forget a ``flowfile run flow`` subprocess.
 
-    Uses ``os.open`` / ``os.close`` to pass a raw file descriptor to
-    ``Popen``.  ``Popen`` internally duplicates the fd for the child
-    process, so closing it in the parent afterwards is safe — no race
-    condition with child fd inheritance.
+    A warm flow runner takes the run when one is available. Otherwise a
+    new process is spawned, using ``os.open`` / ``os.close`` to pass a raw
+    file descriptor to ``Popen``.  ``Popen`` internally duplicates the fd
+    for the child process, so closing it in the parent afterwards is
+    safe — no race condition with child fd inheritance.
 
-    Returns the child PID on success, or ``None`` on failure.
+    Returns the PID running the flow on success, or ``None`` on failure.
     """
+    pid = submit_flow_to_runner(flow_path, run_id)
+    if pid is not None:
+        return pid
     frozen = getattr(sys, "frozen", False)
     logger.debug("Frozen mode: %s, sys.executable: %s", frozen, sys.executable)
     if frozen:
@@ -185,3 +185,21 @@ def test_fast_schema_hooks_parity_harness_is_not_vacuous(tmp_path):
     predicted_table = dialect.table_schema(uri, "t", None)
     assert predicted is not None and dict(predicted) == dict(result.schema)
     assert predicted_table is not None and dict(predicted_table) == dict(result.schema)
+
+
+def test_mysql_load_data_local_is_opt_in(monkeypatch):
+    from shared import db_writer
+    from shared.db_dialects import builtin
+
+    loaded = []
+    monkeypatch.setattr(db_writer, "insert_rows", lambda conn, table, df: loaded.append("insert"))
+    monkeypatch.setattr(db_writer, "load_data_local_mysql", lambda conn, table, df: loaded.append("load_data"))
+    mysql = get_dialect("mysql")
+    df = pl.DataFrame({"id": [1]})
+
+    assert mysql.write_connect_args() == {}
+    mysql.load_chunk(None, None, df)
+    monkeypatch.setattr(builtin, "MYSQL_LOCAL_INFILE", True)
+    assert mysql.write_connect_args() == {"local_infile": True}
+    mysql.load_chunk(None, None, df)
+    assert loaded == ["insert", "load_data"]
@@ -13,10 +13,11 @@ import uuid
 from unittest.mock import patch
 
 import polars as pl
+import pytest
 
-from shared.kafka.consumer import commit_offsets, read_kafka_source
+from shared.kafka.consumer import _partition_groups, _SharedSpill, commit_offsets, read_kafka_source
 from shared.kafka.models import KafkaReadSettings
-from test_utils.kafka.fixtures import BOOTSTRAP_SERVERS, produce_json_messages
+from test_utils.kafka.fixtures import BOOTSTRAP_SERVERS, create_topic, produce_json_messages
 
 
 def _unique_group() -> str:
@@ -310,6 +311,90 @@ class TestSpillFlushOverThreshold:
             os.unlink(spill_path)
 
 
+# Parallel partition consumers
+
+
+@pytest.fixture()
+def partitioned_topic():
+    topic_name = f"test_partitioned_{uuid.uuid4().hex[:8]}"
+    create_topic(topic_name, num_partitions=4)
+    return topic_name
+
+
+class TestPartitionGroups:
+    """Topics with several partitions are read by one consumer per partition group."""
+
+    def test_partitions_are_dealt_round_robin(self):
+        assert _partition_groups(list(range(6)), 4) == [[0, 4], [1, 5], [2], [3]]
+        assert _partition_groups([0, 1], 4) == [[0], [1]]
+        assert _partition_groups([], 4) == []
+
+    @pytest.mark.parametrize("max_consumers", [1, 2, 4])
+    def test_reads_every_partition(self, partitioned_topic, max_consumers, tmp_path):
+        produce_json_messages(partitioned_topic, [{"n": i, "k": f"key-{i}"} for i in range(40)], key_field="k")
+        spill_path = tmp_path / "result.arrow"
+
+        settings = _settings(partitioned_topic, max_consumers=max_consumers)
+        result_data, result = read_kafka_source(settings, commit=False, spill_path=str(spill_path))
+
+        df = result_data.collect()
+        assert sorted(df["n"].to_list()) == list(range(40))
+        assert result.messages_consumed == 40
+        # One entry per partition that had messages, each just past its last offset read.
+        last_offsets = df.group_by("_kafka_partition").agg(pl.col("_kafka_offset").max())
+        assert result.new_offsets == {p: o + 1 for p, o in last_offsets.iter_rows()}
+        # The consumers spill into the result file itself; no shard is left behind.
+        assert [p.name for p in tmp_path.iterdir()] == ["result.arrow"]
+
+    def test_max_messages_is_shared_by_all_consumers(self, partitioned_topic):
+        produce_json_messages(partitioned_topic, [{"n": i, "k": f"key-{i}"} for i in range(40)], key_field="k")
+
+        df, result = read_kafka_source(_settings(partitioned_topic, max_messages=10))
+        assert df.height == 10
+        assert result.messages_consumed == 10
+
+    def test_commit_merges_partition_offsets(self, partitioned_topic):
+        produce_json_messages(partitioned_topic, [{"n": i, "k": f"key-{i}"} for i in range(20)], key_field="k")
+        settings = _settings(partitioned_topic)
+
+        _, first = read_kafka_source(settings)
+        assert first.messages_consumed == 20
+
+        produce_json_messages(partitioned_topic, [{"n": i, "k": f"key-{i}"} for i in range(20, 25)], key_field="k")
+        df, second = read_kafka_source(settings)
+        assert sorted(df["n"].to_list()) == list(range(20, 25))
+        assert second.messages_consumed == 5
+
+
+class TestSharedSpill:
+    """Parallel consumers write into one IPC file; only a differing schema gets a shard."""
+
+    def test_matching_schemas_share_the_file(self, tmp_path):
+        path = tmp_path / "result.arrow"
+        spill = _SharedSpill(str(path))
+        spill.route(0).write_batch(pl.DataFrame({"n": [1, 2]}))
+        spill.route(1).write_batch(pl.DataFrame({"n": [3]}))
+        spill.route(0).write_batch(pl.DataFrame({"n": [4]}))
+
+        assert sorted(spill.finish().collect()["n"].to_list()) == [1, 2, 3, 4]
+        assert [p.name for p in tmp_path.iterdir()] == ["result.arrow"]
+
+    def test_differing_schema_is_merged_by_column_name(self, tmp_path):
+        path = tmp_path / "result.arrow"
+        spill = _SharedSpill(str(path))
+        spill.route(0).write_batch(pl.DataFrame({"n": [1]}))
+        spill.route(1).write_batch(pl.DataFrame({"n": [2], "extra": ["x"]}))
+
+        df = spill.finish().collect().sort("n")
+        assert df.to_dict(as_series=False) == {"n": [1, 2], "extra": [None, "x"]}
+        assert [p.name for p in tmp_path.iterdir()] == ["result.arrow"]
+
+    def test_nothing_written_leaves_an_empty_result(self, tmp_path):
+        df = _SharedSpill(str(tmp_path / "result.arrow")).finish().collect()
+        assert df.height == 0
+        assert "_kafka_offset" in df.columns
+
+
 # commit_offsets tests
 
 
@@ -1,5 +1,6 @@
 """Tests for Kafka deserializers."""
 
+import polars as pl
 import pytest
 
 from shared.kafka.deserializers import JsonDeserializer, get_deserializer
@@ -32,6 +33,34 @@ class TestJsonDeserializer:
         assert result is None
 
 
+class TestJsonBatchDeserializer:
+    def test_batch_parses_all_values_in_one_frame(self):
+        values = [b'{"name": "Alice", "age": 30}', b'{"name": "Bob", "tags": ["x"]}']
+        df, kept = JsonDeserializer().deserialize_batch(values)
+        assert kept == [0, 1]
+        assert df["name"].to_list() == ["Alice", "Bob"]
+        assert df["age"].to_list() == [30, None]
+        assert df["tags"].to_list() == [None, ["x"]]
+
+    def test_batch_flattens_multiline_values(self):
+        df, kept = JsonDeserializer().deserialize_batch([b'{\n  "a": 1\n}', b'{"a": 2, "s": "line\\nbreak"}'])
+        assert kept == [0, 1]
+        assert df["a"].to_list() == [1, 2]
+        assert df["s"].to_list() == [None, "line\nbreak"]
+
+    def test_batch_drops_invalid_and_wraps_non_objects(self):
+        values = [b'{"seq": 1}', b"not json", b"[1, 2]", b'{"seq": 2}']
+        df, kept = JsonDeserializer().deserialize_batch(values)
+        assert kept == [0, 2, 3]
+        assert df["seq"].to_list() == [1, None, 2]
+        assert df["value"].to_list() == [None, [1, 2], None]
+
+    def test_batch_of_nothing(self):
+        df, kept = JsonDeserializer().deserialize_batch([])
+        assert kept == []
+        assert df.shape == (0, 0)
+
+
 class TestGetDeserializer:
     def test_get_json_deserializer(self):
         d = get_deserializer("json")
@@ -15,6 +15,7 @@ class TestKafkaReadSettings:
         assert settings.start_offset == "latest"
         assert settings.max_messages == 100_000
         assert settings.poll_timeout_seconds == 30.0
+        assert settings.max_consumers == 4
         assert settings.security_protocol == "PLAINTEXT"
 
     def test_custom_group_id(self):
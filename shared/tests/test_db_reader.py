@@ -1,11 +1,22 @@
 import logging
+import sqlite3
+import threading
 import time
+from datetime import date
 
 import polars as pl
 import pytest
-
-from shared import db_reader
-from shared.db_reader import DatabaseReadCancelledError, read_sql_with_fallback
+from pydantic import ValidationError
+
+from shared import db_dialects, db_reader
+from shared.db_reader import (
+    DatabaseReadCancelledError,
+    DbReadPartitioning,
+    partition_queries,
+    read_sql_partitioned,
+    read_sql_with_fallback,
+    write_partitions_ipc,
+)
 
 logger = logging.getLogger("test-db-reader")
 
@@ -141,3 +152,99 @@ def test_cancel_check_aborts_quickly(calls, monkeypatch):
             cancel_check=lambda: time.monotonic() >= cancelled_at,
         )
     assert time.monotonic() - start < 5
+
+
+@pytest.fixture
+def sqlite_reads(monkeypatch):
+    """Route dialect reads to an in-memory SQLite table and record the queries."""
+    con = sqlite3.connect(":memory:", check_same_thread=False)
+    ids = [*range(1, 101), None]
+    con.execute("CREATE TABLE facts (id INTEGER, day TEXT)")
+    con.executemany(
+        "INSERT INTO facts VALUES (?, ?)",
+        [(i, date(2024, 1, 1 + (i or 1) % 28).isoformat()) for i in ids],
+    )
+    queries = []
+    lock = threading.Lock()
+
+    def fake_read_sql(query, uri, logger, *, database_type=None, cancel_check=None):
+        with lock:
+            queries.append(query)
+            cursor = con.execute(query)
+            columns = [c[0] for c in cursor.description]
+            return pl.DataFrame(cursor.fetchall(), schema=columns, orient="row")
+
+    monkeypatch.setattr(db_dialects, "read_sql", fake_read_sql)
+    yield queries
+    con.close()
+
+
+def _read_all(partitioning: DbReadPartitioning) -> list[pl.DataFrame]:
+    return list(read_sql_partitioned("SELECT * FROM facts", "sqlite://", logger, partitioning))
+
+
+def test_partitions_return_every_row_once(sqlite_reads):
+    partitions = _read_all(DbReadPartitioning(column="id", num_partitions=4, max_concurrency=2))
+    assert len(partitions) == 4
+    assert sqlite_reads[0].startswith("SELECT MIN(id)")
+    ids = pl.concat(partitions)["id"]
+    assert ids.len() == 101
+    assert ids.null_count() == 1
+    assert sorted(ids.drop_nulls().to_list()) == list(range(1, 101))
+
+
+def test_bounds_only_place_the_cuts(sqlite_reads):
+    partitions = _read_all(DbReadPartitioning(column="id", num_partitions=3, lower_bound=40, upper_bound=70))
+    # Given bounds skip the MIN/MAX query, and rows outside them land in the first and last partitions.
+    assert not any(q.startswith("SELECT MIN") for q in sqlite_reads)
+    assert pl.concat(partitions).height == 101
+
+
+def test_partitions_are_read_in_a_bounded_window(sqlite_reads):
+    partitions = read_sql_partitioned(
+        "SELECT * FROM facts", "sqlite://", logger, DbReadPartitioning(column="id", num_partitions=4, max_concurrency=1)
+    )
+    next(partitions)
+    # The MIN/MAX query, the partition just yielded and at most the next one: the rest wait for the consumer.
+    assert len(sqlite_reads) <= 3
+    assert len(list(partitions)) == 3
+    assert len(sqlite_reads) == 5
+
+
+def test_partition_queries_cut_dates_on_whole_days():
+    queries = partition_queries(
+        "SELECT * FROM facts", DbReadPartitioning(column="day", num_partitions=3), date(2024, 1, 1), date(2024, 1, 10)
+    )
+    assert queries[0].endswith("WHERE day < '2024-01-04' OR day IS NULL")
+    assert queries[1].endswith("WHERE day >= '2024-01-04' AND day < '2024-01-07'")
+    assert queries[2].endswith("WHERE day >= '2024-01-07'")
+
+
+def test_small_ranges_get_fewer_partitions():
+    partitioning = DbReadPartitioning(column="id", num_partitions=10)
+    assert len(partition_queries("SELECT * FROM t", partitioning, 1, 3)) == 2
+    assert partition_queries("SELECT * FROM t", partitioning, 5, 5) == ["SELECT * FROM t"]
+
+
+def test_partitioning_on_a_text_column_is_refused(sqlite_reads):
+    with pytest.raises(ValueError, match="column 'day' with str and str bounds"):
+        _read_all(DbReadPartitioning(column="day", num_partitions=3))
+    with pytest.raises(ValueError, match="column 'id' with int and date bounds"):
+        partition_queries("SELECT * FROM t", DbReadPartitioning(column="id"), 1, date(2024, 1, 1))
+
+
+def test_partition_column_must_be_an_identifier():
+    with pytest.raises(ValidationError):
+        DbReadPartitioning(column="id; DROP TABLE facts")
+
+
+def test_write_partitions_ipc_holds_back_all_null_partitions(tmp_path):
+    path = str(tmp_path / "result.arrow")
+    partitions = [
+        pl.DataFrame({"id": [1, 2], "value": [None, None]}),
+        pl.DataFrame({"id": [3], "value": [1.5]}),
+    ]
+    assert write_partitions_ipc(partitions, path) == 3
+    result = pl.read_ipc(path)
+    assert result.schema == pl.Schema({"id": pl.Int64, "value": pl.Float64})
+    assert result["id"].to_list() == [3, 1, 2]
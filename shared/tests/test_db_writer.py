@@ -1,10 +1,12 @@
 import datetime
 import decimal
+import sqlite3
 
 import polars as pl
 import pytest
 
-from shared.db_writer import write_dataframe_to_database
+from shared import db_writer
+from shared.db_writer import _write_df_via_sqlalchemy_core, to_csv_bytes, write_dataframe_to_database
 
 
 def _uri(tmp_path, name="out.db"):
@@ -62,3 +64,143 @@ def test_sqlite_empty_frame(tmp_path):
         pl.DataFrame({"id": [1]}).head(0), database_type="sqlite", uri=uri, table_name="t", if_exists="replace"
     )
     assert pl.read_database_uri("SELECT count(*) c FROM t", uri)["c"][0] == 0
+
+
+def test_sqlite_chunked_write(tmp_path, monkeypatch):
+    monkeypatch.setattr(db_writer, "WRITE_CHUNK_ROWS", 3)
+    uri = _uri(tmp_path, "chunks.db")
+    df = pl.DataFrame({"id": range(10), "tags": [[str(i)] for i in range(10)]})
+    write_dataframe_to_database(df, database_type="sqlite", uri=uri, table_name="t", if_exists="replace")
+    back = pl.read_database_uri("SELECT * FROM t ORDER BY id", uri)
+    assert back["id"].to_list() == list(range(10))
+    assert back["tags"][9] == '["9"]'
+
+
+def test_nested_columns_read_back_as_json(tmp_path):
+    uri = _uri(tmp_path, "nested.db")
+    df = pl.DataFrame({
+        "id": [1, 2, 3],
+        "tags": [["x", "y"], [], None],
+        "scores": [[1, 2], [3], [None]],
+        "meta": [{"k": 1, "tags": ["a"]}, {"k": 2, "tags": []}, {"k": 3, "tags": ["b", "c"]}],
+    })
+    _write_df_via_sqlalchemy_core(df, uri, "t", "replace")
+    back = pl.read_database_uri("SELECT * FROM t ORDER BY id", uri)
+    assert back["tags"].to_list() == ['["x", "y"]', "[]", None]
+    assert back["scores"].to_list() == ["[1, 2]", "[3]", "[null]"]
+    assert back["meta"][0] == '{"k": 1, "tags": ["a"]}'
+
+
+def _failing_on_chunk(n: int, chunks: list[int]):
+    def load_chunk(conn, sql_table, chunk):
+        chunks.append(chunk.height)
+        if len(chunks) == n:
+            raise RuntimeError("boom")
+        db_writer.insert_rows(conn, sql_table, chunk)
+
+    return load_chunk
+
+
+def test_sqlalchemy_core_loads_one_transaction_per_chunk(tmp_path):
+    uri = _uri(tmp_path, "core.db")
+    df = pl.DataFrame({"id": range(7), "span": [datetime.timedelta(seconds=i) for i in range(7)]})
+    chunks = []
+
+    with pytest.raises(RuntimeError, match="boom"):
+        _write_df_via_sqlalchemy_core(df, uri, "t", "append", load_chunk=_failing_on_chunk(3, chunks), chunk_rows=3)
+    assert chunks == [3, 3, 1]
+    back = pl.read_database_uri("SELECT * FROM t ORDER BY id", uri)
+    # The chunks before the failed one stay committed.
+    assert back["id"].to_list() == list(range(6))
+    assert back["span"][1] == df["span"].cast(pl.String)[1]
+
+
+def test_failed_replace_keeps_the_old_table(tmp_path):
+    uri = _uri(tmp_path, "replace.db")
+    _write_df_via_sqlalchemy_core(pl.DataFrame({"id": [100]}), uri, "t", "replace")
+    df = pl.DataFrame({"id": range(7)})
+
+    with pytest.raises(RuntimeError, match="boom"):
+        _write_df_via_sqlalchemy_core(df, uri, "t", "replace", load_chunk=_failing_on_chunk(3, []), chunk_rows=3)
+    assert pl.read_database_uri("SELECT * FROM t", uri)["id"].to_list() == [100]
+    tables = pl.read_database_uri("SELECT name FROM sqlite_master WHERE type = 'table'", uri)["name"].to_list()
+    assert tables == ["t"]
+
+    _write_df_via_sqlalchemy_core(df, uri, "t", "replace", chunk_rows=3)
+    assert pl.read_database_uri("SELECT * FROM t ORDER BY id", uri)["id"].to_list() == list(range(7))
+
+
+def test_sqlite_failed_replace_keeps_the_old_table(tmp_path, monkeypatch):
+    uri = _uri(tmp_path, "sqlite_replace.db")
+    write_dataframe_to_database(pl.DataFrame({"id": [100]}), database_type="sqlite", uri=uri, table_name="t")
+    connect = sqlite3.connect
+
+    class FailingSecondChunk:
+        def __init__(self, path):
+            self._conn, self._chunks = connect(path), 0
+
+        def __getattr__(self, name):
+            return getattr(self._conn, name)
+
+        def executemany(self, sql, rows):
+            self._chunks += 1
+            if self._chunks == 2:
+                raise sqlite3.OperationalError("boom")
+            return self._conn.executemany(sql, rows)
+
+    monkeypatch.setattr(db_writer, "WRITE_CHUNK_ROWS", 2)
+    monkeypatch.setattr(db_writer.sqlite3, "connect", FailingSecondChunk)
+    with pytest.raises(sqlite3.OperationalError, match="boom"):
+        write_dataframe_to_database(
+            pl.DataFrame({"id": [1, 2, 3, 4]}), database_type="sqlite", uri=uri, table_name="t", if_exists="replace"
+        )
+    monkeypatch.undo()
+    assert pl.read_database_uri("SELECT * FROM t", uri)["id"].to_list() == [100]
+
+
+def test_csv_bytes_keep_nulls_apart_from_strings():
+    df = pl.DataFrame({"s": ["NULL", None, "a,b"], "n": [1, None, 3]})
+    assert to_csv_bytes(df, null_value="NULL").decode().splitlines() == ['"NULL",1', "NULL,NULL", '"a,b",3']
+
+
+def _merge(df, uri, mode, keys=("id",)):
+    write_dataframe_to_database(
+        df, database_type="sqlite", uri=uri, table_name="dim", if_exists=mode, merge_keys=list(keys)
+    )
+
+
+def _rows(uri):
+    return pl.read_database_uri("SELECT id, name FROM dim ORDER BY id", uri).rows()
+
+
+def test_sqlite_merge_modes(tmp_path):
+    uri = _uri(tmp_path, "merge.db")
+    _merge(pl.DataFrame({"id": [1, 2], "name": ["a", "b"]}), uri, "upsert")
+    assert _rows(uri) == [(1, "a"), (2, "b")]
+
+    _merge(pl.DataFrame({"id": [2, 3], "name": ["B", "c"]}), uri, "upsert")
+    assert _rows(uri) == [(1, "a"), (2, "B"), (3, "c")]
+    _merge(pl.DataFrame({"id": [1, 4], "name": ["A", "d"]}), uri, "update")
+    assert _rows(uri) == [(1, "A"), (2, "B"), (3, "c")]
+    _merge(pl.DataFrame({"id": [2, 3, 9]}), uri, "delete")
+    assert _rows(uri) == [(1, "A")]
+    # The staging tables are gone.
+    tables = pl.read_database_uri("SELECT name FROM sqlite_master WHERE type = 'table'", uri)["name"].to_list()
+    assert tables == ["dim"]
+
+
+def test_merge_into_missing_table_creates_it(tmp_path):
+    uri = _uri(tmp_path, "missing.db")
+    _merge(pl.DataFrame({"id": [1], "name": ["a"]}), uri, "update")
+    assert _rows(uri) == []
+
+
+def test_merge_validates_keys(tmp_path):
+    uri = _uri(tmp_path, "keys.db")
+    df = pl.DataFrame({"id": [1, 1], "name": ["a", "b"]})
+    with pytest.raises(ValueError, match="merge_keys is required"):
+        _merge(df, uri, "upsert", keys=())
+    with pytest.raises(ValueError, match="not found"):
+        _merge(df, uri, "upsert", keys=("nope",))
+    with pytest.raises(ValueError, match="duplicate keys"):
+        _merge(df, uri, "upsert")
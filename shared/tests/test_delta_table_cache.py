@@ -0,0 +1,112 @@
+"""Unit tests for the shared Delta snapshot cache in shared.delta_utils.
+
+Covers handle reuse with incremental refresh of the latest snapshot, pinned
+versions, metadata-only lookups, local tables deleted or re-created in place,
+explicit invalidation, the LRU bound, and ``scan_delta_table``.
+"""
+
+import shutil
+
+import polars as pl
+import pytest
+from deltalake.exceptions import TableNotFoundError
+
+from shared.delta_utils import DeltaTableCache, get_delta_version, scan_delta_table, write_delta
+
+
+@pytest.fixture()
+def table_path(tmp_path) -> str:
+    path = str(tmp_path / "t")
+    write_delta(pl.DataFrame({"a": [1, 2]}), path, mode="error")
+    return path
+
+
+def _append(path: str, values: list[int]) -> None:
+    pl.DataFrame({"a": values}).write_delta(path, mode="append")
+
+
+def test_latest_handle_is_reused_and_follows_commits(table_path):
+    cache = DeltaTableCache()
+    first = cache.get(table_path)
+    assert first.version() == 0
+
+    _append(table_path, [3])
+    second = cache.get(table_path)
+    assert second is first
+    assert second.version() == 1
+    assert len(second.file_uris()) == 2
+
+
+def test_pinned_version_does_not_move(table_path):
+    cache = DeltaTableCache()
+    pinned = cache.get(table_path, version=0)
+    _append(table_path, [3])
+
+    assert cache.get(table_path, version=0) is pinned
+    assert pinned.version() == 0
+    assert cache.get(table_path).version() == 1
+
+
+def test_metadata_lookup_reuses_a_handle_with_files(table_path):
+    cache = DeltaTableCache()
+    with_files = cache.get(table_path)
+    assert cache.get(table_path, without_files=True) is with_files
+
+    metadata_only = DeltaTableCache().get(table_path, without_files=True)
+    assert metadata_only.version() == 0
+
+
+def test_deleted_local_table_is_not_served(table_path):
+    cache = DeltaTableCache()
+    cache.get(table_path)
+    shutil.rmtree(table_path)
+
+    with pytest.raises(TableNotFoundError):
+        cache.get(table_path)
+
+
+def test_recreated_local_table_is_reopened(table_path):
+    cache = DeltaTableCache()
+    _append(table_path, [3])
+    assert cache.get(table_path).version() == 1
+
+    shutil.rmtree(table_path)
+    pl.DataFrame({"b": ["x"]}).write_delta(table_path, mode="error")
+    table = cache.get(table_path)
+    assert table.version() == 0
+    assert [f.name for f in table.schema().fields] == ["b"]
+
+
+def test_invalidate_drops_the_handles(table_path):
+    cache = DeltaTableCache()
+    first = cache.get(table_path)
+    cache.get(table_path, version=0)
+
+    cache.invalidate(table_path)
+    assert cache.get(table_path) is not first
+
+
+def test_least_recently_used_table_is_evicted(tmp_path):
+    paths = [str(tmp_path / name) for name in ("a", "b", "c")]
+    for path in paths:
+        write_delta(pl.DataFrame({"a": [1]}), path, mode="error")
+    cache = DeltaTableCache(max_tables=2)
+
+    first = cache.get(paths[0])
+    cache.get(paths[1])
+    cache.get(paths[0])
+    cache.get(paths[2])
+    assert cache.get(paths[0]) is first
+    assert len(cache._entries) == 2
+
+
+def test_disabled_cache_opens_every_time(table_path):
+    cache = DeltaTableCache(max_tables=0)
+    assert cache.get(table_path) is not cache.get(table_path)
+
+
+def test_module_helpers(table_path):
+    _append(table_path, [3])
+    assert get_delta_version(table_path) == 1
+    assert scan_delta_table(table_path).collect()["a"].sort().to_list() == [1, 2, 3]
+    assert scan_delta_table(table_path, version=0).collect().height == 2
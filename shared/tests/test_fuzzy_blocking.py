@@ -0,0 +1,111 @@
+"""Tests for candidate blocking of fuzzy joins (``shared.fuzzy_blocking``)."""
+
+import logging
+
+import polars as pl
+import pytest
+from pl_fuzzy_frame_match import fuzzy_match_dfs
+from pl_fuzzy_frame_match.models import FuzzyMapping
+
+from shared import fuzzy_blocking
+from shared.fuzzy_blocking import BlockingKey, FuzzyBlocking, block_key_selects, blocked_fuzzy_match, plan_chunks
+
+LEFT = pl.DataFrame(
+    {
+        "name": ["edward", "eduward", "court", "apple inc", "microsft", None],
+        "country": ["nl", "nl", "uk", "us", "us", "us"],
+    }
+)
+RIGHT = pl.DataFrame(
+    {
+        "name_right": ["edward", "courts", "apple inc.", "microsoft", "zebra"],
+        "country_right": ["nl", "uk", "us", "us", "nl"],
+    }
+)
+MAPS = [FuzzyMapping(left_col="name", right_col="name_right", threshold_score=75)]
+
+
+def _with_keys(blocking: FuzzyBlocking) -> tuple[pl.DataFrame, pl.DataFrame]:
+    left_keys, right_keys = block_key_selects(blocking)
+    return LEFT.select(pl.all(), *left_keys), RIGHT.select(pl.all(), *right_keys)
+
+
+def _candidates(blocking: FuzzyBlocking, index_dir=None) -> set[tuple[str, str]]:
+    left, right = (df.with_row_index("__ff_row_id") for df in _with_keys(blocking))
+    left_chunks, right_chunks = plan_chunks(left, right, "name", "name_right", blocking, index_dir=index_dir)
+    pairs = left_chunks.join(right_chunks, on="__ff_chunk", suffix="_right")
+    return {
+        (LEFT["name"][lid], RIGHT["name_right"][rid])
+        for lid, rid in pairs.select("__ff_row_id", "__ff_row_id_right").iter_rows()
+    }
+
+
+def _sorted_rows(df: pl.DataFrame) -> list[tuple]:
+    return sorted(df.select(sorted(df.columns)).iter_rows(), key=str)
+
+
+def test_exact_keys_only_pair_rows_with_equal_keys():
+    blocking = FuzzyBlocking(exact_keys=[BlockingKey(left_col="country", right_col="country_right")], chunk_size=1)
+    candidates = _candidates(blocking)
+    assert ("edward", "edward") in candidates
+    assert ("edward", "courts") not in candidates
+    assert ("court", "courts") in candidates
+    # Null match text never becomes a candidate.
+    assert not any(left is None for left, _ in candidates)
+
+
+def test_lsh_pairs_similar_strings_and_skips_unrelated_ones():
+    candidates = _candidates(FuzzyBlocking(method="lsh", num_bands=32, rows_per_band=1))
+    assert {("edward", "edward"), ("apple inc", "apple inc."), ("microsft", "microsoft")} <= candidates
+    assert ("edward", "zebra") not in candidates
+
+
+def test_sorted_neighbourhood_only_pairs_nearby_rows():
+    candidates = _candidates(FuzzyBlocking(method="sorted_neighbourhood", window_size=2, chunk_size=1))
+    assert ("court", "courts") in candidates
+    assert ("apple inc", "zebra") not in candidates
+
+
+def test_right_index_is_reused_while_the_right_side_is_unchanged(tmp_path, monkeypatch):
+    blocking = FuzzyBlocking(method="lsh")
+    first = _candidates(blocking, index_dir=tmp_path)
+    assert len(list(tmp_path.glob("*.arrow"))) == 1
+
+    calls = []
+    lsh_blocks = fuzzy_blocking._lsh_blocks
+    monkeypatch.setattr(
+        fuzzy_blocking, "_lsh_blocks", lambda frame, b: calls.append(frame.height) or lsh_blocks(frame, b)
+    )
+    assert _candidates(blocking, index_dir=tmp_path) == first
+    # Only the left side is hashed again.
+    assert calls == [LEFT.drop_nulls("name").height]
+
+
+def test_blocked_match_finds_the_same_pairs_as_a_full_match():
+    full = fuzzy_match_dfs(LEFT.lazy(), RIGHT.lazy(), fuzzy_maps=MAPS, logger=logging.getLogger(__name__))
+    blocked = blocked_fuzzy_match(
+        LEFT.lazy(),
+        RIGHT.lazy(),
+        fuzzy_maps=MAPS,
+        blocking=FuzzyBlocking(method="lsh", num_bands=32, rows_per_band=1, chunk_size=2, max_workers=2),
+        logger=logging.getLogger(__name__),
+        index_dir=None,
+    )
+    assert _sorted_rows(blocked) == _sorted_rows(full)
+
+
+@pytest.mark.parametrize("method", ["none", "lsh"])
+def test_blocked_match_keeps_exact_keys_and_drops_the_helper_columns(method):
+    blocking = FuzzyBlocking(method=method, exact_keys=[BlockingKey(left_col="country", right_col="country_right")])
+    left, right = _with_keys(blocking)
+    result = blocked_fuzzy_match(
+        left.lazy(),
+        right.lazy(),
+        fuzzy_maps=MAPS,
+        blocking=blocking,
+        logger=logging.getLogger(__name__),
+        index_dir=None,
+    )
+    assert not any(c.startswith("__ff_") for c in result.columns)
+    assert result.filter(pl.col("country") != pl.col("country_right")).is_empty()
+    assert ("microsft", "microsoft") in set(result.select("name", "name_right").iter_rows())
@@ -0,0 +1,67 @@
+"""Tests for the partitioned graph solver (``shared.graph_components``)."""
+
+import random
+
+import polars as pl
+from polars_grouper import graph_solver
+
+from shared import graph_components as cc
+from shared.graph_components import connected_components
+
+
+def _random_edges(n_nodes: int, n_edges: int, seed: int = 7) -> pl.DataFrame:
+    rng = random.Random(seed)
+    return pl.DataFrame(
+        {
+            "from": [f"n{rng.randrange(n_nodes)}" for _ in range(n_edges)],
+            "to": [f"n{rng.randrange(n_nodes)}" for _ in range(n_edges)],
+        }
+    )
+
+
+def _partition(df: pl.DataFrame, label_col: str) -> set[frozenset]:
+    """The components as sets of rows, independent of how they are labelled."""
+    groups = df.with_row_index("row").group_by(label_col).agg("row")["row"]
+    return {frozenset(rows) for rows in groups.to_list()}
+
+
+def test_partitioned_matches_graph_solver(tmp_path):
+    edges = _random_edges(3_000, 2_500)
+    expected = edges.with_columns(graph_solver(pl.col("from"), pl.col("to")).alias("group"))
+    labels = connected_components(edges.lazy(), "from", "to", chunk_size=300, max_workers=4, spill_dir=tmp_path)
+    result = cc.label_rows(edges.lazy(), "from", "to", labels, "group").collect()
+
+    assert _partition(result, "group") == _partition(expected, "group")
+    assert labels["label"].min() == 1
+    assert labels["label"].max() == labels["label"].n_unique()
+    assert not list(tmp_path.glob("edges_*.parquet"))
+
+
+def test_null_partners_and_mixed_types():
+    edges = pl.DataFrame({"from": [1, 2, 4, None], "to": ["2", None, None, "5"]})
+    labels = connected_components(edges.lazy(), "from", "to")
+    assert labels.height == 4
+    result = cc.label_rows(edges.lazy(), "from", "to", labels, "group").collect()
+    group = result["group"].to_list()
+    assert group[0] == group[1]
+    assert len({group[0], group[2], group[3]}) == 3
+
+
+def test_incremental_runs_keep_labels_and_skip_known_edges(tmp_path, monkeypatch):
+    state = tmp_path / "state.parquet"
+    first = pl.DataFrame({"from": ["a", "c", "e"], "to": ["b", "d", "f"]})
+    first_labels = dict(connected_components(first.lazy(), "from", "to", state_path=state).iter_rows())
+    assert state.exists()
+
+    solved_rows = []
+    chunk_forest = cc._chunk_forest
+    monkeypatch.setattr(cc, "_chunk_forest", lambda edges: solved_rows.append(edges.height) or chunk_forest(edges))
+    second = pl.concat([first, pl.DataFrame({"from": ["b", "x"], "to": ["c", "y"]})])
+    second_labels = dict(connected_components(second.lazy(), "from", "to", state_path=state).iter_rows())
+
+    # Only the two new edges are solved; the known ones are inside persisted components.
+    assert solved_rows == [2]
+    merged = min(first_labels["a"], first_labels["c"])
+    assert {second_labels[n] for n in "abcd"} == {merged}
+    assert second_labels["e"] == second_labels["f"] == first_labels["e"]
+    assert second_labels["x"] == second_labels["y"] > max(first_labels.values())